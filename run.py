@@ -4,13 +4,26 @@ GuildScout Bot Runner
 
 This is the main entry point to run the GuildScout Discord Bot.
 Simply run: python run.py
+
+Everything happens under the ``__main__`` guard: the rank card render pool
+uses the ``spawn`` start method, which re-imports this file as
+``__mp_main__`` in every worker. Workers must not install the import hook
+or load the bot's module graph.
 """
 
 import sys
-from src.bot import main
-from src.utils import SingleInstanceLock
 
 if __name__ == "__main__":
+    from src.utils.startup_profiler import get_startup_profiler
+
+    # Time module imports from here until the bot is ready
+    get_startup_profiler().install_import_hook()
+
+    from src.bot import main
+    from src.utils import SingleInstanceLock
+
+    get_startup_profiler().mark("imports done")
+
     # Ensure only one instance is running
     lock = SingleInstanceLock()
     if not lock.acquire():
@@ -21,4 +34,4 @@ if __name__ == "__main__":
     try:
         main()
     finally:
-        lock.release()
\ No newline at end of file
+        lock.release()
@@ -305,14 +305,72 @@ class ActivityTracker:
 
         return counts
 
+    async def count_channel_window(
+        self,
+        channel: discord.abc.GuildChannel,
+        after: datetime,
+        before: datetime
+    ) -> Dict[int, int]:
+        """
+        Count non-bot messages per author in a channel within a time window.
+
+        Only the window is fetched, so the cost scales with recent activity
+        instead of the channel's full history.
+
+        Args:
+            channel: Channel or thread to count
+            after: Window start (exclusive)
+            before: Window end (exclusive)
+
+        Returns:
+            Dict mapping author_id -> message count in the window
+        """
+        retry_count = 0
+        max_wait = 300
+
+        while True:
+            counts: Dict[int, int] = {}
+            try:
+                async for message in channel.history(
+                    limit=None,
+                    after=after,
+                    before=before,
+                    oldest_first=True
+                ):
+                    if message.author.bot:
+                        continue
+                    counts[message.author.id] = counts.get(message.author.id, 0) + 1
+                return counts
+
+            except discord.Forbidden:
+                logger.warning(f"Access denied to channel: {channel.name}")
+                return counts
+
+            except discord.HTTPException as e:
+                transient_statuses = {500, 502, 503, 504}
+                if e.status == 429 or e.status in transient_statuses:
+                    retry_after = (
+                        e.retry_after if hasattr(e, "retry_after")
+                        else min(2 ** retry_count, max_wait)
+                    )
+                    retry_count += 1
+                    logger.warning(
+                        f"⏳ HTTP {e.status} on channel {channel.name}. "
+                        f"Waiting {retry_after:.1f}s (attempt #{retry_count})"
+                    )
+                    await asyncio.sleep(retry_after)
+                    continue
+                raise
+
     async def count_messages_for_users(
         self,
         users: List[discord.Member],
         days_lookback: Optional[int] = None,
         progress_callback: Optional[callable] = None,
         use_cache: bool = True,
-        parallel_channels: int = 5
-    ) -> tuple[Dict[int, int], Dict]:
+        parallel_channels: int = 5,
+        return_breakdown: bool = False
+    ) -> tuple[Dict[int, int], Dict] | tuple[Dict[int, int], Dict, Dict[int, Dict[int, int]]]:
         """
         Count messages for multiple users (OPTIMIZED: channel-first algorithm).
 
@@ -322,14 +380,18 @@ class ActivityTracker:
             progress_callback: Optional callback function(current, total)
             use_cache: Whether to use cache (default: True)
             parallel_channels: Number of channels to process in parallel (default: 5)
+            return_breakdown: Whether to also return the per-channel counts
+                collected during the scan (users served from cache have none)
 
         Returns:
-            Tuple of (message_counts dict, cache_stats dict)
+            Tuple of (message_counts dict, cache_stats dict), plus a
+            {user_id: {channel_id: count}} dict if return_breakdown=True
         """
         logger.info(f"Counting messages for {len(users)} users (optimized mode)...")
 
         # If message store is available and import completed, use it for instant results
-        if self.message_store and days_lookback is None:
+        # (not when a breakdown is requested - that's used to verify the store)
+        if self.message_store and days_lookback is None and not return_breakdown:
             is_imported = await self.message_store.is_import_completed(self.guild.id)
             if is_imported:
                 logger.info("Using message store for instant counts!")
@@ -357,32 +419,37 @@ class ActivityTracker:
                 return message_counts, cache_stats
 
         message_counts = {}
+        breakdown: Dict[int, Dict[int, int]] = {}
         total_users = len(users)
         cache_hits = 0
         cache_misses = 0
 
-        # Step 1: Check cache for all users first
+        # Step 1: Check cache for all users first (one batched lookup)
         users_needing_count = []
         user_ids_needing_count = set()
 
+        cached_counts: Dict[int, int] = {}
+        if use_cache and self.cache:
+            cached_counts = await self.cache.get_many(
+                self.guild.id,
+                [user.id for user in users],
+                days_lookback,
+                self.excluded_channels
+            )
+
         for user in users:
-            if use_cache and self.cache:
-                cached = await self.cache.get(
-                    self.guild.id,
-                    user.id,
-                    days_lookback,
-                    self.excluded_channels
-                )
-                if cached is not None:
-                    message_counts[user.id] = cached
-                    cache_hits += 1
-                    logger.debug(f"💾 Cache hit for {user.name}: {cached}")
-                    continue
+            cached = cached_counts.get(user.id)
+            if cached is not None:
+                message_counts[user.id] = cached
+                cache_hits += 1
+                logger.debug(f"💾 Cache hit for {user.name}: {cached}")
+                continue
 
             # Need to count this user
             users_needing_count.append(user)
             user_ids_needing_count.add(user.id)
             message_counts[user.id] = 0
+            breakdown[user.id] = {}
             cache_misses += 1
 
         # Step 2: If all cached, return early
@@ -393,6 +460,8 @@ class ActivityTracker:
                 "cache_misses": 0,
                 "cache_hit_rate": 100.0
             }
+            if return_breakdown:
+                return message_counts, cache_stats, breakdown
             return message_counts, cache_stats
 
         logger.info(
@@ -435,6 +504,7 @@ class ActivityTracker:
                 for user_id, count in result.items():
                     if count > 0:
                         message_counts[user_id] += count
+                        breakdown[user_id][channel.id] = count
                         logger.debug(f"User {user_id} has {count} messages in #{channel.name}")
 
                 processed_channels += 1
@@ -447,18 +517,14 @@ class ActivityTracker:
                 estimated_users_done = cache_hits + int((processed_channels / total_channels) * cache_misses)
                 await progress_callback(min(estimated_users_done, total_users), total_users)
 
-        # Step 5: Cache the newly counted users
+        # Step 5: Cache the newly counted users (one transaction)
         if use_cache and self.cache:
-            for user in users_needing_count:
-                count = message_counts[user.id]
-                await self.cache.set(
-                    self.guild.id,
-                    user.id,
-                    count,
-                    days_lookback,
-                    self.excluded_channels
-                )
-                logger.debug(f"Cached count for {user.name}: {count}")
+            await self.cache.set_many(
+                self.guild.id,
+                {user.id: message_counts[user.id] for user in users_needing_count},
+                days_lookback,
+                self.excluded_channels
+            )
 
         # Step 6: Report results
         cache_stats = {
@@ -477,6 +543,8 @@ class ActivityTracker:
         if progress_callback:
             await progress_callback(total_users, total_users)
 
+        if return_breakdown:
+            return message_counts, cache_stats, breakdown
         return message_counts, cache_stats
 
     async def get_channels_info(self) -> List[Dict]:
@@ -17,10 +17,17 @@ from src.utils import Config, setup_logger
 from src.utils.log_helper import DiscordLogger
 from src.utils.status_manager import StatusManager
 from src.utils.health_server import HealthCheckServer
+from src.utils.loop_monitor import get_loop_monitor
+from src.utils.rate_limit_monitor import get_monitor
 from src.utils.config_watcher import setup_config_watcher
+from src.utils.startup_profiler import get_startup_profiler
+from src.utils.startup_orchestrator import StartupOrchestrator
+from src.utils.managed_message import edit_if_changed
+from src.utils.bot_messages import track_message
 from src.database import MessageCache
 from src.database.message_store import MessageStore
 from src.database.raid_store import RaidStore
+from src.database.bot_message_store import PURPOSE_DASHBOARD, get_bot_message_store
 from src.commands.analyze import setup as setup_analyze
 from src.commands.my_score import setup as setup_my_score
 from src.commands.admin import setup as setup_admin
@@ -72,6 +79,7 @@ class GuildScoutBot(commands.Bot):
         self.logger = logging.getLogger("guildscout.bot")
         self.discord_logger = DiscordLogger(bot=self, config=config)
         self.status_manager = StatusManager(bot=self, config=config)
+        self.startup = StartupOrchestrator()
 
         # Health check HTTP server
         self.health_server = HealthCheckServer(bot=self, port=self.config.health_check_port)
@@ -95,6 +103,8 @@ class GuildScoutBot(commands.Bot):
         super().__init__(
             command_prefix="!",  # Use a dummy prefix to avoid "NoneType is not iterable" error in on_message
             intents=intents,
+            # Per-route/bucket/subsystem REST accounting
+            http_trace=get_monitor().create_trace_config(),
             *args,
             **kwargs
         )
@@ -102,70 +112,87 @@ class GuildScoutBot(commands.Bot):
     async def setup_hook(self):
         """Setup hook called when bot is starting."""
         self.logger.info("Setting up bot...")
+        startup = self.startup
+        profiler = startup.profiler
+        profiler.mark("setup_hook")
 
         self.last_offline_seconds = self._compute_offline_seconds()
+
+        # Watch the event loop from the start so slow startup work shows up too
+        get_loop_monitor().start(threshold=self.config.loop_lag_threshold_seconds)
         if self._heartbeat_task is None:
             self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
 
-        # Initialize cache
-        await self.cache.initialize()
-        self.logger.info("Cache initialized")
-
-        # Initialize message store
-        await self.message_store.initialize()
-        self.logger.info("Message store initialized")
-
-        # Initialize raid store
-        await self.raid_store.initialize()
-        self.logger.info("Raid store initialized")
+        # Stores are independent of each other - initialize them concurrently
+        await startup.run_group("store", [
+            ("cache", self.cache.initialize),
+            ("message_store", self.message_store.initialize),
+            ("raid_store", self.raid_store.initialize),
+            # Registry of bot-posted messages (used by channel cleanup)
+            ("bot_message_store", get_bot_message_store().initialize),
+        ])
+        self.logger.info("Stores initialized")
 
         # Load commands
-        await setup_analyze(self, self.config, self.cache)
-        await setup_my_score(self, self.config, self.cache)
-        await setup_admin(self, self.config, self.cache)
-        await setup_ranking_channel(self, self.config)
-        await setup_assign_guild_role(self, self.config, self.cache)
-        await setup_guild_status(self, self.config)
-        await setup_set_max_spots(self, self.config)
-        await setup_status(self, self.config)
-        await setup_profile(self, self.config)
-        await setup_raid(self, self.config, self.raid_store)
-
-        await setup_message_store_admin(self, self.config, self.message_store)
+        await startup.run_group("cog", [
+            ("analyze", lambda: setup_analyze(self, self.config, self.cache)),
+            ("my_score", lambda: setup_my_score(self, self.config, self.cache)),
+            ("admin", lambda: setup_admin(self, self.config, self.cache)),
+            ("ranking_channel", lambda: setup_ranking_channel(self, self.config)),
+            ("assign_guild_role", lambda: setup_assign_guild_role(self, self.config, self.cache)),
+            ("guild_status", lambda: setup_guild_status(self, self.config)),
+            ("set_max_spots", lambda: setup_set_max_spots(self, self.config)),
+            ("status", lambda: setup_status(self, self.config)),
+            ("profile", lambda: setup_profile(self, self.config)),
+            ("raid", lambda: setup_raid(self, self.config, self.raid_store)),
+            ("message_store_admin", lambda: setup_message_store_admin(self, self.config, self.message_store)),
+        ])
         self.logger.info("Commands loaded")
 
         # Load event handlers
-        await setup_guild_events(self, self.config, self.message_store)
-        await setup_message_tracking(self, self.config, self.message_store)
-        await setup_rate_limit_tracking(self)
-        await setup_voice_tracking(self, self.config, self.message_store)
-        await setup_raid_events(self, self.config, self.raid_store)
+        await startup.run_group("cog", [
+            ("guild_events", lambda: setup_guild_events(self, self.config, self.message_store)),
+            ("message_tracking", lambda: setup_message_tracking(self, self.config, self.message_store)),
+            ("rate_limit_tracking", lambda: setup_rate_limit_tracking(self)),
+            ("voice_tracking", lambda: setup_voice_tracking(self, self.config, self.message_store)),
+            ("raid_events", lambda: setup_raid_events(self, self.config, self.raid_store)),
+        ])
         self.logger.info("Event handlers loaded")
 
-        # Load background tasks
-        await setup_verification_scheduler(self, self.config, self.message_store)
-        await setup_backup_scheduler(self, self.config)
-        await setup_db_maintenance(self, self.config)
-        await setup_health_monitor(self, self.config)
-        await setup_weekly_reporter(self, self.config)
-        await setup_raid_scheduler(self, self.config, self.raid_store)
+        # Load background tasks needed right after connecting
+        await startup.run_group("cog", [
+            ("verification_scheduler", lambda: setup_verification_scheduler(self, self.config, self.message_store)),
+            ("db_maintenance", lambda: setup_db_maintenance(self, self.config)),
+            ("health_monitor", lambda: setup_health_monitor(self, self.config)),
+            ("raid_scheduler", lambda: setup_raid_scheduler(self, self.config, self.raid_store)),
+        ])
         self.logger.info("Background tasks loaded")
 
+        # Non-critical tasks (no app commands) are loaded after on_ready
+        startup.defer([
+            ("weekly_reporter", lambda: setup_weekly_reporter(self, self.config)),
+            ("backup_scheduler", lambda: setup_backup_scheduler(self, self.config)),
+        ])
+
         # Sync commands to guild
         try:
-            guild = discord.Object(id=self.config.guild_id)
-            self.tree.copy_global_to(guild=guild)
-            await self.tree.sync(guild=guild)
+            with profiler.stage("command sync"):
+                guild = discord.Object(id=self.config.guild_id)
+                self.tree.copy_global_to(guild=guild)
+                await self.tree.sync(guild=guild)
             self.logger.info(f"Synced commands to guild {self.config.guild_id}")
         except Exception as e:
             self.logger.error(f"Failed to sync commands: {e}")
 
         # Start health check server
         try:
-            await self.health_server.start()
+            with profiler.stage("health server start"):
+                await self.health_server.start()
         except Exception as e:
             self.logger.error(f"Failed to start health check server: {e}")
 
+        profiler.mark("setup_hook done")
+
     async def on_ready(self):
         """
         Called when bot is ready.
@@ -175,6 +202,10 @@ class GuildScoutBot(commands.Bot):
         """
         self.logger.info(f"Bot is ready! Logged in as {self.user.name} ({self.user.id})")
 
+        # Log the startup timeline and load deferred cogs (first ready event only)
+        self.startup.profiler.finish()
+        self.startup.start_deferred()
+
         # Initialize lock on first call
         if self._import_lock is None:
             import asyncio
@@ -293,9 +324,13 @@ class GuildScoutBot(commands.Bot):
         self._initial_startup_complete = True
         self.logger.info("Background tasks enabled.")
 
-        # Start config file watcher for automatic git commits
+        # Start config file watcher for automatic git commits and hot reload
+        # (picks up settings saved from the web UI)
         try:
-            self.config_watcher = await setup_config_watcher()
+            self.config_watcher = await setup_config_watcher(
+                self.config.config_path,
+                on_change=self.config.reload
+            )
         except Exception as e:
             self.logger.warning(f"Failed to start config watcher: {e}")
 
@@ -401,7 +436,7 @@ class GuildScoutBot(commands.Bot):
             )
             embed.set_footer(text="Live-Update")
 
-            await status_message.edit(embed=embed)
+            await edit_if_changed(status_message, embed=embed)
         except Exception as exc:
             self.logger.debug("Failed to update import progress embed: %s", exc)
 
@@ -438,6 +473,7 @@ class GuildScoutBot(commands.Bot):
 
         try:
             message = await dashboard_channel.send(embed=embed)
+            await track_message(message, PURPOSE_DASHBOARD, "import_status")
             self.logger.info(f"Created import status message in #{dashboard_channel.name}")
             return message
         except Exception as e:
@@ -496,8 +532,8 @@ class GuildScoutBot(commands.Bot):
                 embed.set_footer(text="Letztes Update")
                 embed.timestamp = discord.utils.utcnow()
 
-                await status_message.edit(embed=embed)
-                self.logger.debug(f"Updated status: {total_messages:,} messages, {duration_str}")
+                if await edit_if_changed(status_message, embed=embed):
+                    self.logger.debug(f"Updated status: {total_messages:,} messages, {duration_str}")
 
                 # Sleep before next update (30 seconds)
                 await asyncio.sleep(30)
@@ -722,6 +758,8 @@ class GuildScoutBot(commands.Bot):
                         dashboard_manager = message_tracker.dashboard_manager
                         if dashboard_manager:
                             # Force dashboard update after import completion
+                            # Counts may have changed in bulk - re-read the dashboard data
+                            dashboard_manager.invalidate_model(guild.id)
                             lock = dashboard_manager._dashboard_locks.setdefault(guild.id, asyncio.Lock())
                             async with lock:
                                 state = dashboard_manager._get_dashboard_state(guild.id)
@@ -833,6 +871,7 @@ class GuildScoutBot(commands.Bot):
                         color=discord.Color.orange()
                     )
                     status_msg = await dashboard_channel.send(embed=embed)
+                    await track_message(status_msg, PURPOSE_DASHBOARD, "import_status")
 
                     # Protect message from cleanup
                     try:
@@ -933,6 +972,19 @@ class GuildScoutBot(commands.Bot):
         except Exception as e:
             self.logger.error(f"Error stopping health server: {e}")
 
+        get_loop_monitor().stop()
+
+        # Write pending live-tracking deltas so the cache isn't stale after restart
+        try:
+            await self.cache.flush_deltas()
+        except Exception as e:
+            self.logger.error(f"Error flushing cache deltas: {e}")
+
+        # Stop rank card worker processes (only loaded once a card was rendered)
+        rank_cards = sys.modules.get("src.utils.rank_card_generator")
+        if rank_cards:
+            rank_cards.shutdown_render_pool()
+
         # Close parent bot
         await super().close()
 
@@ -956,7 +1008,8 @@ def main():
         name="guildscout",
         level=config.log_level,
         log_file=config.log_file,
-        log_format=config.log_format
+        log_format=config.log_format,
+        json_file=config.log_json_file
     )
 
     logger.info("=" * 50)
@@ -971,8 +1024,12 @@ def main():
     message_store = MessageStore()
     logger.info("Message store system initialized")
 
+    # Keep cached counts current from live tracking instead of waiting for the TTL
+    message_store.add_delta_listener(cache.apply_delta)
+
     # Create and run bot
     bot = GuildScoutBot(config, cache, message_store)
+    get_startup_profiler().mark("bot created")
 
     try:
         bot.run(config.discord_token)
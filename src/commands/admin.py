@@ -168,7 +168,9 @@ class AdminCommands(commands.Cog):
                 value=(
                     f"Total: {stats['total_entries']:,}\n"
                     f"Valid: {stats['valid_entries']:,}\n"
-                    f"Expired: {stats['expired_entries']:,}"
+                    f"Expired: {stats['expired_entries']:,}\n"
+                    f"In memory: {stats['memory_entries']:,} "
+                    f"({stats['memory_hits']:,} hits / {stats['memory_misses']:,} misses)"
                 ),
                 inline=True
             )
@@ -429,7 +429,9 @@ class AnalyzeCommand(commands.Cog):
             )
             csv_exporter = CSVExporter(
                 delimiter=self.config.csv_delimiter,
-                encoding=self.config.csv_encoding
+                encoding=self.config.csv_encoding,
+                export_format=self.config.export_format,
+                compress=self.config.export_compress
             )
 
             logger.info(
@@ -8,7 +8,7 @@ from discord.ext import commands
 from typing import Optional
 import logging
 from datetime import datetime
-import pandas as pd
+import csv
 from pathlib import Path
 
 from src.utils.config import Config
@@ -90,7 +90,8 @@ class GuildStatusCommand(commands.Cog):
             # Quick scoring for guild members
             member_scores = {}
             if guild_members:
-                cache = MessageCache(ttl=self.config.cache_ttl)
+                # Shared cache: it receives the live-tracking deltas
+                cache = getattr(self.bot, 'cache', None) or MessageCache(ttl=self.config.cache_ttl)
                 activity_tracker = ActivityTracker(
                     guild,
                     excluded_channels=self.config.excluded_channels,
@@ -207,33 +208,31 @@ class GuildStatusCommand(commands.Cog):
             # Create CSV export (sorted by score, highest first)
             csv_path = None
             if guild_members:
-                csv_data = []
                 sorted_members = sorted(
                     guild_members,
                     key=lambda m: member_scores.get(m.id, {}).get('score', 0),
                     reverse=True
                 )
 
-                for member in sorted_members:
-                    score_info = member_scores.get(member.id, {})
-                    csv_data.append({
-                        'Rank': score_info.get('rank', '?'),
-                        'Username': member.name,
-                        'User ID': member.id,
-                        'Score': score_info.get('score', 0),
-                        'Messages': score_info.get('messages', 0),
-                        'Days': score_info.get('days', 0),
-                        'Joined Server': member.joined_at.isoformat() if member.joined_at else 'N/A'
-                    })
-
-                df = pd.DataFrame(csv_data)
-
-                # Save CSV
+                # Save CSV (rows are written as they are built)
                 output_dir = Path("output")
                 output_dir.mkdir(exist_ok=True)
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 csv_path = output_dir / f"guild_members_{timestamp}.csv"
-                df.to_csv(csv_path, index=False)
+                with open(csv_path, "w", encoding="utf-8", newline="") as handle:
+                    writer = csv.writer(handle)
+                    writer.writerow(['Rank', 'Username', 'User ID', 'Score', 'Messages', 'Days', 'Joined Server'])
+                    for member in sorted_members:
+                        score_info = member_scores.get(member.id, {})
+                        writer.writerow([
+                            score_info.get('rank', '?'),
+                            member.name,
+                            member.id,
+                            score_info.get('score', 0),
+                            score_info.get('messages', 0),
+                            score_info.get('days', 0),
+                            member.joined_at.isoformat() if member.joined_at else 'N/A'
+                        ])
                 logger.info(f"Exported guild members to {csv_path}")
 
             # Send response
@@ -1,5 +1,6 @@
 """My-Score command for users to check their own ranking."""
 
+import asyncio
 import logging
 import discord
 from discord import app_commands
@@ -8,7 +9,6 @@ from typing import Optional
 
 from ..analytics import RoleScanner, ActivityTracker, Scorer, Ranker
 from ..utils import Config
-from ..utils.rank_card_generator import RankCardGenerator
 from ..database import MessageCache
 
 
@@ -30,6 +30,33 @@ class MyScoreCommand(commands.Cog):
         self.bot = bot
         self.config = config
         self.cache = cache
+        self._card_generator = None
+        self._warm_up_task: Optional[asyncio.Task] = None
+
+    @property
+    def card_generator(self):
+        """Rank card generator, created (and Pillow imported) on first use."""
+        if self._card_generator is None:
+            from ..utils.rank_card_generator import RankCardGenerator
+            self._card_generator = RankCardGenerator()
+        return self._card_generator
+
+    async def cog_load(self):
+        """Start the rank card workers in the background once the bot is ready."""
+        self._warm_up_task = asyncio.create_task(self._warm_up_card_generator())
+
+    def cog_unload(self):
+        """Stop a warm-up that is still running."""
+        if self._warm_up_task is not None and not self._warm_up_task.done():
+            self._warm_up_task.cancel()
+
+    async def _warm_up_card_generator(self):
+        await self.bot.wait_until_ready()
+        try:
+            await self.card_generator.warm_up()
+        except Exception as e:
+            # Cards still render; the first one just pays the startup cost
+            logger.warning(f"Rank card warm-up failed: {e}", exc_info=True)
 
     @app_commands.command(
         name="my-score",
@@ -146,7 +173,6 @@ class MyScoreCommand(commands.Cog):
 
             # Generate visual rank card
             try:
-                card_gen = RankCardGenerator()
                 # Convert UserScore to dict for generator, but handle properties manually or just pass dict
                 score_data = {
                     'final_score': user_score.final_score,
@@ -155,7 +181,7 @@ class MyScoreCommand(commands.Cog):
                     'voice_score': user_score.voice_score
                 }
                 
-                card_buffer = await card_gen.generate_card(
+                card_buffer = await self.card_generator.generate_card(
                     user, 
                     score_data, 
                     user_rank, 
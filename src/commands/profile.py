@@ -4,20 +4,118 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import psutil
+import math
+from bisect import bisect_right
 import os
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Tuple
-from collections import defaultdict, deque
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from src.utils import Config
+from src.utils.metrics import MetricFamily, get_registry
+from src.utils.loop_monitor import get_loop_monitor
+from src.utils.managed_message import get_edit_stats
+from src.utils.startup_profiler import get_startup_profiler
+
+
+# Latency histogram layout (HDR-style): durations are bucketed by power of
+# two in microseconds, each power split into SUB_BUCKETS linear steps. That
+# keeps the relative error of a percentile below 1/(2*SUB_BUCKETS) with a
+# fixed number of counters per operation, from 1µs up to ~18 minutes.
+SUB_BUCKETS = 8
+MIN_EXPONENT = 1  # 2^0 µs; faster records land in the first bucket
+MAX_EXPONENT = 30
+BUCKET_COUNT = (MAX_EXPONENT - MIN_EXPONENT + 1) * SUB_BUCKETS
+
+# Percentiles cover the last WINDOW_COUNT windows of WINDOW_SECONDS each
+WINDOW_SECONDS = 60
+WINDOW_COUNT = 15
+
+PERCENTILES = (0.5, 0.95, 0.99)
+
+
+def _bucket_value(index: int) -> float:
+    """Midpoint of a bucket in seconds."""
+    exponent, step = divmod(index, SUB_BUCKETS)
+    lower = (0.5 + step / (2 * SUB_BUCKETS)) * 2 ** (exponent + MIN_EXPONENT)
+    return (lower + 2 ** (exponent + MIN_EXPONENT) / (4 * SUB_BUCKETS)) / 1_000_000
+
+
+# Upper bounds (seconds) of all but the last bucket; a bisect on this list
+# is a single C call, cheaper than computing the bucket arithmetically
+_BUCKET_UPPER_BOUNDS = [
+    _bucket_value(index) + 2 ** (index // SUB_BUCKETS + MIN_EXPONENT) / (4 * SUB_BUCKETS) / 1_000_000
+    for index in range(BUCKET_COUNT - 1)
+]
+
+
+def _bucket_index(duration: float) -> int:
+    """Histogram bucket of a duration in seconds (clamped to the first/last bucket)."""
+    return bisect_right(_BUCKET_UPPER_BOUNDS, duration)
+
+
+class OperationStats:
+    """Aggregates and rolling latency histogram of one operation."""
+
+    __slots__ = ("count", "errors", "total", "min", "max", "windows", "window_ids")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        # Ring of per-window bucket counts; window_ids says which window a slot holds
+        self.windows: List[Optional[List[int]]] = [None] * WINDOW_COUNT
+        self.window_ids = [-1] * WINDOW_COUNT
+
+    def merged_counts(self, window_id: int) -> List[int]:
+        """Bucket counts of all windows still inside the rolling period."""
+        merged = [0] * BUCKET_COUNT
+        for counts, slot_window in zip(self.windows, self.window_ids):
+            if counts is not None and window_id - slot_window < WINDOW_COUNT:
+                for index, count in enumerate(counts):
+                    if count:
+                        merged[index] += count
+        return merged
+
+    def percentiles(self, window_id: int, quantiles: Sequence[float] = PERCENTILES) -> Tuple[int, Dict[float, float]]:
+        """
+        Latency percentiles over the rolling period.
+
+        Returns:
+            Tuple of (samples in the period, {quantile: seconds})
+        """
+        counts = self.merged_counts(window_id)
+        samples = sum(counts)
+        if not samples:
+            return 0, {q: 0.0 for q in quantiles}
+
+        results = {}
+        targets = sorted((max(1, math.ceil(q * samples)), q) for q in quantiles)
+        cumulative = 0
+        target_pos = 0
+        for index, count in enumerate(counts):
+            if not count:
+                continue
+            cumulative += count
+            while target_pos < len(targets) and cumulative >= targets[target_pos][0]:
+                results[targets[target_pos][1]] = min(_bucket_value(index), self.max)
+                target_pos += 1
+            if target_pos == len(targets):
+                break
+        return samples, results
 
 
 class PerformanceTracker:
     """
     Tracks performance metrics for bot operations.
 
+    Each operation keeps running aggregates plus a fixed-size latency
+    histogram per time window, so memory doesn't grow with the call rate
+    and recording stays a handful of integer operations.
+
     Singleton pattern to ensure single instance across all cogs.
     """
 
@@ -33,14 +131,8 @@ class PerformanceTracker:
         if self._initialized:
             return
 
-        # Track execution times: {operation_name: deque([duration, ...])}
-        self.execution_times: Dict[str, deque] = defaultdict(lambda: deque(maxlen=100))
-
-        # Track call counts
-        self.call_counts: Dict[str, int] = defaultdict(int)
-
-        # Track errors
-        self.error_counts: Dict[str, int] = defaultdict(int)
+        # {operation_name: OperationStats}
+        self.operations: Dict[str, OperationStats] = {}
 
         # Track start time
         self.tracker_start = datetime.utcnow()
@@ -56,42 +148,71 @@ class PerformanceTracker:
             duration: Execution time in seconds
             error: Whether the operation errored
         """
-        self.execution_times[operation].append(duration)
-        self.call_counts[operation] += 1
-
+        # Hot path: kept inline, a method call per record costs more than the work
+        stats = self.operations.get(operation)
+        if stats is None:
+            stats = self.operations[operation] = OperationStats()
+
+        stats.count += 1
+        stats.total += duration
+        if duration < stats.min:
+            stats.min = duration
+        if duration > stats.max:
+            stats.max = duration
         if error:
-            self.error_counts[operation] += 1
+            stats.errors += 1
+
+        window_id = int(time.monotonic() // WINDOW_SECONDS)
+        slot = window_id % WINDOW_COUNT
+        counts = stats.windows[slot]
+        if counts is None or stats.window_ids[slot] != window_id:
+            counts = stats.windows[slot] = [0] * BUCKET_COUNT
+            stats.window_ids[slot] = window_id
+        counts[bisect_right(_BUCKET_UPPER_BOUNDS, duration)] += 1
+
+    @property
+    def call_counts(self) -> Dict[str, int]:
+        return {name: stats.count for name, stats in self.operations.items()}
+
+    @property
+    def error_counts(self) -> Dict[str, int]:
+        return {name: stats.errors for name, stats in self.operations.items()}
 
     def get_stats(self, operation: str) -> Dict:
-        """Get statistics for a specific operation."""
-        times = list(self.execution_times.get(operation, []))
+        """Get statistics for a specific operation (percentiles over the rolling period)."""
+        stats = self.operations.get(operation)
 
-        if not times:
+        if stats is None or not stats.count:
             return {
                 'count': 0,
                 'avg': 0,
                 'min': 0,
                 'max': 0,
                 'total': 0,
-                'errors': 0
+                'errors': 0,
+                'recent_count': 0,
+                'p50': 0,
+                'p95': 0,
+                'p99': 0
             }
 
+        recent_count, percentiles = stats.percentiles(int(time.monotonic() // WINDOW_SECONDS))
         return {
-            'count': len(times),
-            'avg': sum(times) / len(times),
-            'min': min(times),
-            'max': max(times),
-            'total': sum(times),
-            'errors': self.error_counts.get(operation, 0)
+            'count': stats.count,
+            'avg': stats.total / stats.count,
+            'min': stats.min,
+            'max': stats.max,
+            'total': stats.total,
+            'errors': stats.errors,
+            'recent_count': recent_count,
+            'p50': percentiles[0.5],
+            'p95': percentiles[0.95],
+            'p99': percentiles[0.99]
         }
 
     def get_all_operations(self) -> List[Tuple[str, Dict]]:
         """Get all tracked operations sorted by total time."""
-        operations = []
-
-        for op_name in self.execution_times.keys():
-            stats = self.get_stats(op_name)
-            operations.append((op_name, stats))
+        operations = [(op_name, self.get_stats(op_name)) for op_name in list(self.operations)]
 
         # Sort by total time descending
         operations.sort(key=lambda x: x[1]['total'], reverse=True)
@@ -99,16 +220,14 @@ class PerformanceTracker:
         return operations
 
     def get_slowest_operations(self, limit: int = 5) -> List[Tuple[str, Dict]]:
-        """Get the slowest operations by average execution time."""
-        operations = []
+        """Get the slowest operations by tail latency (p95 of the rolling period)."""
+        operations = [
+            (op_name, stats) for op_name, stats in self.get_all_operations()
+            if stats['count'] > 0
+        ]
 
-        for op_name in self.execution_times.keys():
-            stats = self.get_stats(op_name)
-            if stats['count'] > 0:
-                operations.append((op_name, stats))
-
-        # Sort by average time descending
-        operations.sort(key=lambda x: x[1]['avg'], reverse=True)
+        # Operations without recent calls fall back to their all-time average
+        operations.sort(key=lambda x: x[1]['p95'] if x[1]['recent_count'] else x[1]['avg'], reverse=True)
 
         return operations[:limit]
 
@@ -121,16 +240,30 @@ class PerformanceTracker:
         )
         return sorted_ops[:limit]
 
+    def collect_metrics(self) -> List[MetricFamily]:
+        """Export call counts and tail latencies for the /metrics endpoint."""
+        calls = MetricFamily("guildscout_operation_calls_total", "counter", "Tracked operation calls by result")
+        latency = MetricFamily(
+            "guildscout_operation_latency_seconds", "gauge",
+            f"Operation latency percentiles over the last {WINDOW_COUNT * WINDOW_SECONDS // 60} minutes"
+        )
+        for op_name, stats in self.get_all_operations():
+            calls.add(stats['count'] - stats['errors'], operation=op_name, result="ok")
+            calls.add(stats['errors'], operation=op_name, result="error")
+            if stats['recent_count']:
+                for quantile in PERCENTILES:
+                    latency.add(stats[f"p{int(quantile * 100)}"], operation=op_name, quantile=quantile)
+        return [calls, latency]
+
     def reset(self):
         """Reset all tracking data."""
-        self.execution_times.clear()
-        self.call_counts.clear()
-        self.error_counts.clear()
+        self.operations.clear()
         self.tracker_start = datetime.utcnow()
 
 
 # Global tracker instance
 _tracker = PerformanceTracker()
+get_registry().add_collector(_tracker.collect_metrics)
 
 
 def get_tracker() -> PerformanceTracker:
@@ -184,32 +317,68 @@ class ProfileCommand(commands.Cog):
         uptime = datetime.utcnow() - self.tracker.tracker_start
         total_ops = sum(self.tracker.call_counts.values())
         total_errors = sum(self.tracker.error_counts.values())
+        edit_stats = get_edit_stats()
 
         embed.add_field(
             name="📈 Tracking Info",
             value=(
                 f"**Uptime:** {self._format_timedelta(uptime)}\n"
                 f"**Operationen:** {total_ops:,}\n"
-                f"**Fehler:** {total_errors}"
+                f"**Fehler:** {total_errors}\n"
+                f"**Edits gespart:** {edit_stats['skipped']:,} / {edit_stats['edits'] + edit_stats['skipped']:,}"
             ),
             inline=True
         )
 
+        # Startup timeline
+        startup = get_startup_profiler()
+        if startup.finished:
+            startup_lines = startup.format_timeline(stage_limit=5, import_limit=5)
+            embed.add_field(
+                name="🚀 Start-Zeitleiste",
+                value="```\n" + "\n".join(startup_lines)[:1000] + "\n```",
+                inline=False
+            )
+
+        # Event loop responsiveness and the code blocking it
+        loop_monitor = get_loop_monitor()
+        lag = loop_monitor.get_lag_stats()
+        if lag['samples']:
+            loop_lines = [
+                f"**Lag:** p50 {lag['p50']*1000:.1f}ms | p99 {lag['p99']*1000:.1f}ms | "
+                f"Max {lag['max']*1000:.0f}ms",
+                f"**Blockaden:** {lag['stalls']} (> {loop_monitor.threshold*1000:.0f}ms)"
+            ]
+            loop_lines.extend(loop_monitor.format_offenders(limit=3))
+            embed.add_field(
+                name="🧵 Event-Loop",
+                value="\n".join(loop_lines)[:1024],
+                inline=False
+            )
+
         # Slowest Operations (by avg time)
         if slowest:
             slowest_text = []
             for op_name, stats in slowest:
                 # Shorten operation name if too long
                 display_name = op_name if len(op_name) <= 30 else op_name[:27] + "..."
+                if stats['recent_count']:
+                    latency = (
+                        f"⏱️ p50 {stats['p50']*1000:.1f}ms | "
+                        f"p95 {stats['p95']*1000:.1f}ms | "
+                        f"p99 {stats['p99']*1000:.1f}ms"
+                    )
+                else:
+                    latency = f"⏱️ Ø {stats['avg']*1000:.1f}ms"
                 slowest_text.append(
                     f"**{display_name}**\n"
-                    f"⏱️ Ø {stats['avg']*1000:.1f}ms | "
+                    f"{latency} | "
                     f"Max {stats['max']*1000:.1f}ms | "
                     f"Calls {stats['count']}"
                 )
 
             embed.add_field(
-                name="🐌 Langsamste Operationen (Durchschnitt)",
+                name=f"🐌 Langsamste Operationen (p95, letzte {WINDOW_COUNT * WINDOW_SECONDS // 60} Min.)",
                 value="\n\n".join(slowest_text[:5]),
                 inline=False
             )
@@ -281,6 +450,11 @@ class ProfileCommand(commands.Cog):
                 bottlenecks.append(
                     f"🐌 **{op_name}**: Sehr langsam (Ø {stats['avg']:.1f}s)"
                 )
+            elif stats['recent_count'] and stats['p99'] > 1.0:
+                # Fast on average, but the tail blocks users
+                bottlenecks.append(
+                    f"🐢 **{op_name}**: Langsame Ausreißer (p99 {stats['p99']:.1f}s, Ø {stats['avg']*1000:.0f}ms)"
+                )
 
         if not bottlenecks:
             bottlenecks.append("✅ Keine kritischen Engpässe erkannt")
@@ -12,9 +12,14 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
-from src.database.raid_store import RaidStore
+from src.database.bot_message_store import (
+    PURPOSE_RAID_REMINDER,
+    PURPOSE_RAID_SLOT_PING,
+)
+from src.database.raid_store import RaidRecord, RaidStore
 from src.database.raid_template_store import RaidTemplateStore, DEFAULT_TEMPLATE_SPECS
 from src.events.raid_events import BenchPreferenceView
+from src.utils.bot_messages import delete_message_ids, track_message
 from src.utils.config import Config
 from src.utils.raid_utils import (
     GAME_LABELS,
@@ -34,6 +39,7 @@ from src.utils.raid_utils import (
     get_role_limit,
     get_notice_delete_after,
     parse_raid_datetime,
+    purge_raid_notices,
 )
 
 
@@ -1233,22 +1239,9 @@ class RaidSlotEditView(discord.ui.View):
     async def _cleanup_slot_pings(
         self,
         channel: discord.TextChannel,
-        raid_title: str,
-        limit: int = 50,
+        raid: RaidRecord,
     ) -> None:
-        title_key = (raid_title or "").lower()
-        async for message in channel.history(limit=limit):
-            if not message.author or not message.author.bot:
-                continue
-            content = (message.content or "").lower()
-            if "open slots" not in content and "slots frei" not in content:
-                continue
-            if title_key and title_key not in content:
-                continue
-            try:
-                await message.delete()
-            except Exception:
-                pass
+        await purge_raid_notices(channel, raid, PURPOSE_RAID_SLOT_PING)
 
     async def _promote_from_bench(
         self,
@@ -1319,7 +1312,7 @@ class RaidSlotEditView(discord.ui.View):
         total_open = open_tanks + open_healers + open_dps
         if total_open <= 0:
             if message and isinstance(message.channel, discord.TextChannel):
-                await self._cleanup_slot_pings(message.channel, raid.title)
+                await self._cleanup_slot_pings(message.channel, raid)
             return
 
         cooldown = self.config.raid_open_slot_ping_minutes * 60
@@ -1346,11 +1339,12 @@ class RaidSlotEditView(discord.ui.View):
         try:
             if message:
                 if isinstance(message.channel, discord.TextChannel):
-                    await self._cleanup_slot_pings(message.channel, raid.title)
+                    await self._cleanup_slot_pings(message.channel, raid)
                 if delete_after:
-                    await message.channel.send(content, delete_after=delete_after)
+                    ping = await message.channel.send(content, delete_after=delete_after)
                 else:
-                    await message.channel.send(content)
+                    ping = await message.channel.send(content)
+                await track_message(ping, PURPOSE_RAID_SLOT_PING, raid.id)
                 await self.raid_store.mark_alert_sent(raid.id, "open_slots")
         except Exception:
             logger.warning("Failed to send open slot ping", exc_info=True)
@@ -2102,42 +2096,16 @@ class RaidManageView(discord.ui.View):
     async def _cleanup_reminder_messages(
         self,
         channel: discord.TextChannel,
-        raid_title: str,
-        limit: int = 50,
+        raid: RaidRecord,
     ) -> None:
-        title_key = (raid_title or "").lower()
-        async for message in channel.history(limit=limit):
-            if not message.author or not message.author.bot:
-                continue
-            content = (message.content or "").lower()
-            if "reminder" not in content and "erinnerung" not in content:
-                continue
-            if title_key and title_key not in content:
-                continue
-            try:
-                await message.delete()
-            except Exception:
-                pass
+        await purge_raid_notices(channel, raid, PURPOSE_RAID_REMINDER)
 
     async def _cleanup_slot_pings(
         self,
         channel: discord.TextChannel,
-        raid_title: str,
-        limit: int = 50,
+        raid: RaidRecord,
     ) -> None:
-        title_key = (raid_title or "").lower()
-        async for message in channel.history(limit=limit):
-            if not message.author or not message.author.bot:
-                continue
-            content = (message.content or "").lower()
-            if "open slots" not in content and "slots frei" not in content:
-                continue
-            if title_key and title_key not in content:
-                continue
-            try:
-                await message.delete()
-            except Exception:
-                pass
+        await purge_raid_notices(channel, raid, PURPOSE_RAID_SLOT_PING)
 
     async def _cleanup_confirmation_message(
         self,
@@ -2147,15 +2115,7 @@ class RaidManageView(discord.ui.View):
         message_id = await self.raid_store.get_confirmation_message_id(raid_id)
         if not message_id:
             return
-        try:
-            message = await channel.fetch_message(message_id)
-        except Exception:
-            await self.raid_store.clear_confirmation_message(raid_id)
-            return
-        try:
-            await message.delete()
-        except Exception:
-            pass
+        await delete_message_ids(channel, [message_id])
         await self.raid_store.clear_confirmation_message(raid_id)
 
     async def _send_raid_log(
@@ -2536,8 +2496,8 @@ class RaidManageView(discord.ui.View):
                     except Exception:
                         pass
         if isinstance(channel, discord.TextChannel):
-            await self._cleanup_reminder_messages(channel, raid.title)
-            await self._cleanup_slot_pings(channel, raid.title)
+            await self._cleanup_reminder_messages(channel, raid)
+            await self._cleanup_slot_pings(channel, raid)
             await self._cleanup_confirmation_message(channel, raid.id)
         await self._remove_participant_roles(interaction, raid.id)
         await self._refresh_history_embed(interaction)
@@ -2607,8 +2567,8 @@ class RaidManageView(discord.ui.View):
                     except Exception:
                         pass
         if isinstance(channel, discord.TextChannel):
-            await self._cleanup_reminder_messages(channel, raid.title)
-            await self._cleanup_slot_pings(channel, raid.title)
+            await self._cleanup_reminder_messages(channel, raid)
+            await self._cleanup_slot_pings(channel, raid)
             await self._cleanup_confirmation_message(channel, raid.id)
         await self._remove_participant_roles(interaction, raid.id)
         await self._refresh_history_embed(interaction)
@@ -101,6 +101,10 @@ class StatusCommand(commands.Cog):
                 f"**Current:** {rate_stats['requests_per_second']} req/s\n"
                 f"**Limit Hits:** {rate_stats['total_rate_limit_hits']}\n"
                 f"**Status:** {rate_stats['status']}"
+                + "".join(
+                    f"\n`{c['name']}` {c['requests_per_second']:.1f}/s ({c['total']:,})"
+                    for c in rate_monitor.get_top_consumers(limit=3)
+                )
             ),
             inline=True
         )
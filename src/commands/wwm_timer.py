@@ -7,8 +7,10 @@ from discord import app_commands
 from discord.ext import commands, tasks
 from datetime import datetime, timezone
 import logging
+from typing import Optional
 
 from src.utils.config import Config
+from src.utils.managed_message import ManagedMessage
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +26,7 @@ class WWMTimerCommand(commands.Cog):
         self.config = config
         self.timer_channel_id = None
         self.timer_message_id = None
+        self._timer_message: Optional[ManagedMessage] = None
         # Start auto-setup task
         self.bot.loop.create_task(self._auto_setup_timer())
         # Start update loop
@@ -395,16 +398,16 @@ class WWMTimerCommand(commands.Cog):
                 logger.warning("WWM timer channel not found")
                 return
 
-            message = await channel.fetch_message(self.timer_message_id)
-            if not message:
-                logger.warning("WWM timer message not found")
-                return
+            # Reuse the handle instead of fetching the message every 10 seconds
+            if self._timer_message is None or self._timer_message.id != self.timer_message_id:
+                self._timer_message = ManagedMessage.from_id(
+                    channel, self.timer_message_id, name="wwm_timer"
+                )
 
-            # Update the embed
+            # Update the embed (skipped if nothing visible changed, e.g. after release)
             embed = self._create_countdown_embed()
-            await message.edit(embed=embed)
-
-            logger.debug("Updated WWM countdown timer")
+            if await self._timer_message.edit(embed=embed):
+                logger.debug("Updated WWM countdown timer")
 
         except discord.NotFound:
             logger.warning("WWM timer message was deleted")
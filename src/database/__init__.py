@@ -1,7 +1,8 @@
 """Database modules for GuildScout Bot."""
 
+from .bot_message_store import BotMessageStore
 from .cache import MessageCache
 from .raid_store import RaidStore
 from .raid_template_store import RaidTemplateStore
 
-__all__ = ["MessageCache", "RaidStore", "RaidTemplateStore"]
+__all__ = ["BotMessageStore", "MessageCache", "RaidStore", "RaidTemplateStore"]
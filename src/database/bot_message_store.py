@@ -0,0 +1,251 @@
+"""SQLite registry of messages the bot posted, indexed by purpose."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import aiosqlite
+
+from src.database.migrations import Migration, MigrationRunner
+
+
+logger = logging.getLogger("guildscout.bot_message_store")
+
+# Purposes of tracked messages
+PURPOSE_DASHBOARD = "dashboard"
+PURPOSE_STATUS = "status"
+PURPOSE_RAID_REMINDER = "raid_reminder"
+PURPOSE_RAID_SLOT_PING = "raid_slot_ping"
+
+
+async def _record_tracking_start(db: aiosqlite.Connection) -> None:
+    """Remember when tracking started; older messages need a one-time scan."""
+    await db.execute(
+        "INSERT OR IGNORE INTO registry_meta (key, value) VALUES ('tracking_since', ?)",
+        (int(datetime.now(timezone.utc).timestamp()),),
+    )
+
+
+MIGRATIONS = [
+    Migration(1, "initial schema", (
+        """
+        CREATE TABLE IF NOT EXISTS bot_messages (
+            message_id INTEGER PRIMARY KEY,
+            guild_id INTEGER NOT NULL,
+            channel_id INTEGER NOT NULL,
+            purpose TEXT NOT NULL,
+            ref_key TEXT NOT NULL DEFAULT '',
+            created_at INTEGER NOT NULL
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_bot_messages_purpose
+        ON bot_messages(purpose, ref_key)
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_bot_messages_channel
+        ON bot_messages(channel_id, purpose)
+        """,
+    )),
+    Migration(2, "legacy message scans", (
+        """
+        CREATE TABLE IF NOT EXISTS registry_meta (
+            key TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS legacy_scans (
+            channel_id INTEGER NOT NULL,
+            scope TEXT NOT NULL,
+            scanned_at INTEGER NOT NULL,
+            PRIMARY KEY (channel_id, scope)
+        )
+        """,
+    ), apply=_record_tracking_start),
+]
+
+
+@dataclass(frozen=True)
+class TrackedMessage:
+    """A bot message recorded in the registry."""
+
+    message_id: int
+    guild_id: int
+    channel_id: int
+    purpose: str
+    ref_key: str
+    created_at: int
+
+
+class BotMessageStore:
+    """Registry of bot-posted message IDs.
+
+    Cleanup code looks its targets up here by purpose and reference
+    (raid ID, status kind, ...) instead of scanning channel history, so it
+    finds every message regardless of how far back it is.
+    """
+
+    def __init__(self, db_path: str = "data/bot_messages.db"):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._initialized = False
+        self._tracking_since: Optional[int] = None
+
+    async def initialize(self) -> None:
+        """Ensure the database schema exists."""
+        if self._initialized:
+            return
+
+        await MigrationRunner(self.db_path, "bot_messages", MIGRATIONS, journal_mode="WAL").run()
+
+        self._initialized = True
+
+    @staticmethod
+    def _row_to_record(row) -> TrackedMessage:
+        return TrackedMessage(
+            message_id=int(row[0]),
+            guild_id=int(row[1]),
+            channel_id=int(row[2]),
+            purpose=row[3],
+            ref_key=row[4],
+            created_at=int(row[5]),
+        )
+
+    async def register(
+        self,
+        guild_id: int,
+        channel_id: int,
+        message_id: int,
+        purpose: str,
+        ref_key: str = "",
+        created_at: Optional[int] = None,
+    ) -> None:
+        """
+        Record a message the bot posted.
+
+        Args:
+            guild_id: Discord guild ID
+            channel_id: Channel the message was posted in
+            message_id: Discord message ID
+            purpose: One of the PURPOSE_* constants
+            ref_key: What the message belongs to (raid ID, status kind, ...)
+            created_at: Unix timestamp (defaults to now)
+        """
+        await self.initialize()
+        if created_at is None:
+            created_at = int(datetime.now(timezone.utc).timestamp())
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute(
+                """
+                INSERT OR REPLACE INTO bot_messages
+                    (message_id, guild_id, channel_id, purpose, ref_key, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (message_id, guild_id, channel_id, purpose, str(ref_key), created_at),
+            )
+            await db.commit()
+
+    async def list_messages(
+        self,
+        purpose: str,
+        ref_key: Optional[str] = None,
+        *,
+        channel_id: Optional[int] = None,
+        created_before: Optional[int] = None,
+    ) -> List[TrackedMessage]:
+        """
+        Return tracked messages for a purpose, oldest first.
+
+        Args:
+            purpose: One of the PURPOSE_* constants
+            ref_key: Only messages with this reference (None for all)
+            channel_id: Only messages in this channel
+            created_before: Only messages registered before this Unix timestamp
+
+        Returns:
+            List of TrackedMessage records
+        """
+        await self.initialize()
+        query = """
+            SELECT message_id, guild_id, channel_id, purpose, ref_key, created_at
+            FROM bot_messages
+            WHERE purpose = ?
+        """
+        params: list = [purpose]
+        if ref_key is not None:
+            query += " AND ref_key = ?"
+            params.append(str(ref_key))
+        if channel_id is not None:
+            query += " AND channel_id = ?"
+            params.append(channel_id)
+        if created_before is not None:
+            query += " AND created_at < ?"
+            params.append(created_before)
+        query += " ORDER BY message_id"
+
+        async with aiosqlite.connect(self.db_path) as db:
+            cursor = await db.execute(query, tuple(params))
+            rows = await cursor.fetchall()
+            return [self._row_to_record(row) for row in rows]
+
+    async def forget(self, message_ids: Iterable[int]) -> None:
+        """Remove messages from the registry (deleted or no longer managed)."""
+        message_ids = list(message_ids)
+        if not message_ids:
+            return
+        await self.initialize()
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.executemany(
+                "DELETE FROM bot_messages WHERE message_id = ?",
+                [(message_id,) for message_id in message_ids],
+            )
+            await db.commit()
+
+
+    async def get_tracking_since(self) -> int:
+        """Unix timestamp from which posted messages are in the registry."""
+        if self._tracking_since is None:
+            await self.initialize()
+            async with aiosqlite.connect(self.db_path) as db:
+                cursor = await db.execute(
+                    "SELECT value FROM registry_meta WHERE key = 'tracking_since'"
+                )
+                row = await cursor.fetchone()
+            self._tracking_since = int(row[0])
+        return self._tracking_since
+
+    async def is_scanned(self, channel_id: int, scope: str) -> bool:
+        """Whether the one-time legacy scan of a channel already ran."""
+        await self.initialize()
+        async with aiosqlite.connect(self.db_path) as db:
+            cursor = await db.execute(
+                "SELECT 1 FROM legacy_scans WHERE channel_id = ? AND scope = ?",
+                (channel_id, scope),
+            )
+            return await cursor.fetchone() is not None
+
+    async def mark_scanned(self, channel_id: int, scope: str) -> None:
+        """Record that the legacy scan of a channel is done."""
+        await self.initialize()
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute(
+                "INSERT OR REPLACE INTO legacy_scans (channel_id, scope, scanned_at) VALUES (?, ?, ?)",
+                (channel_id, scope, int(datetime.now(timezone.utc).timestamp())),
+            )
+            await db.commit()
+
+
+_bot_message_store: Optional[BotMessageStore] = None
+
+
+def get_bot_message_store() -> BotMessageStore:
+    """Get the process-wide bot message registry."""
+    global _bot_message_store
+    if _bot_message_store is None:
+        _bot_message_store = BotMessageStore()
+    return _bot_message_store
@@ -1,153 +1,525 @@
 """SQLite caching system for message counts."""
 
 import aiosqlite
+import asyncio
+import hashlib
 import logging
+import time
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 import json
 
+from src.database.migrations import Migration, MigrationRunner
+from src.utils.metrics import SIZE_BUCKETS, get_registry
+
 
 logger = logging.getLogger("guildscout.cache")
 
+_flush_batch_size = get_registry().histogram(
+    "guildscout_flush_batch_size",
+    "Items written per batched flush",
+    ("source",),
+    buckets=SIZE_BUCKETS
+)
+
+
+MIGRATIONS = [
+    Migration(1, "initial schema", (
+        # Create message counts table
+        """
+        CREATE TABLE IF NOT EXISTS message_counts (
+            guild_id INTEGER NOT NULL,
+            user_id INTEGER NOT NULL,
+            message_count INTEGER NOT NULL,
+            last_updated TEXT NOT NULL,
+            days_lookback INTEGER,
+            excluded_channels TEXT,
+            PRIMARY KEY (guild_id, user_id, days_lookback, excluded_channels)
+        )
+        """,
+        # Create index for faster lookups
+        """
+        CREATE INDEX IF NOT EXISTS idx_guild_user
+        ON message_counts(guild_id, user_id)
+        """,
+        # Create metadata table
+        """
+        CREATE TABLE IF NOT EXISTS cache_metadata (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        )
+        """,
+    )),
+    # Entries are keyed by an exclusion-set hash now, and "all time" is stored
+    # as -1 (NULL in a primary key allowed duplicate rows). It's a cache, so
+    # the old entries are simply dropped.
+    Migration(2, "exclusion key", (
+        "DROP TABLE IF EXISTS message_counts",
+        """
+        CREATE TABLE message_counts (
+            guild_id INTEGER NOT NULL,
+            user_id INTEGER NOT NULL,
+            days_lookback INTEGER NOT NULL,
+            exclusion_key TEXT NOT NULL,
+            message_count INTEGER NOT NULL,
+            last_updated TEXT NOT NULL,
+            PRIMARY KEY (guild_id, user_id, days_lookback, exclusion_key)
+        )
+        """,
+    )),
+]
+
+# days_lookback value stored for "all time"
+ALL_TIME = -1
+
+# Default number of entries kept in memory in front of SQLite
+DEFAULT_MEMORY_ENTRIES = 50_000
+
+# Seconds live deltas are collected before they are written to SQLite
+DELTA_FLUSH_DELAY = 5.0
+
+MemoryKey = Tuple[int, int, int, str]
+
+
+def exclusion_key(excluded_channels: Optional[Iterable[int]]) -> str:
+    """
+    Hash a set of excluded channel IDs into a short cache key.
+
+    Compute it once per batch and pass it to get_many/set_many instead of
+    re-encoding the channel list for every user.
+
+    Args:
+        excluded_channels: Excluded channel IDs (order doesn't matter)
+
+    Returns:
+        Hex digest identifying the exclusion set
+    """
+    ids = sorted({int(channel_id) for channel_id in (excluded_channels or [])})
+    return hashlib.sha1(json.dumps(ids).encode()).hexdigest()[:16]
+
 
 class MessageCache:
-    """SQLite-based cache for user message counts."""
+    """SQLite-based cache for user message counts.
+
+    A bounded in-memory LRU sits in front of SQLite. Lookups and writes for
+    many users go through ``get_many`` / ``set_many``, which use one query
+    (or one executemany) per batch.
 
-    def __init__(self, db_path: str = "data/cache.db", ttl: Optional[int] = None):
+    Subscribed to MessageStore deltas (``apply_delta``), cached counts are
+    patched in place when a tracked message is added or deleted, or dropped
+    when the change can't be applied exactly. Memory entries change at once;
+    SQLite rows are updated in batches.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "data/cache.db",
+        ttl: Optional[int] = None,
+        max_memory_entries: int = DEFAULT_MEMORY_ENTRIES
+    ):
         """
         Initialize the message cache.
 
         Args:
             db_path: Path to SQLite database file
             ttl: Cache time-to-live in seconds (None = never expires)
+            max_memory_entries: Size of the in-memory LRU (0 disables it)
         """
         self.db_path = Path(db_path)
         self.ttl = ttl
+        self.max_memory_entries = max_memory_entries
 
         # Create data directory if it doesn't exist
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         self._initialized = False
 
+        # (guild_id, user_id, days_lookback, exclusion_key) -> (count, updated_at epoch),
+        # least recently used first
+        self._memory: "OrderedDict[MemoryKey, Tuple[int, float]]" = OrderedDict()
+        self._last_sweep = 0.0
+        self.memory_stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+        # Cached (days_lookback, exclusion_key) combinations and the channel
+        # sets behind the keys - needed to tell which entries a delta affects
+        self._variants: Set[Tuple[int, str]] = set()
+        self._exclusion_sets: Dict[str, FrozenSet[int]] = {}
+        # (guild_id, user_id, channel_id, delta, message_date) not yet in SQLite
+        self._pending_deltas: List[tuple] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self.delta_stats = {"patched": 0, "dropped": 0}
+
     async def initialize(self):
         """Initialize the database schema."""
         if self._initialized:
             return
 
-        async with aiosqlite.connect(self.db_path) as db:
-            # Create message counts table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS message_counts (
-                    guild_id INTEGER NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    message_count INTEGER NOT NULL,
-                    last_updated TEXT NOT NULL,
-                    days_lookback INTEGER,
-                    excluded_channels TEXT,
-                    PRIMARY KEY (guild_id, user_id, days_lookback, excluded_channels)
-                )
-            """)
-
-            # Create index for faster lookups
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_guild_user
-                ON message_counts(guild_id, user_id)
-            """)
-
-            # Create metadata table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS cache_metadata (
-                    key TEXT PRIMARY KEY,
-                    value TEXT NOT NULL
-                )
-            """)
+        await MigrationRunner(self.db_path, "cache", MIGRATIONS).run()
 
-            await db.commit()
+        async with aiosqlite.connect(self.db_path) as db:
+            cursor = await db.execute("SELECT DISTINCT days_lookback, exclusion_key FROM message_counts")
+            self._variants.update((row[0], row[1]) for row in await cursor.fetchall())
+            cursor = await db.execute(
+                "SELECT key, value FROM cache_metadata WHERE key LIKE 'exclusion:%'"
+            )
+            for key, value in await cursor.fetchall():
+                self._exclusion_sets[key.split(":", 1)[1]] = frozenset(json.loads(value))
 
         self._initialized = True
         logger.info(f"Cache initialized at {self.db_path}")
 
-    def _make_cache_key(
+    @property
+    def _expires(self) -> bool:
+        # If TTL is None or 0, cache never expires
+        return self.ttl is not None and self.ttl > 0
+
+    def _is_fresh(self, updated_at: float, now: float) -> bool:
+        return not self._expires or now - updated_at <= self.ttl
+
+    def _memory_get(self, key: MemoryKey, now: float) -> Optional[int]:
+        entry = self._memory.get(key)
+        if entry is None:
+            self.memory_stats["misses"] += 1
+            return None
+        count, updated_at = entry
+        if not self._is_fresh(updated_at, now):
+            del self._memory[key]
+            self.memory_stats["expirations"] += 1
+            self.memory_stats["misses"] += 1
+            return None
+        self._memory.move_to_end(key)
+        self.memory_stats["hits"] += 1
+        return count
+
+    def _memory_put(self, key: MemoryKey, count: int, updated_at: float) -> None:
+        if self.max_memory_entries <= 0:
+            return
+        self._memory[key] = (count, updated_at)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.max_memory_entries:
+            self._evict(time.time())
+
+    def _evict(self, now: float) -> None:
+        """Make room: drop expired entries first, then least recently used ones."""
+        # A full sweep is O(n), so do it at most once a minute
+        if self._expires and now - self._last_sweep >= 60:
+            self._last_sweep = now
+            expired = [
+                key for key, (_, updated_at) in self._memory.items()
+                if not self._is_fresh(updated_at, now)
+            ]
+            for key in expired:
+                del self._memory[key]
+            self.memory_stats["expirations"] += len(expired)
+
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self.memory_stats["evictions"] += 1
+
+    def _forget_memory(self, guild_id: Optional[int] = None, user_id: Optional[int] = None) -> None:
+        if guild_id is None:
+            self._memory.clear()
+            return
+        stale = [
+            key for key in self._memory
+            if key[0] == guild_id and (user_id is None or key[1] == user_id)
+        ]
+        for key in stale:
+            del self._memory[key]
+
+    async def get_many(
         self,
         guild_id: int,
-        user_id: int,
-        days_lookback: Optional[int],
-        excluded_channels: list
-    ) -> tuple:
+        user_ids: Iterable[int],
+        days_lookback: Optional[int] = None,
+        excluded_channels: Optional[list] = None,
+        *,
+        excl_key: Optional[str] = None
+    ) -> Dict[int, int]:
         """
-        Create a cache key from parameters.
+        Get cached message counts for several users.
 
         Args:
             guild_id: Discord guild ID
-            user_id: Discord user ID
+            user_ids: Discord user IDs
             days_lookback: Days to look back
             excluded_channels: List of excluded channel IDs
+            excl_key: Precomputed ``exclusion_key(excluded_channels)``
 
         Returns:
-            Tuple cache key
+            Dictionary mapping user_id to count for the users found (and not expired)
         """
-        # Sort excluded channels for consistent hashing
-        excluded_str = json.dumps(sorted(excluded_channels))
-        return (guild_id, user_id, days_lookback, excluded_str)
+        excl_key = excl_key or exclusion_key(excluded_channels)
+        days = ALL_TIME if days_lookback is None else days_lookback
+        now = time.time()
+
+        found: Dict[int, int] = {}
+        missing: List[int] = []
+        for user_id in user_ids:
+            count = self._memory_get((guild_id, user_id, days, excl_key), now)
+            if count is None:
+                missing.append(user_id)
+            else:
+                found[user_id] = count
 
-    async def get(
+        if not missing:
+            return found
+
+        await self.initialize()
+        await self.flush_deltas()
+
+        query = """
+            SELECT user_id, message_count, last_updated
+            FROM message_counts
+            WHERE guild_id = ?
+            AND days_lookback = ?
+            AND exclusion_key = ?
+            AND user_id IN (SELECT value FROM json_each(?))
+        """
+        params = [guild_id, days, excl_key, json.dumps(missing)]
+        if self._expires:
+            query += " AND last_updated >= ?"
+            params.append(datetime.fromtimestamp(now - self.ttl, timezone.utc).isoformat())
+
+        async with aiosqlite.connect(self.db_path) as db:
+            cursor = await db.execute(query, params)
+            rows = await cursor.fetchall()
+
+        for user_id, count, last_updated in rows:
+            found[user_id] = count
+            self._memory_put(
+                (guild_id, user_id, days, excl_key),
+                count,
+                datetime.fromisoformat(last_updated).timestamp()
+            )
+
+        logger.debug(
+            f"Cache lookup: {len(found)} hits ({len(rows)} from SQLite), "
+            f"{len(missing) - len(rows)} misses"
+        )
+        return found
+
+    async def set_many(
         self,
         guild_id: int,
-        user_id: int,
+        counts: Dict[int, int],
         days_lookback: Optional[int] = None,
-        excluded_channels: Optional[list] = None
-    ) -> Optional[int]:
+        excluded_channels: Optional[list] = None,
+        *,
+        excl_key: Optional[str] = None
+    ):
         """
-        Get cached message count for a user.
+        Cache message counts for several users in one transaction.
 
         Args:
             guild_id: Discord guild ID
-            user_id: Discord user ID
+            counts: Dictionary mapping user_id to message count
             days_lookback: Days to look back
             excluded_channels: List of excluded channel IDs
-
-        Returns:
-            Cached message count or None if not found/expired
+            excl_key: Precomputed ``exclusion_key(excluded_channels)``
         """
-        await self.initialize()
+        if not counts:
+            return
 
-        if excluded_channels is None:
-            excluded_channels = []
+        await self.initialize()
+        # Earlier deltas must not land on top of the fresh counts
+        await self.flush_deltas()
 
-        excluded_str = json.dumps(sorted(excluded_channels))
+        key_known = excl_key is None  # computed here, so the channel set is known
+        excl_key = excl_key or exclusion_key(excluded_channels)
+        days = ALL_TIME if days_lookback is None else days_lookback
+        now = datetime.now(timezone.utc)
+        now_str = now.isoformat()
 
         async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(
+            if excl_key not in self._exclusion_sets and (key_known or excluded_channels is not None):
+                self._exclusion_sets[excl_key] = frozenset(int(c) for c in (excluded_channels or []))
+                await db.execute(
+                    "INSERT OR REPLACE INTO cache_metadata (key, value) VALUES (?, ?)",
+                    (f"exclusion:{excl_key}", json.dumps(sorted(self._exclusion_sets[excl_key])))
+                )
+            await db.executemany(
                 """
-                SELECT message_count, last_updated
-                FROM message_counts
-                WHERE guild_id = ?
-                AND user_id = ?
-                AND (days_lookback = ? OR (days_lookback IS NULL AND ? IS NULL))
-                AND excluded_channels = ?
+                INSERT OR REPLACE INTO message_counts
+                (guild_id, user_id, days_lookback, exclusion_key, message_count, last_updated)
+                VALUES (?, ?, ?, ?, ?, ?)
                 """,
-                (guild_id, user_id, days_lookback, days_lookback, excluded_str)
+                [
+                    (guild_id, user_id, days, excl_key, count, now_str)
+                    for user_id, count in counts.items()
+                ]
             )
+            await db.commit()
+
+        self._variants.add((days, excl_key))
+        now_ts = now.timestamp()
+        for user_id, count in counts.items():
+            self._memory_put((guild_id, user_id, days, excl_key), count, now_ts)
 
-            row = await cursor.fetchone()
+        logger.debug(f"Cached message counts for {len(counts)} users")
 
-            if row is None:
-                logger.debug(f"Cache miss for user {user_id}")
-                return None
+    def _delta_action(
+        self,
+        days: int,
+        excl_key: str,
+        channel_id: Optional[int],
+        delta: Optional[int],
+        message_date: Optional[datetime],
+        now: datetime
+    ) -> str:
+        """Decide how a delta affects entries of one variant: "patch", "skip" or "drop"."""
+        excluded = self._exclusion_sets.get(excl_key)
+        if delta is None or channel_id is None or excluded is None:
+            return "drop"
+        if channel_id in excluded:
+            return "skip"
+        if days == ALL_TIME:
+            return "patch"
+        # Windowed counts: a message before the window doesn't change them;
+        # without a date the entry can't be kept exact
+        if message_date is None:
+            return "drop"
+        if message_date.tzinfo is None:
+            message_date = message_date.replace(tzinfo=timezone.utc)
+        return "patch" if message_date >= now - timedelta(days=days) else "skip"
+
+    def apply_delta(
+        self,
+        guild_id: int,
+        user_id: Optional[int],
+        channel_id: Optional[int],
+        delta: Optional[int],
+        message_date: Optional[datetime] = None
+    ):
+        """
+        Apply a MessageStore count change to the cached counts.
 
-            message_count, last_updated_str = row
-            last_updated = datetime.fromisoformat(last_updated_str)
+        Signature matches ``MessageStore.add_delta_listener``.
 
-            # Check if cache is expired (only if TTL is set)
-            # If TTL is None or 0, cache never expires
-            if self.ttl is not None and self.ttl > 0:
-                if datetime.now(timezone.utc) - last_updated > timedelta(seconds=self.ttl):
-                    logger.debug(f"Cache expired for user {user_id}")
-                    return None
+        Args:
+            guild_id: Discord guild ID
+            user_id: Discord user ID (None = whole guild changed)
+            channel_id: Channel of the change (None = all of the user's counts changed)
+            delta: Count change (None = counts were replaced)
+            message_date: Timestamp of the message, if known
+        """
+        if delta == 0:
+            return
+
+        if user_id is None:
+            self._forget_memory(guild_id)
+        else:
+            now = datetime.now(timezone.utc)
+            for days, excl_key in self._variants:
+                key = (guild_id, user_id, days, excl_key)
+                entry = self._memory.get(key)
+                if entry is None:
+                    continue
+                action = self._delta_action(days, excl_key, channel_id, delta, message_date, now)
+                if action == "patch":
+                    self._memory[key] = (max(0, entry[0] + delta), entry[1])
+                elif action == "drop":
+                    del self._memory[key]
+
+        self._pending_deltas.append((guild_id, user_id, channel_id, delta, message_date))
+
+        if self._flush_task is None or self._flush_task.done():
+            try:
+                self._flush_task = asyncio.get_running_loop().create_task(self._flush_later())
+            except RuntimeError:
+                pass  # No loop - flushed before the next SQLite access
+
+    async def _flush_later(self):
+        await asyncio.sleep(DELTA_FLUSH_DELAY)
+        try:
+            await self.flush_deltas()
+        except Exception as e:
+            logger.warning(f"Failed to write cache deltas: {e}")
+
+    async def flush_deltas(self) -> int:
+        """
+        Write collected deltas to the SQLite cache in one transaction.
+
+        Returns:
+            Number of deltas processed
+        """
+        if not self._pending_deltas:
+            return 0
+
+        await self.initialize()
+        pending, self._pending_deltas = self._pending_deltas, []
+        _flush_batch_size.observe(len(pending), source="cache_deltas")
+        now = datetime.now(timezone.utc)
+
+        guild_drops = set()
+        user_drops = set()  # (guild_id, user_id, days, excl_key)
+        patches: Dict[Tuple[int, int, int, str], int] = {}
+
+        for guild_id, user_id, channel_id, delta, message_date in pending:
+            if user_id is None:
+                guild_drops.add(guild_id)
+                continue
+            for days, excl_key in self._variants:
+                key = (guild_id, user_id, days, excl_key)
+                action = self._delta_action(days, excl_key, channel_id, delta, message_date, now)
+                if action == "patch":
+                    patches[key] = patches.get(key, 0) + delta
+                elif action == "drop":
+                    user_drops.add(key)
+
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.executemany(
+                "DELETE FROM message_counts WHERE guild_id = ?",
+                [(guild_id,) for guild_id in guild_drops]
+            )
+            await db.executemany(
+                """
+                UPDATE message_counts
+                SET message_count = MAX(0, message_count + ?)
+                WHERE guild_id = ? AND user_id = ? AND days_lookback = ? AND exclusion_key = ?
+                """,
+                [(delta, *key) for key, delta in patches.items() if key not in user_drops]
+            )
+            await db.executemany(
+                """
+                DELETE FROM message_counts
+                WHERE guild_id = ? AND user_id = ? AND days_lookback = ? AND exclusion_key = ?
+                """,
+                list(user_drops)
+            )
+            await db.commit()
+
+        self.delta_stats["patched"] += len(patches)
+        self.delta_stats["dropped"] += len(user_drops) + len(guild_drops)
+        logger.debug(
+            f"Applied {len(pending)} count deltas to cache "
+            f"({len(patches)} patched, {len(user_drops)} dropped, {len(guild_drops)} guilds cleared)"
+        )
+        return len(pending)
+
+    async def get(
+        self,
+        guild_id: int,
+        user_id: int,
+        days_lookback: Optional[int] = None,
+        excluded_channels: Optional[list] = None
+    ) -> Optional[int]:
+        """
+        Get cached message count for a user.
 
-            logger.debug(f"Cache hit for user {user_id}: {message_count} messages")
-            return message_count
+        Args:
+            guild_id: Discord guild ID
+            user_id: Discord user ID
+            days_lookback: Days to look back
+            excluded_channels: List of excluded channel IDs
+
+        Returns:
+            Cached message count or None if not found/expired
+        """
+        found = await self.get_many(guild_id, [user_id], days_lookback, excluded_channels)
+        return found.get(user_id)
 
     async def set(
         self,
@@ -167,26 +539,7 @@ class MessageCache:
             days_lookback: Days to look back
             excluded_channels: List of excluded channel IDs
         """
-        await self.initialize()
-
-        if excluded_channels is None:
-            excluded_channels = []
-
-        excluded_str = json.dumps(sorted(excluded_channels))
-        now = datetime.now(timezone.utc).isoformat()
-
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                """
-                INSERT OR REPLACE INTO message_counts
-                (guild_id, user_id, message_count, last_updated, days_lookback, excluded_channels)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (guild_id, user_id, message_count, now, days_lookback, excluded_str)
-            )
-            await db.commit()
-
-        logger.debug(f"Cached {message_count} messages for user {user_id}")
+        await self.set_many(guild_id, {user_id: message_count}, days_lookback, excluded_channels)
 
     async def clear_user(self, guild_id: int, user_id: int):
         """
@@ -197,6 +550,7 @@ class MessageCache:
             user_id: Discord user ID
         """
         await self.initialize()
+        self._forget_memory(guild_id, user_id)
 
         async with aiosqlite.connect(self.db_path) as db:
             await db.execute(
@@ -215,6 +569,7 @@ class MessageCache:
             guild_id: Discord guild ID
         """
         await self.initialize()
+        self._forget_memory(guild_id)
 
         async with aiosqlite.connect(self.db_path) as db:
             cursor = await db.execute(
@@ -230,6 +585,7 @@ class MessageCache:
     async def clear_all(self):
         """Clear entire cache."""
         await self.initialize()
+        self._forget_memory()
 
         async with aiosqlite.connect(self.db_path) as db:
             cursor = await db.execute("DELETE FROM message_counts")
@@ -276,7 +632,10 @@ class MessageCache:
             "expired_entries": expired_entries,
             "db_size_bytes": db_size,
             "db_size_mb": round(db_size / 1024 / 1024, 2),
-            "ttl_seconds": self.ttl
+            "ttl_seconds": self.ttl,
+            "memory_entries": len(self._memory),
+            "memory_hits": self.memory_stats["hits"],
+            "memory_misses": self.memory_stats["misses"],
         }
 
     async def cleanup_expired(self):
@@ -289,6 +648,8 @@ class MessageCache:
             return 0
 
         cutoff = (datetime.now(timezone.utc) - timedelta(seconds=self.ttl)).isoformat()
+        self._last_sweep = 0.0
+        self._evict(time.time())
 
         async with aiosqlite.connect(self.db_path) as db:
             cursor = await db.execute(
@@ -4,13 +4,154 @@ import aiosqlite
 import logging
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Optional, Dict, List
+from typing import Callable, Optional, Dict, List
 from collections import defaultdict
 import discord
 
+from src.database.migrations import Migration, MigrationRunner
+from src.utils.metrics import get_registry, timed
+
 
 logger = logging.getLogger("guildscout.message_store")
 
+_write_seconds = get_registry().histogram(
+    "guildscout_db_write_seconds",
+    "Duration of message store writes",
+    ("operation",)
+)
+
+
+MIGRATIONS = [
+    Migration(1, "initial schema", (
+        # Track guild members (non-bots) to know total population even without messages
+        """
+        CREATE TABLE IF NOT EXISTS guild_members (
+            guild_id INTEGER NOT NULL,
+            user_id INTEGER NOT NULL,
+            display_name TEXT,
+            joined_at TEXT,
+            top_role_id INTEGER,
+            last_seen TEXT,
+            is_bot INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (guild_id, user_id)
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_members_guild
+        ON guild_members(guild_id)
+        """,
+        # Create message counts table
+        """
+        CREATE TABLE IF NOT EXISTS message_counts (
+            guild_id INTEGER NOT NULL,
+            user_id INTEGER NOT NULL,
+            channel_id INTEGER NOT NULL,
+            message_count INTEGER NOT NULL DEFAULT 0,
+            last_message_date TEXT,
+            PRIMARY KEY (guild_id, user_id, channel_id)
+        )
+        """,
+        # Create index for faster user lookups
+        """
+        CREATE INDEX IF NOT EXISTS idx_guild_user
+        ON message_counts(guild_id, user_id)
+        """,
+        # Create index for faster guild lookups
+        """
+        CREATE INDEX IF NOT EXISTS idx_guild
+        ON message_counts(guild_id)
+        """,
+        # Create index for faster channel lookups (crucial for pruning and adjustments)
+        """
+        CREATE INDEX IF NOT EXISTS idx_channel
+        ON message_counts(channel_id)
+        """,
+        # Create metadata table for tracking import status
+        """
+        CREATE TABLE IF NOT EXISTS import_metadata (
+            guild_id INTEGER PRIMARY KEY,
+            import_completed INTEGER NOT NULL DEFAULT 0,
+            import_date TEXT,
+            import_start_time TEXT,
+            import_end_time TEXT,
+            total_messages_imported INTEGER DEFAULT 0
+        )
+        """,
+        # Create daily activity table for trends and graphs
+        """
+        CREATE TABLE IF NOT EXISTS daily_stats (
+            guild_id INTEGER NOT NULL,
+            date TEXT NOT NULL,
+            message_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (guild_id, date)
+        )
+        """,
+        # Create hourly activity table for "Prime Time" analysis
+        """
+        CREATE TABLE IF NOT EXISTS hourly_stats (
+            guild_id INTEGER NOT NULL,
+            hour INTEGER NOT NULL,
+            message_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (guild_id, hour)
+        )
+        """,
+        # Create voice sessions table (detailed log)
+        """
+        CREATE TABLE IF NOT EXISTS voice_sessions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL,
+            user_id INTEGER NOT NULL,
+            channel_id INTEGER NOT NULL,
+            start_time TEXT NOT NULL,
+            end_time TEXT NOT NULL,
+            duration_seconds INTEGER NOT NULL
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_voice_user_date
+        ON voice_sessions(guild_id, user_id, start_time)
+        """,
+        # Create daily voice stats table (aggregated for ranking)
+        """
+        CREATE TABLE IF NOT EXISTS voice_daily_stats (
+            guild_id INTEGER NOT NULL,
+            user_id INTEGER NOT NULL,
+            date TEXT NOT NULL,
+            total_seconds INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (guild_id, user_id, date)
+        )
+        """,
+        # Per-guild data version, bumped on every write so readers (e.g. the
+        # web UI ranking cache) can detect changes with a single PK lookup
+        """
+        CREATE TABLE IF NOT EXISTS guild_data_version (
+            guild_id INTEGER PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0,
+            updated_at TEXT
+        )
+        """,
+    )),
+    # Per-channel store totals at the last verification run; the next run
+    # only compares the messages of the window since then
+    Migration(2, "channel checkpoints", (
+        """
+        CREATE TABLE IF NOT EXISTS channel_checkpoints (
+            guild_id INTEGER NOT NULL,
+            channel_id INTEGER NOT NULL,
+            checked_at TEXT NOT NULL,
+            store_total INTEGER NOT NULL,
+            PRIMARY KEY (guild_id, channel_id)
+        )
+        """,
+    )),
+]
+
+
+# Called after committed count changes:
+#   (guild_id, user_id, channel_id, delta, message_date)
+# delta None means the user's counts were replaced (user_id None: the whole guild)
+DeltaListener = Callable[[int, Optional[int], Optional[int], Optional[int], Optional[datetime]], None]
+
 
 class MessageStore:
     """SQLite-based persistent storage for message counts."""
@@ -28,132 +169,85 @@ class MessageStore:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         self._initialized = False
+        self._delta_listeners: List[DeltaListener] = []
+
+    def add_delta_listener(self, listener: DeltaListener):
+        """
+        Subscribe to count changes (e.g. to keep MessageCache current).
+
+        Args:
+            listener: Synchronous callback, see DeltaListener
+        """
+        self._delta_listeners.append(listener)
+
+    def _notify_delta(
+        self,
+        guild_id: int,
+        user_id: Optional[int] = None,
+        channel_id: Optional[int] = None,
+        delta: Optional[int] = None,
+        message_date: Optional[datetime] = None
+    ):
+        for listener in self._delta_listeners:
+            try:
+                listener(guild_id, user_id, channel_id, delta, message_date)
+            except Exception as e:
+                logger.warning(f"Delta listener failed: {e}")
 
     async def initialize(self):
         """Initialize the database schema."""
         if self._initialized:
             return
 
-        async with aiosqlite.connect(self.db_path) as db:
-            # Enable WAL mode for better concurrency (allows concurrent reads + 1 write)
-            # This is crucial because message tracking and import can run simultaneously
-            await db.execute("PRAGMA journal_mode=WAL")
-
-            # Track guild members (non-bots) to know total population even without messages
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS guild_members (
-                    guild_id INTEGER NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    display_name TEXT,
-                    joined_at TEXT,
-                    top_role_id INTEGER,
-                    last_seen TEXT,
-                    is_bot INTEGER NOT NULL DEFAULT 0,
-                    PRIMARY KEY (guild_id, user_id)
-                )
-            """)
-
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_members_guild
-                ON guild_members(guild_id)
-            """)
-
-            # Create message counts table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS message_counts (
-                    guild_id INTEGER NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    channel_id INTEGER NOT NULL,
-                    message_count INTEGER NOT NULL DEFAULT 0,
-                    last_message_date TEXT,
-                    PRIMARY KEY (guild_id, user_id, channel_id)
-                )
-            """)
-
-            # Create index for faster user lookups
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_guild_user
-                ON message_counts(guild_id, user_id)
-            """)
-
-            # Create index for faster guild lookups
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_guild
-                ON message_counts(guild_id)
-            """)
-
-            # Create index for faster channel lookups (crucial for pruning and adjustments)
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_channel
-                ON message_counts(channel_id)
-            """)
-
-            # Create metadata table for tracking import status
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS import_metadata (
-                    guild_id INTEGER PRIMARY KEY,
-                    import_completed INTEGER NOT NULL DEFAULT 0,
-                    import_date TEXT,
-                    import_start_time TEXT,
-                    import_end_time TEXT,
-                    total_messages_imported INTEGER DEFAULT 0
-                )
-            """)
-
-            # Create daily activity table for trends and graphs
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS daily_stats (
-                    guild_id INTEGER NOT NULL,
-                    date TEXT NOT NULL,
-                    message_count INTEGER NOT NULL DEFAULT 0,
-                    PRIMARY KEY (guild_id, date)
-                )
-            """)
-
-            # Create hourly activity table for "Prime Time" analysis
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS hourly_stats (
-                    guild_id INTEGER NOT NULL,
-                    hour INTEGER NOT NULL,
-                    message_count INTEGER NOT NULL DEFAULT 0,
-                    PRIMARY KEY (guild_id, hour)
-                )
-            """)
-
-            # Create voice sessions table (detailed log)
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS voice_sessions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    channel_id INTEGER NOT NULL,
-                    start_time TEXT NOT NULL,
-                    end_time TEXT NOT NULL,
-                    duration_seconds INTEGER NOT NULL
-                )
-            """)
-
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_voice_user_date
-                ON voice_sessions(guild_id, user_id, start_time)
-            """)
-
-            # Create daily voice stats table (aggregated for ranking)
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS voice_daily_stats (
-                    guild_id INTEGER NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    date TEXT NOT NULL,
-                    total_seconds INTEGER NOT NULL DEFAULT 0,
-                    PRIMARY KEY (guild_id, user_id, date)
-                )
-            """)
-
-            await db.commit()
+        # WAL mode allows concurrent reads + 1 write. This is crucial because
+        # message tracking and import can run simultaneously
+        await MigrationRunner(self.db_path, "message_store", MIGRATIONS, journal_mode="WAL").run()
 
         self._initialized = True
         logger.info(f"Message store initialized at {self.db_path}")
 
+    async def _bump_data_version(self, db: aiosqlite.Connection, *guild_ids: int):
+        """
+        Increment the data version of one or more guilds.
+
+        Runs inside the caller's transaction so the bump is committed
+        together with the data change it describes.
+
+        Args:
+            db: Open database connection
+            guild_ids: Guild IDs whose data changed
+        """
+        now_str = datetime.now(timezone.utc).isoformat()
+        await db.executemany(
+            """
+            INSERT INTO guild_data_version (guild_id, version, updated_at)
+            VALUES (?, 1, ?)
+            ON CONFLICT(guild_id)
+            DO UPDATE SET version = version + 1, updated_at = excluded.updated_at
+            """,
+            [(guild_id, now_str) for guild_id in set(guild_ids)]
+        )
+
+    async def get_data_version(self, guild_id: int) -> int:
+        """
+        Get the current data version for a guild.
+
+        Args:
+            guild_id: Discord guild ID
+
+        Returns:
+            Monotonic version counter (0 if the guild was never written)
+        """
+        await self.initialize()
+
+        async with aiosqlite.connect(self.db_path) as db:
+            cursor = await db.execute(
+                "SELECT version FROM guild_data_version WHERE guild_id = ?",
+                (guild_id,)
+            )
+            row = await cursor.fetchone()
+            return row[0] if row else 0
+
     async def log_voice_session(
         self,
         guild_id: int,
@@ -208,6 +302,7 @@ class MessageStore:
                 (guild_id, user_id, date_key, duration, duration)
             )
             
+            await self._bump_data_version(db, guild_id)
             await db.commit()
 
     async def get_voice_seconds(
@@ -246,6 +341,7 @@ class MessageStore:
             row = await cursor.fetchone()
             return row[0] if row else 0
 
+    @timed(_write_seconds, operation="increment_message")
     async def increment_message(
         self,
         guild_id: int,
@@ -310,8 +406,12 @@ class MessageStore:
                 (guild_id, hour_key, count, count)
             )
 
+            await self._bump_data_version(db, guild_id)
             await db.commit()
 
+        self._notify_delta(guild_id, user_id, channel_id, count, message_date)
+
+    @timed(_write_seconds, operation="bulk_increment_messages")
     async def bulk_increment_messages(
         self,
         message_counts: Dict,
@@ -353,8 +453,14 @@ class MessageStore:
                     """,
                     records
                 )
+                await self._bump_data_version(db, *{key[0] for key in message_counts})
                 await db.commit()
 
+            # Imported history can already be part of cached counts (e.g. from
+            # an API scan), so entries of affected users are replaced, not patched
+            for guild_id, user_id in {(key[0], key[1]) for key in message_counts}:
+                self._notify_delta(guild_id, user_id)
+
         # 2. Update Stats (Daily & Hourly)
         # If historical_records are provided, use them. Otherwise, assume "now" for message_counts.
         
@@ -406,6 +512,7 @@ class MessageStore:
                 """,
                 hourly_records
             )
+            await self._bump_data_version(db, *{guild_id for guild_id, _ in stats_daily})
             await db.commit()
 
     async def get_daily_history(self, guild_id: int, days: int = 7) -> Dict[str, int]:
@@ -439,6 +546,7 @@ class MessageStore:
             rows = await cursor.fetchall()
             return {row[0]: row[1] for row in rows}
 
+    @timed(_write_seconds, operation="adjust_message_count")
     async def adjust_message_count(
         self,
         guild_id: int,
@@ -455,7 +563,8 @@ class MessageStore:
             user_id: Discord user ID
             channel_id: Discord channel ID
             delta: Change to apply (negative to decrement)
-            message_date: Optional timestamp for last_message_date when increasing
+            message_date: Time of the message added or removed; only an
+                increase updates last_message_date
         """
         if delta == 0:
             return
@@ -485,7 +594,8 @@ class MessageStore:
             else:
                 # Update or insert
                 message_date_str = (
-                    message_date.isoformat() if message_date else (row[1] if row else None)
+                    message_date.isoformat() if message_date and delta > 0
+                    else (row[1] if row else None)
                 )
                 await db.execute(
                     """
@@ -500,8 +610,11 @@ class MessageStore:
                     (guild_id, user_id, channel_id, new_count, message_date_str)
                 )
 
+            await self._bump_data_version(db, guild_id)
             await db.commit()
 
+        self._notify_delta(guild_id, user_id, channel_id, new_count - current, message_date)
+
     async def update_user_counts(
         self,
         guild_id: int,
@@ -516,36 +629,58 @@ class MessageStore:
             user_id: Discord user ID
             channel_counts: Dictionary mapping channel_id to message count
         """
+        await self.update_users_counts(guild_id, {user_id: channel_counts})
+
+    @timed(_write_seconds, operation="update_users_counts")
+    async def update_users_counts(
+        self,
+        guild_id: int,
+        user_channel_counts: Dict[int, Dict[int, int]]
+    ):
+        """
+        Replace all message counts for several users in one transaction (Self-Healing).
+
+        Args:
+            guild_id: Discord guild ID
+            user_channel_counts: Dictionary mapping user_id to {channel_id: message count}
+        """
+        if not user_channel_counts:
+            return
+
         await self.initialize()
         now_str = datetime.now(timezone.utc).isoformat()
 
         async with aiosqlite.connect(self.db_path) as db:
-            # 1. Delete all existing counts for this user
-            await db.execute(
+            # 1. Delete all existing counts for these users
+            await db.executemany(
                 "DELETE FROM message_counts WHERE guild_id = ? AND user_id = ?",
-                (guild_id, user_id)
+                [(guild_id, user_id) for user_id in user_channel_counts]
             )
 
             # 2. Insert new counts
-            if channel_counts:
-                records = [
-                    (guild_id, user_id, channel_id, count, now_str)
-                    for channel_id, count in channel_counts.items()
-                    if count > 0
-                ]
-                if records:
-                    await db.executemany(
-                        """
-                        INSERT INTO message_counts
-                        (guild_id, user_id, channel_id, message_count, last_message_date)
-                        VALUES (?, ?, ?, ?, ?)
-                        """,
-                        records
-                    )
+            records = [
+                (guild_id, user_id, channel_id, count, now_str)
+                for user_id, channel_counts in user_channel_counts.items()
+                for channel_id, count in (channel_counts or {}).items()
+                if count > 0
+            ]
+            if records:
+                await db.executemany(
+                    """
+                    INSERT INTO message_counts
+                    (guild_id, user_id, channel_id, message_count, last_message_date)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    records
+                )
 
+            await self._bump_data_version(db, guild_id)
             await db.commit()
-        
-        logger.info(f"Healed message counts for user {user_id} in guild {guild_id}")
+
+        for user_id in user_channel_counts:
+            self._notify_delta(guild_id, user_id)
+
+        logger.info(f"Healed message counts for {len(user_channel_counts)} user(s) in guild {guild_id}")
 
     async def get_user_total(
         self,
@@ -673,6 +808,163 @@ class MessageStore:
 
             return {row[0]: row[1] for row in rows}
 
+    async def get_user_breakdowns(
+        self,
+        guild_id: int,
+        user_ids: List[int],
+        excluded_channels: Optional[List[int]] = None
+    ) -> Dict[int, Dict[int, int]]:
+        """
+        Get per-channel message counts for several users with a single query.
+
+        Args:
+            guild_id: Discord guild ID
+            user_ids: Discord user IDs
+            excluded_channels: List of channel IDs to exclude
+
+        Returns:
+            Dictionary mapping user_id to {channel_id: message count}
+            (every requested user is present, possibly with an empty dict)
+        """
+        breakdowns: Dict[int, Dict[int, int]] = {user_id: {} for user_id in user_ids}
+        if not breakdowns:
+            return breakdowns
+
+        await self.initialize()
+
+        user_placeholders = ','.join('?' * len(breakdowns))
+        query = f"""
+            SELECT user_id, channel_id, message_count
+            FROM message_counts
+            WHERE guild_id = ?
+            AND user_id IN ({user_placeholders})
+        """
+        params = [guild_id] + list(breakdowns)
+        if excluded_channels:
+            placeholders = ','.join('?' * len(excluded_channels))
+            query += f" AND channel_id NOT IN ({placeholders})"
+            params += list(excluded_channels)
+
+        async with aiosqlite.connect(self.db_path) as db:
+            cursor = await db.execute(query, params)
+            rows = await cursor.fetchall()
+
+        for user_id, channel_id, count in rows:
+            breakdowns[user_id][channel_id] = count
+
+        return breakdowns
+
+    async def get_channel_totals(self, guild_id: int) -> Dict[int, int]:
+        """
+        Get total message counts per channel.
+
+        Args:
+            guild_id: Discord guild ID
+
+        Returns:
+            Dictionary mapping channel_id to message count
+        """
+        await self.initialize()
+
+        async with aiosqlite.connect(self.db_path) as db:
+            cursor = await db.execute(
+                """
+                SELECT channel_id, SUM(message_count)
+                FROM message_counts
+                WHERE guild_id = ?
+                GROUP BY channel_id
+                """,
+                (guild_id,)
+            )
+            rows = await cursor.fetchall()
+
+            return {row[0]: row[1] for row in rows}
+
+    async def get_channel_top_users(
+        self,
+        guild_id: int,
+        channel_id: int,
+        limit: int = 10
+    ) -> List[int]:
+        """
+        Get the users with the most messages in a channel.
+
+        Args:
+            guild_id: Discord guild ID
+            channel_id: Discord channel ID
+            limit: Maximum number of users
+
+        Returns:
+            User IDs, most active first
+        """
+        await self.initialize()
+
+        async with aiosqlite.connect(self.db_path) as db:
+            cursor = await db.execute(
+                """
+                SELECT user_id
+                FROM message_counts
+                WHERE guild_id = ? AND channel_id = ?
+                ORDER BY message_count DESC
+                LIMIT ?
+                """,
+                (guild_id, channel_id, limit)
+            )
+            rows = await cursor.fetchall()
+
+            return [row[0] for row in rows]
+
+    async def get_channel_checkpoints(self, guild_id: int) -> Dict[int, tuple[datetime, int]]:
+        """
+        Get the per-channel checkpoints of the last verification run.
+
+        Args:
+            guild_id: Discord guild ID
+
+        Returns:
+            Dictionary mapping channel_id to (checked_at, store_total)
+        """
+        await self.initialize()
+
+        async with aiosqlite.connect(self.db_path) as db:
+            cursor = await db.execute(
+                "SELECT channel_id, checked_at, store_total FROM channel_checkpoints WHERE guild_id = ?",
+                (guild_id,)
+            )
+            rows = await cursor.fetchall()
+
+            return {row[0]: (datetime.fromisoformat(row[1]), row[2]) for row in rows}
+
+    async def set_channel_checkpoints(
+        self,
+        guild_id: int,
+        channel_totals: Dict[int, int],
+        checked_at: datetime
+    ):
+        """
+        Set the checkpoints of the given channels; other channels keep theirs.
+
+        Args:
+            guild_id: Discord guild ID
+            channel_totals: Dictionary mapping channel_id to store total at checked_at
+            checked_at: Time the totals were read
+        """
+        await self.initialize()
+        checked_at_str = checked_at.isoformat()
+
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.executemany(
+                """
+                INSERT OR REPLACE INTO channel_checkpoints (guild_id, channel_id, checked_at, store_total)
+                VALUES (?, ?, ?, ?)
+                """,
+                [
+                    (guild_id, channel_id, checked_at_str, total)
+                    for channel_id, total in channel_totals.items()
+                ]
+            )
+            await db.commit()
+
     async def is_import_completed(self, guild_id: int) -> bool:
         """
         Check if historical data import is completed for a guild.
@@ -849,8 +1141,10 @@ class MessageStore:
                 "DELETE FROM import_metadata WHERE guild_id = ?",
                 (guild_id,)
             )
+            await self._bump_data_version(db, guild_id)
             await db.commit()
 
+        self._notify_delta(guild_id)
         logger.info(f"Reset all data for guild {guild_id}")
 
     async def delete_channel_counts(self, guild_id: int, channel_id: int) -> int:
@@ -861,8 +1155,11 @@ class MessageStore:
                 "DELETE FROM message_counts WHERE guild_id = ? AND channel_id = ?",
                 (guild_id, channel_id)
             )
+            await self._bump_data_version(db, guild_id)
             await db.commit()
-            return cursor.rowcount or 0
+
+        self._notify_delta(guild_id)
+        return cursor.rowcount or 0
 
     async def prune_deleted_channels(self, guild: discord.Guild) -> int:
         """
@@ -908,8 +1205,10 @@ class MessageStore:
                 f"DELETE FROM message_counts WHERE guild_id = ? AND channel_id IN ({placeholders})",
                 params
             )
+            await self._bump_data_version(db, guild.id)
             await db.commit()
 
+        self._notify_delta(guild.id)
         logger.info(
             "Pruned %d deleted channels from message_counts for guild %s",
             len(stale_channels),
@@ -1054,6 +1353,7 @@ class MessageStore:
                     [(guild.id, user_id) for user_id in removed_ids]
                 )
 
+            await self._bump_data_version(db, guild.id)
             await db.commit()
 
         logger.info(
@@ -1097,6 +1397,7 @@ class MessageStore:
                     now
                 )
             )
+            await self._bump_data_version(db, member.guild.id)
             await db.commit()
 
     async def remove_member(self, guild_id: int, user_id: int):
@@ -1107,6 +1408,7 @@ class MessageStore:
                 "DELETE FROM guild_members WHERE guild_id = ? AND user_id = ?",
                 (guild_id, user_id)
             )
+            await self._bump_data_version(db, guild_id)
             await db.commit()
 
     async def get_guild_voice_totals(
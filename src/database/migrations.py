@@ -0,0 +1,261 @@
+"""
+Versioned schema migrations for the SQLite stores.
+
+Every store describes its schema as an ordered list of migrations. The
+applied versions are recorded per component in a ``schema_version``
+table, so several stores can share one database file (e.g. web_ui.db)
+and a store whose schema is current only pays for a single SELECT.
+
+Two kinds of migrations:
+- ``Migration``: DDL (or a small data fix) applied in one transaction.
+- ``OnlineMigration``: a data migration processed in chunks, one short
+  transaction per chunk, with its progress persisted. It doesn't hold the
+  write lock for long, can run in the background while the bot serves
+  requests, and resumes where it stopped after a restart.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Union
+
+import aiosqlite
+
+logger = logging.getLogger("guildscout.migrations")
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A schema change applied atomically.
+
+    Either ``statements`` (executed in order) or ``apply`` (for changes that
+    need to inspect the schema first) or both.
+    """
+
+    version: int
+    name: str
+    statements: Sequence[str] = ()
+    apply: Optional[Callable[[aiosqlite.Connection], Awaitable[None]]] = None
+
+
+@dataclass(frozen=True)
+class OnlineMigration:
+    """A chunked data migration.
+
+    ``step(db, position, chunk_size)`` processes one chunk starting after
+    ``position`` (None on the first call) and returns the position to
+    continue from, or None when done. Positions must be JSON-serializable
+    (typically the last rowid/key processed). Each step runs in its own
+    transaction together with the saved position.
+    """
+
+    version: int
+    name: str
+    step: Callable[[aiosqlite.Connection, Any, int], Awaitable[Any]]
+    chunk_size: int = 5000
+    # Pause between chunks so other writers get the lock
+    pause_seconds: float = 0.05
+
+
+AnyMigration = Union[Migration, OnlineMigration]
+
+
+@dataclass
+class MigrationResult:
+    """Outcome of a migration run."""
+
+    applied: List[int] = field(default_factory=list)
+    background: Optional[asyncio.Task] = None
+
+
+class MigrationRunner:
+    """Applies pending migrations of one component to one database file."""
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        component: str,
+        migrations: Sequence[AnyMigration],
+        journal_mode: Optional[str] = None
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            db_path: SQLite database file
+            component: Name the versions are recorded under (e.g. "raid_store")
+            migrations: Migrations with strictly increasing versions
+            journal_mode: Journal mode to set before migrating (e.g. "WAL")
+        """
+        versions = [migration.version for migration in migrations]
+        if versions != sorted(set(versions)) or (versions and versions[0] < 1):
+            raise ValueError(f"Migrations of {component} need unique, increasing versions >= 1")
+
+        self.db_path = Path(db_path)
+        self.component = component
+        self.migrations = list(migrations)
+        self.journal_mode = journal_mode
+
+    @property
+    def latest_version(self) -> int:
+        return self.migrations[-1].version if self.migrations else 0
+
+    @staticmethod
+    async def _ensure_tables(db: aiosqlite.Connection) -> None:
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                component TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                name TEXT NOT NULL,
+                applied_at INTEGER NOT NULL,
+                PRIMARY KEY (component, version)
+            )
+        """)
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS schema_migration_progress (
+                component TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                position TEXT,
+                updated_at INTEGER NOT NULL,
+                PRIMARY KEY (component, version)
+            )
+        """)
+        await db.commit()
+
+    async def _current_version(self, db: aiosqlite.Connection) -> int:
+        try:
+            cursor = await db.execute(
+                "SELECT MAX(version) FROM schema_version WHERE component = ?",
+                (self.component,)
+            )
+        except aiosqlite.OperationalError:
+            return 0  # schema_version table doesn't exist yet
+        row = await cursor.fetchone()
+        return int(row[0]) if row and row[0] is not None else 0
+
+    async def current_version(self) -> int:
+        """Highest applied migration version of this component (0 if none)."""
+        async with aiosqlite.connect(self.db_path) as db:
+            return await self._current_version(db)
+
+    async def _record(self, db: aiosqlite.Connection, migration: AnyMigration) -> None:
+        await db.execute(
+            "INSERT OR REPLACE INTO schema_version (component, version, name, applied_at) "
+            "VALUES (?, ?, ?, ?)",
+            (self.component, migration.version, migration.name, int(time.time()))
+        )
+
+    async def _apply(self, db: aiosqlite.Connection, migration: Migration) -> None:
+        await db.execute("BEGIN IMMEDIATE")
+        try:
+            for statement in migration.statements:
+                await db.execute(statement)
+            if migration.apply is not None:
+                await migration.apply(db)
+            await self._record(db, migration)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+    async def _load_position(self, db: aiosqlite.Connection, version: int) -> Any:
+        cursor = await db.execute(
+            "SELECT position FROM schema_migration_progress WHERE component = ? AND version = ?",
+            (self.component, version)
+        )
+        row = await cursor.fetchone()
+        return json.loads(row[0]) if row and row[0] is not None else None
+
+    async def _apply_online(self, db: aiosqlite.Connection, migration: OnlineMigration) -> None:
+        position = await self._load_position(db, migration.version)
+        if position is not None:
+            logger.info(f"Resuming {self.component} migration {migration.version} ({migration.name})")
+
+        chunks = 0
+        while True:
+            await db.execute("BEGIN IMMEDIATE")
+            try:
+                position = await migration.step(db, position, migration.chunk_size)
+                if position is None:
+                    await db.execute(
+                        "DELETE FROM schema_migration_progress WHERE component = ? AND version = ?",
+                        (self.component, migration.version)
+                    )
+                    await self._record(db, migration)
+                else:
+                    await db.execute(
+                        "INSERT OR REPLACE INTO schema_migration_progress "
+                        "(component, version, position, updated_at) VALUES (?, ?, ?, ?)",
+                        (self.component, migration.version, json.dumps(position), int(time.time()))
+                    )
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+
+            chunks += 1
+            if position is None:
+                break
+            # Release the write lock between chunks
+            await asyncio.sleep(migration.pause_seconds)
+
+        logger.info(f"Applied {self.component} migration {migration.version} ({migration.name}) in {chunks} chunk(s)")
+
+    async def _run_pending(self, pending: Sequence[AnyMigration], applied: List[int]) -> None:
+        async with aiosqlite.connect(self.db_path) as db:
+            await self._ensure_tables(db)
+            for migration in pending:
+                if isinstance(migration, OnlineMigration):
+                    await self._apply_online(db, migration)
+                else:
+                    await self._apply(db, migration)
+                    logger.info(f"Applied {self.component} migration {migration.version} ({migration.name})")
+                applied.append(migration.version)
+
+    async def run(self, *, background: bool = True) -> MigrationResult:
+        """
+        Apply all pending migrations in order.
+
+        Args:
+            background: Continue from the first pending OnlineMigration on in a
+                background task instead of waiting for it (the store is usable
+                meanwhile; code relying on the migrated data checks
+                ``current_version``)
+
+        Returns:
+            MigrationResult with the versions applied so far and the
+            background task, if any
+        """
+        result = MigrationResult()
+
+        async with aiosqlite.connect(self.db_path) as db:
+            if self.journal_mode:
+                await db.execute(f"PRAGMA journal_mode={self.journal_mode}")
+            current = await self._current_version(db)
+
+        pending = [migration for migration in self.migrations if migration.version > current]
+        if not pending:
+            return result
+
+        split = len(pending)
+        if background:
+            for index, migration in enumerate(pending):
+                if isinstance(migration, OnlineMigration):
+                    split = index
+                    break
+
+        await self._run_pending(pending[:split], result.applied)
+
+        if split < len(pending):
+            async def run_online():
+                try:
+                    await self._run_pending(pending[split:], result.applied)
+                except Exception as e:
+                    logger.error(f"Online migration of {self.component} failed: {e}", exc_info=True)
+
+            result.background = asyncio.create_task(run_online())
+
+        return result
@@ -2,17 +2,195 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import aiosqlite
 
+from src.database.migrations import Migration, MigrationRunner
+
 
 logger = logging.getLogger("guildscout.raid_store")
 
+# Scheduled raid jobs, in the order they run when due at the same time
+JOB_REMINDER = "reminder"
+JOB_DM_REMINDER = "dm_reminder"
+JOB_CONFIRMATION = "confirmation"
+JOB_CONFIRMATION_REMINDER = "confirmation_reminder"
+JOB_NO_SHOW = "no_show"
+JOB_CLOSE = "close"
+JOB_ORDER = (
+    JOB_REMINDER,
+    JOB_DM_REMINDER,
+    JOB_CONFIRMATION,
+    JOB_CONFIRMATION_REMINDER,
+    JOB_NO_SHOW,
+    JOB_CLOSE,
+)
+
+# (job_type, offset, seconds relative to the raid start); the offset tells
+# jobs of one type apart, e.g. the hours of a reminder
+JobPlan = Sequence[Tuple[str, int, int]]
+
+_RAID_COLUMNS = """
+    r.id, r.guild_id, r.channel_id, r.message_id, r.creator_id, r.title, r.description,
+    r.game, r.mode, r.start_time, r.tanks_needed, r.healers_needed, r.dps_needed,
+    r.bench_needed, r.status, r.created_at, r.closed_at
+"""
+
+
+async def _add_legacy_columns(db: aiosqlite.Connection) -> None:
+    """Add columns introduced after the first release to existing tables."""
+    cursor = await db.execute("PRAGMA table_info(raids)")
+    columns = [row[1] for row in await cursor.fetchall()]
+    if "game" not in columns:
+        await db.execute(
+            "ALTER TABLE raids ADD COLUMN game TEXT NOT NULL DEFAULT 'where_winds_meet'"
+        )
+    if "mode" not in columns:
+        await db.execute(
+            "ALTER TABLE raids ADD COLUMN mode TEXT NOT NULL DEFAULT 'raid'"
+        )
+
+    cursor = await db.execute("PRAGMA table_info(raid_signups)")
+    columns = [row[1] for row in await cursor.fetchall()]
+    if "preferred_role" not in columns:
+        await db.execute("ALTER TABLE raid_signups ADD COLUMN preferred_role TEXT")
+    if "confirmed" not in columns:
+        await db.execute(
+            "ALTER TABLE raid_signups ADD COLUMN confirmed INTEGER NOT NULL DEFAULT 0"
+        )
+
+
+async def _add_job_attempts(db: aiosqlite.Connection) -> None:
+    """Track how often a raid job has failed."""
+    cursor = await db.execute("PRAGMA table_info(raid_jobs)")
+    columns = [row[1] for row in await cursor.fetchall()]
+    if "attempts" not in columns:
+        await db.execute(
+            "ALTER TABLE raid_jobs ADD COLUMN attempts INTEGER NOT NULL DEFAULT 0"
+        )
+
+
+MIGRATIONS = [
+    Migration(1, "initial schema", (
+        """
+        CREATE TABLE IF NOT EXISTS raids (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL,
+            channel_id INTEGER NOT NULL,
+            message_id INTEGER,
+            creator_id INTEGER NOT NULL,
+            title TEXT NOT NULL,
+            description TEXT,
+            game TEXT NOT NULL DEFAULT 'where_winds_meet',
+            mode TEXT NOT NULL DEFAULT 'raid',
+            start_time INTEGER NOT NULL,
+            tanks_needed INTEGER NOT NULL,
+            healers_needed INTEGER NOT NULL,
+            dps_needed INTEGER NOT NULL,
+            bench_needed INTEGER NOT NULL,
+            status TEXT NOT NULL DEFAULT 'open',
+            created_at INTEGER NOT NULL,
+            closed_at INTEGER
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_raids_message
+        ON raids(message_id)
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS raid_signups (
+            raid_id INTEGER NOT NULL,
+            user_id INTEGER NOT NULL,
+            role TEXT NOT NULL,
+            joined_at INTEGER NOT NULL,
+            preferred_role TEXT,
+            confirmed INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (raid_id, user_id)
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_raid_signups_raid
+        ON raid_signups(raid_id)
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS raid_reminders (
+            raid_id INTEGER NOT NULL,
+            reminder_hours INTEGER NOT NULL,
+            sent_at INTEGER NOT NULL,
+            PRIMARY KEY (raid_id, reminder_hours)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS raid_confirmations (
+            raid_id INTEGER PRIMARY KEY,
+            message_id INTEGER NOT NULL,
+            created_at INTEGER NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS raid_alerts (
+            raid_id INTEGER NOT NULL,
+            alert_type TEXT NOT NULL,
+            sent_at INTEGER NOT NULL,
+            PRIMARY KEY (raid_id, alert_type)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS raid_participation (
+            raid_id INTEGER NOT NULL,
+            user_id INTEGER NOT NULL,
+            role TEXT NOT NULL,
+            status TEXT NOT NULL,
+            confirmed INTEGER NOT NULL,
+            joined_at INTEGER NOT NULL,
+            recorded_at INTEGER NOT NULL,
+            PRIMARY KEY (raid_id, user_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS raid_leave_requests (
+            user_id INTEGER NOT NULL,
+            raid_id INTEGER NOT NULL,
+            requested_at INTEGER NOT NULL,
+            expires_at INTEGER NOT NULL,
+            PRIMARY KEY (user_id, raid_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS raid_leave_reasons (
+            raid_id INTEGER NOT NULL,
+            user_id INTEGER NOT NULL,
+            reason TEXT NOT NULL,
+            created_at INTEGER NOT NULL,
+            PRIMARY KEY (raid_id, user_id)
+        )
+        """,
+    )),
+    Migration(2, "legacy raid and signup columns", apply=_add_legacy_columns),
+    Migration(3, "raid job queue", (
+        """
+        CREATE TABLE IF NOT EXISTS raid_jobs (
+            raid_id INTEGER NOT NULL,
+            job_type TEXT NOT NULL,
+            job_offset INTEGER NOT NULL DEFAULT 0,
+            due_at INTEGER NOT NULL,
+            PRIMARY KEY (raid_id, job_type, job_offset)
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_raid_jobs_due
+        ON raid_jobs(due_at)
+        """,
+    )),
+    Migration(4, "raid job retries", apply=_add_job_attempts),
+]
+
 
 @dataclass(frozen=True)
 class RaidRecord:
@@ -37,6 +215,17 @@ class RaidRecord:
     closed_at: Optional[int]
 
 
+@dataclass(frozen=True)
+class RaidJob:
+    """A due raid job together with its raid."""
+
+    raid: RaidRecord
+    job_type: str
+    offset: int
+    due_at: int
+    attempts: int = 0
+
+
 class RaidStore:
     """SQLite-based storage for raids and signups."""
 
@@ -44,160 +233,16 @@ class RaidStore:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._initialized = False
+        self._job_plan: JobPlan = ()
+        # Set whenever raid_jobs changes, so the scheduler can re-plan its sleep
+        self.jobs_changed = asyncio.Event()
 
     async def initialize(self) -> None:
         """Ensure the database schema exists."""
         if self._initialized:
             return
 
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("PRAGMA journal_mode=WAL")
-
-            await db.execute(
-                """
-                CREATE TABLE IF NOT EXISTS raids (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER NOT NULL,
-                    channel_id INTEGER NOT NULL,
-                    message_id INTEGER,
-                    creator_id INTEGER NOT NULL,
-                    title TEXT NOT NULL,
-                    description TEXT,
-                    game TEXT NOT NULL DEFAULT 'where_winds_meet',
-                    mode TEXT NOT NULL DEFAULT 'raid',
-                    start_time INTEGER NOT NULL,
-                    tanks_needed INTEGER NOT NULL,
-                    healers_needed INTEGER NOT NULL,
-                    dps_needed INTEGER NOT NULL,
-                    bench_needed INTEGER NOT NULL,
-                    status TEXT NOT NULL DEFAULT 'open',
-                    created_at INTEGER NOT NULL,
-                    closed_at INTEGER
-                )
-                """
-            )
-
-            await db.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_raids_message
-                ON raids(message_id)
-                """
-            )
-
-            cursor = await db.execute("PRAGMA table_info(raids)")
-            columns = [row[1] for row in await cursor.fetchall()]
-            if "game" not in columns:
-                await db.execute(
-                    "ALTER TABLE raids ADD COLUMN game TEXT NOT NULL DEFAULT 'where_winds_meet'"
-                )
-            if "mode" not in columns:
-                await db.execute(
-                    "ALTER TABLE raids ADD COLUMN mode TEXT NOT NULL DEFAULT 'raid'"
-                )
-
-            await db.execute(
-                """
-                CREATE TABLE IF NOT EXISTS raid_signups (
-                    raid_id INTEGER NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    role TEXT NOT NULL,
-                    joined_at INTEGER NOT NULL,
-                    preferred_role TEXT,
-                    confirmed INTEGER NOT NULL DEFAULT 0,
-                    PRIMARY KEY (raid_id, user_id)
-                )
-                """
-            )
-
-            await db.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_raid_signups_raid
-                ON raid_signups(raid_id)
-                """
-            )
-
-            # Add preferred_role column for existing installs
-            cursor = await db.execute("PRAGMA table_info(raid_signups)")
-            columns = [row[1] for row in await cursor.fetchall()]
-            if "preferred_role" not in columns:
-                await db.execute("ALTER TABLE raid_signups ADD COLUMN preferred_role TEXT")
-            if "confirmed" not in columns:
-                await db.execute(
-                    "ALTER TABLE raid_signups ADD COLUMN confirmed INTEGER NOT NULL DEFAULT 0"
-                )
-
-            await db.execute(
-                """
-                CREATE TABLE IF NOT EXISTS raid_reminders (
-                    raid_id INTEGER NOT NULL,
-                    reminder_hours INTEGER NOT NULL,
-                    sent_at INTEGER NOT NULL,
-                    PRIMARY KEY (raid_id, reminder_hours)
-                )
-                """
-            )
-
-            await db.execute(
-                """
-                CREATE TABLE IF NOT EXISTS raid_confirmations (
-                    raid_id INTEGER PRIMARY KEY,
-                    message_id INTEGER NOT NULL,
-                    created_at INTEGER NOT NULL
-                )
-                """
-            )
-
-            await db.execute(
-                """
-                CREATE TABLE IF NOT EXISTS raid_alerts (
-                    raid_id INTEGER NOT NULL,
-                    alert_type TEXT NOT NULL,
-                    sent_at INTEGER NOT NULL,
-                    PRIMARY KEY (raid_id, alert_type)
-                )
-                """
-            )
-
-            await db.execute(
-                """
-                CREATE TABLE IF NOT EXISTS raid_participation (
-                    raid_id INTEGER NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    role TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    confirmed INTEGER NOT NULL,
-                    joined_at INTEGER NOT NULL,
-                    recorded_at INTEGER NOT NULL,
-                    PRIMARY KEY (raid_id, user_id)
-                )
-                """
-            )
-
-            await db.execute(
-                """
-                CREATE TABLE IF NOT EXISTS raid_leave_requests (
-                    user_id INTEGER NOT NULL,
-                    raid_id INTEGER NOT NULL,
-                    requested_at INTEGER NOT NULL,
-                    expires_at INTEGER NOT NULL,
-                    PRIMARY KEY (user_id, raid_id)
-                )
-                """
-            )
-
-            await db.execute(
-                """
-                CREATE TABLE IF NOT EXISTS raid_leave_reasons (
-                    raid_id INTEGER NOT NULL,
-                    user_id INTEGER NOT NULL,
-                    reason TEXT NOT NULL,
-                    created_at INTEGER NOT NULL,
-                    PRIMARY KEY (raid_id, user_id)
-                )
-                """
-            )
-
-            await db.commit()
+        await MigrationRunner(self.db_path, "raid_store", MIGRATIONS, journal_mode="WAL").run()
 
         self._initialized = True
         logger.info("Raid store initialized at %s", self.db_path)
@@ -279,8 +324,11 @@ class RaidStore:
                     created_at,
                 ),
             )
+            raid_id = cursor.lastrowid
+            await self._schedule_jobs(db, [(raid_id, start_time)])
             await db.commit()
-            return cursor.lastrowid
+        self._notify_jobs_changed()
+        return raid_id
 
     async def set_message_id(self, raid_id: int, message_id: int) -> None:
         """Associate a Discord message with a raid."""
@@ -468,6 +516,7 @@ class RaidStore:
                 "UPDATE raids SET status = 'closed', closed_at = ? WHERE id = ?",
                 (timestamp, raid_id),
             )
+            await db.execute("DELETE FROM raid_jobs WHERE raid_id = ?", (raid_id,))
             await db.commit()
 
     async def update_status(self, raid_id: int, status: str) -> None:
@@ -481,6 +530,8 @@ class RaidStore:
                 "UPDATE raids SET status = ?, closed_at = ? WHERE id = ?",
                 (status, closed_at, raid_id),
             )
+            if closed_at:
+                await db.execute("DELETE FROM raid_jobs WHERE raid_id = ?", (raid_id,))
             await db.commit()
 
     async def update_raid_details(
@@ -502,7 +553,10 @@ class RaidStore:
                 (title, description, start_time, raid_id),
             )
             await db.execute("DELETE FROM raid_reminders WHERE raid_id = ?", (raid_id,))
+            await db.execute("DELETE FROM raid_jobs WHERE raid_id = ?", (raid_id,))
+            await self._schedule_jobs(db, [(raid_id, start_time)])
             await db.commit()
+        self._notify_jobs_changed()
 
     async def update_raid_slots(
         self,
@@ -592,29 +646,6 @@ class RaidStore:
             rows = await cursor.fetchall()
             return [self._row_to_record(row) for row in rows]
 
-    async def list_raids_past_grace(
-        self,
-        now_ts: int,
-        grace_seconds: int,
-    ) -> List[RaidRecord]:
-        """Return open/locked raids that passed start_time + grace."""
-        await self.initialize()
-        cutoff = now_ts - grace_seconds
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            cursor = await db.execute(
-                """
-                SELECT id, guild_id, channel_id, message_id, creator_id, title, description,
-                       game, mode, start_time, tanks_needed, healers_needed, dps_needed,
-                       bench_needed, status, created_at, closed_at
-                FROM raids
-                WHERE status IN ('open', 'locked') AND start_time <= ?
-                """,
-                (cutoff,),
-            )
-            rows = await cursor.fetchall()
-            return [self._row_to_record(row) for row in rows]
-
     async def list_upcoming_raids(self, now_ts: int, limit: int = 10) -> List[RaidRecord]:
         """Return upcoming raids for listing."""
         await self.initialize()
@@ -1090,37 +1121,171 @@ class RaidStore:
             row = await cursor.fetchone()
             return int(row[0]) if row else 0
 
-    async def get_sent_reminders(self, raid_ids: List[int]) -> Dict[int, List[int]]:
-        """Return sent reminders for raids."""
+    async def mark_reminder_sent(self, raid_id: int, reminder_hours: int) -> None:
+        """Mark a reminder as sent."""
+        await self.initialize()
+        sent_at = int(datetime.now(timezone.utc).timestamp())
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute(
+                """
+                INSERT OR REPLACE INTO raid_reminders (raid_id, reminder_hours, sent_at)
+                VALUES (?, ?, ?)
+                """,
+                (raid_id, reminder_hours, sent_at),
+            )
+            await db.commit()
+
+    def configure_jobs(self, plan: JobPlan) -> None:
+        """Set which jobs are scheduled for every raid.
+
+        Args:
+            plan: (job_type, offset, seconds relative to start) per job; an
+                empty plan stops scheduling new jobs
+        """
+        self._job_plan = tuple(plan)
+
+    def _notify_jobs_changed(self) -> None:
+        if self._job_plan:
+            self.jobs_changed.set()
+
+    async def _schedule_jobs(
+        self,
+        db: aiosqlite.Connection,
+        raids: Iterable[Tuple[int, int]],
+        skip: Optional[set] = None,
+    ) -> None:
+        """Insert the planned jobs for (raid_id, start_time) pairs."""
+        if not self._job_plan:
+            return
+        rows = [
+            (raid_id, job_type, offset, start_time + delta)
+            for raid_id, start_time in raids
+            for job_type, offset, delta in self._job_plan
+            if not skip or (raid_id, job_type, offset) not in skip
+        ]
+        await db.executemany(
+            """
+            INSERT OR REPLACE INTO raid_jobs (raid_id, job_type, job_offset, due_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            rows,
+        )
+
+    async def resync_jobs(self) -> int:
+        """Rebuild the job queue of all open/locked raids from the current plan.
+
+        Covers raids created before the queue existed and plan changes
+        between restarts. Reminders already recorded as sent are not
+        scheduled again.
+
+        Returns:
+            Number of raids scheduled
+        """
+        await self.initialize()
+        async with aiosqlite.connect(self.db_path) as db:
+            cursor = await db.execute(
+                "SELECT id, start_time FROM raids WHERE status IN ('open', 'locked')"
+            )
+            raids = [(int(row[0]), int(row[1])) for row in await cursor.fetchall()]
+            cursor = await db.execute(
+                """
+                SELECT m.raid_id, m.reminder_hours
+                FROM raid_reminders m
+                JOIN raids r ON r.id = m.raid_id
+                WHERE r.status IN ('open', 'locked')
+                """
+            )
+            skip = set()
+            for raid_id, marker in await cursor.fetchall():
+                # DM reminders are recorded as negative minutes
+                if marker < 0:
+                    skip.add((int(raid_id), JOB_DM_REMINDER, -int(marker)))
+                else:
+                    skip.add((int(raid_id), JOB_REMINDER, int(marker)))
+
+            await db.execute("DELETE FROM raid_jobs")
+            await self._schedule_jobs(db, raids, skip)
+            await db.commit()
+        self._notify_jobs_changed()
+        return len(raids)
+
+    async def list_due_jobs(self, now_ts: int) -> List[RaidJob]:
+        """Return all jobs due at now_ts of open/locked raids, in run order."""
         await self.initialize()
-        if not raid_ids:
-            return {}
-        placeholders = ",".join("?" for _ in raid_ids)
         async with aiosqlite.connect(self.db_path) as db:
             cursor = await db.execute(
                 f"""
-                SELECT raid_id, reminder_hours
-                FROM raid_reminders
-                WHERE raid_id IN ({placeholders})
+                SELECT j.job_type, j.job_offset, j.due_at, j.attempts, {_RAID_COLUMNS}
+                FROM raid_jobs j
+                JOIN raids r ON r.id = j.raid_id
+                WHERE j.due_at <= ? AND r.status IN ('open', 'locked')
                 """,
-                tuple(raid_ids),
+                (now_ts,),
             )
             rows = await cursor.fetchall()
-            result: Dict[int, List[int]] = {}
-            for raid_id, hours in rows:
-                result.setdefault(int(raid_id), []).append(int(hours))
-            return result
+        jobs = [
+            RaidJob(
+                raid=self._row_to_record(row[4:]),
+                job_type=row[0],
+                offset=int(row[1]),
+                due_at=int(row[2]),
+                attempts=int(row[3]),
+            )
+            for row in rows
+        ]
+        order = {job_type: index for index, job_type in enumerate(JOB_ORDER)}
+        jobs.sort(key=lambda job: (job.due_at, order.get(job.job_type, len(order))))
+        return jobs
 
-    async def mark_reminder_sent(self, raid_id: int, reminder_hours: int) -> None:
-        """Mark a reminder as sent."""
+    async def next_job_due_at(self) -> Optional[int]:
+        """Return when the next job of an open/locked raid is due."""
+        await self.initialize()
+        async with aiosqlite.connect(self.db_path) as db:
+            cursor = await db.execute(
+                """
+                SELECT j.due_at
+                FROM raid_jobs j
+                JOIN raids r ON r.id = j.raid_id
+                WHERE r.status IN ('open', 'locked')
+                ORDER BY j.due_at ASC
+                LIMIT 1
+                """
+            )
+            row = await cursor.fetchone()
+            return int(row[0]) if row else None
+
+    async def retry_job(self, job: RaidJob, due_at: int) -> None:
+        """Move a failed job to due_at and count the attempt.
+
+        Matching on the due time that was read leaves the job alone if the
+        raid was rescheduled meanwhile.
+        """
         await self.initialize()
-        sent_at = int(datetime.now(timezone.utc).timestamp())
         async with aiosqlite.connect(self.db_path) as db:
             await db.execute(
                 """
-                INSERT OR REPLACE INTO raid_reminders (raid_id, reminder_hours, sent_at)
-                VALUES (?, ?, ?)
+                UPDATE raid_jobs SET due_at = ?, attempts = attempts + 1
+                WHERE raid_id = ? AND job_type = ? AND job_offset = ? AND due_at = ?
                 """,
-                (raid_id, reminder_hours, sent_at),
+                (due_at, job.raid.id, job.job_type, job.offset, job.due_at),
+            )
+            await db.commit()
+
+    async def complete_jobs(self, jobs: Iterable[RaidJob]) -> None:
+        """Remove processed jobs from the queue.
+
+        Jobs re-scheduled since they were read (a moved raid) are kept.
+        """
+        keys = [(job.raid.id, job.job_type, job.offset, job.due_at) for job in jobs]
+        if not keys:
+            return
+        await self.initialize()
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.executemany(
+                """
+                DELETE FROM raid_jobs
+                WHERE raid_id = ? AND job_type = ? AND job_offset = ? AND due_at = ?
+                """,
+                keys,
             )
             await db.commit()
@@ -8,6 +8,26 @@ from typing import Dict, List, Optional
 
 import aiosqlite
 
+from src.database.migrations import Migration, MigrationRunner
+
+
+MIGRATIONS = [
+    Migration(1, "initial schema", (
+        """
+        CREATE TABLE IF NOT EXISTS raid_templates (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            guild_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            tanks INTEGER NOT NULL,
+            healers INTEGER NOT NULL,
+            dps INTEGER NOT NULL,
+            bench INTEGER NOT NULL,
+            is_default INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_raid_templates_guild ON raid_templates(guild_id)",
+    )),
+]
 
 DEFAULT_TEMPLATE_SPECS = [
     {"name": "Standard", "tanks": 2, "healers": 2, "dps": 6, "bench": 0, "is_default": True},
@@ -45,26 +65,7 @@ class RaidTemplateStore:
     async def initialize(self) -> None:
         if self._initialized:
             return
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("PRAGMA journal_mode=WAL")
-            await db.execute(
-                """
-                CREATE TABLE IF NOT EXISTS raid_templates (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    guild_id INTEGER NOT NULL,
-                    name TEXT NOT NULL,
-                    tanks INTEGER NOT NULL,
-                    healers INTEGER NOT NULL,
-                    dps INTEGER NOT NULL,
-                    bench INTEGER NOT NULL,
-                    is_default INTEGER NOT NULL DEFAULT 0
-                )
-                """
-            )
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_raid_templates_guild ON raid_templates(guild_id)"
-            )
-            await db.commit()
+        await MigrationRunner(self.db_path, "raid_templates", MIGRATIONS, journal_mode="WAL").run()
         self._initialized = True
 
     def _row_to_template(self, row) -> RaidTemplate:
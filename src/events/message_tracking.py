@@ -12,9 +12,18 @@ from discord.ext import commands
 from src.database.message_store import MessageStore
 from src.utils.log_helper import DiscordLogger
 from src.utils.dashboard_manager import DashboardManager
+from src.utils.logger import LogSampler
+from src.utils.metrics import get_registry
 
 
 logger = logging.getLogger("guildscout.message_tracking")
+# Per-message debug events: one line per event type every 10s
+_sampled = LogSampler(logger)
+
+_messages_tracked = get_registry().counter(
+    "guildscout_messages_tracked_total",
+    "Messages counted by live tracking"
+)
 
 
 class MessageTracker(commands.Cog):
@@ -247,6 +256,10 @@ class MessageTracker(commands.Cog):
         Args:
             message: Message object
         """
+        # Pin notices etc. in the dashboard channel are cleaned up later
+        if message.type is not discord.MessageType.default and self.dashboard_manager:
+            await self.dashboard_manager.track_system_message(message)
+
         # Ignore bot messages
         if message.author.bot:
             return
@@ -262,9 +275,11 @@ class MessageTracker(commands.Cog):
 
             if message.id in self._recent_message_ids:
                 self._duplicates_blocked += 1
-                logger.debug(
-                    f"Duplicate message event detected for message {message.id} "
-                    f"from {message.author.name} - skipping to prevent double-count"
+                _sampled.debug(
+                    "duplicate",
+                    "Duplicate message event detected for message %d from %s - skipping to prevent double-count",
+                    message.id,
+                    message.author.name
                 )
                 return
             # Mark as seen
@@ -274,7 +289,7 @@ class MessageTracker(commands.Cog):
         channel = message.channel
         if isinstance(channel, (discord.TextChannel, discord.Thread)):
             if self._should_exclude_channel(channel):
-                logger.debug(f"Excluded channel: {channel.name}")
+                _sampled.debug("excluded", "Excluded channel: %s", channel.name)
                 return
 
         # Check if import is currently running
@@ -297,17 +312,19 @@ class MessageTracker(commands.Cog):
                     if message_time < import_start_time:
                         # Message was created BEFORE import started
                         # Skip tracking - historical import will handle it
-                        logger.debug(
-                            f"Skipping message from {message.author.name} "
-                            f"(created before import started)"
+                        _sampled.debug(
+                            "before_import",
+                            "Skipping message from %s (created before import started)",
+                            message.author.name
                         )
                         return
                     else:
                         # Message was created AFTER import started
                         # Track it - historical import won't see it
-                        logger.debug(
-                            f"Tracking new message from {message.author.name} "
-                            f"during active import"
+                        _sampled.debug(
+                            "during_import",
+                            "Tracking new message from %s during active import",
+                            message.author.name
                         )
 
             # Track the message
@@ -319,10 +336,9 @@ class MessageTracker(commands.Cog):
                 count=1,
                 message_date=message.created_at
             )
-            logger.debug(
-                f"Tracked message from {message.author.name} in {channel.name}"
-            )
-            logger.debug(
+            _messages_tracked.inc()
+            _sampled.debug(
+                "tracked",
                 "🟢 Live-Tracking | Guild: %s (%d) | Channel: #%s (%d) | User: %s (%d) | Message ID: %d",
                 message.guild.name,
                 message.guild.id,
@@ -368,8 +384,11 @@ class MessageTracker(commands.Cog):
                 guild_id=message.guild.id,
                 user_id=message.author.id,
                 channel_id=channel.id,
-                delta=-1
+                delta=-1,
+                message_date=message.created_at
             )
+            if self.dashboard_manager:
+                self.dashboard_manager.record_message_removed(message.guild.id, message.author.id)
             logger.debug(
                 "Adjusted count for deleted message from %s in %s",
                 getattr(message.author, "name", "unknown"),
@@ -400,6 +419,8 @@ class MessageTracker(commands.Cog):
                     channel_id=channel_id,
                     delta=-count
                 )
+                if self.dashboard_manager:
+                    self.dashboard_manager.record_message_removed(guild_id, user_id, count)
             if aggregate:
                 logger.debug("Adjusted counts for %d deleted messages (bulk)", sum(aggregate.values()))
         except Exception as exc:
@@ -10,7 +10,9 @@ from typing import Optional
 import discord
 from discord.ext import commands
 
-from src.database.raid_store import RaidStore
+from src.database.bot_message_store import PURPOSE_RAID_SLOT_PING
+from src.database.raid_store import RaidRecord, RaidStore
+from src.utils.bot_messages import track_message
 from src.utils.config import Config
 from src.utils.raid_utils import (
     CONFIRM_EMOJI,
@@ -24,6 +26,7 @@ from src.utils.raid_utils import (
     build_raid_embed,
     get_notice_delete_after,
     get_role_limit,
+    purge_raid_notices,
 )
 
 
@@ -314,22 +317,9 @@ class RaidEvents(commands.Cog):
     async def _cleanup_slot_pings(
         self,
         channel: discord.TextChannel,
-        raid_title: str,
-        limit: int = 50,
+        raid: RaidRecord,
     ) -> None:
-        title_key = (raid_title or "").lower()
-        async for message in channel.history(limit=limit):
-            if not message.author or not message.author.bot:
-                continue
-            content = (message.content or "").lower()
-            if "open slots" not in content and "slots frei" not in content:
-                continue
-            if title_key and title_key not in content:
-                continue
-            try:
-                await message.delete()
-            except Exception:
-                pass
+        await purge_raid_notices(channel, raid, PURPOSE_RAID_SLOT_PING)
 
     async def _update_raid_message(
         self,
@@ -353,7 +343,7 @@ class RaidEvents(commands.Cog):
             open_dps = max(raid.dps_needed - len(signups.get(ROLE_DPS, [])), 0)
             total_open = open_tanks + open_healers + open_dps
             if total_open <= 0:
-                await self._cleanup_slot_pings(message.channel, raid.title)
+                await self._cleanup_slot_pings(message.channel, raid)
         embed = build_raid_embed(
             raid,
             signups,
@@ -509,7 +499,7 @@ class RaidEvents(commands.Cog):
         total_open = open_tanks + open_healers + open_dps
         if total_open <= 0:
             if isinstance(message.channel, discord.TextChannel):
-                await self._cleanup_slot_pings(message.channel, raid.title)
+                await self._cleanup_slot_pings(message.channel, raid)
             return
 
         cooldown = self.config.raid_open_slot_ping_minutes * 60
@@ -535,11 +525,12 @@ class RaidEvents(commands.Cog):
         )
         try:
             if isinstance(message.channel, discord.TextChannel):
-                await self._cleanup_slot_pings(message.channel, raid.title)
+                await self._cleanup_slot_pings(message.channel, raid)
             if delete_after:
-                await message.channel.send(content, delete_after=delete_after)
+                ping = await message.channel.send(content, delete_after=delete_after)
             else:
-                await message.channel.send(content)
+                ping = await message.channel.send(content)
+            await track_message(ping, PURPOSE_RAID_SLOT_PING, raid.id)
             await self.raid_store.mark_alert_sent(raid.id, "open_slots")
         except Exception:
             logger.warning("Failed to send open slot ping", exc_info=True)
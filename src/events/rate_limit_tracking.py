@@ -1,7 +1,7 @@
 """Discord API Rate Limit Event Tracking."""
 
 import logging
-from discord.ext import commands
+from discord.ext import commands, tasks
 
 from src.utils.rate_limit_monitor import get_monitor
 
@@ -9,34 +9,28 @@ logger = logging.getLogger("guildscout.rate_limits")
 
 
 class RateLimitTracking(commands.Cog):
-    """Tracks Discord API rate limits using bot events."""
+    """
+    Reports Discord REST usage.
+
+    Requests themselves are counted by the HTTP trace installed on the bot's
+    client (see RateLimitMonitor.create_trace_config); gateway events don't
+    cost REST budget and are not counted.
+    """
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.monitor = get_monitor()
+        self.report_task.start()
         logger.info("📊 Rate limit tracking enabled")
 
-    @commands.Cog.listener()
-    async def on_command(self, ctx: commands.Context):
-        """Track command invocation as an API request."""
-        self.monitor.track_request()
-
-    @commands.Cog.listener()
-    async def on_message(self, message):
-        """Track message events (potential API requests)."""
-        # Only track if bot processes this message
-        if not message.author.bot:
-            self.monitor.track_request()
-
-    @commands.Cog.listener()
-    async def on_guild_channel_update(self, before, after):
-        """Track channel updates."""
-        self.monitor.track_request()
-
-    @commands.Cog.listener()
-    async def on_member_update(self, before, after):
-        """Track member updates."""
-        self.monitor.track_request()
+    def cog_unload(self):
+        self.report_task.cancel()
+
+    @tasks.loop(minutes=15)
+    async def report_task(self):
+        """Log request rates and the biggest budget consumers."""
+        if self.monitor.total_requests:
+            self.monitor.log_stats()
 
 
 async def setup(bot: commands.Bot):
@@ -54,6 +54,7 @@ class VoiceTracking(commands.Cog):
                         start_time=start_time,
                         end_time=now
                     )
+                    self._record_dashboard_voice(guild_id, user_id, int((now - start_time).total_seconds()))
                     logger.debug(f"Logged voice session for {member.display_name}: {(now - start_time).total_seconds()}s")
 
         # Case 2: User joined a voice channel (or moved)
@@ -65,6 +66,13 @@ class VoiceTracking(commands.Cog):
                 self.active_sessions[key] = now
                 logger.debug(f"Started voice session for {member.display_name} in {after.channel.name}")
 
+    def _record_dashboard_voice(self, guild_id: int, user_id: int, seconds: int):
+        """Forward a finished session to the dashboard's in-memory totals."""
+        message_tracker = self.bot.get_cog('MessageTracker')
+        dashboard_manager = getattr(message_tracker, 'dashboard_manager', None)
+        if dashboard_manager:
+            dashboard_manager.record_voice_session(guild_id, user_id, seconds)
+
     def scan_active_users(self):
         """Scan all guilds for currently active voice users (use on startup)."""
         if not self.config.voice_tracking_enabled:
@@ -1,23 +1,89 @@
 """CSV exporter for ranking data."""
 
+import csv
+import gzip
 import logging
-import pandas as pd
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Iterable, List, Optional
 from datetime import datetime
 
 
 logger = logging.getLogger("guildscout.csv_exporter")
 
+# Column order of ranking exports
+RANKING_COLUMNS = [
+    "Rang",
+    "Username",
+    "Gesamt-Score",
+    "Nachrichten",
+    "Tage_im_Server",
+    "Beigetreten_am",
+    "Aktivitäts-Score",
+    "Tage-Score",
+    "User_ID",
+]
+
+EXPORT_FORMATS = ("csv", "parquet")
+
+# Rows buffered per Parquet row group / record batch
+PARQUET_BATCH_ROWS = 1024
+
+_pyarrow = None
+
+
+def _load_pyarrow():
+    """Import pyarrow on first use (only needed for Parquet exports)."""
+    global _pyarrow
+    if _pyarrow is None:
+        try:
+            import pyarrow
+            import pyarrow.parquet  # noqa: F401 - registers pyarrow.parquet
+        except ImportError as e:
+            raise ImportError(
+                "Parquet export requires pyarrow (pip install pyarrow)"
+            ) from e
+        _pyarrow = pyarrow
+    return _pyarrow
+
+
+def _parquet_available() -> bool:
+    try:
+        _load_pyarrow()
+    except ImportError:
+        return False
+    return True
+
+
+def _ranking_row(rank: int, score) -> List[Any]:
+    """Build one export row in RANKING_COLUMNS order."""
+    return [
+        rank,
+        score.display_name,
+        score.final_score,
+        score.message_count,
+        score.days_in_server,
+        score.join_date.strftime("%Y-%m-%d %H:%M:%S"),
+        score.activity_score,
+        score.days_score,
+        score.user_id,
+    ]
+
 
 class CSVExporter:
-    """Exports ranking data to CSV files."""
+    """Exports ranking data to CSV files.
+
+    Rows are written as they are produced, so memory use does not grow
+    with the size of the ranking. Optional outputs are gzip-compressed CSV
+    and Parquet (pyarrow, imported only when used).
+    """
 
     def __init__(
         self,
         export_dir: str = "exports",
         delimiter: str = ",",
-        encoding: str = "utf-8-sig"
+        encoding: str = "utf-8-sig",
+        export_format: str = "csv",
+        compress: bool = False
     ):
         """
         Initialize the CSV exporter.
@@ -26,74 +92,135 @@ class CSVExporter:
             export_dir: Directory to save CSV files
             delimiter: CSV delimiter character
             encoding: File encoding
+            export_format: Default output format ("csv" or "parquet"; CSV
+                if pyarrow is not installed)
+            compress: Gzip CSV output by default
         """
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format: {export_format}")
+        if export_format == "parquet" and not _parquet_available():
+            # Checked up front, so /analyze doesn't fail after the analysis ran
+            logger.warning("export.format is parquet but pyarrow is not installed - exporting CSV")
+            export_format = "csv"
+
         self.export_dir = Path(export_dir)
         self.delimiter = delimiter
         self.encoding = encoding
+        self.export_format = export_format
+        self.compress = compress
 
         # Create export directory if it doesn't exist
         self.export_dir.mkdir(parents=True, exist_ok=True)
 
+    @staticmethod
+    def _default_filename(role_name: str) -> str:
+        timestamp = datetime.utcnow().strftime("%Y-%m-%d_%H-%M-%S")
+        return f"guildscout_{role_name}_{timestamp}"
+
     def export_ranking(
         self,
-        ranked_users: List[tuple],
+        ranked_users: Iterable[tuple],
         role_name: str,
-        filename: str = None
+        filename: str = None,
+        export_format: Optional[str] = None,
+        compress: Optional[bool] = None
     ) -> str:
         """
         Export ranking to CSV file.
 
         Args:
-            ranked_users: List of (rank, UserScore) tuples
+            ranked_users: Iterable of (rank, UserScore) tuples; may be a
+                generator, rows are written as they are produced
             role_name: Name of the role analyzed
             filename: Optional custom filename (without extension)
+            export_format: "csv" or "parquet" (defaults to the exporter setting)
+            compress: Gzip the CSV (defaults to the exporter setting)
 
         Returns:
-            Path to the created CSV file
+            Path to the created file
         """
+        export_format = export_format or self.export_format
+        compress = self.compress if compress is None else compress
+        if export_format == "parquet" and not _parquet_available():
+            logger.warning("Parquet export requested but pyarrow is not installed - exporting CSV")
+            export_format = "csv"
+
         # Generate filename if not provided
         if filename is None:
-            timestamp = datetime.utcnow().strftime("%Y-%m-%d_%H-%M-%S")
-            filename = f"guildscout_{role_name}_{timestamp}"
-
-        # Ensure .csv extension
-        if not filename.endswith(".csv"):
-            filename += ".csv"
+            filename = self._default_filename(role_name)
 
-        filepath = self.export_dir / filename
+        if export_format == "parquet":
+            if not filename.endswith(".parquet"):
+                filename += ".parquet"
+            filepath = self.export_dir / filename
+            count = self._write_parquet(filepath, ranked_users)
+        elif export_format == "csv":
+            extension = ".csv.gz" if compress else ".csv"
+            if filename.endswith(".csv") and compress:
+                filename += ".gz"
+            elif not filename.endswith(extension):
+                filename += extension
+            filepath = self.export_dir / filename
+            count = self._write_csv(filepath, ranked_users, compress)
+        else:
+            raise ValueError(f"Unknown export format: {export_format}")
 
-        # Prepare data for DataFrame with logical column order
-        data = []
-        for rank, score in ranked_users:
-            data.append({
-                "Rang": rank,
-                "Username": score.display_name,
-                "Gesamt-Score": score.final_score,
-                "Nachrichten": score.message_count,
-                "Tage_im_Server": score.days_in_server,
-                "Beigetreten_am": score.join_date.strftime("%Y-%m-%d %H:%M:%S"),
-                "Aktivitäts-Score": score.activity_score,
-                "Tage-Score": score.days_score,
-                "User_ID": score.user_id
-            })
-
-        # Create DataFrame
-        df = pd.DataFrame(data)
-
-        # Export to CSV
-        df.to_csv(
-            filepath,
-            index=False,
-            sep=self.delimiter,
-            encoding=self.encoding
-        )
-
-        logger.info(f"Exported {len(data)} users to {filepath}")
+        logger.info(f"Exported {count} users to {filepath}")
         return str(filepath)
 
+    def _write_csv(self, filepath: Path, ranked_users: Iterable[tuple], compress: bool) -> int:
+        """Stream ranking rows into a (gzipped) CSV file."""
+        if compress:
+            handle = gzip.open(filepath, "wt", encoding=self.encoding, newline="")
+        else:
+            handle = open(filepath, "w", encoding=self.encoding, newline="")
+
+        count = 0
+        with handle:
+            writer = csv.writer(handle, delimiter=self.delimiter)
+            writer.writerow(RANKING_COLUMNS)
+            for rank, score in ranked_users:
+                writer.writerow(_ranking_row(rank, score))
+                count += 1
+        return count
+
+    def _write_parquet(self, filepath: Path, ranked_users: Iterable[tuple]) -> int:
+        """Write ranking rows to Parquet in fixed-size record batches."""
+        pa = _load_pyarrow()
+        schema = pa.schema([
+            ("Rang", pa.int64()),
+            ("Username", pa.string()),
+            ("Gesamt-Score", pa.float64()),
+            ("Nachrichten", pa.int64()),
+            ("Tage_im_Server", pa.int64()),
+            ("Beigetreten_am", pa.string()),
+            ("Aktivitäts-Score", pa.float64()),
+            ("Tage-Score", pa.float64()),
+            ("User_ID", pa.int64()),
+        ])
+
+        count = 0
+        columns: List[List[Any]] = [[] for _ in RANKING_COLUMNS]
+
+        def flush(writer) -> None:
+            writer.write_batch(pa.record_batch(columns, schema=schema))
+            for column in columns:
+                column.clear()
+
+        with pa.parquet.ParquetWriter(str(filepath), schema) as writer:
+            for rank, score in ranked_users:
+                for column, value in zip(columns, _ranking_row(rank, score)):
+                    column.append(value)
+                count += 1
+                if len(columns[0]) >= PARQUET_BATCH_ROWS:
+                    flush(writer)
+            if columns[0] or count == 0:
+                flush(writer)
+        return count
+
     def export_with_stats(
         self,
-        ranked_users: List[tuple],
+        ranked_users: Iterable[tuple],
         role_name: str,
         stats: dict,
         scoring_info: dict,
@@ -103,7 +230,7 @@ class CSVExporter:
         Export ranking with additional statistics sheet.
 
         Args:
-            ranked_users: List of (rank, UserScore) tuples
+            ranked_users: Iterable of (rank, UserScore) tuples
             role_name: Name of the role analyzed
             stats: Statistics dictionary
             scoring_info: Scoring configuration
@@ -114,8 +241,7 @@ class CSVExporter:
         """
         # Generate filename if not provided
         if filename is None:
-            timestamp = datetime.utcnow().strftime("%Y-%m-%d_%H-%M-%S")
-            filename = f"guildscout_{role_name}_{timestamp}"
+            filename = self._default_filename(role_name)
 
         # For Excel files with multiple sheets
         if filename.endswith(".xlsx"):
@@ -124,23 +250,8 @@ class CSVExporter:
             # For CSV, just use regular export
             return self.export_ranking(ranked_users, role_name, filename)
 
-        # Prepare ranking data with logical column order
-        ranking_data = []
-        for rank, score in ranked_users:
-            ranking_data.append({
-                "Rang": rank,
-                "Username": score.display_name,
-                "Gesamt-Score": score.final_score,
-                "Nachrichten": score.message_count,
-                "Tage_im_Server": score.days_in_server,
-                "Beigetreten_am": score.join_date.strftime("%Y-%m-%d %H:%M:%S"),
-                "Aktivitäts-Score": score.activity_score,
-                "Tage-Score": score.days_score,
-                "User_ID": score.user_id
-            })
-
         # Prepare stats data
-        stats_data = [{
+        stats_data: List[Dict[str, Any]] = [{
             "Metric": "Total Users",
             "Value": stats["total_users"]
         }, {
@@ -166,14 +277,23 @@ class CSVExporter:
             "Value": f"{scoring_info['weight_messages']:.1%}"
         }]
 
-        # Create DataFrames
-        df_ranking = pd.DataFrame(ranking_data)
-        df_stats = pd.DataFrame(stats_data)
+        # Write-only workbook streams rows to disk instead of keeping cells in memory
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        ranking_sheet = workbook.create_sheet("Rankings")
+        ranking_sheet.append(RANKING_COLUMNS)
+        count = 0
+        for rank, score in ranked_users:
+            ranking_sheet.append(_ranking_row(rank, score))
+            count += 1
+
+        stats_sheet = workbook.create_sheet("Statistics")
+        stats_sheet.append(["Metric", "Value"])
+        for entry in stats_data:
+            stats_sheet.append([entry["Metric"], entry["Value"]])
 
-        # Export to Excel with multiple sheets
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            df_ranking.to_excel(writer, sheet_name="Rankings", index=False)
-            df_stats.to_excel(writer, sheet_name="Statistics", index=False)
+        workbook.save(filepath)
 
-        logger.info(f"Exported {len(ranking_data)} users to {filepath}")
+        logger.info(f"Exported {count} users to {filepath}")
         return str(filepath)
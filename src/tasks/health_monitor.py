@@ -10,6 +10,7 @@ import aiosqlite
 from discord.ext import commands, tasks
 
 from src.utils import Config
+from src.utils.loop_monitor import get_loop_monitor
 
 logger = logging.getLogger("guildscout.health_monitor")
 
@@ -406,6 +407,18 @@ class HealthMonitor(commands.Cog):
             inline=True
         )
 
+        # Event loop responsiveness
+        loop_monitor = get_loop_monitor()
+        lag = loop_monitor.get_lag_stats()
+        loop_status = "✅" if lag['p99'] < loop_monitor.threshold else "⚠️"
+        loop_lines = [f"{loop_status} p99 {lag['p99']*1000:.0f}ms, {lag['stalls']} Blockaden"]
+        loop_lines.extend(loop_monitor.format_offenders(limit=3))
+        embed.add_field(
+            name="🧵 Event-Loop",
+            value="\n".join(loop_lines)[:1024],
+            inline=False
+        )
+
         embed.set_footer(text="Nächster Bericht in 24 Stunden")
 
         # Send report
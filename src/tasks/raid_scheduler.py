@@ -1,452 +1,447 @@
-"""Background task to close raids after their start time."""
+"""Background task running due raid jobs (reminders, check-ins, auto-close).
+
+Every raid gets its jobs queued in the ``raid_jobs`` table when it is created
+or rescheduled. The task fetches all due jobs in one query, runs them, and
+then sleeps until the next job is due - or until the store reports a change.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, timezone
+from typing import List, Tuple
 
 import discord
 from discord.ext import commands, tasks
 
-from src.database.raid_store import RaidStore
+from src.database.bot_message_store import (
+    PURPOSE_RAID_REMINDER,
+    PURPOSE_RAID_SLOT_PING,
+)
+from src.database.raid_store import (
+    JOB_CLOSE,
+    JOB_CONFIRMATION,
+    JOB_CONFIRMATION_REMINDER,
+    JOB_DM_REMINDER,
+    JOB_NO_SHOW,
+    JOB_REMINDER,
+    RaidJob,
+    RaidRecord,
+    RaidStore,
+)
+from src.utils.bot_messages import delete_message_ids, track_message
 from src.utils.config import Config
 from src.utils.raid_utils import (
     CONFIRM_EMOJI,
     build_raid_embed,
     build_raid_log_embed,
     get_notice_delete_after,
+    purge_raid_notices,
 )
 
 
 logger = logging.getLogger("guildscout.tasks.raid_scheduler")
 
+# Notices that are this late (bot offline, raid created or moved too close
+# to start) are dropped instead of sent
+NOTICE_WINDOW_SECONDS = 120
+# Upper bound for one sleep, in case the clock jumps
+MAX_SLEEP_SECONDS = 900
+# Failed jobs are retried after 1, 2, 4 ... minutes (at most hourly). Notices
+# get a single retry, which still lands inside their window.
+RETRY_BASE_SECONDS = 60
+RETRY_MAX_SECONDS = 3600
+NOTICE_RETRIES = 1
+
+_NOTICE_JOBS = (JOB_REMINDER, JOB_DM_REMINDER, JOB_CONFIRMATION, JOB_CONFIRMATION_REMINDER)
+
+
+def build_job_plan(config: Config) -> List[Tuple[str, int, int]]:
+    """Jobs to schedule per raid as (job_type, offset, seconds relative to start)."""
+    plan = [(JOB_REMINDER, hours, -hours * 3600) for hours in config.raid_reminder_hours]
+    plan += [(JOB_DM_REMINDER, minutes, -minutes * 60) for minutes in config.raid_dm_reminder_minutes]
+
+    if config.raid_checkin_enabled:
+        minutes = config.raid_confirmation_minutes
+        if minutes > 0:
+            plan.append((JOB_CONFIRMATION, minutes, -minutes * 60))
+        minutes = config.raid_confirmation_reminder_minutes
+        if minutes > 0:
+            plan.append((JOB_CONFIRMATION_REMINDER, minutes, -minutes * 60))
+        plan.append((JOB_NO_SHOW, 0, 0))
+
+    if config.raid_auto_close_at_start:
+        plan.append((JOB_CLOSE, 0, 0))
+    elif config.raid_auto_close_after_hours > 0:
+        plan.append((JOB_CLOSE, 0, config.raid_auto_close_after_hours * 3600))
+    return plan
+
 
 class RaidScheduler(commands.Cog):
-    """Closes raids automatically and updates final roster."""
+    """Runs scheduled raid jobs and closes raids with their final roster."""
 
     def __init__(self, bot: commands.Bot, config: Config, raid_store: RaidStore):
         self.bot = bot
         self.config = config
         self.raid_store = raid_store
         if self.config.raid_enabled:
-            self.close_task.start()
+            self.raid_store.configure_jobs(build_job_plan(self.config))
+            self.job_task.start()
 
     def cog_unload(self) -> None:
-        if self.close_task.is_running():
-            self.close_task.cancel()
+        if self.job_task.is_running():
+            self.job_task.cancel()
 
-    @tasks.loop(minutes=1)
-    async def close_task(self) -> None:
+    @tasks.loop()
+    async def job_task(self) -> None:
+        # Cleared before querying, so changes made while we run wake the next sleep
+        self.raid_store.jobs_changed.clear()
         now_ts = int(datetime.now(timezone.utc).timestamp())
-        await self._send_reminders(now_ts)
-        await self._send_dm_reminders(now_ts)
-        await self._send_confirmation_checks(now_ts)
-        await self._send_confirmation_reminders(now_ts)
-        await self._mark_no_shows(now_ts)
-
-        raids_to_close = {}
-        if self.config.raid_auto_close_at_start:
-            for raid in await self.raid_store.list_raids_to_close(now_ts):
-                raids_to_close[raid.id] = raid
-
-        grace_hours = self.config.raid_auto_close_after_hours
-        if grace_hours > 0:
-            grace_seconds = grace_hours * 3600
-            for raid in await self.raid_store.list_raids_past_grace(now_ts, grace_seconds):
-                raids_to_close[raid.id] = raid
-
-        for raid in raids_to_close.values():
-            await self.raid_store.close_raid(raid.id, closed_at=now_ts)
-            await self.raid_store.archive_participation(raid.id, "auto-closed")
-
-            guild = self.bot.get_guild(raid.guild_id)
-            if not guild:
-                continue
+        await self.run_due_jobs(now_ts)
 
-            channel = guild.get_channel(raid.channel_id)
-            if not isinstance(channel, discord.TextChannel):
-                try:
-                    channel = await guild.fetch_channel(raid.channel_id)
-                except Exception:
-                    continue
+        next_due = await self.raid_store.next_job_due_at()
+        now_ts = int(datetime.now(timezone.utc).timestamp())
+        timeout = MAX_SLEEP_SECONDS if next_due is None else min(MAX_SLEEP_SECONDS, next_due - now_ts)
+        if timeout <= 0:
+            return
+        try:
+            await asyncio.wait_for(self.raid_store.jobs_changed.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
 
-            if not raid.message_id:
-                continue
+    async def run_due_jobs(self, now_ts: int) -> int:
+        """Run every job due at now_ts in one pass.
 
+        Jobs that fail are retried with a backoff instead of being dropped.
+
+        Returns:
+            Number of jobs processed
+        """
+        jobs = await self.raid_store.list_due_jobs(now_ts)
+        finished = []
+        for job in jobs:
+            if job.job_type in _NOTICE_JOBS and now_ts - job.due_at > NOTICE_WINDOW_SECONDS:
+                logger.debug("Dropping stale %s job for raid %s", job.job_type, job.raid.id)
+                finished.append(job)
+                continue
             try:
-                message = await channel.fetch_message(raid.message_id)
+                await self._run_job(job, now_ts)
             except Exception:
+                if job.job_type in _NOTICE_JOBS and job.attempts >= NOTICE_RETRIES:
+                    logger.exception("Raid job %s for raid %s failed, giving up", job.job_type, job.raid.id)
+                    finished.append(job)
+                    continue
+                delay = min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * 2 ** job.attempts)
+                logger.exception(
+                    "Raid job %s for raid %s failed, retrying in %ss", job.job_type, job.raid.id, delay
+                )
+                await self.raid_store.retry_job(job, now_ts + delay)
                 continue
+            finished.append(job)
+        await self.raid_store.complete_jobs(finished)
+        return len(jobs)
+
+    async def _run_job(self, job: RaidJob, now_ts: int) -> None:
+        if job.job_type == JOB_REMINDER:
+            await self._send_reminder(job.raid, job.offset, now_ts)
+        elif job.job_type == JOB_DM_REMINDER:
+            await self._send_dm_reminder(job.raid, job.offset)
+        elif job.job_type == JOB_CONFIRMATION:
+            await self._send_confirmation_check(job.raid)
+        elif job.job_type == JOB_CONFIRMATION_REMINDER:
+            await self._send_confirmation_reminder(job.raid, job.offset)
+        elif job.job_type == JOB_NO_SHOW:
+            await self._mark_no_shows(job.raid)
+        elif job.job_type == JOB_CLOSE:
+            await self._close_raid(job.raid, now_ts)
+        else:
+            logger.warning("Unknown raid job type %s", job.job_type)
+
+    async def _close_raid(self, raid: RaidRecord, now_ts: int) -> None:
+        await self.raid_store.close_raid(raid.id, closed_at=now_ts)
+        await self.raid_store.archive_participation(raid.id, "auto-closed")
+
+        guild = self.bot.get_guild(raid.guild_id)
+        if not guild:
+            return
 
-            updated = await self.raid_store.get_raid(raid.id)
-            if not updated:
-                continue
-
-            signups = await self.raid_store.get_signups_by_role(raid.id)
-            bench_preferences = await self.raid_store.get_bench_preferences(raid.id)
-            confirmed = await self.raid_store.get_confirmed_user_ids(raid.id)
-            no_shows = await self.raid_store.get_no_show_user_ids(raid.id)
-            embed = build_raid_embed(
-                updated,
-                signups,
-                self.config.raid_timezone,
-                confirmed,
-                no_shows,
-                bench_preferences=bench_preferences,
-            )
-
+        channel = guild.get_channel(raid.channel_id)
+        if not isinstance(channel, discord.TextChannel):
             try:
-                await message.delete()
+                channel = await guild.fetch_channel(raid.channel_id)
             except Exception:
-                try:
-                    await message.edit(embed=embed)
-                    await message.clear_reactions()
-                except Exception:
-                    logger.warning(
-                        "Failed to update raid message %s", raid.id, exc_info=True
-                    )
-
-            await self._cleanup_reminder_messages(channel, raid.title)
-            await self._cleanup_slot_pings(channel, raid.title)
-            await self._cleanup_confirmation_message(channel, raid.id)
-            await self._send_raid_log(guild, updated, signups, confirmed, "auto-closed")
-            await self._remove_participant_roles(guild, raid.id)
-            await self._refresh_history_embed(guild)
+                return
 
-    async def _send_reminders(self, now_ts: int) -> None:
-        reminder_hours = self.config.raid_reminder_hours
-        if not reminder_hours:
+        if not raid.message_id:
             return
 
-        raids = await self.raid_store.list_active_raids(now_ts)
-        if not raids:
+        try:
+            message = await channel.fetch_message(raid.message_id)
+        except Exception:
             return
 
-        sent = await self.raid_store.get_sent_reminders([raid.id for raid in raids])
-        window_seconds = 120
-
-        for raid in raids:
-            remaining = raid.start_time - now_ts
-            if remaining <= 0:
-                continue
-
-            guild = self.bot.get_guild(raid.guild_id)
-            if not guild:
-                continue
-
-            channel = guild.get_channel(raid.channel_id)
-            if not isinstance(channel, discord.TextChannel):
-                try:
-                    channel = await guild.fetch_channel(raid.channel_id)
-                except Exception:
-                    continue
-
-            role_mention = ""
-            role_id = self.config.raid_participant_role_id
-            if role_id:
-                role = guild.get_role(role_id)
-                if role:
-                    role_mention = f"{role.mention} "
+        updated = await self.raid_store.get_raid(raid.id)
+        if not updated:
+            return
 
-            sent_hours = set(sent.get(raid.id, []))
-            for hours in reminder_hours:
-                if hours in sent_hours:
-                    continue
-                trigger_ts = raid.start_time - (hours * 3600)
-                if now_ts < trigger_ts or (now_ts - trigger_ts) > window_seconds:
-                    continue
+        signups = await self.raid_store.get_signups_by_role(raid.id)
+        bench_preferences = await self.raid_store.get_bench_preferences(raid.id)
+        confirmed = await self.raid_store.get_confirmed_user_ids(raid.id)
+        no_shows = await self.raid_store.get_no_show_user_ids(raid.id)
+        embed = build_raid_embed(
+            updated,
+            signups,
+            self.config.raid_timezone,
+            confirmed,
+            no_shows,
+            bench_preferences=bench_preferences,
+        )
 
-                jump_url = None
-                if raid.message_id:
-                    jump_url = (
-                        f"https://discord.com/channels/{raid.guild_id}/"
-                        f"{raid.channel_id}/{raid.message_id}"
-                    )
-                hour_label = "hour" if hours == 1 else "hours"
-                content = (
-                    f"{role_mention}⏰ Reminder: **{raid.title}** starts in "
-                    f"{hours} {hour_label} (<t:{raid.start_time}:R>)."
-                )
-                if jump_url:
-                    content = f"{content}\n{jump_url}"
-
-                await self._cleanup_reminder_messages(channel, raid.title)
-                delete_after = get_notice_delete_after(
-                    raid.start_time,
-                    now_ts,
-                    self.config.raid_notice_delete_minutes,
+        try:
+            await message.delete()
+        except Exception:
+            try:
+                await message.edit(embed=embed)
+                await message.clear_reactions()
+            except Exception:
+                logger.warning(
+                    "Failed to update raid message %s", raid.id, exc_info=True
                 )
-                try:
-                    if delete_after:
-                        await channel.send(content, delete_after=delete_after)
-                    else:
-                        await channel.send(content)
-                    await self.raid_store.mark_reminder_sent(raid.id, hours)
-                except Exception:
-                    logger.warning(
-                        "Failed to send reminder for raid %s", raid.id, exc_info=True
-                    )
 
-    async def _send_dm_reminders(self, now_ts: int) -> None:
-        reminder_minutes = self.config.raid_dm_reminder_minutes
-        if not reminder_minutes:
-            return
+        await self._cleanup_reminder_messages(channel, raid)
+        await self._cleanup_slot_pings(channel, raid)
+        await self._cleanup_confirmation_message(channel, raid.id)
+        await self._send_raid_log(guild, updated, signups, confirmed, "auto-closed")
+        await self._remove_participant_roles(guild, raid.id)
+        await self._refresh_history_embed(guild)
 
-        raids = await self.raid_store.list_active_raids(now_ts)
-        if not raids:
+    async def _send_reminder(self, raid: RaidRecord, hours: int, now_ts: int) -> None:
+        guild = self.bot.get_guild(raid.guild_id)
+        if not guild:
             return
 
-        sent = await self.raid_store.get_sent_reminders([raid.id for raid in raids])
-        window_seconds = 120
-
-        for raid in raids:
-            remaining = raid.start_time - now_ts
-            if remaining <= 0:
-                continue
-
-            minutes_sent = set(sent.get(raid.id, []))
-            for minutes in reminder_minutes:
-                marker = -int(minutes)
-                if marker in minutes_sent:
-                    continue
-                trigger_ts = raid.start_time - (minutes * 60)
-                if now_ts < trigger_ts or (now_ts - trigger_ts) > window_seconds:
-                    continue
-
-                signups = await self.raid_store.list_signups(raid.id)
-                if not signups:
-                    continue
-
-                guild = self.bot.get_guild(raid.guild_id)
-                if not guild:
-                    continue
+        channel = guild.get_channel(raid.channel_id)
+        if not isinstance(channel, discord.TextChannel):
+            try:
+                channel = await guild.fetch_channel(raid.channel_id)
+            except Exception:
+                return
 
-                jump_url = None
-                if raid.message_id:
-                    jump_url = (
-                        f"https://discord.com/channels/{raid.guild_id}/"
-                        f"{raid.channel_id}/{raid.message_id}"
-                    )
-                for entry in signups:
-                    user_id = entry.get("user_id")
-                    if not user_id:
-                        continue
-                    member = guild.get_member(int(user_id))
-                    if not member:
-                        try:
-                            member = await guild.fetch_member(int(user_id))
-                        except Exception:
-                            continue
-                    role_label = entry.get("role", "").upper()
-                    message = (
-                        f"⏰ Reminder: **{raid.title}** starts in {minutes} minutes "
-                        f"(<t:{raid.start_time}:R>)."
-                    )
-                    if role_label:
-                        message = f"{message}\nRole: {role_label}"
-                    if jump_url:
-                        message = f"{message}\n{jump_url}"
-                    try:
-                        await member.send(message)
-                    except Exception:
-                        pass
-
-                await self.raid_store.mark_reminder_sent(raid.id, marker)
-
-    async def _send_confirmation_checks(self, now_ts: int) -> None:
-        if not self.config.raid_checkin_enabled:
-            return
-        minutes = self.config.raid_confirmation_minutes
-        if minutes <= 0:
+        role_mention = ""
+        role_id = self.config.raid_participant_role_id
+        if role_id:
+            role = guild.get_role(role_id)
+            if role:
+                role_mention = f"{role.mention} "
+
+        jump_url = None
+        if raid.message_id:
+            jump_url = (
+                f"https://discord.com/channels/{raid.guild_id}/"
+                f"{raid.channel_id}/{raid.message_id}"
+            )
+        hour_label = "hour" if hours == 1 else "hours"
+        content = (
+            f"{role_mention}⏰ Reminder: **{raid.title}** starts in "
+            f"{hours} {hour_label} (<t:{raid.start_time}:R>)."
+        )
+        if jump_url:
+            content = f"{content}\n{jump_url}"
+
+        await self._cleanup_reminder_messages(channel, raid)
+        delete_after = get_notice_delete_after(
+            raid.start_time,
+            now_ts,
+            self.config.raid_notice_delete_minutes,
+        )
+        # Send failures propagate so the job is retried
+        if delete_after:
+            reminder = await channel.send(content, delete_after=delete_after)
+        else:
+            reminder = await channel.send(content)
+        await self.raid_store.mark_reminder_sent(raid.id, hours)
+        await track_message(reminder, PURPOSE_RAID_REMINDER, raid.id)
+
+    async def _send_dm_reminder(self, raid: RaidRecord, minutes: int) -> None:
+        signups = await self.raid_store.list_signups(raid.id)
+        if not signups:
             return
 
-        raids = await self.raid_store.list_active_raids(now_ts)
-        if not raids:
+        guild = self.bot.get_guild(raid.guild_id)
+        if not guild:
             return
 
-        window_seconds = 120
-
-        for raid in raids:
-            trigger_ts = raid.start_time - (minutes * 60)
-            if now_ts < trigger_ts or (now_ts - trigger_ts) > window_seconds:
-                continue
-
-            existing = await self.raid_store.get_confirmation_message_id(raid.id)
-            if existing:
-                continue
-
-            signups = await self.raid_store.get_signups_by_role(raid.id)
-            if not any(signups.values()):
-                continue
-
-            guild = self.bot.get_guild(raid.guild_id)
-            if not guild:
+        jump_url = None
+        if raid.message_id:
+            jump_url = (
+                f"https://discord.com/channels/{raid.guild_id}/"
+                f"{raid.channel_id}/{raid.message_id}"
+            )
+        for entry in signups:
+            user_id = entry.get("user_id")
+            if not user_id:
                 continue
-
-            channel = guild.get_channel(raid.channel_id)
-            if not isinstance(channel, discord.TextChannel):
+            member = guild.get_member(int(user_id))
+            if not member:
                 try:
-                    channel = await guild.fetch_channel(raid.channel_id)
+                    member = await guild.fetch_member(int(user_id))
                 except Exception:
                     continue
-
-            role_mention = ""
-            role_id = self.config.raid_participant_role_id
-            if role_id:
-                role = guild.get_role(role_id)
-                if role:
-                    role_mention = f"{role.mention} "
-
-            content = (
-                f"{role_mention}Please confirm your attendance for "
-                f"**{raid.title}** with {CONFIRM_EMOJI}."
+            role_label = entry.get("role", "").upper()
+            message = (
+                f"⏰ Reminder: **{raid.title}** starts in {minutes} minutes "
+                f"(<t:{raid.start_time}:R>)."
             )
+            if role_label:
+                message = f"{message}\nRole: {role_label}"
+            if jump_url:
+                message = f"{message}\n{jump_url}"
             try:
-                message = await channel.send(content)
-                await message.add_reaction(CONFIRM_EMOJI)
-                await self.raid_store.reset_confirmations(raid.id)
-                await self.raid_store.set_confirmation_message(raid.id, message.id)
-                if raid.message_id:
-                    try:
-                        raid_message = await channel.fetch_message(raid.message_id)
-                    except Exception:
-                        raid_message = None
-                    if raid_message:
-                        signups = await self.raid_store.get_signups_by_role(raid.id)
-                        bench_preferences = await self.raid_store.get_bench_preferences(
-                            raid.id
-                        )
-                        confirmed = await self.raid_store.get_confirmed_user_ids(raid.id)
-                        no_shows = await self.raid_store.get_no_show_user_ids(raid.id)
-                        embed = build_raid_embed(
-                            raid,
-                            signups,
-                            self.config.raid_timezone,
-                            confirmed,
-                            no_shows,
-                            bench_preferences=bench_preferences,
-                        )
-                        await raid_message.edit(embed=embed)
+                await member.send(message)
             except Exception:
-                logger.warning(
-                    "Failed to send confirmation check for raid %s", raid.id, exc_info=True
-                )
+                pass
 
-    async def _send_confirmation_reminders(self, now_ts: int) -> None:
-        if not self.config.raid_checkin_enabled:
-            return
-        minutes = self.config.raid_confirmation_reminder_minutes
-        if minutes <= 0:
-            return
+        # DM reminders are recorded as negative minutes
+        await self.raid_store.mark_reminder_sent(raid.id, -int(minutes))
 
-        raids = await self.raid_store.list_active_raids(now_ts)
-        if not raids:
+    async def _send_confirmation_check(self, raid: RaidRecord) -> None:
+        existing = await self.raid_store.get_confirmation_message_id(raid.id)
+        if existing:
             return
 
-        window_seconds = 120
-
-        for raid in raids:
-            confirmation_message_id = await self.raid_store.get_confirmation_message_id(
-                raid.id
-            )
-            if not confirmation_message_id:
-                continue
-
-            trigger_ts = raid.start_time - (minutes * 60)
-            if now_ts < trigger_ts or (now_ts - trigger_ts) > window_seconds:
-                continue
+        signups = await self.raid_store.get_signups_by_role(raid.id)
+        if not any(signups.values()):
+            return
 
-            alert_type = f"confirm_reminder_{minutes}"
-            if await self.raid_store.get_alert_sent_at(raid.id, alert_type):
-                continue
+        guild = self.bot.get_guild(raid.guild_id)
+        if not guild:
+            return
 
-            unconfirmed = await self.raid_store.get_unconfirmed_user_ids(raid.id)
-            if not unconfirmed:
-                await self.raid_store.mark_alert_sent(raid.id, alert_type)
-                continue
+        channel = guild.get_channel(raid.channel_id)
+        if not isinstance(channel, discord.TextChannel):
+            try:
+                channel = await guild.fetch_channel(raid.channel_id)
+            except Exception:
+                return
 
-            guild = self.bot.get_guild(raid.guild_id)
-            if not guild:
-                continue
+        role_mention = ""
+        role_id = self.config.raid_participant_role_id
+        if role_id:
+            role = guild.get_role(role_id)
+            if role:
+                role_mention = f"{role.mention} "
+
+        content = (
+            f"{role_mention}Please confirm your attendance for "
+            f"**{raid.title}** with {CONFIRM_EMOJI}."
+        )
+        # A failed send propagates and the job is retried; once the message
+        # is recorded, a retry stops at the check above
+        message = await channel.send(content)
+        await self.raid_store.reset_confirmations(raid.id)
+        await self.raid_store.set_confirmation_message(raid.id, message.id)
+        await message.add_reaction(CONFIRM_EMOJI)
+        if raid.message_id:
+            try:
+                raid_message = await channel.fetch_message(raid.message_id)
+            except Exception:
+                raid_message = None
+            if raid_message:
+                signups = await self.raid_store.get_signups_by_role(raid.id)
+                bench_preferences = await self.raid_store.get_bench_preferences(
+                    raid.id
+                )
+                confirmed = await self.raid_store.get_confirmed_user_ids(raid.id)
+                no_shows = await self.raid_store.get_no_show_user_ids(raid.id)
+                embed = build_raid_embed(
+                    raid,
+                    signups,
+                    self.config.raid_timezone,
+                    confirmed,
+                    no_shows,
+                    bench_preferences=bench_preferences,
+                )
+                await raid_message.edit(embed=embed)
 
-            channel = guild.get_channel(raid.channel_id)
-            if not isinstance(channel, discord.TextChannel):
-                try:
-                    channel = await guild.fetch_channel(raid.channel_id)
-                except Exception:
-                    continue
+    async def _send_confirmation_reminder(self, raid: RaidRecord, minutes: int) -> None:
+        confirmation_message_id = await self.raid_store.get_confirmation_message_id(
+            raid.id
+        )
+        if not confirmation_message_id:
+            return
 
-            mentions = [f"<@{user_id}>" for user_id in unconfirmed]
-            chunk_size = 20
-            for idx in range(0, len(mentions), chunk_size):
-                chunk = ", ".join(mentions[idx : idx + chunk_size])
-                content = (
-                    f"⏰ Check-in missing for **{raid.title}**. "
-                    f"Please confirm with {CONFIRM_EMOJI}: {chunk}"
-                )
-                try:
-                    await channel.send(content)
-                except Exception:
-                    logger.warning(
-                        "Failed to send confirmation reminder for raid %s",
-                        raid.id,
-                        exc_info=True,
-                    )
-                    break
+        alert_type = f"confirm_reminder_{minutes}"
+        if await self.raid_store.get_alert_sent_at(raid.id, alert_type):
+            return
 
+        unconfirmed = await self.raid_store.get_unconfirmed_user_ids(raid.id)
+        if not unconfirmed:
             await self.raid_store.mark_alert_sent(raid.id, alert_type)
-
-    async def _mark_no_shows(self, now_ts: int) -> None:
-        if not self.config.raid_checkin_enabled:
             return
-        raids = await self.raid_store.list_raids_to_close(now_ts)
-        if not raids:
+
+        guild = self.bot.get_guild(raid.guild_id)
+        if not guild:
             return
 
-        for raid in raids:
-            if await self.raid_store.get_alert_sent_at(raid.id, "no_show_marked"):
-                continue
+        channel = guild.get_channel(raid.channel_id)
+        if not isinstance(channel, discord.TextChannel):
+            try:
+                channel = await guild.fetch_channel(raid.channel_id)
+            except Exception:
+                return
 
-            no_shows = await self.raid_store.mark_no_shows(raid.id)
-            await self.raid_store.mark_alert_sent(raid.id, "no_show_marked")
+        mentions = [f"<@{user_id}>" for user_id in unconfirmed]
+        chunk_size = 20
+        for idx in range(0, len(mentions), chunk_size):
+            chunk = ", ".join(mentions[idx : idx + chunk_size])
+            content = (
+                f"⏰ Check-in missing for **{raid.title}**. "
+                f"Please confirm with {CONFIRM_EMOJI}: {chunk}"
+            )
+            # Not marked as sent on failure, so the job is retried
+            await channel.send(content)
 
-            if not raid.message_id:
-                continue
+        await self.raid_store.mark_alert_sent(raid.id, alert_type)
 
-            guild = self.bot.get_guild(raid.guild_id)
-            if not guild:
-                continue
+    async def _mark_no_shows(self, raid: RaidRecord) -> None:
+        # The alert only guards the marking; a retry still updates the embed
+        if not await self.raid_store.get_alert_sent_at(raid.id, "no_show_marked"):
+            await self.raid_store.mark_no_shows(raid.id)
+            await self.raid_store.mark_alert_sent(raid.id, "no_show_marked")
 
-            channel = guild.get_channel(raid.channel_id)
-            if not isinstance(channel, discord.TextChannel):
-                try:
-                    channel = await guild.fetch_channel(raid.channel_id)
-                except Exception:
-                    continue
+        if not raid.message_id:
+            return
 
-            try:
-                message = await channel.fetch_message(raid.message_id)
-            except Exception:
-                continue
+        guild = self.bot.get_guild(raid.guild_id)
+        if not guild:
+            return
 
-            signups = await self.raid_store.get_signups_by_role(raid.id)
-            bench_preferences = await self.raid_store.get_bench_preferences(raid.id)
-            confirmed = await self.raid_store.get_confirmed_user_ids(raid.id)
-            no_show_ids = await self.raid_store.get_no_show_user_ids(raid.id)
-            embed = build_raid_embed(
-                raid,
-                signups,
-                self.config.raid_timezone,
-                confirmed,
-                no_show_ids,
-                bench_preferences=bench_preferences,
-            )
+        channel = guild.get_channel(raid.channel_id)
+        if not isinstance(channel, discord.TextChannel):
             try:
-                await message.edit(embed=embed)
+                channel = await guild.fetch_channel(raid.channel_id)
             except Exception:
-                logger.warning(
-                    "Failed to update raid message for no-shows %s", raid.id, exc_info=True
-                )
+                return
+
+        try:
+            message = await channel.fetch_message(raid.message_id)
+        except Exception:
+            return
+
+        signups = await self.raid_store.get_signups_by_role(raid.id)
+        bench_preferences = await self.raid_store.get_bench_preferences(raid.id)
+        confirmed = await self.raid_store.get_confirmed_user_ids(raid.id)
+        no_show_ids = await self.raid_store.get_no_show_user_ids(raid.id)
+        embed = build_raid_embed(
+            raid,
+            signups,
+            self.config.raid_timezone,
+            confirmed,
+            no_show_ids,
+            bench_preferences=bench_preferences,
+        )
+        await message.edit(embed=embed)
 
     async def _send_raid_log(
         self,
@@ -484,42 +479,16 @@ class RaidScheduler(commands.Cog):
     async def _cleanup_reminder_messages(
         self,
         channel: discord.TextChannel,
-        raid_title: str,
-        limit: int = 50,
+        raid: RaidRecord,
     ) -> None:
-        title_key = (raid_title or "").lower()
-        async for message in channel.history(limit=limit):
-            if not message.author or not message.author.bot:
-                continue
-            content = (message.content or "").lower()
-            if "reminder" not in content and "erinnerung" not in content:
-                continue
-            if title_key and title_key not in content:
-                continue
-            try:
-                await message.delete()
-            except Exception:
-                pass
+        await purge_raid_notices(channel, raid, PURPOSE_RAID_REMINDER)
 
     async def _cleanup_slot_pings(
         self,
         channel: discord.TextChannel,
-        raid_title: str,
-        limit: int = 50,
+        raid: RaidRecord,
     ) -> None:
-        title_key = (raid_title or "").lower()
-        async for message in channel.history(limit=limit):
-            if not message.author or not message.author.bot:
-                continue
-            content = (message.content or "").lower()
-            if "open slots" not in content and "slots frei" not in content:
-                continue
-            if title_key and title_key not in content:
-                continue
-            try:
-                await message.delete()
-            except Exception:
-                pass
+        await purge_raid_notices(channel, raid, PURPOSE_RAID_SLOT_PING)
 
     async def _cleanup_confirmation_message(
         self,
@@ -529,15 +498,7 @@ class RaidScheduler(commands.Cog):
         message_id = await self.raid_store.get_confirmation_message_id(raid_id)
         if not message_id:
             return
-        try:
-            message = await channel.fetch_message(message_id)
-        except Exception:
-            await self.raid_store.clear_confirmation_message(raid_id)
-            return
-        try:
-            await message.delete()
-        except Exception:
-            pass
+        await delete_message_ids(channel, [message_id])
         await self.raid_store.clear_confirmation_message(raid_id)
 
     async def _remove_participant_roles(self, guild: discord.Guild, raid_id: int) -> None:
@@ -590,9 +551,11 @@ class RaidScheduler(commands.Cog):
         except Exception:
             logger.warning("Failed to refresh raid history embed", exc_info=True)
 
-    @close_task.before_loop
-    async def before_close_task(self) -> None:
+    @job_task.before_loop
+    async def before_job_task(self) -> None:
         await self.bot.wait_until_ready()
+        count = await self.raid_store.resync_jobs()
+        logger.info("Scheduled jobs for %s open raid(s)", count)
 
 
 async def setup(bot: commands.Bot, config: Config, raid_store: RaidStore) -> None:
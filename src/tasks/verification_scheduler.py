@@ -13,7 +13,7 @@ from src.utils import Config
 from src.database import MessageCache
 from src.database.message_store import MessageStore
 from src.analytics.activity_tracker import ActivityTracker
-from src.utils.validation import MessageCountValidator
+from src.utils.validation import ChannelWindowValidator, MessageCountValidator
 from src.utils.verification_stats import VerificationStats
 from src.utils.shadowops_notifier import ShadowOpsNotifier
 from src.utils.performance_decorator import track_performance
@@ -113,6 +113,8 @@ class VerificationScheduler(commands.Cog):
             if message_tracker and hasattr(message_tracker, 'dashboard_manager'):
                 dashboard_manager = message_tracker.dashboard_manager
                 if dashboard_manager:
+                    # Counts may have changed in bulk - re-read the dashboard data
+                    dashboard_manager.invalidate_model(guild.id)
                     lock = dashboard_manager._dashboard_locks.setdefault(guild.id, asyncio.Lock())
                     async with lock:
                         state = dashboard_manager._get_dashboard_state(guild.id)
@@ -128,9 +130,20 @@ class VerificationScheduler(commands.Cog):
         label: str,
         sample_size: int,
         tolerance_percent: float = 1.0,
-        enable_healing: bool = True
+        enable_healing: bool = True,
+        mode: str = "users"
     ):
-        """Execute a verification job and log the results."""
+        """
+        Execute a verification job and log the results.
+
+        Args:
+            label: Job name shown in status messages
+            sample_size: Number of users ("users" mode) to check
+            tolerance_percent: Acceptable difference percentage
+            enable_healing: Whether mismatching users are fixed
+            mode: "users" (random user sample, full history) or
+                "channels" (stratified channel windows since the last run)
+        """
         async with self._run_lock:
             guild = self.bot.get_guild(self.config.guild_id)
             if not guild:
@@ -176,18 +189,32 @@ class VerificationScheduler(commands.Cog):
             self.verification_stats.mark_running(guild.id, True, label)
             await self._update_dashboard_display(guild)
 
+            if mode == "channels":
+                started = (
+                    f"Prüfung von **{self.config.verification_channel_sample_size}** Kanälen "
+                    "seit dem letzten Lauf gestartet.\n"
+                )
+            else:
+                started = f"Stichprobe mit **{sample_size}** Usern gestartet.\n"
             log_message = await self._log_status(
                 guild,
                 title=f"🔍 {label}",
-                description=(
-                    f"Stichprobe mit **{sample_size}** Usern gestartet.\n"
-                    "Vergleiche Datenbank mit Live-API…"
-                ),
+                description=started + "Vergleiche Datenbank mit Live-API…",
                 status="🔄 Läuft",
                 color=discord.Color.orange()
             )
 
             try:
+                if mode == "channels":
+                    await self._run_channel_verification(
+                        guild,
+                        label=label,
+                        log_message=log_message,
+                        tolerance_percent=tolerance_percent,
+                        enable_healing=enable_healing
+                    )
+                    return
+
                 totals = await self.message_store.get_guild_totals(guild.id)
                 eligible_ids = [
                     user_id for user_id, count in totals.items() if count >= 10
@@ -308,63 +335,17 @@ class VerificationScheduler(commands.Cog):
 
                 # Pass if accuracy is high OR if we successfully healed the mismatches
                 passed = results["passed"] or (enable_healing and results.get("healed", 0) == results["mismatches"])
-                
-                status_text = "✅ Erfolgreich" if passed else "⚠️ Abweichungen"
-                color = discord.Color.green() if passed else discord.Color.orange()
-                ping = self.config.alert_ping if not passed else None
-
-                # Record stats for dashboard
-                # Note: This also clears the 'current_run' flag internally in VerificationStats
-                self.verification_stats.record_verification(
-                    guild.id,
+
+                await self._finish_job(
+                    guild,
+                    label=label,
+                    log_message=log_message,
+                    description=description,
                     passed=passed,
                     accuracy=results["accuracy_percent"],
                     sample_size=results["total_users"],
-                    mismatches=results["mismatches"]
-                )
-
-                # Send alert to ShadowOps
-                try:
-                    await self.shadowops_notifier.send_verification_result(
-                        passed=passed,
-                        accuracy=results["accuracy_percent"],
-                        total_users=results["total_users"],
-                        mismatches=results["mismatches"],
-                        healed=results.get("healed", 0),
-                        verification_type=label.split()[0].lower()  # "tägliche" -> "tägliche"
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to send ShadowOps notification: {e}")
-
-                # If successful (or healed), delete the message (don't spam log channel)
-                # If failed (unhealed mismatches), keep the message for visibility
-                if passed:
-                    if log_message:
-                        try:
-                            await log_message.delete()
-                            logger.info(f"✅ {label} erfolgreich - Message gelöscht (clean logs)")
-                        except:
-                            pass
-                else:
-                    # Failed - post persistent warning message
-                    await self._log_status(
-                        guild,
-                        title=f"🔍 {label}",
-                        description=description,
-                        status=status_text,
-                        color=color,
-                        message=log_message,
-                        ping=ping
-                    )
-
-                # Update dashboard with new stats (now showing 'last run', no longer 'running')
-                await self._update_dashboard_display(guild)
-
-                logger.info(
-                    "%s abgeschlossen: %s (Accuracy %.1f%%)",
-                    label,
-                    status_text,
-                    results["accuracy_percent"]
+                    mismatches=results["mismatches"],
+                    healed=results.get("healed", 0)
                 )
 
             except Exception as exc:
@@ -382,6 +363,139 @@ class VerificationScheduler(commands.Cog):
                     ping=self.config.alert_ping
                 )
 
+    async def _run_channel_verification(
+        self,
+        guild: discord.Guild,
+        *,
+        label: str,
+        log_message: Optional[discord.Message],
+        tolerance_percent: float,
+        enable_healing: bool
+    ):
+        """Run the stratified channel-window check and report it."""
+        activity_tracker = ActivityTracker(
+            guild,
+            excluded_channels=self.config.excluded_channels,
+            excluded_channel_names=self.config.excluded_channel_names
+        )
+        validator = ChannelWindowValidator(guild, self.message_store, activity_tracker)
+        results = await validator.validate_windows(
+            sample_size=self.config.verification_channel_sample_size,
+            tolerance_percent=max(tolerance_percent, 2.0),
+            heal_mismatches=enable_healing
+        )
+
+        description = (
+            f"{label}\n"
+            f"**Kanäle:** {results['channels_checked']}/{results['channels_total']} geprüft "
+            f"({results['api_messages']} Nachrichten seit dem letzten Lauf)\n"
+            f"**Matches:** {results['matches']} ✅ | "
+            f"**Mismatches:** {results['mismatches']} ❌"
+        )
+        if results["baseline_only"]:
+            description += "\n_Erster Lauf: Kanal-Stände gespeichert, Prüfung ab dem nächsten Lauf._"
+
+        if results["discrepancies"]:
+            diff_lines = [
+                f"- #{disc['channel']}: Store +{disc['store_delta']} | API {disc['api_count']} "
+                f"(Diff {disc['difference']})"
+                for disc in results["discrepancies"][:5]
+            ]
+            description += "\n\n**Auffällige Kanäle:**\n" + "\n".join(diff_lines)
+
+        user_results = results["user_results"]
+        if user_results:
+            description += (
+                f"\n\n**Eskaliert:** {results['escalated_users']} User geprüft – "
+                f"{user_results['mismatches']} Abweichungen"
+            )
+            if results["healed"]:
+                description += f", {results['healed']} korrigiert 🩹"
+
+        await self._finish_job(
+            guild,
+            label=label,
+            log_message=log_message,
+            description=description,
+            passed=results["passed"],
+            accuracy=results["accuracy_percent"],
+            sample_size=results["channels_checked"],
+            mismatches=results["mismatches"],
+            healed=results["healed"]
+        )
+
+    async def _finish_job(
+        self,
+        guild: discord.Guild,
+        *,
+        label: str,
+        log_message: Optional[discord.Message],
+        description: str,
+        passed: bool,
+        accuracy: float,
+        sample_size: int,
+        mismatches: int,
+        healed: int
+    ):
+        """Record, notify and log the outcome of a verification job."""
+        status_text = "✅ Erfolgreich" if passed else "⚠️ Abweichungen"
+        color = discord.Color.green() if passed else discord.Color.orange()
+        ping = self.config.alert_ping if not passed else None
+
+        # Record stats for dashboard
+        # Note: This also clears the 'current_run' flag internally in VerificationStats
+        self.verification_stats.record_verification(
+            guild.id,
+            passed=passed,
+            accuracy=accuracy,
+            sample_size=sample_size,
+            mismatches=mismatches
+        )
+
+        # Send alert to ShadowOps
+        try:
+            await self.shadowops_notifier.send_verification_result(
+                passed=passed,
+                accuracy=accuracy,
+                total_users=sample_size,
+                mismatches=mismatches,
+                healed=healed,
+                verification_type=label.split()[0].lower()  # "tägliche" -> "tägliche"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to send ShadowOps notification: {e}")
+
+        # If successful (or healed), delete the message (don't spam log channel)
+        # If failed (unhealed mismatches), keep the message for visibility
+        if passed:
+            if log_message:
+                try:
+                    await log_message.delete()
+                    logger.info(f"✅ {label} erfolgreich - Message gelöscht (clean logs)")
+                except:
+                    pass
+        else:
+            # Failed - post persistent warning message
+            await self._log_status(
+                guild,
+                title=f"🔍 {label}",
+                description=description,
+                status=status_text,
+                color=color,
+                message=log_message,
+                ping=ping
+            )
+
+        # Update dashboard with new stats (now showing 'last run', no longer 'running')
+        await self._update_dashboard_display(guild)
+
+        logger.info(
+            "%s abgeschlossen: %s (Accuracy %.1f%%)",
+            label,
+            status_text,
+            accuracy
+        )
+
     async def _log_status(
         self,
         guild: discord.Guild,
@@ -454,7 +568,8 @@ class VerificationScheduler(commands.Cog):
             return
         await self._run_verification_job(
             label="Tägliche Stichproben-Verifikation",
-            sample_size=self.config.daily_verification_sample_size
+            sample_size=self.config.daily_verification_sample_size,
+            mode=self.config.verification_mode
         )
         self._daily_last_run = now.date()
 
@@ -513,7 +628,8 @@ class VerificationScheduler(commands.Cog):
         # Run verification for this hour (remove strict minute check to be more robust)
         await self._run_verification_job(
             label=f"6h-Verifikation ({current_hour:02d}:00 UTC)",
-            sample_size=self.config.sixhour_verification_sample_size
+            sample_size=self.config.sixhour_verification_sample_size,
+            mode=self.config.verification_mode
         )
         self._sixhour_last_runs[current_hour] = now.date()
 
@@ -0,0 +1,207 @@
+"""Register bot-posted messages and delete them by ID, without history scans.
+
+Messages posted before the registry existed are picked up once per channel
+(and cleanup scope) by ``adopt_legacy_messages``, which scans the history
+that predates the registry and registers what the old history-based
+cleanup would have deleted.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Collection, Iterable, List, Optional, Set, Tuple
+
+import discord
+
+from src.database.bot_message_store import get_bot_message_store
+
+logger = logging.getLogger("guildscout.bot_messages")
+
+# Discord only bulk-deletes messages younger than 14 days, at most 100 per call
+BULK_DELETE_MAX_AGE = timedelta(days=14)
+BULK_DELETE_CHUNK = 100
+
+
+async def track_message(
+    message: Optional[discord.Message],
+    purpose: str,
+    ref_key: object = "",
+) -> None:
+    """
+    Record a message the bot just posted, so cleanup can find it by ID.
+
+    Args:
+        message: Sent message (None is ignored, so ``send`` results can be passed directly)
+        purpose: One of the PURPOSE_* constants of bot_message_store
+        ref_key: What the message belongs to (raid ID, status kind, ...)
+    """
+    if message is None or message.guild is None:
+        return
+    try:
+        await get_bot_message_store().register(
+            message.guild.id,
+            message.channel.id,
+            message.id,
+            purpose,
+            str(ref_key),
+            created_at=int(message.created_at.timestamp()),
+        )
+    except Exception as e:
+        logger.warning(f"Could not register message {message.id} ({purpose}): {e}")
+
+
+async def adopt_legacy_messages(
+    channel: discord.TextChannel,
+    scope: str,
+    classify: Callable[[discord.Message], Optional[Tuple[str, object]]],
+    limit: int = 100,
+    owner_created_at: Optional[int] = None,
+) -> int:
+    """
+    Register messages from before the registry existed, once per channel and scope.
+
+    Only history older than the start of tracking is scanned, so later calls
+    (and channels without legacy messages after the first call) cost a single
+    lookup.
+
+    Args:
+        channel: Channel to scan
+        scope: Name of the cleanup the scan is for (e.g. "dashboard", "raid:12")
+        classify: Returns (purpose, ref_key) for a message to register, or None
+        limit: Maximum number of messages to scan (what the old cleanup scanned)
+        owner_created_at: Creation time of what the messages belong to (e.g. a
+            raid); if tracking already ran then there is nothing to scan
+
+    Returns:
+        Number of messages registered
+    """
+    store = get_bot_message_store()
+    try:
+        tracking_since = await store.get_tracking_since()
+        if owner_created_at is not None and owner_created_at >= tracking_since:
+            return 0
+        if await store.is_scanned(channel.id, scope):
+            return 0
+    except Exception as e:
+        logger.warning(f"Could not read message registry for #{channel.name}: {e}")
+        return 0
+
+    found = 0
+    try:
+        async for message in channel.history(
+            limit=limit,
+            before=datetime.fromtimestamp(tracking_since, timezone.utc),
+        ):
+            target = classify(message)
+            if target is None:
+                continue
+            purpose, ref_key = target
+            await track_message(message, purpose, ref_key)
+            found += 1
+    except Exception as e:
+        # Retried with the next cleanup
+        logger.warning(f"Legacy message scan of #{channel.name} ({scope}) failed: {e}")
+        return found
+
+    await store.mark_scanned(channel.id, scope)
+    if found:
+        logger.info(f"Registered {found} message(s) from before tracking in #{channel.name} ({scope})")
+    return found
+
+
+async def delete_message_ids(
+    channel: discord.TextChannel,
+    message_ids: Iterable[int],
+) -> Set[int]:
+    """
+    Delete messages by ID, in bulk where Discord allows it.
+
+    Messages younger than 14 days are bulk-deleted in chunks of 100, older
+    ones one by one. Messages that are already gone count as deleted.
+
+    Args:
+        channel: Channel holding the messages
+        message_ids: IDs to delete
+
+    Returns:
+        IDs that are gone now (deleted or not found)
+    """
+    cutoff = datetime.now(timezone.utc) - BULK_DELETE_MAX_AGE
+    recent: List[int] = []
+    old: List[int] = []
+    for message_id in sorted(set(message_ids)):
+        if discord.utils.snowflake_time(message_id) > cutoff:
+            recent.append(message_id)
+        else:
+            old.append(message_id)
+
+    gone: Set[int] = set()
+    for start in range(0, len(recent), BULK_DELETE_CHUNK):
+        chunk = recent[start:start + BULK_DELETE_CHUNK]
+        if len(chunk) == 1:
+            old.extend(chunk)
+            continue
+        try:
+            await channel.delete_messages([discord.Object(id=message_id) for message_id in chunk])
+            gone.update(chunk)
+        except discord.HTTPException:
+            # e.g. a message was deleted in the meantime - retry one by one
+            old.extend(chunk)
+
+    for message_id in old:
+        try:
+            await channel.get_partial_message(message_id).delete()
+            gone.add(message_id)
+        except discord.NotFound:
+            gone.add(message_id)
+        except Exception as e:
+            logger.warning(f"Could not delete message {message_id} in #{channel.name}: {e}")
+            continue
+        if len(old) > 1:
+            await asyncio.sleep(0.5)  # Avoid rate limits
+
+    return gone
+
+
+async def purge_tracked(
+    channel: discord.TextChannel,
+    purpose: str,
+    ref_key: Optional[object] = None,
+    *,
+    exclude: Collection[int] = (),
+    created_before: Optional[int] = None,
+) -> int:
+    """
+    Delete all registered messages of a purpose in a channel.
+
+    Args:
+        channel: Channel to clean up
+        purpose: One of the PURPOSE_* constants of bot_message_store
+        ref_key: Only messages with this reference (None for all)
+        exclude: Message IDs to keep
+        created_before: Only messages posted before this Unix timestamp
+
+    Returns:
+        Number of messages removed
+    """
+    store = get_bot_message_store()
+    try:
+        tracked = await store.list_messages(
+            purpose,
+            None if ref_key is None else str(ref_key),
+            channel_id=channel.id,
+            created_before=created_before,
+        )
+    except Exception as e:
+        logger.warning(f"Could not read message registry for #{channel.name}: {e}")
+        return 0
+
+    message_ids = [record.message_id for record in tracked if record.message_id not in exclude]
+    if not message_ids:
+        return 0
+
+    gone = await delete_message_ids(channel, message_ids)
+    await store.forget(gone)
+    if gone:
+        logger.debug(f"Deleted {len(gone)} tracked {purpose} message(s) in #{channel.name}")
+    return len(gone)
@@ -1,28 +1,54 @@
-"""Helper module to generate activity charts for the dashboard."""
+"""Helper module to generate activity charts for the dashboard.
+
+Two backends render the same daily/hourly chart:
+- "pil" (default): small bar/line renderer on Pillow, used for dashboard
+  refreshes. No matplotlib import, a few ms per chart.
+- "matplotlib": the richer figure for reports. matplotlib is only imported
+  the first time this backend is used.
+
+Benchmark both with: python -m src.utils.chart_generator --runs 20
+"""
 
 import io
 import logging
-import matplotlib
-# Force non-interactive backend before importing pyplot
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
 import discord
 
+from src.utils.image_cache import get_image_cache
+
 logger = logging.getLogger("guildscout.chart_generator")
 
+# Image cache namespace; bump the version when a chart layout changes
+CHART_CACHE_KIND = "activity_chart:v2"
+CHART_BACKENDS = ("pil", "matplotlib")
+
+# Color palette
+BAR_COLOR = (88, 101, 242)        # Discord Blurple
+HIGHLIGHT_COLOR = (235, 69, 158)
+BACKGROUND_COLOR = (47, 49, 54)   # #2f3136
+SPINE_COLOR = (68, 68, 68)        # #444444
+GRID_COLOR = (255, 255, 255, 40)
+TEXT_COLOR = (255, 255, 255)
+MUTED_COLOR = (128, 128, 128)
+
+
 def generate_activity_chart(
     daily_data: Dict[str, int],
-    hourly_data: Dict[int, int]
+    hourly_data: Dict[int, int],
+    backend: str = "pil"
 ) -> Optional[discord.File]:
     """
     Generate a combined chart image for daily and hourly activity.
 
+    Identical inputs are served from the image cache without rendering.
+
     Args:
         daily_data: Dictionary mapping date string (YYYY-MM-DD) to message count
         hourly_data: Dictionary mapping hour (0-23) to total message count
+        backend: "pil" (fast, default) or "matplotlib" (richer styling)
 
     Returns:
         discord.File object containing the chart image, or None if no data.
@@ -30,98 +56,389 @@ def generate_activity_chart(
     if not daily_data and not hourly_data:
         return None
 
-    try:
-        # Set style
-        plt.style.use('dark_background')
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
-        
-        # Color palette
-        bar_color = '#5865F2'  # Discord Blurple
-        highlight_color = '#EB459E'
-
-        # --- Plot 1: Daily Trend (Last 7 Days) ---
-        if daily_data:
-            # Sort available data
-            sorted_dates = sorted(daily_data.keys())
-            start_date_str = sorted_dates[0]
-            end_date_str = sorted_dates[-1]
-            
-            start_date = datetime.strptime(start_date_str, "%Y-%m-%d")
-            end_date = datetime.strptime(end_date_str, "%Y-%m-%d")
-            
-            # Fill in missing days with 0
-            dates = []
-            counts = []
-            curr = start_date
-            while curr <= end_date:
-                d_str = curr.strftime("%Y-%m-%d")
-                dates.append(curr)
-                counts.append(daily_data.get(d_str, 0))
-                curr += timedelta(days=1)
-
-            # If we have fewer than 7 days of data total, pad backwards to show context
-            while len(dates) < 7:
-                prev_date = dates[0] - timedelta(days=1)
-                dates.insert(0, prev_date)
-                counts.insert(0, 0)
-
-            # Slice to last 7-14 days max to keep chart readable
-            if len(dates) > 14:
-                dates = dates[-14:]
-                counts = counts[-14:]
-            
-            ax1.plot(dates, counts, marker='o', color=bar_color, linewidth=2, markersize=6)
-            ax1.fill_between(dates, counts, color=bar_color, alpha=0.3)
-            
-            ax1.set_title("Nachrichten (Verlauf)", fontsize=10, color='white')
-            ax1.xaxis.set_major_formatter(mdates.DateFormatter('%d.%m'))
-            ax1.grid(True, linestyle='--', alpha=0.2)
-            ax1.tick_params(colors='white')
-            
-            # Rotate date labels slightly
-            plt.setp(ax1.xaxis.get_majorticklabels(), rotation=30, ha='right')
-            
-            for spine in ax1.spines.values():
-                spine.set_color('#444444')
-        else:
-            ax1.text(0.5, 0.5, "Keine Daten", ha='center', va='center', color='gray')
-            ax1.set_title("Täglicher Trend", fontsize=10)
-
-        # --- Plot 2: Hourly Distribution (Prime Time) ---
-        if hourly_data:
-            hours = list(range(24))
-            # Ensure all hours 0-23 exist
-            counts = [hourly_data.get(h, 0) for h in hours]
-            
-            ax2.bar(hours, counts, color=bar_color, alpha=0.8, width=0.8)
-            
-            # Highlight peak hour
-            if max(counts) > 0:
-                peak_hour = hours[counts.index(max(counts))]
-                ax2.patches[peak_hour].set_facecolor(highlight_color)
-            
-            ax2.set_title("Aktivität nach Uhrzeit (UTC)", fontsize=10, color='white')
-            ax2.set_xlim(-0.5, 23.5)
-            ax2.set_xticks([0, 6, 12, 18])
-            ax2.set_xticklabels(['00:00', '06:00', '12:00', '18:00'])
-            ax2.grid(axis='y', linestyle='--', alpha=0.2)
-            ax2.tick_params(colors='white')
-            for spine in ax2.spines.values():
-                spine.set_color('#444444')
-        else:
-            ax2.text(0.5, 0.5, "Keine Daten", ha='center', va='center', color='gray')
-            ax2.set_title("Stündliche Aktivität", fontsize=10)
-
-        plt.tight_layout()
-
-        # Save to buffer
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=100, transparent=False, bbox_inches='tight', facecolor='#2f3136')
-        buf.seek(0)
-        plt.close(fig)
-
-        return discord.File(buf, filename="activity_chart.png")
+    cache = get_image_cache()
+    cache_key = cache.make_key(f"{CHART_CACHE_KIND}:{backend}", {
+        "daily": sorted(daily_data.items()),
+        "hourly": sorted(hourly_data.items()),
+    })
+    png = cache.get(cache_key)
+    if png is None:
+        png = render_activity_chart(daily_data, hourly_data, backend)
+        if png is None:
+            return None
+        cache.put(cache_key, png)
+
+    return discord.File(io.BytesIO(png), filename="activity_chart.png")
+
+
+def render_activity_chart(
+    daily_data: Dict[str, int],
+    hourly_data: Dict[int, int],
+    backend: str = "pil"
+) -> Optional[bytes]:
+    """
+    Render the daily/hourly activity chart without caching.
 
+    Args:
+        daily_data: Dictionary mapping date string (YYYY-MM-DD) to message count
+        hourly_data: Dictionary mapping hour (0-23) to total message count
+        backend: "pil" or "matplotlib"
+
+    Returns:
+        PNG image bytes, or None if rendering failed.
+    """
+    if backend not in CHART_BACKENDS:
+        raise ValueError(f"Unknown chart backend: {backend}")
+
+    try:
+        if backend == "matplotlib":
+            return _render_matplotlib(daily_data, hourly_data)
+        return _render_pil(daily_data, hourly_data)
     except Exception as e:
         logger.error(f"Failed to generate chart: {e}")
         return None
+
+
+def _daily_series(daily_data: Dict[str, int]) -> Tuple[List[datetime], List[int]]:
+    """Continuous series of 7-14 days ending at the last date with data."""
+    # Sort available data
+    sorted_dates = sorted(daily_data.keys())
+    start_date = datetime.strptime(sorted_dates[0], "%Y-%m-%d")
+    end_date = datetime.strptime(sorted_dates[-1], "%Y-%m-%d")
+
+    # Fill in missing days with 0
+    dates = []
+    counts = []
+    curr = start_date
+    while curr <= end_date:
+        d_str = curr.strftime("%Y-%m-%d")
+        dates.append(curr)
+        counts.append(daily_data.get(d_str, 0))
+        curr += timedelta(days=1)
+
+    # If we have fewer than 7 days of data total, pad backwards to show context
+    while len(dates) < 7:
+        prev_date = dates[0] - timedelta(days=1)
+        dates.insert(0, prev_date)
+        counts.insert(0, 0)
+
+    # Slice to last 7-14 days max to keep chart readable
+    if len(dates) > 14:
+        dates = dates[-14:]
+        counts = counts[-14:]
+
+    return dates, counts
+
+
+# =============================================================================
+# PIL backend
+# =============================================================================
+
+CHART_WIDTH = 1000
+CHART_HEIGHT = 400
+# Plot area insets inside each half of the image: left, top, right, bottom
+PANEL_INSETS = (60, 40, 20, 50)
+
+_fonts: Dict[int, ImageFont.FreeTypeFont] = {}
+
+
+def _font(size: int):
+    font = _fonts.get(size)
+    if font is None:
+        try:
+            font = ImageFont.truetype("DejaVuSans.ttf", size)
+        except OSError:
+            font = ImageFont.load_default(size)
+        _fonts[size] = font
+    return font
+
+
+def _nice_max(value: int) -> int:
+    """Round the y-axis maximum up to 1/2/5 x 10^n."""
+    if value <= 0:
+        return 1
+    magnitude = 10 ** (len(str(int(value))) - 1)
+    for step in (1, 2, 5, 10):
+        if value <= step * magnitude:
+            return step * magnitude
+    return 10 * magnitude
+
+
+def _draw_centered(draw: ImageDraw.ImageDraw, xy: Tuple[float, float], text: str, size: int, fill) -> None:
+    font = _font(size)
+    width = draw.textlength(text, font=font)
+    draw.text((xy[0] - width / 2, xy[1]), text, font=font, fill=fill)
+
+
+def _draw_axes(
+    draw: ImageDraw.ImageDraw,
+    box: Tuple[int, int, int, int],
+    y_max: int,
+    title: str
+) -> None:
+    """Title, y grid with labels and the two visible spines."""
+    left, top, right, bottom = box
+    _draw_centered(draw, ((left + right) / 2, top - 28), title, 15, TEXT_COLOR)
+
+    font = _font(11)
+    for i in range(5):
+        y = bottom - (bottom - top) * i / 4
+        if i:
+            # Dashed grid line
+            for x in range(left, right, 8):
+                draw.line([(x, y), (min(x + 4, right), y)], fill=GRID_COLOR)
+        label = f"{y_max * i / 4:g}"
+        width = draw.textlength(label, font=font)
+        draw.text((left - 8 - width, y - 7), label, font=font, fill=TEXT_COLOR)
+
+    draw.line([(left, top), (left, bottom)], fill=SPINE_COLOR)
+    draw.line([(left, bottom), (right, bottom)], fill=SPINE_COLOR)
+
+
+def _draw_no_data(draw: ImageDraw.ImageDraw, box: Tuple[int, int, int, int], title: str) -> None:
+    left, top, right, bottom = box
+    _draw_centered(draw, ((left + right) / 2, top - 28), title, 15, TEXT_COLOR)
+    _draw_centered(draw, ((left + right) / 2, (top + bottom) / 2 - 8), "Keine Daten", 14, MUTED_COLOR)
+
+
+def _panel_box(index: int) -> Tuple[int, int, int, int]:
+    half = CHART_WIDTH // 2
+    left, top, right, bottom = PANEL_INSETS
+    return (half * index + left, top, half * (index + 1) - right, CHART_HEIGHT - bottom)
+
+
+def _draw_daily(draw: ImageDraw.ImageDraw, daily_data: Dict[str, int]) -> None:
+    box = _panel_box(0)
+    if not daily_data:
+        _draw_no_data(draw, box, "Täglicher Trend")
+        return
+
+    dates, counts = _daily_series(daily_data)
+    left, top, right, bottom = box
+    y_max = _nice_max(max(counts))
+    _draw_axes(draw, box, y_max, "Nachrichten (Verlauf)")
+
+    pad = 12
+    step = (right - left - 2 * pad) / max(len(dates) - 1, 1)
+    points = [
+        (left + pad + step * i, bottom - (bottom - top) * count / y_max)
+        for i, count in enumerate(counts)
+    ]
+
+    # Filled area under the line
+    draw.polygon(
+        [(points[0][0], bottom)] + points + [(points[-1][0], bottom)],
+        fill=BAR_COLOR + (77,),
+    )
+    draw.line(points, fill=BAR_COLOR, width=2, joint="curve")
+    for x, y in points:
+        draw.ellipse((x - 4, y - 4, x + 4, y + 4), fill=BAR_COLOR)
+
+    # Date labels, thinned out for two-week ranges
+    every = 1 if len(dates) <= 7 else 2
+    for i in range(len(dates) - 1, -1, -every):
+        _draw_centered(draw, (points[i][0], bottom + 8), dates[i].strftime("%d.%m"), 11, TEXT_COLOR)
+
+
+def _draw_hourly(draw: ImageDraw.ImageDraw, hourly_data: Dict[int, int]) -> None:
+    box = _panel_box(1)
+    if not hourly_data:
+        _draw_no_data(draw, box, "Stündliche Aktivität")
+        return
+
+    left, top, right, bottom = box
+    # Ensure all hours 0-23 exist
+    counts = [hourly_data.get(h, 0) for h in range(24)]
+    y_max = _nice_max(max(counts))
+    _draw_axes(draw, box, y_max, "Aktivität nach Uhrzeit (UTC)")
+
+    slot = (right - left) / 24
+    peak_hour = counts.index(max(counts)) if max(counts) > 0 else None
+    for hour, count in enumerate(counts):
+        if count <= 0:
+            continue
+        x0 = left + slot * hour + slot * 0.1
+        x1 = x0 + slot * 0.8
+        y0 = bottom - (bottom - top) * count / y_max
+        color = HIGHLIGHT_COLOR if hour == peak_hour else BAR_COLOR
+        draw.rectangle((x0, y0, x1, bottom - 1), fill=color + (204,))
+
+    for hour in (0, 6, 12, 18):
+        _draw_centered(draw, (left + slot * (hour + 0.5), bottom + 8), f"{hour:02d}:00", 11, TEXT_COLOR)
+
+
+def _render_pil(daily_data: Dict[str, int], hourly_data: Dict[int, int]) -> bytes:
+    image = Image.new("RGB", (CHART_WIDTH, CHART_HEIGHT), BACKGROUND_COLOR)
+    draw = ImageDraw.Draw(image, "RGBA")
+
+    _draw_daily(draw, daily_data)
+    _draw_hourly(draw, hourly_data)
+
+    buf = io.BytesIO()
+    image.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+# =============================================================================
+# matplotlib backend
+# =============================================================================
+
+_pyplot = None
+
+
+def _load_pyplot():
+    """Import matplotlib on first use with the non-interactive backend."""
+    global _pyplot
+    if _pyplot is None:
+        import matplotlib
+        # Force non-interactive backend before importing pyplot
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        _pyplot = plt
+    return _pyplot
+
+
+def _render_matplotlib(daily_data: Dict[str, int], hourly_data: Dict[int, int]) -> bytes:
+    plt = _load_pyplot()
+    import matplotlib.dates as mdates
+
+    bar_color = '#5865F2'  # Discord Blurple
+    highlight_color = '#EB459E'
+
+    with plt.style.context('dark_background'):
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
+        try:
+            # --- Plot 1: Daily Trend (Last 7 Days) ---
+            if daily_data:
+                dates, counts = _daily_series(daily_data)
+
+                ax1.plot(dates, counts, marker='o', color=bar_color, linewidth=2, markersize=6)
+                ax1.fill_between(dates, counts, color=bar_color, alpha=0.3)
+
+                ax1.set_title("Nachrichten (Verlauf)", fontsize=10, color='white')
+                ax1.xaxis.set_major_formatter(mdates.DateFormatter('%d.%m'))
+                ax1.grid(True, linestyle='--', alpha=0.2)
+                ax1.tick_params(colors='white')
+
+                # Rotate date labels slightly
+                plt.setp(ax1.xaxis.get_majorticklabels(), rotation=30, ha='right')
+
+                for spine in ax1.spines.values():
+                    spine.set_color('#444444')
+            else:
+                ax1.text(0.5, 0.5, "Keine Daten", ha='center', va='center', color='gray')
+                ax1.set_title("Täglicher Trend", fontsize=10)
+
+            # --- Plot 2: Hourly Distribution (Prime Time) ---
+            if hourly_data:
+                hours = list(range(24))
+                # Ensure all hours 0-23 exist
+                counts = [hourly_data.get(h, 0) for h in hours]
+
+                ax2.bar(hours, counts, color=bar_color, alpha=0.8, width=0.8)
+
+                # Highlight peak hour
+                if max(counts) > 0:
+                    peak_hour = hours[counts.index(max(counts))]
+                    ax2.patches[peak_hour].set_facecolor(highlight_color)
+
+                ax2.set_title("Aktivität nach Uhrzeit (UTC)", fontsize=10, color='white')
+                ax2.set_xlim(-0.5, 23.5)
+                ax2.set_xticks([0, 6, 12, 18])
+                ax2.set_xticklabels(['00:00', '06:00', '12:00', '18:00'])
+                ax2.grid(axis='y', linestyle='--', alpha=0.2)
+                ax2.tick_params(colors='white')
+                for spine in ax2.spines.values():
+                    spine.set_color('#444444')
+            else:
+                ax2.text(0.5, 0.5, "Keine Daten", ha='center', va='center', color='gray')
+                ax2.set_title("Stündliche Aktivität", fontsize=10)
+
+            fig.tight_layout()
+
+            # Save to buffer
+            buf = io.BytesIO()
+            fig.savefig(buf, format='png', dpi=100, transparent=False, bbox_inches='tight', facecolor='#2f3136')
+            return buf.getvalue()
+        finally:
+            plt.close(fig)
+
+
+# =============================================================================
+# Benchmark
+# =============================================================================
+
+_BENCHMARK_SCRIPT = """
+import json, resource, sys, time
+from datetime import date, timedelta
+
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+started = time.perf_counter()
+from src.utils.chart_generator import render_activity_chart
+
+today = date(2024, 1, 31)
+daily = {{(today - timedelta(days=i)).isoformat(): (i * 37) % 250 for i in range(14)}}
+hourly = {{h: (h * 53) % 400 for h in range(24)}}
+
+render_activity_chart(daily, hourly, "{backend}")
+first_ms = (time.perf_counter() - started) * 1000
+
+started = time.perf_counter()
+for _ in range({runs}):
+    render_activity_chart(daily, hourly, "{backend}")
+mean_ms = (time.perf_counter() - started) * 1000 / {runs}
+
+rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{
+    "first_render_ms": first_ms,
+    "mean_render_ms": mean_ms,
+    "rss_growth_mb": (rss_after - rss_before) / 1024,
+}}))
+"""
+
+
+def benchmark(runs: int = 20) -> Dict[str, Dict[str, float]]:
+    """
+    Compare render time and memory of both backends.
+
+    Each backend runs in a fresh interpreter so import cost and peak RSS
+    are measured independently.
+
+    Args:
+        runs: Renders per backend after the first (cold) one
+
+    Returns:
+        Dict of backend -> first_render_ms, mean_render_ms, rss_growth_mb
+    """
+    import json
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    project_root = Path(__file__).resolve().parents[2]
+    results = {}
+    for backend in CHART_BACKENDS:
+        output = subprocess.run(
+            [sys.executable, "-c", _BENCHMARK_SCRIPT.format(backend=backend, runs=runs)],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        results[backend] = json.loads(output.stdout.strip().splitlines()[-1])
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark activity chart backends")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    for name, result in benchmark(args.runs).items():
+        print(
+            f"{name:>10}: first {result['first_render_ms']:.1f} ms, "
+            f"mean {result['mean_render_ms']:.1f} ms, "
+            f"RSS +{result['rss_growth_mb']:.1f} MB"
+        )
@@ -31,9 +31,11 @@ class Config:
             self._config = yaml.safe_load(f) or {}
 
     def save(self) -> None:
-        """Persist configuration to disk."""
-        with open(self.config_path, "w", encoding="utf-8") as f:
+        """Persist configuration to disk (atomically, so watchers never see a partial file)."""
+        tmp_path = self.config_path.with_suffix(self.config_path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
             yaml.safe_dump(self._config, f, sort_keys=False, allow_unicode=False)
+        tmp_path.replace(self.config_path)
 
     def reload(self) -> None:
         """Reload configuration from YAML file."""
@@ -85,6 +87,15 @@ class Config:
         """Get the port for the health check server."""
         return self.get("health_check.port", 8765)
 
+    @property
+    def loop_lag_threshold_seconds(self) -> float:
+        """Event-loop lag from which a stall is recorded with its stack."""
+        threshold_ms = self.get("health_check.loop_lag_threshold_ms", 250)
+        try:
+            return max(10, float(threshold_ms)) / 1000
+        except (TypeError, ValueError):
+            return 0.25
+
     @property
     def scoring_weights(self) -> Dict[str, float]:
         """Get scoring weights."""
@@ -159,6 +170,17 @@ class Config:
         """Get CSV encoding."""
         return self.get("export.csv_encoding", "utf-8-sig")
 
+    @property
+    def export_format(self) -> str:
+        """Get ranking export format ("csv" or "parquet"; anything else means csv)."""
+        export_format = str(self.get("export.format", "csv")).lower()
+        return export_format if export_format in ("csv", "parquet") else "csv"
+
+    @property
+    def export_compress(self) -> bool:
+        """Get whether CSV exports are gzip-compressed."""
+        return bool(self.get("export.compress", False))
+
     @property
     def log_level(self) -> str:
         """Get logging level."""
@@ -169,6 +191,11 @@ class Config:
         """Get log file path."""
         return self.get("logging.file", "logs/guildscout.log")
 
+    @property
+    def log_json_file(self) -> Optional[str]:
+        """Get the JSON-lines log file path (None disables structured logs)."""
+        return self.get("logging.json_file")
+
     @property
     def log_format(self) -> str:
         """Get log format string."""
@@ -298,6 +325,21 @@ class Config:
         # Validate each hour is 0-23
         return [max(0, min(23, int(h))) for h in hours if isinstance(h, (int, str))]
 
+    @property
+    def verification_mode(self) -> str:
+        """Mode of the daily and 6-hourly runs: "channels" (window check) or "users" (user sample)."""
+        mode = str(self.get("verification.mode", "channels")).lower()
+        return mode if mode in ("channels", "users") else "channels"
+
+    @property
+    def verification_channel_sample_size(self) -> int:
+        """Number of channels checked per channel-window verification."""
+        size = self.get("verification.channel_sample_size", 12)
+        try:
+            return max(1, int(size))
+        except (TypeError, ValueError):
+            return 12
+
     @property
     def shadowops_enabled(self) -> bool:
         """Whether ShadowOps integration is enabled."""
@@ -6,17 +6,40 @@ import hashlib
 import subprocess
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Callable, List, Optional, Tuple
 
 logger = logging.getLogger("guildscout.config_watcher")
 
+FileSignature = Tuple[int, int, int]
+
+
+def file_signature(path: Path) -> Optional[FileSignature]:
+    """
+    Return a cheap change signature for a file (mtime_ns, inode, size).
+
+    A single stat() call; used by the watcher and by the web UI config cache
+    to decide whether the file needs to be re-read at all.
+
+    Args:
+        path: File to inspect
+
+    Returns:
+        Signature tuple, or None if the file does not exist
+    """
+    try:
+        stat = Path(path).stat()
+    except (FileNotFoundError, OSError):
+        return None
+    return (stat.st_mtime_ns, stat.st_ino, stat.st_size)
+
 
 class ConfigWatcher:
     """
     Watches config.yaml for changes and automatically commits to Git.
 
     Features:
-    - Detects config file changes via hash comparison
+    - Detects config file changes via stat signature + hash comparison
+    - Notifies listeners (e.g. Config.reload) when the content changed
     - Creates meaningful commit messages
     - Keeps last 10 config versions
     - Rollback support via git
@@ -31,8 +54,12 @@ class ConfigWatcher:
         """
         self.config_path = config_path
         self.last_hash: Optional[str] = None
-        self.check_interval = 60  # Check every 60 seconds
+        self.check_interval = 10  # stat() is cheap; only hash when it changes
         self.watcher_task: Optional[asyncio.Task] = None
+        self._listeners: List[Callable[[], None]] = []
+        self._signature: Optional[FileSignature] = None
+        self._signature_hash: Optional[str] = None
+        self._applied_hash: Optional[str] = None
 
         logger.info(f"📝 Config watcher initialized for {config_path}")
 
@@ -48,6 +75,33 @@ class ConfigWatcher:
             logger.error(f"Failed to hash config: {e}")
             return None
 
+    def _get_current_hash(self) -> Optional[str]:
+        """Return the file hash, re-reading the file only if its signature changed."""
+        signature = file_signature(self.config_path)
+        if signature is None:
+            return None
+        if signature != self._signature:
+            self._signature = signature
+            self._signature_hash = self._get_file_hash()
+        return self._signature_hash
+
+    def add_listener(self, callback: Callable[[], None]):
+        """
+        Register a callback invoked whenever the config content changes.
+
+        Args:
+            callback: Synchronous callable without arguments
+        """
+        self._listeners.append(callback)
+
+    def _notify_listeners(self):
+        """Invoke all change listeners, isolating their failures."""
+        for callback in self._listeners:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Config change listener failed: {e}")
+
     def _get_config_diff(self) -> Optional[str]:
         """Get git diff of config file."""
         try:
@@ -164,7 +218,8 @@ class ConfigWatcher:
             return
 
         # Initialize hash
-        self.last_hash = self._get_file_hash()
+        self.last_hash = self._get_current_hash()
+        self._applied_hash = self.last_hash
 
         self.watcher_task = asyncio.create_task(self._watch_loop())
         logger.info(f"🔄 Started config watcher (checking every {self.check_interval}s)")
@@ -185,7 +240,11 @@ class ConfigWatcher:
             try:
                 await asyncio.sleep(self.check_interval)
 
-                current_hash = self._get_file_hash()
+                current_hash = self._get_current_hash()
+
+                if current_hash and current_hash != self._applied_hash:
+                    self._applied_hash = current_hash
+                    self._notify_listeners()
 
                 if current_hash and current_hash != self.last_hash:
                     logger.info("📝 Config file changed, creating auto-commit...")
@@ -203,16 +262,22 @@ class ConfigWatcher:
                 logger.error(f"Error in config watcher: {e}")
 
 
-async def setup_config_watcher(config_path: Path = Path("config/config.yaml")):
+async def setup_config_watcher(
+    config_path: Path = Path("config/config.yaml"),
+    on_change: Optional[Callable[[], None]] = None
+):
     """
     Setup and start config watcher.
 
     Args:
         config_path: Path to config file
+        on_change: Optional listener called when the config content changes
 
     Returns:
         ConfigWatcher instance
     """
     watcher = ConfigWatcher(config_path)
+    if on_change:
+        watcher.add_listener(on_change)
     await watcher.start()
     return watcher
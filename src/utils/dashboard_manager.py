@@ -9,15 +9,31 @@ from typing import Any, Dict, Optional
 import discord
 from discord.ext import commands
 
+from src.database.bot_message_store import PURPOSE_DASHBOARD
 from src.database.message_store import MessageStore
 from src.utils.config import Config
 from src.utils.verification_stats import VerificationStats
 from src.utils.bot_statistics import BotStatistics
-from src.utils.chart_generator import generate_activity_chart
+from src.utils.dashboard_model import DashboardModel
+from src.utils.managed_message import ManagedMessage
+from src.utils.bot_messages import adopt_legacy_messages, purge_tracked, track_message
 from src.analytics.scorer import Scorer
 
 logger = logging.getLogger("guildscout.dashboard")
 
+# Discord system notices that are cleaned out of the dashboard channel
+SYSTEM_MESSAGE_TYPES = (
+    discord.MessageType.pins_add,
+    discord.MessageType.channel_name_change,
+    discord.MessageType.channel_icon_change,
+)
+
+
+def _generate_activity_chart(daily_data, hourly_data):
+    """Render the activity chart; the chart module (Pillow) is imported on first use."""
+    from src.utils.chart_generator import generate_activity_chart
+    return generate_activity_chart(daily_data, hourly_data)
+
 
 class AtRiskSelect(discord.ui.Select):
     """Select menu to choose a user to remove role from."""
@@ -166,7 +182,8 @@ class DashboardManager:
         config: Config,
         message_store: MessageStore,
         update_interval_seconds: int = 300,  # 5 minutes
-        idle_gap_seconds: int = 120  # 2 minutes
+        idle_gap_seconds: int = 120,  # 2 minutes
+        model_resync_seconds: int = 3600  # 1 hour
     ):
         """
         Initialize the dashboard manager.
@@ -177,6 +194,8 @@ class DashboardManager:
             message_store: MessageStore instance
             update_interval_seconds: Max time between updates (default 5 min)
             idle_gap_seconds: Idle time before immediate update (default 2 min)
+            model_resync_seconds: Max age of the in-memory dashboard data
+                before it is re-read from the store (default 1 h)
         """
         self.bot = bot
         self.config = config
@@ -188,6 +207,8 @@ class DashboardManager:
         self._dashboard_state: Dict[int, Dict[str, Any]] = {}
         self._dashboard_locks: Dict[int, asyncio.Lock] = {}
         self._protected_messages: set = set()  # Message IDs to skip during cleanup
+        self._models: Dict[int, DashboardModel] = {}
+        self._model_resync_seconds = model_resync_seconds
 
     def _get_dashboard_channel(self, guild: discord.Guild) -> Optional[discord.TextChannel]:
         """Get the dashboard channel for a guild."""
@@ -210,12 +231,39 @@ class DashboardManager:
                 "entries": deque(maxlen=10),  # Last 10 messages
                 "total_tracked": 0,
                 "dashboard_message": None,
+                "managed_message": ManagedMessage(name="dashboard"),
                 "last_update": discord.utils.utcnow(),
                 "last_message_time": None
             }
             self._dashboard_state[guild_id] = state
         return state
 
+    def get_model(self, guild_id: int) -> DashboardModel:
+        """Return or create the in-memory dashboard model for a guild."""
+        model = self._models.get(guild_id)
+        if model is None:
+            model = DashboardModel(guild_id)
+            self._models[guild_id] = model
+        return model
+
+    def invalidate_model(self, guild_id: int):
+        """Re-read dashboard data from the store on the next update (after bulk changes)."""
+        model = self._models.get(guild_id)
+        if model:
+            model.invalidate()
+
+    def record_message_removed(self, guild_id: int, user_id: int, count: int = 1):
+        """Apply deleted messages to the dashboard model."""
+        model = self._models.get(guild_id)
+        if model:
+            model.record_message_removed(user_id, count)
+
+    def record_voice_session(self, guild_id: int, user_id: int, seconds: int):
+        """Apply a finished voice session to the dashboard model."""
+        model = self._models.get(guild_id)
+        if model:
+            model.record_voice(user_id, seconds)
+
     async def add_message_event(
         self,
         message: discord.Message,
@@ -246,6 +294,8 @@ class DashboardManager:
                 "message_id": message.id
             })
 
+            self.get_model(guild.id).record_message(message.author.id, message.created_at)
+
             previous_message_time = state.get("last_message_time")
             state["last_message_time"] = now
             state["total_tracked"] += 1
@@ -312,17 +362,19 @@ class DashboardManager:
             logger.warning(f"No dashboard channel configured for guild {guild.name}")
             return
 
-        # --- FETCH DATA ---
-        # 1. Daily & Hourly Stats (Fetch 60 days for monthly comparison)
-        daily_history = await self.message_store.get_daily_history(guild.id, days=60)
-        hourly_activity = await self.message_store.get_hourly_activity(guild.id)
+        # --- DATA MODEL ---
+        # Daily/hourly buckets and member totals live in memory and follow
+        # the live deltas; the store is only re-read periodically.
+        model = self.get_model(guild.id)
+        if model.is_stale(self._model_resync_seconds):
+            await model.load(self.message_store)
 
-        # 2. Trend Calculation
+        # 1. Trend Calculation
         # A) Daily Trend (Today vs Yesterday)
         now_str = datetime.utcnow().strftime("%Y-%m-%d")
         yesterday_str = (datetime.utcnow() - timedelta(days=1)).strftime("%Y-%m-%d")
-        today_count = daily_history.get(now_str, 0)
-        yesterday_count = daily_history.get(yesterday_str, 0)
+        today_count = model.daily.get(now_str, 0)
+        yesterday_count = model.daily.get(yesterday_str, 0)
 
         daily_trend_emoji = "➖"
         daily_trend_pct = 0.0
@@ -333,12 +385,8 @@ class DashboardManager:
         
         daily_text = f"{daily_trend_emoji} **{today_count}** heute ({daily_trend_pct:+.0f}%)"
 
-        # Sort dates descending for range calculations
-        sorted_dates = sorted(daily_history.keys(), reverse=True)
-
         # B) Weekly Trend (Last 7 Days vs Previous 7 Days)
-        last_7_days_sum = sum([daily_history[d] for d in sorted_dates[:7]])
-        prev_7_days_sum = sum([daily_history[d] for d in sorted_dates[7:14]])
+        last_7_days_sum, prev_7_days_sum = model.window_sums(7)
 
         weekly_trend_emoji = "➖"
         weekly_trend_pct = 0.0
@@ -350,8 +398,7 @@ class DashboardManager:
         weekly_text = f"{weekly_trend_emoji} **{last_7_days_sum}** / 7 Tage ({weekly_trend_pct:+.0f}%)"
 
         # C) Monthly Trend (Last 30 Days vs Previous 30 Days)
-        last_30_days_sum = sum([daily_history[d] for d in sorted_dates[:30]])
-        prev_30_days_sum = sum([daily_history[d] for d in sorted_dates[30:60]])
+        last_30_days_sum, prev_30_days_sum = model.window_sums(30)
 
         monthly_trend_emoji = "➖"
         monthly_trend_pct = 0.0
@@ -362,19 +409,25 @@ class DashboardManager:
         
         monthly_text = f"{monthly_trend_emoji} **{last_30_days_sum}** / 30 Tage ({monthly_trend_pct:+.0f}%)"
 
-        # 3. Prime Time
+        # 2. Prime Time
         prime_time_text = "—"
-        if hourly_activity:
-            best_hour = max(hourly_activity, key=hourly_activity.get)
+        best_hour = model.prime_hour()
+        if best_hour is not None:
             prime_time_text = f"🕒 Prime Time: **{best_hour:02d}:00 UTC**"
 
-        # 4. Chart Generation (Pass only last 14 days for better readability)
-        chart_data_14_days = {k: v for k, v in daily_history.items() if k in sorted_dates[:14]}
-        chart_file = await self.bot.loop.run_in_executor(
-            None, generate_activity_chart, chart_data_14_days, hourly_activity
+        # 3. Chart Generation (only when a daily/hourly bucket changed)
+        chart_file = None
+        keep_chart = (
+            state["dashboard_message"] is not None
+            and state.get("chart_version") == (model.guild_id, model.chart_version)
         )
+        if not keep_chart:
+            chart_daily, chart_hourly = model.chart_data()
+            chart_file = await self.bot.loop.run_in_executor(
+                None, _generate_activity_chart, chart_daily, chart_hourly
+            )
 
-        # 5. At-Risk Users
+        # 4. At-Risk Users
         at_risk_text = "Keine Daten."
         if self.config.guild_role_id:
             try:
@@ -387,25 +440,18 @@ class DashboardManager:
                     exclusion_user_ids=self.config.exclusion_users
                 )
                 role_members, excluded_members = await scanner.get_members_by_role_id(self.config.guild_role_id)
-                totals = await self.message_store.get_guild_totals(guild.id)
-                voice_totals = await self.message_store.get_guild_voice_totals(guild.id)
-                
+
                 scorer = Scorer(
                     weight_days=self.config.scoring_weights["days_in_server"],
                     weight_messages=self.config.scoring_weights["message_count"],
                     weight_voice=self.config.scoring_weights.get("voice_activity", 0.2),
                     min_messages=0
                 )
-                scores = scorer.calculate_scores(role_members, totals, voice_totals)
-                
-                # FILTER: Ignore users who joined less than 7 days ago
+                # FILTER: Users who joined less than 7 days ago are skipped
                 # New users have low scores by definition (low days_in_server)
-                valid_scores = [s for s in scores if s.days_in_server >= 7]
+                bottom_5, valid_count = model.at_risk(role_members, scorer)
 
-                valid_scores.sort(key=lambda x: x.final_score)
-                
                 # Show raw bottom 5
-                bottom_5 = valid_scores[:5]
                 if bottom_5:
                     lines = []
                     for s in bottom_5:
@@ -419,7 +465,7 @@ class DashboardManager:
                             at_risk_text = f"Alle Mitglieder ausgeschlossen ({len(excluded_members)})."
                         else:
                             at_risk_text = "Keine Mitglieder mit Rolle gefunden."
-                    elif not valid_scores:
+                    elif not valid_count:
                         at_risk_text = "Alle Kandidaten sind noch neu (<7 Tage)."
                     else:
                         at_risk_text = "Keine gefährdeten Mitglieder."
@@ -465,17 +511,8 @@ class DashboardManager:
 
         # 2. Aktivitäts-Analyse
         # Get bot stats summary
-        try:
-            stats = await self.message_store.get_stats(guild.id)
-            db_total = stats.get("total_messages", 0)
-            
-            # Get total voice hours
-            all_voice_totals = await self.message_store.get_guild_voice_totals(guild.id)
-            total_voice_seconds = sum(all_voice_totals.values())
-            total_voice_hours = total_voice_seconds / 3600
-        except:
-            db_total = 0
-            total_voice_hours = 0
+        db_total = model.total_messages
+        total_voice_hours = model.total_voice_seconds / 3600
         
         # Combine Trend, Prime Time and Session Stats
         analysis_text = (
@@ -522,11 +559,13 @@ class DashboardManager:
         )
         embed.add_field(name="📖 Commands & Tools", value=commands_text, inline=False)
 
-        if chart_file:
+        if chart_file or keep_chart:
             embed.set_image(url="attachment://activity_chart.png")
             logger.debug("Attached activity chart to dashboard")
 
-        embed.set_footer(text=f"GuildScout • Last Update: {datetime.utcnow().strftime('%H:%M')} UTC")
+        # The embed timestamp shows when the content last changed; a clock in the
+        # footer would make every refresh a visible change and defeat edit skipping
+        embed.set_footer(text="GuildScout • Letzte Änderung")
 
         # Create View
         view = DashboardView(self.bot, self.config, self.message_store)
@@ -540,17 +579,33 @@ class DashboardManager:
                         # To upload a new file in edit, we pass it in attachments
                         # Note: This removes existing attachments not listed here
                         edit_kwargs["attachments"] = [chart_file]
+                    elif keep_chart:
+                        # Chart data unchanged: omit attachments to keep the uploaded chart
+                        pass
                     else:
                         # Keep existing attachments if we don't have a new chart (or clear them? usually we want to clear old chart if no new one)
                         # If we want to clear, we pass empty list. If we want to keep, we omit parameter.
                         # Here we likely want to clear if no chart is generated.
                         edit_kwargs["attachments"] = []
                         
-                    await state["dashboard_message"].edit(**edit_kwargs)
+                    managed = state["managed_message"]
+                    if managed.message is not state["dashboard_message"]:
+                        managed.bind(state["dashboard_message"])
+                    if await managed.edit(**edit_kwargs):
+                        state["dashboard_message"] = managed.message
+                    else:
+                        logger.debug("Dashboard unchanged, edit skipped")
                 except discord.NotFound:
                     state["dashboard_message"] = None # Trigger re-send
             
             if not state["dashboard_message"]:
+                if keep_chart:
+                    # The message with the kept chart is gone - render it again
+                    chart_daily, chart_hourly = model.chart_data()
+                    chart_file = await self.bot.loop.run_in_executor(
+                        None, _generate_activity_chart, chart_daily, chart_hourly
+                    )
+
                 # For send(), we use 'file' (singular) or 'files'
                 send_kwargs = {"embed": embed, "view": view}
                 if chart_file:
@@ -560,6 +615,7 @@ class DashboardManager:
                 
                 # Create new message
                 state["dashboard_message"] = await channel.send(**send_kwargs)
+                await track_message(state["dashboard_message"], PURPOSE_DASHBOARD, "dashboard")
                 
                 # Pin & Persist
                 try:
@@ -569,6 +625,9 @@ class DashboardManager:
                     pass
 
             state["last_update"] = discord.utils.utcnow()
+            state["chart_version"] = (
+                (model.guild_id, model.chart_version) if chart_file or keep_chart else None
+            )
             logger.info("✅ Dashboard updated with Trends & Charts")
 
         except Exception as e:
@@ -592,22 +651,51 @@ class DashboardManager:
             # Pin the dashboard
             await message.pin()
             logger.info(f"Pinned dashboard {message.id} in #{channel.name}")
+
         except discord.Forbidden:
             logger.warning(f"Missing permissions to pin/unpin in #{channel.name}")
         except Exception as pin_err:
             logger.error(f"Failed to manage pins: {pin_err}", exc_info=True)
 
-    async def _cleanup_old_messages(self, channel: discord.TextChannel, max_scan: int = 100):
+    async def track_system_message(self, message: discord.Message):
+        """
+        Register a system notice (pin, channel rename/icon) in the dashboard channel.
+
+        Called from on_message, so the "pinned a message" notice of the
+        dashboard is picked up by the next cleanup.
+
+        Args:
+            message: Message from the gateway
         """
-        Delete old bot messages from the channel to keep it clean.
+        if message.type not in SYSTEM_MESSAGE_TYPES or message.guild is None:
+            return
+        channel = self._get_dashboard_channel(message.guild)
+        if channel is None or channel.id != message.channel.id:
+            return
+        await track_message(message, PURPOSE_DASHBOARD, "system")
+
+    def _classify_legacy_message(self, message: discord.Message):
+        """What the history-based cleanup used to delete: system notices and bot messages."""
+        if message.type in SYSTEM_MESSAGE_TYPES:
+            return PURPOSE_DASHBOARD, "system"
+        if message.author.id == self.bot.user.id:
+            return PURPOSE_DASHBOARD, "dashboard"
+        return None
+
+    async def _cleanup_old_messages(self, channel: discord.TextChannel):
+        """
+        Delete old dashboard messages from the channel to keep it clean.
+
+        Targets are the messages registered under PURPOSE_DASHBOARD (old
+        dashboards, import status messages, system notices), so the cleanup
+        is exact no matter how far back they are. Messages from before the
+        registry existed are registered by a one-time history scan.
 
         Args:
             channel: Channel to clean up
-            max_scan: Maximum number of messages to scan (default 100)
         """
         try:
             bot_user_id = self.bot.user.id
-            messages_to_delete = []
             unpinned_count = 0
 
             # First, unpin all old pinned messages from the bot
@@ -627,55 +715,18 @@ class DashboardManager:
             except Exception as pin_err:
                 logger.warning(f"Could not fetch pinned messages: {pin_err}")
 
-            # Fetch messages to delete
-            async for message in channel.history(limit=max_scan):
-                # Skip protected messages (e.g., import status)
-                if message.id in self._protected_messages:
-                    continue
-
-                should_delete = False
-
-                # Delete all bot messages
-                if message.author.id == bot_user_id:
-                    should_delete = True
-
-                # Delete Discord system messages (pin notifications, etc.)
-                elif message.type in [
-                    discord.MessageType.pins_add,
-                    discord.MessageType.channel_name_change,
-                    discord.MessageType.channel_icon_change
-                ]:
-                    should_delete = True
-
-                if should_delete:
-                    messages_to_delete.append(message)
-
-            # Delete messages
-            if messages_to_delete:
-                # Try bulk delete first (only works for messages < 14 days old)
-                try:
-                    if len(messages_to_delete) > 1:
-                        await channel.delete_messages(messages_to_delete)
-                        logger.info(f"🧹 Bulk deleted {len(messages_to_delete)} messages in #{channel.name}")
-                    else:
-                        await messages_to_delete[0].delete()
-                        logger.info(f"🧹 Deleted 1 message in #{channel.name}")
-                except discord.HTTPException:
-                    # Fallback to individual deletion if bulk fails (e.g. messages too old)
-                    deleted_count = 0
-                    for msg in messages_to_delete:
-                        try:
-                            await msg.delete()
-                            deleted_count += 1
-                            await asyncio.sleep(0.5)  # Avoid rate limits
-                        except discord.NotFound:
-                            pass
-                        except Exception as del_err:
-                            logger.warning(f"Could not delete message {msg.id}: {del_err}")
-                    logger.info(f"🧹 Individually deleted {deleted_count} messages in #{channel.name}")
+            # Delete registered dashboard messages (by ID, no history scan)
+            await adopt_legacy_messages(channel, PURPOSE_DASHBOARD, self._classify_legacy_message)
+            deleted_count = await purge_tracked(
+                channel,
+                PURPOSE_DASHBOARD,
+                exclude=self._protected_messages
+            )
+            if deleted_count:
+                logger.info(f"🧹 Deleted {deleted_count} old dashboard messages in #{channel.name}")
 
             # Wait a moment for Discord to sync updates
-            if messages_to_delete or unpinned_count > 0:
+            if deleted_count or unpinned_count > 0:
                 await asyncio.sleep(2)
 
         except Exception as e:
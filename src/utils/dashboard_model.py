@@ -0,0 +1,254 @@
+"""In-memory dashboard data model, kept current from live message/voice deltas."""
+
+import asyncio
+import heapq
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import discord
+
+from src.analytics.scorer import Scorer, UserScore
+from src.database.message_store import MessageStore
+
+logger = logging.getLogger("guildscout.dashboard_model")
+
+
+class DashboardModel:
+    """Dashboard data for one guild.
+
+    Loaded once from the MessageStore, then updated in place from the
+    live tracking events:
+    - daily buckets of the last HISTORY_DAYS days and the hourly histogram
+    - per-user message and voice totals (input of the at-risk list)
+
+    ``chart_version`` changes only when a daily/hourly bucket changes, so
+    the chart is redrawn only then. The at-risk list is recomputed (from
+    memory, with a bounded heap) only when a role member's totals, the set
+    of role members, the weights or the date changed.
+    """
+
+    HISTORY_DAYS = 60
+    CHART_DAYS = 14
+
+    def __init__(self, guild_id: int, at_risk_size: int = 5, min_days_in_server: int = 7):
+        """
+        Initialize an empty model.
+
+        Args:
+            guild_id: Discord guild ID
+            at_risk_size: Number of lowest-scoring members to keep
+            min_days_in_server: Members newer than this are never at risk
+        """
+        self.guild_id = guild_id
+        self.at_risk_size = at_risk_size
+        self.min_days_in_server = min_days_in_server
+
+        self.loaded = False
+        self.loaded_at = 0.0
+
+        self.daily: Dict[str, int] = {}
+        self.hourly: Dict[int, int] = {}
+        self.message_totals: Dict[int, int] = {}
+        self.voice_totals: Dict[int, int] = {}
+        self.total_messages = 0
+        self.total_voice_seconds = 0
+
+        self.chart_version = 0
+
+        # At-risk cache: inputs signature -> bottom-N scores
+        self._at_risk_signature: Optional[Tuple] = None
+        self._at_risk: List[UserScore] = []
+        self._at_risk_eligible = 0
+        self._touched_users: Set[int] = set()
+
+    async def load(self, message_store: MessageStore) -> None:
+        """(Re)load all data from the message store."""
+        daily, hourly, totals, voice_totals = await asyncio.gather(
+            message_store.get_daily_history(self.guild_id, days=self.HISTORY_DAYS),
+            message_store.get_hourly_activity(self.guild_id),
+            message_store.get_guild_totals(self.guild_id),
+            message_store.get_guild_voice_totals(self.guild_id),
+        )
+        self.daily = dict(daily)
+        self.hourly = dict(hourly)
+        self.message_totals = dict(totals)
+        self.voice_totals = dict(voice_totals)
+        self.total_messages = sum(self.message_totals.values())
+        self.total_voice_seconds = sum(self.voice_totals.values())
+
+        self.chart_version += 1
+        self._at_risk_signature = None
+        self._touched_users.clear()
+        self.loaded = True
+        self.loaded_at = time.monotonic()
+
+    def is_stale(self, max_age_seconds: float) -> bool:
+        """True if the model was never loaded or is older than max_age_seconds."""
+        return not self.loaded or time.monotonic() - self.loaded_at >= max_age_seconds
+
+    def invalidate(self) -> None:
+        """Force a full reload on next use (after bulk changes to the store)."""
+        self.loaded = False
+
+    # ------------------------------------------------------------------
+    # Deltas
+    # ------------------------------------------------------------------
+
+    def record_message(self, user_id: int, created_at: datetime) -> None:
+        """Apply one tracked message."""
+        if not self.loaded:
+            return
+
+        date_key = created_at.strftime("%Y-%m-%d")
+        if date_key not in self.daily:
+            self.daily[date_key] = 0
+            if len(self.daily) > self.HISTORY_DAYS:
+                del self.daily[min(self.daily)]
+        if date_key in self.daily:
+            self.daily[date_key] += 1
+        self.hourly[created_at.hour] = self.hourly.get(created_at.hour, 0) + 1
+        self.chart_version += 1
+
+        self.message_totals[user_id] = self.message_totals.get(user_id, 0) + 1
+        self.total_messages += 1
+        self._touched_users.add(user_id)
+
+    def record_message_removed(self, user_id: int, count: int = 1) -> None:
+        """Apply deleted messages (daily/hourly buckets are not decremented by the store)."""
+        if not self.loaded:
+            return
+
+        current = self.message_totals.get(user_id, 0)
+        removed = min(current, count)
+        if removed <= 0:
+            return
+        self.message_totals[user_id] = current - removed
+        self.total_messages -= removed
+        self._touched_users.add(user_id)
+
+    def record_voice(self, user_id: int, seconds: int) -> None:
+        """Apply a finished voice session."""
+        if not self.loaded or seconds <= 0:
+            return
+
+        self.voice_totals[user_id] = self.voice_totals.get(user_id, 0) + seconds
+        self.total_voice_seconds += seconds
+        self._touched_users.add(user_id)
+
+    # ------------------------------------------------------------------
+    # Derived views
+    # ------------------------------------------------------------------
+
+    def window_sums(self, days: int) -> Tuple[int, int]:
+        """
+        Sum of the latest ``days`` buckets and of the ``days`` before them.
+
+        Returns:
+            Tuple of (current window, previous window)
+        """
+        counts = [self.daily[key] for key in sorted(self.daily, reverse=True)]
+        return sum(counts[:days]), sum(counts[days:days * 2])
+
+    def chart_data(self) -> Tuple[Dict[str, int], Dict[int, int]]:
+        """Daily buckets of the last CHART_DAYS days and the hourly histogram."""
+        recent = sorted(self.daily, reverse=True)[:self.CHART_DAYS]
+        return {key: self.daily[key] for key in sorted(recent)}, dict(self.hourly)
+
+    def prime_hour(self) -> Optional[int]:
+        if not self.hourly:
+            return None
+        return max(self.hourly, key=self.hourly.get)
+
+    def at_risk(
+        self,
+        members: Iterable[discord.Member],
+        scorer: Scorer,
+        now: Optional[datetime] = None
+    ) -> Tuple[List[UserScore], int]:
+        """
+        Lowest-scoring members, scored like ``Scorer.calculate_scores``.
+
+        Scores are normalized against the maxima of ``members``; members who
+        joined less than ``min_days_in_server`` days ago are skipped.
+
+        Args:
+            members: Members holding the guild role
+            scorer: Scorer providing the (normalized) weights
+            now: Reference time (defaults to now)
+
+        Returns:
+            Tuple of (bottom-N scores, number of eligible members)
+        """
+        now = now or datetime.now(timezone.utc)
+        members = [member for member in members if member.joined_at is not None]
+        member_ids = frozenset(member.id for member in members)
+
+        signature = (
+            member_ids,
+            (scorer.weight_days, scorer.weight_messages, scorer.weight_voice),
+            now.date(),
+        )
+        if signature == self._at_risk_signature and not (self._touched_users & member_ids):
+            self._touched_users.clear()
+            return self._at_risk, self._at_risk_eligible
+
+        rows = []
+        max_days = max_messages = max_voice = 0
+        for member in members:
+            days = (now - member.joined_at).days
+            messages = self.message_totals.get(member.id, 0)
+            voice = self.voice_totals.get(member.id, 0)
+            rows.append((member, days, messages, voice))
+            max_days = max(max_days, days)
+            max_messages = max(max_messages, messages)
+            max_voice = max(max_voice, voice)
+
+        # Prevent division by zero
+        max_days = max_days or 1
+        max_messages = max_messages or 1
+        max_voice = max_voice or 1
+
+        def components(row) -> Tuple[float, float, float, float]:
+            _, days, messages, voice = row
+            days_score = (days / max_days) * 100
+            message_score = (messages / max_messages) * 100
+            voice_score = (voice / max_voice) * 100
+            final_score = (
+                days_score * scorer.weight_days
+                + message_score * scorer.weight_messages
+                + voice_score * scorer.weight_voice
+            )
+            return days_score, message_score, voice_score, final_score
+
+        eligible = [row for row in rows if row[1] >= self.min_days_in_server]
+        bottom = heapq.nsmallest(
+            self.at_risk_size,
+            eligible,
+            key=lambda row: round(components(row)[3], 2),
+        )
+
+        scores = []
+        for row in bottom:
+            member, days, messages, voice = row
+            days_score, message_score, voice_score, final_score = components(row)
+            scores.append(UserScore(
+                user_id=member.id,
+                username=member.name,
+                discriminator=member.discriminator,
+                days_in_server=days,
+                message_count=messages,
+                voice_seconds=voice,
+                days_score=round(days_score, 2),
+                message_score=round(message_score, 2),
+                voice_score=round(voice_score, 2),
+                final_score=round(final_score, 2),
+                join_date=member.joined_at
+            ))
+
+        self._at_risk_signature = signature
+        self._at_risk = scores
+        self._at_risk_eligible = len(eligible)
+        self._touched_users.clear()
+        return scores, len(eligible)
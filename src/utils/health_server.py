@@ -1,13 +1,20 @@
 """
 Simple HTTP Health Check Server for GuildScout
-Provides a /health endpoint for monitoring systems
+Provides a /health endpoint for monitoring systems and /metrics for
+Prometheus-compatible scrapers
 """
 
 import asyncio
 import logging
 from aiohttp import web
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, List, Optional
+
+from src.utils.loop_monitor import get_loop_monitor
+from src.utils.metrics import CONTENT_TYPE, MetricFamily, get_registry
+from src.utils.managed_message import get_edit_stats
+from src.utils.rate_limit_monitor import get_monitor
+from src.utils.verification_stats import VerificationStats
 
 logger = logging.getLogger("guildscout.health")
 
@@ -36,6 +43,7 @@ class HealthCheckServer:
             self.app = web.Application()
             self.app.router.add_get('/health', self.health_check)
             self.app.router.add_get('/ping', self.ping)
+            self.app.router.add_get('/metrics', self.metrics)
 
             self.runner = web.AppRunner(self.app)
             await self.runner.setup()
@@ -67,6 +75,7 @@ class HealthCheckServer:
         )
 
         uptime = (datetime.utcnow() - self.start_time).total_seconds()
+        loop_lag = get_loop_monitor().get_lag_stats()
 
         response_data = {
             'status': 'healthy' if is_healthy else 'unhealthy',
@@ -76,6 +85,8 @@ class HealthCheckServer:
             'uptime_seconds': round(uptime, 2),
             'guilds': len(self.bot.guilds) if self.bot.is_ready() else 0,
             'latency_ms': round(self.bot.latency * 1000, 2) if self.bot.is_ready() else None,
+            'event_loop_lag_p99_ms': round(loop_lag['p99'] * 1000, 2),
+            'event_loop_stalls': loop_lag['stalls'],
             'timestamp': datetime.utcnow().isoformat()
         }
 
@@ -89,3 +100,105 @@ class HealthCheckServer:
             'status': 'pong',
             'timestamp': datetime.utcnow().isoformat()
         })
+
+    async def metrics(self, request: web.Request) -> web.Response:
+        """Metrics in the Prometheus text exposition format"""
+        body = get_registry().render(self._collect_bot_metrics)
+        return web.Response(body=body.encode("utf-8"), headers={"Content-Type": CONTENT_TYPE})
+
+    def _collect_bot_metrics(self) -> Iterable[MetricFamily]:
+        """Numbers kept by other components, read at scrape time"""
+        ready = self.bot.is_ready()
+        families: List[MetricFamily] = [
+            MetricFamily("guildscout_up", "gauge", "1 if the bot is connected and ready").add(
+                1 if ready and not self.bot.is_closed() else 0
+            ),
+            MetricFamily("guildscout_uptime_seconds", "gauge", "Seconds since the health server started").add(
+                (datetime.utcnow() - self.start_time).total_seconds()
+            ),
+            MetricFamily("guildscout_guilds", "gauge", "Guilds the bot is in").add(
+                len(self.bot.guilds) if ready else 0
+            ),
+        ]
+        if ready:
+            families.append(
+                MetricFamily("guildscout_gateway_latency_seconds", "gauge", "Discord gateway heartbeat latency")
+                .add(self.bot.latency)
+            )
+
+        # Discord REST usage
+        monitor = get_monitor()
+        families.append(
+            MetricFamily("guildscout_discord_requests_total", "counter", "Discord REST requests")
+            .add(monitor.total_requests)
+        )
+        families.append(
+            MetricFamily("guildscout_discord_rate_limits_total", "counter", "Discord 429 responses")
+            .add(monitor.rate_limit_hits - monitor.global_rate_limits, scope="route")
+            .add(monitor.global_rate_limits, scope="global")
+        )
+        families.append(
+            MetricFamily("guildscout_discord_requests_per_second", "gauge", "Discord API requests/s over 10s")
+            .add(monitor.get_requests_per_second())
+        )
+
+        # Embed edits sent vs. skipped as unchanged
+        edits = get_edit_stats()
+        families.append(
+            MetricFamily("guildscout_embed_edits_total", "counter", "Managed message edits by outcome")
+            .add(edits.get("edits", 0), result="sent")
+            .add(edits.get("skipped", 0), result="skipped")
+        )
+
+        # Live tracking dedup and lifetime counters
+        tracker = self.bot.get_cog('MessageTracker')
+        if tracker is not None:
+            dedup = tracker.get_dedup_stats()
+            families.append(
+                MetricFamily("guildscout_message_events_total", "counter", "Message events received by outcome")
+                .add(dedup.get("total_seen", 0) - dedup.get("duplicates_blocked", 0), result="accepted")
+                .add(dedup.get("duplicates_blocked", 0), result="duplicate")
+            )
+            bot_statistics = getattr(getattr(tracker, "dashboard_manager", None), "bot_statistics", None)
+            if bot_statistics is not None:
+                families.append(
+                    MetricFamily(
+                        "guildscout_lifetime_messages_tracked", "gauge",
+                        "Messages tracked across all restarts"
+                    ).add(bot_statistics.get_lifetime_stats()["lifetime_messages_tracked"])
+                )
+
+        # Message cache
+        cache = getattr(self.bot, "cache", None)
+        if cache is not None:
+            families.append(
+                MetricFamily("guildscout_cache_lookups_total", "counter", "In-memory cache lookups by result")
+                .add(cache.memory_stats["hits"], result="hit")
+                .add(cache.memory_stats["misses"], result="miss")
+            )
+            families.append(
+                MetricFamily("guildscout_cache_memory_entries", "gauge", "Entries in the in-memory cache")
+                .add(len(cache._memory))
+            )
+
+        # Verification results per guild
+        runs = MetricFamily("guildscout_verification_runs_total", "counter", "Verification runs by result")
+        mismatches = MetricFamily(
+            "guildscout_verification_mismatches_total", "counter", "Mismatches found by verifications"
+        )
+        accuracy = MetricFamily(
+            "guildscout_verification_accuracy_percent", "gauge", "Accuracy of the last verification"
+        )
+        verification_stats = VerificationStats()
+        for guild in self.bot.guilds if ready else []:
+            stats = verification_stats.get_stats(guild.id)
+            if not stats:
+                continue
+            runs.add(stats.get("successful_runs", 0), guild_id=guild.id, result="passed")
+            runs.add(stats.get("total_runs", 0) - stats.get("successful_runs", 0), guild_id=guild.id, result="failed")
+            mismatches.add(stats.get("total_mismatches", 0), guild_id=guild.id)
+            if stats.get("last_run_accuracy") is not None:
+                accuracy.add(stats["last_run_accuracy"], guild_id=guild.id)
+        families.extend([runs, mismatches, accuracy])
+
+        return families
@@ -8,10 +8,34 @@ from typing import List, Optional, Callable, Dict
 from collections import defaultdict
 
 from src.database.message_store import MessageStore
+from src.utils.metrics import SIZE_BUCKETS, get_registry
 
 
 logger = logging.getLogger("guildscout.historical_import")
 
+_metrics = get_registry()
+_flush_batch_size = _metrics.histogram(
+    "guildscout_flush_batch_size",
+    "Items written per batched flush",
+    ("source",),
+    buckets=SIZE_BUCKETS
+)
+_import_messages = _metrics.counter(
+    "guildscout_import_messages_total",
+    "Messages written by historical imports",
+    ("guild_id",)
+)
+_import_channels = _metrics.gauge(
+    "guildscout_import_channels",
+    "Channels of the running (or last) import per state",
+    ("guild_id", "state")
+)
+_import_running = _metrics.gauge(
+    "guildscout_import_running",
+    "1 while a historical import runs for the guild",
+    ("guild_id",)
+)
+
 
 class HistoricalImporter:
     """Imports historical messages into the message store."""
@@ -211,6 +235,12 @@ class HistoricalImporter:
             "channel_message_count": channel_message_count
         }
 
+    def _report_progress(self, total: int, processed: int, failed: int):
+        """Publish channel progress of the running import as metrics."""
+        _import_channels.set(total, guild_id=self.guild.id, state="total")
+        _import_channels.set(processed, guild_id=self.guild.id, state="processed")
+        _import_channels.set(failed, guild_id=self.guild.id, state="failed")
+
     async def _flush_batch(self, batch: List[dict]):
         """
         Flush a batch of individual messages to the store.
@@ -220,7 +250,10 @@ class HistoricalImporter:
         
         if not batch:
             return
-            
+
+        _flush_batch_size.observe(len(batch), source="import")
+        _import_messages.inc(len(batch), guild_id=self.guild.id)
+
         # 1. Aggregate Main Counts: (guild, user, channel) -> total_count
         message_counts = collections.defaultdict(int)
         
@@ -307,8 +340,10 @@ class HistoricalImporter:
             channels = await self._gather_text_sources()
 
             total_channels = len(channels)
+            _import_running.set(1, guild_id=self.guild.id)
 
             for idx, channel in enumerate(channels, 1):
+                self._report_progress(total_channels, channels_processed, channels_failed)
                 try:
                     channel_label = (
                         f"{getattr(channel.parent, 'name', '')} › {channel.name}"
@@ -364,6 +399,8 @@ class HistoricalImporter:
                     })
                     # IMPORTANT: Continue with other channels even if one fails
 
+            self._report_progress(total_channels, channels_processed, channels_failed)
+
             # Refresh member snapshot at the end to capture any late join/leave events
             await self.message_store.sync_guild_members(self.guild)
 
@@ -419,3 +456,6 @@ class HistoricalImporter:
                 "channels_processed": channels_processed,
                 "channels_failed": channels_failed
             }
+
+        finally:
+            _import_running.set(0, guild_id=self.guild.id)
@@ -0,0 +1,180 @@
+"""
+Content-addressed cache for rendered images (rank cards, charts).
+
+Images are stored on disk under the SHA-256 of their render inputs, so
+identical inputs always map to the same file and never need invalidation.
+The cache has a total size cap; when it is exceeded, the least recently
+used files are removed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger("guildscout.image_cache")
+
+# Default size cap for all cached images together
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class ImageCache:
+    """Disk-backed LRU cache of image bytes keyed by a hash of the render inputs.
+
+    Methods are synchronous and thread-safe, so they can be used from
+    executor threads (chart rendering) as well as via ``asyncio.to_thread``.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = "data/cache/images",
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        """
+        Initialize the image cache.
+
+        Args:
+            cache_dir: Directory for cached image files
+            max_bytes: Total size cap for cached images
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        # key -> file size, least recently used first
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self._loaded = False
+
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+    @staticmethod
+    def make_key(kind: str, inputs: Dict[str, Any]) -> str:
+        """
+        Build the content address for a render.
+
+        Args:
+            kind: Renderer name including its version, e.g. "rank_card:v1"
+            inputs: JSON-serializable render inputs
+
+        Returns:
+            Hex digest identifying the image
+        """
+        payload = json.dumps(
+            {"kind": kind, "inputs": inputs},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.png"
+
+    def _load_index(self) -> None:
+        """Build the LRU index from the files on disk (oldest mtime first)."""
+        entries = []
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*/*.png"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, path.stem, stat.st_size))
+
+        entries.sort()
+        for _, key, size in entries:
+            self._index[key] = size
+            self._total_bytes += size
+        self._loaded = True
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached image bytes, or None on a miss."""
+        with self._lock:
+            if not self._loaded:
+                self._load_index()
+            if key not in self._index:
+                self.stats["misses"] += 1
+                return None
+
+            path = self._path(key)
+            try:
+                data = path.read_bytes()
+            except OSError:
+                self._total_bytes -= self._index.pop(key)
+                self.stats["misses"] += 1
+                return None
+
+            self._index.move_to_end(key)
+            self.stats["hits"] += 1
+
+        # Keep the on-disk order in sync for the next process start
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store image bytes and evict least recently used files over the cap."""
+        if len(data) > self.max_bytes:
+            return
+
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Could not write cached image {path}: {e}")
+            return
+
+        with self._lock:
+            if not self._loaded:
+                self._load_index()
+            self._total_bytes -= self._index.pop(key, 0)
+            self._index[key] = len(data)
+            self._total_bytes += len(data)
+            self.stats["writes"] += 1
+            evicted = self._evict()
+
+        for evicted_key in evicted:
+            try:
+                self._path(evicted_key).unlink()
+            except OSError:
+                pass
+
+    def _evict(self) -> list:
+        evicted = []
+        while self._total_bytes > self.max_bytes and self._index:
+            key, size = self._index.popitem(last=False)
+            self._total_bytes -= size
+            evicted.append(key)
+        self.stats["evictions"] += len(evicted)
+        return evicted
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {
+                **self.stats,
+                "entries": len(self._index),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+_image_cache: Optional[ImageCache] = None
+
+
+def get_image_cache() -> ImageCache:
+    """Get the process-wide image cache."""
+    global _image_cache
+    if _image_cache is None:
+        _image_cache = ImageCache()
+    return _image_cache
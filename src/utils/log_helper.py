@@ -6,7 +6,11 @@ from typing import Optional
 
 import discord
 
+from src.database.bot_message_store import PURPOSE_STATUS
+
+from .bot_messages import track_message
 from .config import Config
+from .status_manager import classify_status_message
 
 logger = logging.getLogger("guildscout.log_helper")
 
@@ -59,11 +63,13 @@ class DiscordLogger:
         try:
             if message:
                 await message.edit(embed=embed)
-                return message
-            return await channel.send(
-                content=ping if ping else None,
-                embed=embed
-            )
+            else:
+                message = await channel.send(
+                    content=ping if ping else None,
+                    embed=embed
+                )
+            await track_message(message, PURPOSE_STATUS, classify_status_message(title, color))
+            return message
         except Exception as exc:
             logger.warning("Failed to send Discord log entry: %s", exc)
             return None
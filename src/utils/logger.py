@@ -1,33 +1,146 @@
-"""Logging setup for GuildScout Bot."""
+"""Logging setup for GuildScout Bot.
 
+Records get their message rendered on the calling thread and are then
+handed to a queue; line formatting and all console/file I/O happen in a
+QueueListener thread, so a slow disk never stalls the event loop. Optionally a JSON-lines file is written for log
+shipping, and hot paths can sample their debug output via LogSampler.
+"""
+
+import atexit
+import copy
+import json
 import logging
+import queue
 import sys
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+
+# Attributes every LogRecord has; anything else came in via ``extra=``
+_RESERVED_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+_listener: Optional[QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line with the standard fields plus ``extra`` data."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "thread": record.threadName,
+        }
+        for key, value in vars(record).items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """QueueHandler that keeps exception info for the listener's formatters.
+
+    ``msg % args`` is rendered here, on the caller, so mutable arguments are
+    logged in the state they had at the call. Unlike the stock prepare(),
+    exc_info is left on the record: the queue never leaves the process, and
+    the formatters on the listener thread render tracebacks themselves.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class LogSampler:
+    """
+    Rate-limits a high-frequency debug event to one line per interval.
+
+    Suppressed occurrences are counted and reported with the next line that
+    is emitted (``+N more``, and ``sampled_count`` in structured output).
+    When DEBUG is disabled a call costs one level check.
+    """
+
+    def __init__(self, logger: logging.Logger, interval: float = 10.0):
+        """
+        Initialize the sampler.
+
+        Args:
+            logger: Logger to emit through
+            interval: Seconds between emitted lines per event key
+        """
+        self.logger = logger
+        self.interval = interval
+        # key -> (last emitted at, suppressed since then)
+        self._state: Dict[str, Tuple[float, int]] = {}
+
+    def debug(self, key: str, msg: str, *args) -> None:
+        """
+        Log ``msg % args`` at DEBUG, at most once per interval for ``key``.
+
+        Args:
+            key: Event identifier the sampling is done per
+            msg: %-style message (only formatted if emitted)
+            *args: Message arguments
+        """
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+
+        now = time.monotonic()
+        last, suppressed = self._state.get(key, (0.0, 0))
+        if now - last < self.interval:
+            self._state[key] = (last, suppressed + 1)
+            return
+
+        self._state[key] = (now, 0)
+        if suppressed:
+            msg += f" (+{suppressed} more in {now - last:.0f}s)"
+        self.logger.debug(msg, *args, extra={"sample_key": key, "sampled_count": suppressed + 1})
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 def setup_logger(
     name: str = "guildscout",
     level: str = "INFO",
     log_file: Optional[str] = None,
-    log_format: Optional[str] = None
+    log_format: Optional[str] = None,
+    json_file: Optional[str] = None
 ) -> logging.Logger:
     """
-    Set up logger with console and file handlers.
+    Set up logger with console and file handlers behind a queue.
 
     Args:
         name: Logger name
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Path to log file (optional)
         log_format: Log message format
+        json_file: Path to a JSON-lines log file for log shipping (optional)
 
     Returns:
         Configured logger instance
     """
+    global _listener
+
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
+    log_level = getattr(logging, level.upper())
+    logger.setLevel(log_level)
 
-    # Remove existing handlers
+    # Remove existing handlers (and a listener from an earlier setup)
+    stop_logging()
     logger.handlers.clear()
 
     # Default format
@@ -35,12 +148,12 @@ def setup_logger(
         log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
     formatter = logging.Formatter(log_format)
+    handlers: List[logging.Handler] = []
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, level.upper()))
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
 
     # File handler (if specified)
     if log_file:
@@ -48,8 +161,30 @@ def setup_logger(
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
         file_handler = logging.FileHandler(log_file, encoding="utf-8")
-        file_handler.setLevel(getattr(logging, level.upper()))
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Structured output (if specified)
+    if json_file:
+        json_path = Path(json_file)
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+
+        json_handler = logging.FileHandler(json_file, encoding="utf-8")
+        json_handler.setFormatter(JsonFormatter())
+        handlers.append(json_handler)
+
+    for handler in handlers:
+        handler.setLevel(log_level)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _InProcessQueueHandler(log_queue)
+    queue_handler.setLevel(log_level)
+    logger.addHandler(queue_handler)
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
 
     return logger
+
+
+atexit.register(stop_logging)
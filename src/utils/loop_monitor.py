@@ -0,0 +1,256 @@
+"""
+Event-loop lag monitoring and blocking-call detection.
+
+A heartbeat task asks the loop to wake it up every ``interval`` seconds and
+records how late that happens (scheduling lag). A watchdog thread notices
+when the heartbeat is overdue by more than ``threshold`` while the loop is
+still stuck and captures the loop thread's stack at that moment - which
+points at the code blocking the loop (PIL, matplotlib, pandas, scoring ...).
+Offenders are aggregated by code location for /profile and the health report.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.utils.metrics import get_registry
+
+logger = logging.getLogger("guildscout.loop_monitor")
+
+DEFAULT_INTERVAL = 0.25
+DEFAULT_THRESHOLD = 0.25
+# Distinct offender locations kept (the mildest is dropped first)
+MAX_OFFENDERS = 50
+# Log the same offender at most once per this many seconds
+LOG_COOLDOWN = 60.0
+
+# Frames from here are preferred when naming the offender
+_SOURCE_ROOT = str(Path(__file__).resolve().parents[1])
+_PROJECT_ROOT = str(Path(__file__).resolve().parents[2])
+
+_metrics = get_registry()
+_loop_lag = _metrics.histogram(
+    "guildscout_event_loop_lag_seconds",
+    "Delay between a scheduled wakeup and the event loop running it",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+_loop_stalls = _metrics.counter(
+    "guildscout_event_loop_stalls_total",
+    "Wakeups delayed by more than the blocking threshold"
+)
+
+UNKNOWN_LOCATION = "<nicht erfasst>"
+
+
+@dataclass
+class Offender:
+    """Code location that blocked the event loop."""
+
+    location: str
+    stack: str
+    count: int = 0
+    total_blocked: float = 0.0
+    worst: float = 0.0
+    last_seen: float = 0.0
+    last_logged: float = 0.0
+
+
+def _short_path(filename: str) -> str:
+    if filename.startswith(_PROJECT_ROOT):
+        return filename[len(_PROJECT_ROOT):].lstrip("/\\")
+    return filename
+
+
+def describe_stack(frame) -> Tuple[str, str]:
+    """
+    Name the offender of a captured loop-thread frame.
+
+    Returns:
+        Tuple of (location of the innermost project frame - or the innermost
+        frame if none is ours, formatted stack of the last frames)
+    """
+    stack = traceback.extract_stack(frame)
+    if not stack:
+        return UNKNOWN_LOCATION, ""
+
+    culprit = stack[-1]
+    for entry in reversed(stack):
+        if entry.filename.startswith(_SOURCE_ROOT):
+            culprit = entry
+            break
+
+    location = f"{_short_path(culprit.filename)}:{culprit.lineno} in {culprit.name}"
+    lines = [f"{_short_path(entry.filename)}:{entry.lineno} in {entry.name}" for entry in stack[-12:]]
+    return location, "\n".join(lines)
+
+
+class LoopMonitor:
+    """Measures event-loop lag and identifies blocking code."""
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        interval: float = DEFAULT_INTERVAL,
+        history: int = 480
+    ):
+        """
+        Initialize the monitor.
+
+        Args:
+            threshold: Lag in seconds from which a wakeup counts as a stall
+            interval: Seconds between heartbeats
+            history: Number of recent lag samples kept for percentiles
+        """
+        self.threshold = threshold
+        self.interval = interval
+        self.offenders: Dict[str, Offender] = {}
+        self.stalls = 0
+
+        self._lags: deque = deque(maxlen=history)
+        self._last_beat: Optional[float] = None
+        self._loop_thread_id: Optional[int] = None
+        # Stack captured by the watchdog during the current stall
+        self._captured: Optional[Tuple[str, str]] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, threshold: Optional[float] = None):
+        """Start the heartbeat and watchdog (must be called on the event loop)."""
+        if threshold is not None:
+            self.threshold = threshold
+        if self.running:
+            return
+
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._watchdog, name="guildscout-loop-watchdog", daemon=True)
+        self._thread.start()
+        logger.info(f"Event loop monitor started (threshold {self.threshold * 1000:.0f}ms)")
+
+    def stop(self):
+        """Stop the heartbeat and watchdog."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    async def _heartbeat(self):
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._last_beat = now
+            self._record_lag(max(0.0, now - expected), now)
+
+    def _watchdog(self):
+        poll = max(0.02, min(self.threshold, self.interval) / 2)
+        while not self._stop.wait(poll):
+            last_beat = self._last_beat
+            if last_beat is None:
+                continue
+            # The loop is stuck if the next heartbeat is overdue by more than the threshold
+            if time.monotonic() - last_beat - self.interval < self.threshold:
+                continue
+            with self._lock:
+                if self._captured is not None:
+                    continue  # Already captured this stall
+                frame = sys._current_frames().get(self._loop_thread_id)
+                if frame is None:
+                    continue
+                self._captured = describe_stack(frame)
+
+    def _record_lag(self, lag: float, now: float):
+        self._lags.append(lag)
+        _loop_lag.observe(lag)
+
+        with self._lock:
+            captured, self._captured = self._captured, None
+        if lag < self.threshold and captured is None:
+            return
+
+        # Stalls shorter than the watchdog's poll interval have no stack
+        location, stack = captured or (UNKNOWN_LOCATION, "")
+        self._record_offender(location, stack, lag, now)
+
+    def _record_offender(self, location: str, stack: str, blocked: float, now: float):
+        self.stalls += 1
+        _loop_stalls.inc()
+
+        offender = self.offenders.get(location)
+        if offender is None:
+            if len(self.offenders) >= MAX_OFFENDERS:
+                mildest = min(self.offenders.values(), key=lambda o: o.worst)
+                del self.offenders[mildest.location]
+            offender = self.offenders[location] = Offender(location=location, stack=stack)
+
+        offender.count += 1
+        offender.total_blocked += blocked
+        offender.worst = max(offender.worst, blocked)
+        offender.last_seen = now
+        if stack:
+            offender.stack = stack
+
+        if now - offender.last_logged >= LOG_COOLDOWN:
+            offender.last_logged = now
+            logger.warning(
+                f"Event loop blocked for {blocked * 1000:.0f}ms by {location} "
+                f"({offender.count}x so far)" + (f"\n{stack}" if stack else "")
+            )
+
+    def get_lag_stats(self) -> Dict[str, float]:
+        """Lag percentiles over the recent heartbeats (seconds)."""
+        samples = sorted(self._lags)
+        if not samples:
+            return {"samples": 0, "p50": 0.0, "p99": 0.0, "max": 0.0, "stalls": self.stalls}
+
+        def percentile(q: float) -> float:
+            return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+        return {
+            "samples": len(samples),
+            "p50": percentile(0.5),
+            "p99": percentile(0.99),
+            "max": samples[-1],
+            "stalls": self.stalls
+        }
+
+    def get_worst_offenders(self, limit: int = 5) -> List[Offender]:
+        """Offenders sorted by their longest stall."""
+        return sorted(self.offenders.values(), key=lambda o: o.worst, reverse=True)[:limit]
+
+    def format_offenders(self, limit: int = 3) -> List[str]:
+        """One line per worst offender, for embeds."""
+        return [
+            f"`{offender.location}` - max {offender.worst * 1000:.0f}ms, {offender.count}x"
+            for offender in self.get_worst_offenders(limit)
+        ]
+
+
+# Global instance
+_loop_monitor: Optional[LoopMonitor] = None
+
+
+def get_loop_monitor() -> LoopMonitor:
+    """Get or create the global loop monitor instance."""
+    global _loop_monitor
+    if _loop_monitor is None:
+        _loop_monitor = LoopMonitor()
+    return _loop_monitor
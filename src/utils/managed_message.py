@@ -0,0 +1,206 @@
+"""Edit long-lived bot messages only when their rendered content changed."""
+
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Union
+
+import discord
+
+logger = logging.getLogger("guildscout.managed_message")
+
+_UNSET: Any = object()
+
+# message_id -> fingerprint of the last content sent, for edit_if_changed()
+_FINGERPRINT_CACHE_SIZE = 512
+_fingerprints: "OrderedDict[int, str]" = OrderedDict()
+
+# Counters across all managed messages
+_stats = {"edits": 0, "skipped": 0}
+
+
+def _file_digest(file: discord.File) -> str:
+    """Hash a discord.File's bytes without consuming it."""
+    fp = file.fp
+    position = fp.tell()
+    digest = hashlib.sha256(fp.read()).hexdigest()
+    fp.seek(position)
+    return f"{file.filename}:{digest}"
+
+
+def message_fingerprint(
+    *,
+    content: Any = _UNSET,
+    embed: Any = _UNSET,
+    embeds: Any = _UNSET,
+    attachments: Any = _UNSET,
+    view: Any = _UNSET,
+    ignore_timestamp: bool = True,
+) -> str:
+    """
+    Hash what an edit would render.
+
+    Parameters left unset are not part of the edit and hashed as such.
+
+    Args:
+        content: Message content
+        embed: Single embed
+        embeds: List of embeds
+        attachments: discord.File / Attachment objects to attach
+        view: View whose components are sent
+        ignore_timestamp: Leave the embed timestamp out, so an embed that
+            only carries "now" as timestamp counts as unchanged
+
+    Returns:
+        Hex digest of the rendered payload
+    """
+    payload: Dict[str, Any] = {}
+
+    if content is not _UNSET:
+        payload["content"] = content
+
+    embed_list: Optional[List[discord.Embed]] = None
+    if embed is not _UNSET:
+        embed_list = [embed] if embed is not None else []
+    elif embeds is not _UNSET:
+        embed_list = list(embeds)
+    if embed_list is not None:
+        rendered = []
+        for item in embed_list:
+            data = item.to_dict()
+            if ignore_timestamp:
+                data.pop("timestamp", None)
+            rendered.append(data)
+        payload["embeds"] = rendered
+
+    if attachments is not _UNSET:
+        payload["attachments"] = [
+            _file_digest(item) if isinstance(item, discord.File) else f"id:{item.id}"
+            for item in attachments
+        ]
+
+    if view is not _UNSET:
+        payload["view"] = view.to_components() if view is not None else None
+
+    raw = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class ManagedMessage:
+    """Handle to a long-lived bot message (dashboard, countdown, status).
+
+    Keeps the message object so it doesn't have to be fetched again, and
+    remembers the fingerprint of the last edit. ``edit`` is skipped when
+    the new content hashes the same.
+    """
+
+    def __init__(
+        self,
+        message: Optional[Union[discord.Message, discord.PartialMessage]] = None,
+        name: str = "message",
+    ):
+        self.name = name
+        self.message = message
+        self._fingerprint: Optional[str] = None
+        self.edits = 0
+        self.skipped = 0
+
+    @classmethod
+    def from_id(
+        cls,
+        channel: discord.abc.Messageable,
+        message_id: int,
+        name: str = "message",
+    ) -> "ManagedMessage":
+        """Wrap a known message ID without fetching it first."""
+        return cls(channel.get_partial_message(message_id), name=name)
+
+    @property
+    def id(self) -> Optional[int]:
+        return self.message.id if self.message else None
+
+    def bind(self, message: Optional[Union[discord.Message, discord.PartialMessage]], **rendered) -> None:
+        """
+        Point the handle at a (new) message.
+
+        Args:
+            message: Message to manage, or None to clear
+            **rendered: Content the message was sent with, if known
+        """
+        self.message = message
+        self._fingerprint = message_fingerprint(**rendered) if message and rendered else None
+
+    async def edit(self, *, force: bool = False, ignore_timestamp: bool = True, **kwargs) -> bool:
+        """
+        Edit the message unless the rendered content is unchanged.
+
+        Args:
+            force: Edit even if the fingerprint matches
+            ignore_timestamp: See ``message_fingerprint``
+            **kwargs: Arguments for ``Message.edit`` (content, embed, embeds,
+                attachments, view)
+
+        Returns:
+            True if an edit was sent, False if it was skipped
+
+        Raises:
+            discord.NotFound: The message is gone; the handle is cleared
+        """
+        if self.message is None:
+            raise ValueError(f"Managed message '{self.name}' has no message bound")
+
+        fingerprint = message_fingerprint(ignore_timestamp=ignore_timestamp, **kwargs)
+        if not force and fingerprint == self._fingerprint:
+            self.skipped += 1
+            _stats["skipped"] += 1
+            logger.debug(f"Skipped no-op edit of {self.name} ({self.message.id})")
+            return False
+
+        try:
+            edited = await self.message.edit(**kwargs)
+        except discord.NotFound:
+            self.bind(None)
+            raise
+
+        if edited is not None:
+            self.message = edited
+        self._fingerprint = fingerprint
+        self.edits += 1
+        _stats["edits"] += 1
+        return True
+
+
+async def edit_if_changed(
+    message: Union[discord.Message, discord.PartialMessage],
+    *,
+    force: bool = False,
+    **kwargs
+) -> bool:
+    """
+    Edit any message unless its last edit through this function was identical.
+
+    For call sites that keep the message object themselves instead of a
+    ManagedMessage (e.g. progress messages).
+
+    Returns:
+        True if an edit was sent, False if it was skipped
+    """
+    fingerprint = message_fingerprint(**kwargs)
+    if not force and _fingerprints.get(message.id) == fingerprint:
+        _fingerprints.move_to_end(message.id)
+        _stats["skipped"] += 1
+        return False
+
+    await message.edit(**kwargs)
+    _fingerprints[message.id] = fingerprint
+    _fingerprints.move_to_end(message.id)
+    while len(_fingerprints) > _FINGERPRINT_CACHE_SIZE:
+        _fingerprints.popitem(last=False)
+    _stats["edits"] += 1
+    return True
+
+
+def get_edit_stats() -> Dict[str, int]:
+    """Edits sent vs. skipped across all managed messages."""
+    return dict(_stats)
@@ -0,0 +1,269 @@
+"""
+In-process metrics in the Prometheus text exposition format.
+
+Hot paths record into module-level Counter/Gauge/Histogram objects (a dict
+update, no I/O); the health server renders everything on request at
+``/metrics``. Numbers that already live elsewhere (rate limit monitor,
+dedup counters, verification stats, ...) are read at scrape time through
+collectors instead of being duplicated.
+"""
+
+import functools
+import logging
+import math
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger("guildscout.metrics")
+
+# Seconds; covers sub-millisecond SQLite writes up to slow REST calls
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+@dataclass
+class MetricFamily:
+    """Samples of one metric, as produced by a collector at scrape time."""
+
+    name: str
+    type: str  # "counter" or "gauge"
+    help: str
+    samples: List[Tuple[Dict[str, str], float]] = field(default_factory=list)
+
+    def add(self, value: float, **labels) -> "MetricFamily":
+        self.samples.append(({name: str(v) for name, v in labels.items()}, value))
+        return self
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+        for labels, value in self.samples:
+            lines.append(f"{self.name}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+
+Collector = Callable[[], Iterable[MetricFamily]]
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: Dict[str, object]) -> LabelValues:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        try:
+            return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError as e:
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}") from e
+
+    def _labels(self, key: LabelValues) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type_name}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for key, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self._labels(key))} {_format_value(value)}")
+        return lines
+
+
+class Gauge(Counter):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def set(self, value: float, **labels) -> None:
+        self._values[self._key(labels)] = value
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    """Cumulative bucket counts plus sum and count per label set."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [count per bucket..., overflow count, sum]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        state = self._values.get(key)
+        if state is None:
+            state = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        state[bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        """Observe the duration of the ``with`` block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def snapshot(self, **labels) -> Optional[Dict[str, float]]:
+        """Count and sum for one label set (None if nothing was observed)."""
+        state = self._values.get(self._key(labels))
+        if state is None:
+            return None
+        return {"count": sum(state[:-1]), "sum": state[-1]}
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for key, state in sorted(self._values.items()):
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), state[:-1]):
+                cumulative += count
+                bucket_labels = dict(labels, le=_format_value(bound))
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_labels)} {_format_value(cumulative)}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(state[-1])}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {_format_value(cumulative)}")
+        return lines
+
+
+def timed(histogram: Histogram, **labels):
+    """Decorator observing the duration of a coroutine function."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with histogram.time(**labels):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class MetricsRegistry:
+    """Owns all metrics and renders them for a scrape."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Collector] = []
+
+    def _get_or_create(self, cls, name: str, help_text: str, labelnames: Sequence[str], **kwargs):
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = cls(name, help_text, labelnames, **kwargs)
+        elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+            raise ValueError(f"Metric {name} already registered with a different type or labels")
+        return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help_text, labelnames)
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, help_text, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, help_text, labelnames, buckets=buckets)
+
+    def add_collector(self, collector: Collector) -> None:
+        """Register a callable returning MetricFamily objects at scrape time."""
+        if collector not in self._collectors:
+            self._collectors.append(collector)
+
+    def remove_collector(self, collector: Collector) -> None:
+        if collector in self._collectors:
+            self._collectors.remove(collector)
+
+    def render(self, *extra_collectors: Collector) -> str:
+        """
+        Render all metrics in the text exposition format.
+
+        Args:
+            *extra_collectors: Collectors used for this scrape only
+
+        Returns:
+            Exposition text (newline-terminated)
+        """
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+
+        for collector in list(self._collectors) + list(extra_collectors):
+            try:
+                for family in collector():
+                    lines.extend(family.render())
+            except Exception as e:
+                # One broken source must not take the whole endpoint down
+                logger.warning(f"Metrics collector {getattr(collector, '__name__', collector)} failed: {e}")
+
+        return "\n".join(lines) + "\n"
+
+
+# Global instance
+_registry = MetricsRegistry()
+
+
+def get_registry() -> MetricsRegistry:
+    """Get the global metrics registry."""
+    return _registry
@@ -8,7 +8,9 @@ from zoneinfo import ZoneInfo
 
 import discord
 
+from src.database.bot_message_store import PURPOSE_RAID_REMINDER, PURPOSE_RAID_SLOT_PING
 from src.database.raid_store import RaidRecord
+from src.utils.bot_messages import adopt_legacy_messages, purge_tracked
 
 
 ROLE_TANK = "tank"
@@ -381,3 +383,38 @@ def build_raid_log_embed(
             )
 
     return embed
+
+
+async def purge_raid_notices(
+    channel: discord.TextChannel,
+    raid: RaidRecord,
+    purpose: str,
+) -> int:
+    """Delete a raid's tracked reminders or open-slot pings.
+
+    For raids created before message tracking, the pings posted back then
+    are registered first by a one-time scan that matches them the way the
+    old history-based cleanup did (bot message, keyword and raid title).
+    """
+    title_key = (raid.title or "").lower()
+
+    def classify(message: discord.Message):
+        if not message.author or not message.author.bot:
+            return None
+        content = (message.content or "").lower()
+        if title_key and title_key not in content:
+            return None
+        if "reminder" in content or "erinnerung" in content:
+            return PURPOSE_RAID_REMINDER, raid.id
+        if "open slots" in content or "slots frei" in content:
+            return PURPOSE_RAID_SLOT_PING, raid.id
+        return None
+
+    await adopt_legacy_messages(
+        channel,
+        f"raid:{raid.id}",
+        classify,
+        limit=50,
+        owner_created_at=raid.created_at,
+    )
+    return await purge_tracked(channel, purpose, raid.id)
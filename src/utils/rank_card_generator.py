@@ -1,219 +1,614 @@
 """
 Rank Card Generator for GuildScout.
 Creates visual score cards using Pillow (PIL).
+
+Rendering is split in two parts:
+- CardRenderer: synchronous PIL drawing. Fonts and the static background
+  layers are loaded once per process and reused for every card.
+- RankCardGenerator: async facade for the bot. Fetches avatars through an
+  AvatarCache and runs CardRenderer in a process pool, so a burst of
+  /my-score calls never blocks the event loop (and gateway heartbeats).
 """
 
-import logging
+import asyncio
+import hashlib
 import io
-import math
-from typing import Optional
-from PIL import Image, ImageDraw, ImageFont, ImageFilter
+import logging
+import multiprocessing
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
 import discord
 import aiohttp
 
+from src.utils.image_cache import ImageCache, get_image_cache
+
 logger = logging.getLogger("guildscout.rank_card")
 
-class RankCardGenerator:
-    """Generates a PNG rank card for a user."""
+# Worker processes used for rendering (each holds its own preloaded assets)
+RENDER_WORKERS = 2
+# Avatar size requested from the Discord CDN (drawn at 140px)
+AVATAR_FETCH_SIZE = 256
+# Image cache namespace; bump the version when the card layout changes
+CARD_CACHE_KIND = "rank_card:v1"
+
+
+class CardRenderer:
+    """Synchronous PIL renderer for rank cards.
+
+    Fonts, the gradient/grid background and the stats container are built
+    once on first use (or via ``preload``); each card starts from a copy of
+    the prepared background. Decoded, masked avatars are kept in a small
+    LRU keyed by avatar hash.
+    """
+
+    WIDTH = 900
+    HEIGHT = 450
+    AVATAR_SIZE = 140
+    AVATAR_POS = (50, 50)
+    AVATAR_LRU_SIZE = 32
+
+    # Modern Dark Theme Palette
+    COLOR_BG_START = (20, 20, 24)
+    COLOR_BG_END = (35, 37, 45)
+    COLOR_OVERLAY = (0, 0, 0, 100)
+    COLOR_TEXT_MAIN = (255, 255, 255)
+    COLOR_TEXT_SUB = (170, 175, 185)
+
+    # Accent Colors
+    COLOR_ACCENT = (88, 101, 242)  # Discord Blurple
+    COLOR_MSG = (87, 242, 135)     # Green
+    COLOR_VOICE = (235, 69, 158)   # Pink
+    COLOR_DAYS = (88, 101, 242)    # Blue
+
+    COLOR_BAR_BG = (50, 53, 59)
+
+    FONT_SPECS = {
+        "name": ("DejaVuSans-Bold.ttf", 48),
+        "rank": ("DejaVuSans.ttf", 28),
+        "stat_label": ("DejaVuSans-Bold.ttf", 20),
+        "stat_val": ("DejaVuSans.ttf", 18),
+        "score_big": ("DejaVuSans-Bold.ttf", 60),
+        "score_label": ("DejaVuSans.ttf", 22),
+    }
 
     def __init__(self):
-        # Modern Dark Theme Palette
-        self.COLOR_BG_START = (20, 20, 24) 
-        self.COLOR_BG_END = (35, 37, 45)
-        self.COLOR_OVERLAY = (0, 0, 0, 100)
-        self.COLOR_TEXT_MAIN = (255, 255, 255)
-        self.COLOR_TEXT_SUB = (170, 175, 185)
-        
-        # Accent Colors
-        self.COLOR_ACCENT = (88, 101, 242) # Discord Blurple
-        self.COLOR_MSG = (87, 242, 135)    # Green
-        self.COLOR_VOICE = (235, 69, 158)  # Pink
-        self.COLOR_DAYS = (88, 101, 242)   # Blue
-        
-        self.COLOR_BAR_BG = (50, 53, 59)
+        self._fonts: Optional[Dict[str, Any]] = None
+        self._background: Optional[Image.Image] = None
+        self._avatar_mask: Optional[Image.Image] = None
+        self._avatars: "OrderedDict[str, Image.Image]" = OrderedDict()
 
-    async def generate_card(
-        self, 
-        user: discord.User, 
-        score_data: dict, 
-        rank: int, 
-        total_users: int
-    ) -> io.BytesIO:
-        """
-        Generate the rank card image.
-        """
+    def preload(self) -> None:
+        """Load fonts and build the static layers."""
+        if self._fonts is None:
+            self._fonts = self._load_fonts()
+        if self._background is None:
+            self._background = self._build_background()
+        if self._avatar_mask is None:
+            size = self.AVATAR_SIZE
+            mask = Image.new("L", (size, size), 0)
+            ImageDraw.Draw(mask).ellipse((0, 0, size, size), fill=255)
+            self._avatar_mask = mask
+
+    def _load_fonts(self) -> Dict[str, Any]:
         try:
-            # Canvas (900x450) - More vertical space for separation
-            W, H = 900, 450
-            image = Image.new("RGB", (W, H), self.COLOR_BG_START)
-            draw = ImageDraw.Draw(image)
-
-            # 1. Background Gradient & Pattern
-            self._draw_background(image, W, H)
-            
-            # 2. Load Fonts
-            try:
-                font_name = ImageFont.truetype("DejaVuSans-Bold.ttf", 48)
-                font_rank = ImageFont.truetype("DejaVuSans.ttf", 28)
-                font_stat_label = ImageFont.truetype("DejaVuSans-Bold.ttf", 20)
-                font_stat_val = ImageFont.truetype("DejaVuSans.ttf", 18)
-                font_score_big = ImageFont.truetype("DejaVuSans-Bold.ttf", 60)
-                font_score_label = ImageFont.truetype("DejaVuSans.ttf", 22)
-            except:
-                font_name = ImageFont.load_default()
-                font_rank = ImageFont.load_default()
-                font_stat_label = ImageFont.load_default()
-                font_stat_val = ImageFont.load_default()
-                font_score_big = ImageFont.load_default()
-                font_score_label = ImageFont.load_default()
-
-            # 3. Avatar (Top Left)
-            avatar_size = 140
-            avatar_x, avatar_y = 50, 50
-            
-            avatar_bytes = await self._get_avatar_bytes(user)
-            if avatar_bytes:
-                with Image.open(io.BytesIO(avatar_bytes)) as avatar_img:
-                    avatar_img = avatar_img.convert("RGBA").resize((avatar_size, avatar_size), Image.Resampling.LANCZOS)
-                    mask = Image.new("L", (avatar_size, avatar_size), 0)
-                    draw_mask = ImageDraw.Draw(mask)
-                    draw_mask.ellipse((0, 0, avatar_size, avatar_size), fill=255)
-                    image.paste(avatar_img, (avatar_x, avatar_y), mask)
-                    
-                    # Avatar Ring
-                    self._draw_ring(draw, avatar_x + avatar_size//2, avatar_y + avatar_size//2, avatar_size//2 + 4, 4, 1.0, self.COLOR_ACCENT)
-
-            # 4. User Info (Right of Avatar)
-            info_x = 230
-            draw.text((info_x, 70), str(user.name), font=font_name, fill=self.COLOR_TEXT_MAIN)
-            
-            percentile = (1 - (rank - 1) / total_users) * 100 if total_users > 1 else 100
-            rank_text = f"Rank #{rank}  •  Top {percentile:.1f}%"
-            draw.text((info_x, 130), rank_text, font=font_rank, fill=self.COLOR_TEXT_SUB)
-
-            # 5. Score Circle (Top Right)
-            circle_x, circle_y = 780, 120
-            radius = 80
-            thickness = 18
-            score = score_data.get('final_score', 0)
-            
-            # Background Ring
-            self._draw_ring(draw, circle_x, circle_y, radius, thickness, 1.0, (40, 40, 40))
-            # Progress Ring
-            self._draw_ring(draw, circle_x, circle_y, radius, thickness, score/100, self.COLOR_MSG if score > 50 else self.COLOR_ACCENT)
-            
-            # Score Text
-            txt = f"{int(score)}"
-            try:
-                w = font_score_big.getlength(txt)
-            except:
-                w = 50
-            draw.text((circle_x - w/2, circle_y - 40), txt, font=font_score_big, fill=self.COLOR_TEXT_MAIN)
-            draw.text((circle_x - 20, circle_y + 20), "PTS", font=font_score_label, fill=self.COLOR_TEXT_SUB)
-
-            # 6. Stats Area (Bottom Section)
-            # Draw a semi-transparent container
-            overlay = Image.new("RGBA", (W - 60, 180), (0, 0, 0, 60))
-            image.paste(overlay, (30, 240), overlay)
-            
-            # Stats Configuration
-            stats_y_start = 265
-            bar_height = 16
-            bar_width_total = 550
-            label_x = 60
-            bar_x = 200
-            val_x = 780
-            
-            spacing = 50
-
-            # Messages
-            self._draw_stat_line(draw, label_x, bar_x, val_x, stats_y_start, 
-                               "MESSAGES", self.COLOR_MSG, 
-                               score_data.get('message_score', 0), 
-                               font_stat_label, font_stat_val, bar_width_total, bar_height)
-
-            # Voice
-            self._draw_stat_line(draw, label_x, bar_x, val_x, stats_y_start + spacing, 
-                               "VOICE", self.COLOR_VOICE, 
-                               score_data.get('voice_score', 0), 
-                               font_stat_label, font_stat_val, bar_width_total, bar_height)
-
-            # Days
-            self._draw_stat_line(draw, label_x, bar_x, val_x, stats_y_start + spacing * 2, 
-                               "LOYALTY", self.COLOR_DAYS, 
-                               score_data.get('days_score', 0), 
-                               font_stat_label, font_stat_val, bar_width_total, bar_height)
-
-            # Finalize
-            buffer = io.BytesIO()
-            image.save(buffer, format="PNG")
-            buffer.seek(0)
-            return buffer
+            return {
+                name: ImageFont.truetype(path, size)
+                for name, (path, size) in self.FONT_SPECS.items()
+            }
+        except OSError:
+            logger.warning("DejaVu fonts not found, falling back to default font")
+            default = ImageFont.load_default()
+            return {name: default for name in self.FONT_SPECS}
 
+    def _build_background(self) -> Image.Image:
+        """Gradient, grid pattern and stats container - identical for every card."""
+        W, H = self.WIDTH, self.HEIGHT
+        image = Image.new("RGB", (W, H), self.COLOR_BG_START)
+        self._draw_background(image, W, H)
+
+        # Semi-transparent container behind the stats
+        overlay = Image.new("RGBA", (W - 60, 180), (0, 0, 0, 60))
+        image.paste(overlay, (30, 240), overlay)
+        return image
+
+    def _get_avatar(self, avatar_key: str, avatar_bytes: bytes) -> Optional[Image.Image]:
+        """Decode and resize an avatar, reusing earlier results for the same hash."""
+        avatar = self._avatars.get(avatar_key)
+        if avatar is not None:
+            self._avatars.move_to_end(avatar_key)
+            return avatar
+
+        try:
+            with Image.open(io.BytesIO(avatar_bytes)) as avatar_img:
+                avatar = avatar_img.convert("RGBA").resize(
+                    (self.AVATAR_SIZE, self.AVATAR_SIZE), Image.Resampling.LANCZOS
+                )
         except Exception as e:
-            logger.error(f"Failed to generate rank card: {e}", exc_info=True)
+            logger.warning(f"Could not decode avatar {avatar_key}: {e}")
             return None
 
+        self._avatars[avatar_key] = avatar
+        while len(self._avatars) > self.AVATAR_LRU_SIZE:
+            self._avatars.popitem(last=False)
+        return avatar
+
+    def render(self, spec: Dict[str, Any]) -> bytes:
+        """
+        Render a rank card to PNG bytes.
+
+        Args:
+            spec: Plain render inputs (see ``RankCardGenerator.build_spec``)
+
+        Returns:
+            PNG image bytes
+        """
+        self.preload()
+        fonts = self._fonts
+
+        image = self._background.copy()
+        draw = ImageDraw.Draw(image)
+
+        score_data = spec["score_data"]
+        rank = spec["rank"]
+        total_users = spec["total_users"]
+
+        # Avatar (Top Left)
+        avatar_size = self.AVATAR_SIZE
+        avatar_x, avatar_y = self.AVATAR_POS
+        if spec.get("avatar_bytes"):
+            avatar = self._get_avatar(spec["avatar_key"], spec["avatar_bytes"])
+            if avatar is not None:
+                image.paste(avatar, (avatar_x, avatar_y), self._avatar_mask)
+
+                # Avatar Ring
+                self._draw_ring(draw, avatar_x + avatar_size//2, avatar_y + avatar_size//2, avatar_size//2 + 4, 4, 1.0, self.COLOR_ACCENT)
+
+        # User Info (Right of Avatar)
+        info_x = 230
+        draw.text((info_x, 70), str(spec["name"]), font=fonts["name"], fill=self.COLOR_TEXT_MAIN)
+
+        percentile = (1 - (rank - 1) / total_users) * 100 if total_users > 1 else 100
+        rank_text = f"Rank #{rank}  •  Top {percentile:.1f}%"
+        draw.text((info_x, 130), rank_text, font=fonts["rank"], fill=self.COLOR_TEXT_SUB)
+
+        # Score Circle (Top Right)
+        circle_x, circle_y = 780, 120
+        radius = 80
+        thickness = 18
+        score = score_data.get('final_score', 0)
+
+        # Background Ring
+        self._draw_ring(draw, circle_x, circle_y, radius, thickness, 1.0, (40, 40, 40))
+        # Progress Ring
+        self._draw_ring(draw, circle_x, circle_y, radius, thickness, score/100, self.COLOR_MSG if score > 50 else self.COLOR_ACCENT)
+
+        # Score Text
+        txt = f"{int(score)}"
+        try:
+            w = fonts["score_big"].getlength(txt)
+        except AttributeError:
+            w = 50
+        draw.text((circle_x - w/2, circle_y - 40), txt, font=fonts["score_big"], fill=self.COLOR_TEXT_MAIN)
+        draw.text((circle_x - 20, circle_y + 20), "PTS", font=fonts["score_label"], fill=self.COLOR_TEXT_SUB)
+
+        # Stats Area (Bottom Section)
+        stats_y_start = 265
+        bar_height = 16
+        bar_width_total = 550
+        label_x = 60
+        bar_x = 200
+        val_x = 780
+
+        spacing = 50
+
+        stats = (
+            ("MESSAGES", self.COLOR_MSG, score_data.get('message_score', 0)),
+            ("VOICE", self.COLOR_VOICE, score_data.get('voice_score', 0)),
+            ("LOYALTY", self.COLOR_DAYS, score_data.get('days_score', 0)),
+        )
+        for row, (label, color, value) in enumerate(stats):
+            self._draw_stat_line(draw, label_x, bar_x, val_x, stats_y_start + spacing * row,
+                                 label, color, value,
+                                 fonts["stat_label"], fonts["stat_val"], bar_width_total, bar_height)
+
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+        return buffer.getvalue()
+
     def _draw_stat_line(self, draw, lx, bx, vx, y, label, color, score, font_l, font_v, bw, bh):
         """Helper to draw one row of stats."""
         # Label
         draw.text((lx, y - 5), label, font=font_l, fill=self.COLOR_TEXT_SUB)
-        
+
         # Bar Background
         draw.rounded_rectangle((bx, y, bx + bw, y + bh), radius=bh//2, fill=self.COLOR_BAR_BG)
-        
+
         # Bar Fill
         fill_w = int(bw * (score / 100))
         if fill_w > 0:
             # Ensure min width for visibility if > 0
             fill_w = max(fill_w, bh)
             draw.rounded_rectangle((bx, y, bx + fill_w, y + bh), radius=bh//2, fill=color)
-            
+
         # Value Text
         draw.text((vx, y - 3), f"{int(score)}%", font=font_v, fill=color)
 
     def _draw_background(self, image, w, h):
         """Draws a gradient background with a subtle grid pattern."""
         draw = ImageDraw.Draw(image)
-        
+
         # Vertical Gradient
         for y in range(h):
             r = int(self.COLOR_BG_START[0] + (self.COLOR_BG_END[0] - self.COLOR_BG_START[0]) * y / h)
             g = int(self.COLOR_BG_START[1] + (self.COLOR_BG_END[1] - self.COLOR_BG_START[1]) * y / h)
             b = int(self.COLOR_BG_START[2] + (self.COLOR_BG_END[2] - self.COLOR_BG_START[2]) * y / h)
             draw.line([(0, y), (w, y)], fill=(r, g, b))
-            
+
         # Subtle Grid Pattern
         step = 40
-        grid_color = (255, 255, 255, 10) # Very faint
-        
-        overlay = Image.new("RGBA", (w, h), (0,0,0,0))
+        grid_color = (255, 255, 255, 10)  # Very faint
+
+        overlay = Image.new("RGBA", (w, h), (0, 0, 0, 0))
         d_overlay = ImageDraw.Draw(overlay)
-        
+
         # Draw diagonal lines
         for i in range(0, w + h, step):
             d_overlay.line([(i, 0), (0, i)], fill=grid_color, width=1)
-            
-        image.paste(overlay, (0,0), overlay)
+
+        image.paste(overlay, (0, 0), overlay)
 
     def _draw_ring(self, draw, cx, cy, radius, thickness, progress, color):
         """Draw an arc ring with rounded caps."""
         start_angle = -90
         end_angle = -90 + (360 * max(0.001, min(1, progress)))
-        
+
         bbox = (cx - radius, cy - radius, cx + radius, cy + radius)
         draw.arc(bbox, start=start_angle, end=end_angle, fill=color, width=thickness)
 
-    def _draw_rounded_rect(self, draw, x1, y1, x2, y2, r, fill):
-        """Draw a rounded rectangle."""
-        draw.rounded_rectangle((x1, y1, x2, y2), radius=r, fill=fill)
 
-    async def _get_avatar_bytes(self, user: discord.User) -> Optional[bytes]:
-        url = user.display_avatar.url
+# Renderer of the current (worker) process, created by the pool initializer
+_worker_renderer: Optional[CardRenderer] = None
+
+
+def _init_worker() -> None:
+    """Process pool initializer: preload fonts and static layers."""
+    global _worker_renderer
+    _worker_renderer = CardRenderer()
+    _worker_renderer.preload()
+
+
+def _render_in_worker(spec: Dict[str, Any]) -> bytes:
+    if _worker_renderer is None:
+        _init_worker()
+    return _worker_renderer.render(spec)
+
+
+_render_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_render_pool(max_workers: int = RENDER_WORKERS) -> ProcessPoolExecutor:
+    """Get the shared rendering process pool (created on first use)."""
+    global _render_pool
+    if _render_pool is None:
+        # spawn: forking a process that runs the gateway threads is unsafe
+        _render_pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+    return _render_pool
+
+
+def shutdown_render_pool() -> None:
+    """Stop the rendering worker processes."""
+    global _render_pool
+    if _render_pool is not None:
+        _render_pool.shutdown(wait=False, cancel_futures=True)
+        _render_pool = None
+
+
+class AvatarCache:
+    """Avatar bytes cached by avatar hash on disk, with an in-memory LRU in front.
+
+    Discord avatar hashes change whenever the image changes, so entries never
+    need revalidation - a new avatar simply gets a new key.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = "data/cache/avatars",
+        max_memory_entries: int = 256,
+        max_disk_entries: int = 5000,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._disk_writes = 0
+
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "downloads": 0, "failures": 0}
+
+    @staticmethod
+    def avatar_key(asset: discord.Asset) -> str:
+        """Stable cache key for an avatar asset (hash + requested size)."""
+        return f"{asset.key}_{AVATAR_FETCH_SIZE}"
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        return self.cache_dir / f"{digest}.img"
+
+    def _remember(self, key: str, data: bytes) -> None:
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    async def get(self, user: discord.abc.User) -> Tuple[Optional[str], Optional[bytes]]:
+        """
+        Get avatar bytes for a user.
+
+        Args:
+            user: Discord user or member
+
+        Returns:
+            Tuple of (avatar key, image bytes); bytes are None if unavailable
+        """
+        asset = user.display_avatar.with_size(AVATAR_FETCH_SIZE)
+        key = self.avatar_key(asset)
+
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+            self.stats["memory_hits"] += 1
+            return key, data
+
+        path = self._path(key)
+        data = await asyncio.to_thread(self._read_file, path)
+        if data is not None:
+            self.stats["disk_hits"] += 1
+            self._remember(key, data)
+            return key, data
+
+        data = await self._download(asset.url)
+        if data is None:
+            self.stats["failures"] += 1
+            return key, None
+
+        self.stats["downloads"] += 1
+        self._remember(key, data)
+        await asyncio.to_thread(self._write_file, path, data)
+        return key, data
+
+    async def _download(self, url: str) -> Optional[bytes]:
         try:
-            async with aiohttp.ClientSession() as session:
+            timeout = aiohttp.ClientTimeout(total=10)
+            async with aiohttp.ClientSession(timeout=timeout) as session:
                 async with session.get(url) as response:
                     if response.status == 200:
                         return await response.read()
-        except:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.debug(f"Avatar download failed for {url}: {e}")
+        return None
+
+    @staticmethod
+    def _read_file(path: Path) -> Optional[bytes]:
+        try:
+            return path.read_bytes()
+        except OSError:
             return None
+
+    def _write_file(self, path: Path, data: bytes) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Could not write avatar cache file {path}: {e}")
+            return
+
+        # Prune the oldest files every so often instead of scanning on every write
+        self._disk_writes += 1
+        if self._disk_writes % 100 == 0:
+            self._prune_disk()
+
+    def _prune_disk(self) -> None:
+        try:
+            files = sorted(
+                (entry for entry in os.scandir(self.cache_dir) if entry.name.endswith(".img")),
+                key=lambda entry: entry.stat().st_mtime,
+            )
+        except OSError:
+            return
+        for entry in files[:max(0, len(files) - self.max_disk_entries)]:
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                pass
+
+
+class RankCardGenerator:
+    """Generates a PNG rank card for a user."""
+
+    def __init__(
+        self,
+        avatar_cache: Optional[AvatarCache] = None,
+        use_process_pool: bool = True,
+        image_cache: Optional[ImageCache] = None,
+    ):
+        """
+        Initialize the generator.
+
+        Args:
+            avatar_cache: Avatar cache to use (a new one if omitted)
+            use_process_pool: Render in worker processes; if False, render
+                in a thread of this process
+            image_cache: Cache for finished cards (shared cache if omitted)
+        """
+        self.avatar_cache = avatar_cache or AvatarCache()
+        self.image_cache = image_cache or get_image_cache()
+        self.use_process_pool = use_process_pool
+        self._local_renderer = CardRenderer()
+
+    @staticmethod
+    def build_spec(
+        name: str,
+        score_data: dict,
+        rank: int,
+        total_users: int,
+        avatar_key: Optional[str] = None,
+        avatar_bytes: Optional[bytes] = None,
+    ) -> Dict[str, Any]:
+        """Collect the picklable inputs of one card render."""
+        return {
+            "name": name,
+            "score_data": {
+                key: score_data.get(key, 0)
+                for key in ("final_score", "message_score", "voice_score", "days_score")
+            },
+            "rank": rank,
+            "total_users": total_users,
+            "avatar_key": avatar_key,
+            "avatar_bytes": avatar_bytes,
+        }
+
+    async def warm_up(self) -> None:
+        """Start the worker processes so the first card doesn't pay for spawning them."""
+        if not self.use_process_pool:
+            await asyncio.to_thread(self._local_renderer.preload)
+            return
+        try:
+            pool = get_render_pool()
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(*[
+                loop.run_in_executor(pool, _init_worker) for _ in range(RENDER_WORKERS)
+            ])
+        except Exception as e:
+            logger.warning(f"Could not warm up rank card workers: {e}")
+
+    async def render(self, spec: Dict[str, Any]) -> bytes:
+        """Render a card spec off the event loop."""
+        if self.use_process_pool:
+            loop = asyncio.get_running_loop()
+            try:
+                return await loop.run_in_executor(get_render_pool(), _render_in_worker, spec)
+            except BrokenProcessPool:
+                logger.warning("Rank card worker pool broke, rendering in a thread instead")
+                shutdown_render_pool()
+        return await asyncio.to_thread(self._local_renderer.render, spec)
+
+    async def generate_card(
+        self,
+        user: discord.User,
+        score_data: dict,
+        rank: int,
+        total_users: int
+    ) -> Optional[io.BytesIO]:
+        """
+        Generate the rank card image.
+
+        Args:
+            user: Discord user the card is for
+            score_data: Dict with final_score and the component scores
+            rank: User's rank
+            total_users: Total number of ranked users
+
+        Returns:
+            BytesIO with the PNG image, or None on failure
+        """
+        try:
+            # The avatar hash stands in for the avatar image in the cache key,
+            # so a cache hit needs neither a download nor a render
+            avatar_key = AvatarCache.avatar_key(
+                user.display_avatar.with_size(AVATAR_FETCH_SIZE)
+            )
+            spec = self.build_spec(str(user.name), score_data, rank, total_users, avatar_key)
+            cache_key = self.image_cache.make_key(CARD_CACHE_KIND, spec)
+
+            cached = await asyncio.to_thread(self.image_cache.get, cache_key)
+            if cached is not None:
+                return io.BytesIO(cached)
+
+            _, avatar_bytes = await self.avatar_cache.get(user)
+            spec["avatar_bytes"] = avatar_bytes
+            png = await self.render(spec)
+
+            # Don't pin a card rendered without its avatar (download failed)
+            if avatar_bytes is not None:
+                await asyncio.to_thread(self.image_cache.put, cache_key, png)
+            return io.BytesIO(png)
+
+        except Exception as e:
+            logger.error(f"Failed to generate rank card: {e}", exc_info=True)
+            return None
+
+
+def _benchmark_spec(index: int) -> Dict[str, Any]:
+    avatar = Image.new("RGB", (AVATAR_FETCH_SIZE, AVATAR_FETCH_SIZE), (88, 101, 242))
+    buffer = io.BytesIO()
+    avatar.save(buffer, format="PNG")
+    return RankCardGenerator.build_spec(
+        f"Benchmark User {index}",
+        {"final_score": 72.5, "message_score": 80, "voice_score": 55, "days_score": 90},
+        rank=index + 1,
+        total_users=500,
+        avatar_key=f"bench_{index % 8}",
+        avatar_bytes=buffer.getvalue(),
+    )
+
+
+async def benchmark(count: int = 100, workers: int = RENDER_WORKERS) -> Dict[str, float]:
+    """
+    Measure rank card throughput.
+
+    Args:
+        count: Number of cards to render per mode
+        workers: Process pool size for the pooled run
+
+    Returns:
+        Dict with cards/sec for inline rendering and for the process pool
+    """
+    specs = [_benchmark_spec(i) for i in range(count)]
+
+    renderer = CardRenderer()
+    renderer.preload()
+    started = time.perf_counter()
+    for spec in specs:
+        renderer.render(spec)
+    inline = count / (time.perf_counter() - started)
+
+    generator = RankCardGenerator(avatar_cache=AvatarCache(), use_process_pool=True)
+    get_render_pool(workers)
+    try:
+        await generator.warm_up()
+        started = time.perf_counter()
+        await asyncio.gather(*[generator.render(spec) for spec in specs])
+        pooled = count / (time.perf_counter() - started)
+    finally:
+        shutdown_render_pool()
+
+    return {"cards": count, "inline_cards_per_sec": inline, "pool_cards_per_sec": pooled}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    # Import through the package so worker processes can unpickle the task
+    from src.utils.rank_card_generator import benchmark as run_benchmark
+
+    parser = argparse.ArgumentParser(description="Benchmark rank card rendering")
+    parser.add_argument("--cards", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=RENDER_WORKERS)
+    args = parser.parse_args()
+
+    result = asyncio.run(run_benchmark(args.cards, args.workers))
+    print(f"Rendered {result['cards']} cards")
+    print(f"  inline:       {result['inline_cards_per_sec']:.1f} cards/sec")
+    print(f"  process pool: {result['pool_cards_per_sec']:.1f} cards/sec")
@@ -1,13 +1,125 @@
 """Discord API Rate Limit Monitor."""
 
 import logging
+import re
+import sys
 import time
 from collections import deque
-from typing import Optional
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
 import discord
 
+from src.utils.metrics import MetricFamily, get_registry
+
 logger = logging.getLogger("guildscout.rate_limits")
 
+# Seconds of per-second request counts kept per route/bucket/subsystem
+RATE_WINDOW = 60
+
+_SOURCE_ROOT = Path(__file__).resolve().parents[1]
+
+# Code that consumes REST budget, by source file relative to src/. Requests
+# from other modules are attributed to that module (e.g. "commands.analyze"),
+# requests without any of our frames to "discord" (library internals).
+SUBSYSTEMS = {
+    "utils/historical_import.py": "import",
+    "utils/validation.py": "verification",
+    "tasks/verification_scheduler.py": "verification",
+    "commands/raid.py": "raid",
+    "events/raid_events.py": "raid",
+    "tasks/raid_scheduler.py": "raid",
+    "utils/raid_utils.py": "raid",
+    "utils/dashboard_manager.py": "dashboard",
+    "commands/ranking_channel.py": "dashboard",
+}
+
+# Shared helpers that issue requests on behalf of other code; the request is
+# attributed to their caller
+PASSTHROUGH_MODULES = {
+    "utils/managed_message.py",
+    "utils/bot_messages.py",
+}
+
+_ID_SEGMENT = re.compile(r"/\d{15,25}(?=/|$)")
+
+
+class RollingCounter:
+    """Request and 429 counts with per-second resolution over RATE_WINDOW."""
+
+    __slots__ = ("total", "rate_limited", "counts", "seconds")
+
+    def __init__(self):
+        self.total = 0
+        self.rate_limited = 0
+        self.counts = [0] * RATE_WINDOW
+        self.seconds = [-1] * RATE_WINDOW
+
+    def add(self, now: float, rate_limited: bool = False):
+        second = int(now)
+        slot = second % RATE_WINDOW
+        if self.seconds[slot] != second:
+            self.seconds[slot] = second
+            self.counts[slot] = 0
+        self.counts[slot] += 1
+        self.total += 1
+        if rate_limited:
+            self.rate_limited += 1
+
+    def rate(self, now: float, window: int = 10) -> float:
+        """Requests per second over the last ``window`` seconds."""
+        window = max(1, min(window, RATE_WINDOW))
+        cutoff = int(now) - window
+        return sum(count for count, second in zip(self.counts, self.seconds) if second > cutoff) / window
+
+
+def _route_from_url(method: str, url) -> str:
+    """Route template for requests not issued through HTTPClient.request."""
+    path = getattr(url, "path", str(url))
+    path = path.split("/api/v10", 1)[-1]
+    template = _ID_SEGMENT.sub("/{id}", path)
+    return f"{method} {template}"
+
+
+def _inspect_caller() -> Tuple[Optional[str], str]:
+    """
+    Find the discord.py route and our calling code for the current request.
+
+    Walks the stack of the task issuing the request (the await chain is on it
+    while the request starts) from the innermost frame outwards. Frames of
+    PASSTHROUGH_MODULES are skipped, so an edit through ManagedMessage is
+    booked to the code that owns the message.
+
+    Returns:
+        Tuple of (route key or None, subsystem)
+    """
+    route = None
+    subsystem = None
+    passthrough = None
+    frame = sys._getframe(1)
+    while frame is not None and (route is None or subsystem is None):
+        if route is None and frame.f_code.co_name == "request":
+            candidate = frame.f_locals.get("route")
+            if isinstance(candidate, discord.http.Route):
+                route = candidate.key
+        if subsystem is None:
+            path = Path(frame.f_code.co_filename)
+            try:
+                relative = path.relative_to(_SOURCE_ROOT).as_posix()
+            except ValueError:
+                relative = None
+            if relative in PASSTHROUGH_MODULES:
+                passthrough = passthrough or relative
+            elif relative and relative != "utils/rate_limit_monitor.py":
+                subsystem = SUBSYSTEMS.get(relative) or relative[:-3].replace("/", ".")
+        frame = frame.f_back
+    if subsystem is None and passthrough is not None:
+        # Only a helper was found (e.g. called from a library callback)
+        subsystem = passthrough[:-3].replace("/", ".")
+    return route, subsystem or "discord"
+
 
 class RateLimitMonitor:
     """
@@ -17,19 +129,28 @@ class RateLimitMonitor:
     - Requests per second
     - Rate limit hits (429 responses)
     - Global rate limits
-    - Per-route rate limits
+    - Per-route, per-bucket and per-subsystem REST usage
     """
 
     def __init__(self):
         """Initialize rate limit monitor."""
         # Track requests in last 60 seconds
         self.request_timestamps: deque = deque(maxlen=10000)
+        self.total_requests = 0
 
         # Rate limit hits
         self.rate_limit_hits = 0
         self.global_rate_limits = 0
         self.last_rate_limit_time: Optional[float] = None
 
+        # REST accounting (fed by the aiohttp trace of the bot's HTTP client)
+        self.routes: Dict[str, RollingCounter] = {}
+        self.buckets: Dict[str, RollingCounter] = {}
+        self.subsystems: Dict[str, RollingCounter] = {}
+        # (route, subsystem) -> requests, for attributing a route's budget
+        self.route_subsystems: Dict[Tuple[str, str], int] = {}
+        self.route_buckets: Dict[str, str] = {}
+
         # Warning thresholds
         self.warning_requests_per_second = 40  # Discord global limit is 50/s
         self.critical_requests_per_second = 45
@@ -39,6 +160,7 @@ class RateLimitMonitor:
     def track_request(self):
         """Track an API request."""
         self.request_timestamps.append(time.time())
+        self.total_requests += 1
 
         # Check if we're approaching limits
         rps = self.get_requests_per_second()
@@ -69,15 +191,120 @@ class RateLimitMonitor:
             self.global_rate_limits += 1
             logger.error(
                 f"🚫 GLOBAL RATE LIMIT HIT! "
-                f"Retry after: {retry_after:.1f}s"
+                f"Retry after: {retry_after or 0:.1f}s"
             )
         else:
             logger.warning(
                 f"⚠️ Route rate limit hit. "
-                f"Retry after: {retry_after:.1f}s if provided, "
+                f"Retry after: {retry_after or 0:.1f}s, "
                 f"Total hits: {self.rate_limit_hits}"
             )
 
+    def create_trace_config(self) -> aiohttp.TraceConfig:
+        """
+        Trace config for the bot's HTTP session (``http_trace`` of the client).
+
+        Every REST attempt is counted - including the retries discord.py makes
+        after a 429 - and attributed to route, bucket and calling subsystem.
+        """
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, context: SimpleNamespace, params):
+            context.route, context.subsystem = _inspect_caller()
+            if context.route is None:
+                context.route = _route_from_url(params.method, params.url)
+
+        async def on_request_end(session, context: SimpleNamespace, params):
+            self.record_rest_request(
+                getattr(context, "route", None) or _route_from_url(params.method, params.url),
+                getattr(context, "subsystem", "discord"),
+                params.response.status,
+                params.response.headers
+            )
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        return trace_config
+
+    def record_rest_request(self, route: str, subsystem: str, status: int, headers) -> None:
+        """
+        Account one REST response.
+
+        Args:
+            route: Route template (e.g. "POST /channels/{channel_id}/messages")
+            subsystem: Code path that issued the request
+            status: HTTP status
+            headers: Response headers (rate limit bucket/scope are read)
+        """
+        now = time.time()
+        rate_limited = status == 429
+        bucket = headers.get("X-RateLimit-Bucket") or self.route_buckets.get(route) or route
+        if bucket != route:
+            self.route_buckets[route] = bucket
+
+        for counters, key in ((self.routes, route), (self.buckets, bucket), (self.subsystems, subsystem)):
+            counter = counters.get(key)
+            if counter is None:
+                counter = counters[key] = RollingCounter()
+            counter.add(now, rate_limited)
+        self.route_subsystems[(route, subsystem)] = self.route_subsystems.get((route, subsystem), 0) + 1
+
+        self.track_request()
+        if rate_limited:
+            retry_after = headers.get("Retry-After")
+            logger.warning(f"429 on {route} (bucket {bucket}) from {subsystem}")
+            self.track_rate_limit(
+                is_global=headers.get("X-RateLimit-Global", "").lower() == "true"
+                or headers.get("X-RateLimit-Scope") == "global",
+                retry_after=float(retry_after) if retry_after else None
+            )
+
+    def get_top_consumers(self, kind: str = "subsystems", limit: int = 5, window: int = 60) -> List[Dict]:
+        """
+        Biggest REST budget consumers.
+
+        Args:
+            kind: "subsystems", "routes" or "buckets"
+            limit: Number of entries
+            window: Seconds the request rate is computed over
+
+        Returns:
+            Dicts with name, requests_per_second, total and rate_limited,
+            sorted by current rate, then total
+        """
+        now = time.time()
+        entries = [
+            {
+                "name": name,
+                "requests_per_second": counter.rate(now, window),
+                "total": counter.total,
+                "rate_limited": counter.rate_limited
+            }
+            for name, counter in getattr(self, kind).items()
+        ]
+        entries.sort(key=lambda e: (e["requests_per_second"], e["total"]), reverse=True)
+        return entries[:limit]
+
+    def collect_metrics(self) -> List[MetricFamily]:
+        """Export per-route/bucket REST accounting for the /metrics endpoint."""
+        now = time.time()
+        requests = MetricFamily(
+            "guildscout_discord_rest_requests_total", "counter", "Discord REST requests by route and subsystem"
+        )
+        for (route, subsystem), count in sorted(self.route_subsystems.items()):
+            requests.add(count, route=route, subsystem=subsystem)
+
+        limited = MetricFamily(
+            "guildscout_discord_rest_rate_limited_total", "counter", "Discord 429 responses by bucket"
+        )
+        rates = MetricFamily(
+            "guildscout_discord_bucket_requests_per_second", "gauge", "Discord REST requests/s per bucket over 10s"
+        )
+        for bucket, counter in sorted(self.buckets.items()):
+            limited.add(counter.rate_limited, bucket=bucket)
+            rates.add(counter.rate(now), bucket=bucket)
+        return [requests, limited, rates]
+
     def get_requests_per_second(self, window_seconds: int = 10) -> float:
         """
         Calculate requests per second in the last N seconds.
@@ -133,6 +360,14 @@ class RateLimitMonitor:
             f"{stats['total_rate_limit_hits']} hits, "
             f"Status: {stats['status']}"
         )
+        consumers = self.get_top_consumers(limit=3)
+        if consumers:
+            logger.info(
+                "📊 Top REST consumers: " + ", ".join(
+                    f"{c['name']} {c['requests_per_second']:.2f} req/s ({c['total']} total, {c['rate_limited']}x 429)"
+                    for c in consumers
+                )
+            )
 
 
 # Global instance
@@ -144,4 +379,5 @@ def get_monitor() -> RateLimitMonitor:
     global _monitor
     if _monitor is None:
         _monitor = RateLimitMonitor()
+        get_registry().add_collector(_monitor.collect_metrics)
     return _monitor
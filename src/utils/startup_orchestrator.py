@@ -0,0 +1,95 @@
+"""
+Staged startup: independent steps run concurrently, non-critical ones after on_ready.
+
+``setup_hook`` describes startup as ordered groups of steps. The steps of
+one group don't depend on each other and run concurrently; groups run one
+after another. Deferred steps are collected and started once the bot is
+ready, so they don't delay the gateway connection.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional, Sequence, Tuple
+
+from src.utils.startup_profiler import StartupProfiler, get_startup_profiler
+
+logger = logging.getLogger("guildscout.startup")
+
+StartupStep = Tuple[str, Callable[[], Awaitable[None]]]
+
+
+class StartupOrchestrator:
+    """Runs startup steps in concurrent groups and keeps deferred steps for later."""
+
+    def __init__(self, profiler: Optional[StartupProfiler] = None):
+        """
+        Initialize the orchestrator.
+
+        Args:
+            profiler: Profiler that records each step as a stage
+                (defaults to the process-wide startup profiler)
+        """
+        self.profiler = profiler or get_startup_profiler()
+        self._deferred: List[StartupStep] = []
+        self._deferred_task: Optional[asyncio.Task] = None
+
+    async def _run_step(self, group: str, name: str, step: Callable[[], Awaitable[None]]) -> None:
+        with self.profiler.stage(f"{group} {name}"):
+            await step()
+
+    async def run_group(self, group: str, steps: Sequence[StartupStep]) -> None:
+        """
+        Run the steps of a group concurrently and wait for all of them.
+
+        Args:
+            group: Group name (prefix of the recorded stages)
+            steps: (name, coroutine factory) pairs
+
+        Raises:
+            Exception: The first failure of the group, after all steps finished
+        """
+        with self.profiler.stage(f"{group} (group)"):
+            results = await asyncio.gather(
+                *(self._run_step(group, name, step) for name, step in steps),
+                return_exceptions=True
+            )
+
+        failures = [
+            (name, result) for (name, _), result in zip(steps, results)
+            if isinstance(result, BaseException)
+        ]
+        for name, error in failures:
+            logger.error(f"Startup step {group}/{name} failed: {error}", exc_info=error)
+        if failures:
+            raise failures[0][1]
+
+    def defer(self, steps: Sequence[StartupStep]) -> None:
+        """Queue steps to run after the bot is ready (see ``start_deferred``)."""
+        self._deferred.extend(steps)
+
+    def start_deferred(self) -> Optional[asyncio.Task]:
+        """
+        Run the deferred steps in the background (once).
+
+        Failures are logged and don't affect the other deferred steps.
+
+        Returns:
+            The background task, or None if there is nothing to run
+        """
+        if self._deferred_task is not None or not self._deferred:
+            return self._deferred_task
+
+        steps, self._deferred = self._deferred, []
+
+        async def run():
+            results = await asyncio.gather(
+                *(self._run_step("deferred", name, step) for name, step in steps),
+                return_exceptions=True
+            )
+            for (name, _), result in zip(steps, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Deferred startup step {name} failed: {result}", exc_info=result)
+            logger.info(f"Deferred startup steps loaded: {', '.join(name for name, _ in steps)}")
+
+        self._deferred_task = asyncio.create_task(run())
+        return self._deferred_task
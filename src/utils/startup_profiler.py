@@ -0,0 +1,230 @@
+"""
+Startup timeline for the bot process.
+
+Records, relative to process start:
+- import time per module (via a meta path hook, installed by run.py
+  before ``src.bot`` is imported)
+- the stages of ``setup_hook`` (store init, cog loads, command sync, ...)
+- milestones such as ``on_ready``
+
+The timeline is logged once the bot is ready and shown by ``/profile``.
+"""
+
+import importlib.abc
+import importlib.machinery
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("guildscout.startup")
+
+# Imports faster than this are not kept (keeps the timeline small)
+MIN_IMPORT_SECONDS = 0.002
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Wraps a source loader and times ``exec_module``."""
+
+    def __init__(self, loader, profiler: "StartupProfiler", name: str):
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        # Restore the real loader so reloads and resource lookups see it
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        self._profiler._enter_import()
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit_import(self._name, time.perf_counter() - start)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """Meta path finder that wraps source loaders of newly imported modules."""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if isinstance(spec.loader, importlib.machinery.SourceFileLoader):
+                spec.loader = _TimedLoader(spec.loader, self._profiler, fullname)
+            return spec
+        return None
+
+
+class StartupProfiler:
+    """Collects the startup timeline of the bot process."""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.wall_started_at = time.time()
+
+        self._lock = threading.Lock()
+        self._hook: Optional[_ImportTimer] = None
+        # Stack of child import time per active import (for self time)
+        self._import_stack = threading.local()
+        # module -> (cumulative seconds, self seconds)
+        self.imports: Dict[str, Tuple[float, float]] = {}
+        # (name, start offset, duration)
+        self.stages: List[Tuple[str, float, float]] = []
+        # name -> offset
+        self.marks: Dict[str, float] = {}
+        self.finished = False
+
+    def offset(self) -> float:
+        """Seconds since process start."""
+        return time.perf_counter() - self.started_at
+
+    # ------------------------------------------------------------------
+    # Imports
+    # ------------------------------------------------------------------
+
+    def install_import_hook(self) -> None:
+        """Start timing imports of Python source modules."""
+        if self._hook is None:
+            self._hook = _ImportTimer(self)
+            sys.meta_path.insert(0, self._hook)
+
+    def remove_import_hook(self) -> None:
+        """Stop timing imports."""
+        if self._hook is not None:
+            try:
+                sys.meta_path.remove(self._hook)
+            except ValueError:
+                pass
+            self._hook = None
+
+    def _stack(self) -> List[float]:
+        stack = getattr(self._import_stack, "stack", None)
+        if stack is None:
+            stack = self._import_stack.stack = []
+        return stack
+
+    def _enter_import(self) -> None:
+        self._stack().append(0.0)
+
+    def _exit_import(self, name: str, elapsed: float) -> None:
+        stack = self._stack()
+        children = stack.pop() if stack else 0.0
+        if stack:
+            stack[-1] += elapsed
+        if elapsed >= MIN_IMPORT_SECONDS:
+            with self._lock:
+                self.imports[name] = (elapsed, max(0.0, elapsed - children))
+
+    def slowest_imports(self, limit: int = 10, top_level_only: bool = True) -> List[Tuple[str, float, float]]:
+        """
+        Slowest imports by cumulative time.
+
+        Args:
+            limit: Number of entries
+            top_level_only: Skip submodules whose parent package is listed
+
+        Returns:
+            List of (module, cumulative seconds, self seconds)
+        """
+        with self._lock:
+            items = list(self.imports.items())
+        if top_level_only:
+            names = {name for name, _ in items}
+            items = [
+                (name, times) for name, times in items
+                if not any(name.startswith(parent + ".") for parent in names if parent != name)
+            ]
+        items.sort(key=lambda item: item[1][0], reverse=True)
+        return [(name, cumulative, own) for name, (cumulative, own) in items[:limit]]
+
+    # ------------------------------------------------------------------
+    # Stages and milestones
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a block (also around awaits) as a startup stage."""
+        start = self.offset()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.stages.append((name, start, self.offset() - start))
+
+    def mark(self, name: str) -> float:
+        """Record a milestone (first occurrence wins) and return its offset."""
+        with self._lock:
+            return self.marks.setdefault(name, self.offset())
+
+    def finish(self) -> None:
+        """Mark startup as complete, stop the import hook and log the timeline."""
+        if self.finished:
+            return
+        self.mark("on_ready")
+        self.remove_import_hook()
+        self.finished = True
+        for line in self.format_timeline():
+            logger.info(line)
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def summary(self) -> Dict[str, Any]:
+        """Timeline as a dict (seconds)."""
+        with self._lock:
+            stages = list(self.stages)
+            marks = dict(self.marks)
+        return {
+            "marks": marks,
+            "stages": [
+                {"name": name, "start": start, "duration": duration}
+                for name, start, duration in stages
+            ],
+            "imports": [
+                {"module": name, "cumulative": cumulative, "self": own}
+                for name, cumulative, own in self.slowest_imports(limit=15)
+            ],
+        }
+
+    def format_timeline(self, stage_limit: int = 10, import_limit: int = 5) -> List[str]:
+        """Human-readable timeline lines (slowest stages and imports first)."""
+        lines = []
+        with self._lock:
+            marks = sorted(self.marks.items(), key=lambda item: item[1])
+            stages = sorted(self.stages, key=lambda item: item[2], reverse=True)
+
+        for name, at in marks:
+            lines.append(f"{name}: +{at:.2f}s")
+        for name, _, duration in stages[:stage_limit]:
+            lines.append(f"stage {name}: {duration * 1000:.0f}ms")
+        for name, cumulative, own in self.slowest_imports(limit=import_limit):
+            lines.append(f"import {name}: {cumulative * 1000:.0f}ms (self {own * 1000:.0f}ms)")
+        return lines
+
+
+_profiler: Optional[StartupProfiler] = None
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """Get the process-wide startup profiler (created on first call)."""
+    global _profiler
+    if _profiler is None:
+        _profiler = StartupProfiler()
+    return _profiler
@@ -2,16 +2,67 @@
 
 import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
 import discord
 from discord.ext import commands
 
+from src.database.bot_message_store import PURPOSE_STATUS, get_bot_message_store
+from src.utils.bot_messages import adopt_legacy_messages, purge_tracked, track_message
 from src.utils.config import Config
+from src.utils.managed_message import edit_if_changed
 
 logger = logging.getLogger("guildscout.status")
 
+# Titles of status messages that are obsolete once the bot restarts
+CLEANUP_PHRASES = [
+    "GuildScout gestartet",
+    "GuildScout verbunden",
+    "Verifikation abgeschlossen",
+    "Verifikation erfolgreich",
+    "Delta-Import abgeschlossen",
+    "Import abgeschlossen",
+    "Stichproben-Verifikation",
+    "Tiefenprüfung"
+]
+
+# Titles of running-process messages (obsolete if older than STUCK_PROGRESS_SECONDS)
+PROGRESS_PHRASES = ["Läuft", "Verifiziere", "Import läuft"]
+STUCK_PROGRESS_SECONDS = 1800
+
+# Registry ref_keys of status messages
+STATUS_ALERT = "alert"
+STATUS_OBSOLETE = "obsolete"
+STATUS_PROGRESS = "progress"
+STATUS_OTHER = "other"
+
+
+def classify_status_message(title: Optional[str], color: Optional[discord.Color] = None) -> str:
+    """
+    Decide how the status channel cleanup treats a message.
+
+    Errors and warnings (❌/⚠️/"Fehler" in the title or a red embed) are
+    never cleaned up.
+
+    Args:
+        title: Embed title
+        color: Embed color
+
+    Returns:
+        One of STATUS_ALERT, STATUS_OBSOLETE, STATUS_PROGRESS, STATUS_OTHER
+    """
+    title = title or ""
+    if "❌" in title or "⚠️" in title or "Fehler" in title:
+        return STATUS_ALERT
+    if color == discord.Color.red():
+        return STATUS_ALERT
+    if any(phrase in title for phrase in CLEANUP_PHRASES):
+        return STATUS_OBSOLETE
+    if any(phrase in title for phrase in PROGRESS_PHRASES):
+        return STATUS_PROGRESS
+    return STATUS_OTHER
+
 
 class AcknowledgeButton(discord.ui.View):
     """Button view for acknowledging status messages."""
@@ -43,6 +94,7 @@ class AcknowledgeButton(discord.ui.View):
 
             # Delete message
             await interaction.message.delete()
+            await get_bot_message_store().forget([interaction.message.id])
             logger.info(
                 f"Status message {self.message_id} acknowledged and deleted by {interaction.user} "
                 f"in guild {self.guild_id}"
@@ -73,6 +125,7 @@ class StatusManager:
         self.config = config
         self._acknowledgments: Dict[int, list] = {}  # guild_id -> list of acknowledgments
         self._lock = asyncio.Lock()
+        self._started_at = int(datetime.now(timezone.utc).timestamp())
 
     def _get_status_channel(self, guild: discord.Guild) -> Optional[discord.TextChannel]:
         """Get the status channel for a guild."""
@@ -164,6 +217,7 @@ class StatusManager:
                 # Send with ping if provided
                 content = ping if ping else None
                 message = await channel.send(content=content, embed=embed, view=view)
+                await track_message(message, PURPOSE_STATUS, STATUS_ALERT)
 
                 # Update button with actual message ID
                 view.message_id = message.id
@@ -241,22 +295,33 @@ class StatusManager:
 
             try:
                 if message:
-                    # Update existing message
-                    await message.edit(embed=embed)
-                    return message
+                    # Update existing message (skipped if the embed is unchanged)
+                    await edit_if_changed(message, embed=embed)
                 else:
                     # Send new message
                     message = await channel.send(embed=embed)
-                    return message
+                await track_message(message, PURPOSE_STATUS, classify_status_message(title, color))
+                return message
 
             except Exception as e:
                 logger.error(f"Failed to send temp status: {e}", exc_info=True)
                 return None
 
+    def _classify_legacy_message(self, message: discord.Message):
+        """Classify a status message posted before the registry existed."""
+        if message.author.id != self.bot.user.id or not message.embeds:
+            return None
+        embed = message.embeds[0]
+        return PURPOSE_STATUS, classify_status_message(embed.title, embed.color)
+
     async def cleanup_status_channel(self, guild: discord.Guild):
         """
         Clean up obsolete status messages (e.g., old startup/success messages).
         Preserves active errors and warnings.
+
+        Targets come from the message registry, so messages of previous runs
+        are found regardless of how many messages were posted since. Messages
+        from before the registry existed are registered by a one-time scan.
         """
         async with self._lock:
             channel = self._get_status_channel(guild)
@@ -264,62 +329,29 @@ class StatusManager:
                 return
 
             try:
-                # Define phrases that indicate a message can be safely deleted
-                cleanup_phrases = [
-                    "GuildScout gestartet",
-                    "GuildScout verbunden",
-                    "Verifikation abgeschlossen",
-                    "Verifikation erfolgreich",
-                    "Delta-Import abgeschlossen",
-                    "Import abgeschlossen",
-                    "Stichproben-Verifikation",
-                    "Tiefenprüfung"
-                ]
-
-                deleted_count = 0
-                
-                # Check last 50 messages
-                async for message in channel.history(limit=50):
-                    # Only check messages from this bot
-                    if message.author.id != self.bot.user.id:
-                        continue
-
-                    # Skip if it has no embeds (unlikely for us, but safe check)
-                    if not message.embeds:
-                        continue
-
-                    embed = message.embeds[0]
-                    title = embed.title or ""
-                    
-                    # CRITICAL: Do NOT delete errors or warnings
-                    # These usually have "❌" or "⚠️" in the title, or color red/orange
-                    if "❌" in title or "⚠️" in title or "Fehler" in title:
-                        continue
-                        
-                    if embed.color == discord.Color.red():
-                        continue
-
-                    # Delete if title matches known cleanup phrases
-                    should_delete = False
-                    for phrase in cleanup_phrases:
-                        if phrase in title:
-                            should_delete = True
-                            break
-                    
-                    # Also cleanup temporary "Running" messages that might have stuck
-                    if "Läuft" in title or "Verifiziere" in title or "Import läuft" in title:
-                        # Only delete if older than 30 minutes (stuck process)
-                        age = datetime.utcnow() - message.created_at
-                        if age.total_seconds() > 1800:
-                            should_delete = True
-
-                    if should_delete:
-                        try:
-                            await message.delete()
-                            deleted_count += 1
-                            await asyncio.sleep(0.5)  # Avoid rate limits
-                        except Exception:
-                            pass
+                now_ts = int(datetime.now(timezone.utc).timestamp())
+                await adopt_legacy_messages(
+                    channel,
+                    PURPOSE_STATUS,
+                    self._classify_legacy_message,
+                    limit=50
+                )
+
+                # Startup/success messages of previous runs
+                deleted_count = await purge_tracked(
+                    channel,
+                    PURPOSE_STATUS,
+                    STATUS_OBSOLETE,
+                    created_before=self._started_at
+                )
+
+                # Temporary "Running" messages that got stuck
+                deleted_count += await purge_tracked(
+                    channel,
+                    PURPOSE_STATUS,
+                    STATUS_PROGRESS,
+                    created_before=now_ts - STUCK_PROGRESS_SECONDS
+                )
 
                 if deleted_count > 0:
                     logger.info(f"Cleaned up {deleted_count} obsolete messages in status channel for {guild.name}")
@@ -1,7 +1,9 @@
 """Validation tools for message tracking accuracy."""
 
 import logging
+import random
 import discord
+from datetime import datetime, timezone
 from typing import Dict, List, Optional, Callable, Awaitable
 from discord.ext import commands
 
@@ -97,25 +99,30 @@ class MessageCountValidator:
         excluded_channel_ids = self.activity_tracker.get_excluded_channel_ids()
 
         # OPTIMIZATION: Use channel-first counting for all users at once (10x faster!)
+        # The per-channel counts of this single sweep are kept for healing
         logger.info("🚀 Using optimized channel-first algorithm for validation...")
-        api_counts, cache_stats = await self.activity_tracker.count_messages_for_users(
+        api_counts, cache_stats, api_breakdowns = await self.activity_tracker.count_messages_for_users(
             sample_users,
             days_lookback=None,
             use_cache=False,  # Force fresh count
-            parallel_channels=3  # Conservative parallelism to avoid rate limits
+            parallel_channels=3,  # Conservative parallelism to avoid rate limits
+            return_breakdown=True
         )
         logger.info(f"✅ Optimized counting complete! Now comparing results...")
 
+        # Store side: all sampled users in one query
+        store_breakdowns = await self.message_store.get_user_breakdowns(
+            self.guild.id,
+            [user.id for user in sample_users],
+            excluded_channels=excluded_channel_ids
+        )
+
         # Phase 1: Compare all users
         users_needing_healing = []
 
         for idx, user in enumerate(sample_users, start=1):
             # Get count from MessageStore
-            store_count = await self.message_store.get_user_total(
-                self.guild.id,
-                user.id,
-                excluded_channels=excluded_channel_ids
-            )
+            store_count = sum(store_breakdowns.get(user.id, {}).values())
 
             # Get API count from optimized batch result
             api_count = api_counts.get(user.id, 0)
@@ -185,36 +192,32 @@ class MessageCountValidator:
             logger.info(f"🩹 Healing {len(users_needing_healing)} users with mismatches...")
 
             for user, store_count, api_count, diff in users_needing_healing:
-                try:
-                    # Get detailed breakdown for this user only
-                    logger.info(f"🔍 Fetching breakdown for {user.name}...")
-                    _, channel_breakdown = await self.activity_tracker.count_user_messages(
-                        user,
-                        use_cache=False,
-                        return_breakdown=True
-                    )
+                logger.info(f"🩹 Healing user {user.name} (Diff: {diff}, Store: {store_count}, API: {api_count})")
 
-                    # Update database with correct counts
-                    logger.info(f"🩹 Healing user {user.name} (Diff: {diff}, Store: {store_count}, API: {api_count})")
-                    await self.message_store.update_user_counts(
-                        self.guild.id,
-                        user.id,
-                        channel_breakdown
-                    )
+            try:
+                # Breakdowns come from the sweep above - no second scan, one transaction
+                await self.message_store.update_users_counts(
+                    self.guild.id,
+                    {
+                        user.id: api_breakdowns.get(user.id, {})
+                        for user, _, _, _ in users_needing_healing
+                    }
+                )
 
-                    results["healed"] += 1
+                healed_ids = {user.id for user, _, _, _ in users_needing_healing}
+                results["healed"] = len(healed_ids)
 
-                    # Update results to mark as healed
-                    for disc in results["discrepancies"]:
-                        if disc["user_id"] == user.id:
-                            disc["healed"] = True
+                # Update results to mark as healed
+                for disc in results["discrepancies"]:
+                    if disc["user_id"] in healed_ids:
+                        disc["healed"] = True
 
-                    for user_result in results["user_results"]:
-                        if user_result["user_id"] == user.id:
-                            user_result["healed"] = True
+                for user_result in results["user_results"]:
+                    if user_result["user_id"] in healed_ids:
+                        user_result["healed"] = True
 
-                except Exception as e:
-                    logger.error(f"Failed to heal user {user.name}: {e}")
+            except Exception as e:
+                logger.error(f"Failed to heal {len(users_needing_healing)} users: {e}")
 
         # Calculate average difference
         results["avg_difference"] = (
@@ -294,3 +297,236 @@ class MessageCountValidator:
             })
 
         return summary
+
+
+def stratify_channels(
+    activity: Dict[int, int],
+    sample_size: int,
+    strata: int = 3,
+    rng: Optional[random.Random] = None
+) -> List[int]:
+    """
+    Pick a channel sample stratified by recent activity.
+
+    Channels are ranked by activity and split into equally sized strata
+    (busy ... quiet). Every stratum contributes, so drift in quiet channels
+    is caught as well as in busy ones; busier strata get any remainder.
+
+    Args:
+        activity: Dict mapping channel_id -> recent message count
+        sample_size: Number of channels to pick
+        strata: Number of activity strata
+        rng: Random source (for tests)
+
+    Returns:
+        Sampled channel IDs, busiest stratum first
+    """
+    rng = rng or random.Random()
+    ranked = sorted(activity, key=lambda channel_id: activity[channel_id], reverse=True)
+    if sample_size >= len(ranked):
+        return ranked
+
+    strata = max(1, min(strata, len(ranked), sample_size))
+    bounds = [round(i * len(ranked) / strata) for i in range(strata + 1)]
+    groups = [ranked[bounds[i]:bounds[i + 1]] for i in range(strata)]
+
+    quotas = [sample_size // strata] * strata
+    for i in range(sample_size - sum(quotas)):
+        quotas[i] += 1
+
+    picked: List[int] = []
+    for group, quota in zip(groups, quotas):
+        picked.extend(rng.sample(group, min(quota, len(group))))
+    return picked
+
+
+class ChannelWindowValidator:
+    """Checks per-channel message counts over the window since the last run.
+
+    Each run stores a checkpoint of every channel's store total. The next
+    run fetches only the messages posted since then for a stratified sample
+    of channels and compares them with how much the store total grew.
+    Channels that disagree are escalated to a user-level check of their
+    authors via MessageCountValidator.
+    """
+
+    def __init__(
+        self,
+        guild: discord.Guild,
+        message_store: MessageStore,
+        activity_tracker: ActivityTracker
+    ):
+        """
+        Initialize the validator.
+
+        Args:
+            guild: Discord guild
+            message_store: MessageStore instance
+            activity_tracker: ActivityTracker instance (for Discord API counting)
+        """
+        self.guild = guild
+        self.message_store = message_store
+        self.activity_tracker = activity_tracker
+
+    async def validate_windows(
+        self,
+        sample_size: int = 12,
+        tolerance_percent: float = 2.0,
+        tolerance_messages: int = 2,
+        escalation_limit: int = 25,
+        heal_mismatches: bool = False,
+        rng: Optional[random.Random] = None
+    ) -> Dict:
+        """
+        Verify a stratified sample of channels over their recent window.
+
+        Args:
+            sample_size: Number of channels to check
+            tolerance_percent: Acceptable difference percentage per channel
+            tolerance_messages: Acceptable absolute difference per channel
+                (covers messages in flight and deletions of older messages)
+            escalation_limit: Maximum users checked for disagreeing channels
+            heal_mismatches: Whether escalated user checks fix DB counts
+            rng: Random source (for tests)
+
+        Returns:
+            Dictionary with validation results
+        """
+        now = datetime.now(timezone.utc)
+        channels = await self.activity_tracker._gather_message_sources(include_archived_threads=False)
+        channels_by_id = {channel.id: channel for channel in channels}
+
+        store_totals = await self.message_store.get_channel_totals(self.guild.id)
+        checkpoints = await self.message_store.get_channel_checkpoints(self.guild.id)
+
+        results = {
+            "channels_total": len(channels_by_id),
+            "channels_checked": 0,
+            "matches": 0,
+            "mismatches": 0,
+            "api_messages": 0,
+            "discrepancies": [],
+            "escalated_users": 0,
+            "user_results": None,
+            "healed": 0,
+            "baseline_only": False,
+        }
+
+        # Recent activity = store growth since the checkpoint
+        activity = {
+            channel_id: max(0, store_totals.get(channel_id, 0) - checkpoints[channel_id][1])
+            for channel_id in channels_by_id
+            if channel_id in checkpoints
+        }
+        sampled = stratify_channels(activity, sample_size, rng=rng)
+        logger.info(
+            f"Channel window verification: {len(sampled)}/{len(channels_by_id)} channels "
+            f"({len(channels_by_id) - len(activity)} without checkpoint)"
+        )
+
+        suspects: Dict[int, int] = {}  # user_id -> messages in disagreeing windows
+        checked = set()
+        for channel_id in sampled:
+            channel = channels_by_id[channel_id]
+            checked_at, checkpoint_total = checkpoints[channel_id]
+            try:
+                author_counts = await self.activity_tracker.count_channel_window(
+                    channel,
+                    after=checked_at,
+                    before=now
+                )
+            except Exception as e:
+                logger.error(f"Failed to count window of #{channel.name}: {e}")
+                continue
+
+            api_count = sum(author_counts.values())
+            store_delta = store_totals.get(channel_id, 0) - checkpoint_total
+            diff = abs(store_delta - api_count)
+            allowed = max(tolerance_messages, api_count * tolerance_percent / 100)
+
+            checked.add(channel_id)
+            results["channels_checked"] += 1
+            results["api_messages"] += api_count
+
+            if diff <= allowed:
+                results["matches"] += 1
+                continue
+
+            results["mismatches"] += 1
+            results["discrepancies"].append({
+                "channel": channel.name,
+                "channel_id": channel_id,
+                "since": checked_at,
+                "store_delta": store_delta,
+                "api_count": api_count,
+                "difference": diff,
+            })
+            logger.warning(
+                f"Channel #{channel.name}: store +{store_delta}, API {api_count} since {checked_at:%Y-%m-%d %H:%M}"
+            )
+
+            for user_id, count in author_counts.items():
+                suspects[user_id] = suspects.get(user_id, 0) + count
+            # Store counts too high: the window's authors may not be the culprits
+            if store_delta > api_count:
+                for user_id in await self.message_store.get_channel_top_users(
+                    self.guild.id, channel_id, limit=5
+                ):
+                    suspects.setdefault(user_id, 0)
+
+        results["baseline_only"] = not activity
+        results["accuracy_percent"] = (
+            results["matches"] / results["channels_checked"] * 100
+            if results["channels_checked"] else 100.0
+        )
+
+        # Escalate disagreeing channels to a full user-level check
+        if suspects:
+            members = []
+            for user_id in sorted(suspects, key=lambda uid: suspects[uid], reverse=True):
+                member = self.guild.get_member(user_id)
+                if member and not member.bot:
+                    members.append(member)
+                if len(members) >= escalation_limit:
+                    break
+
+            if members:
+                logger.info(f"Escalating {len(members)} users to a user-level check...")
+                user_validator = MessageCountValidator(self.guild, self.message_store, self.activity_tracker)
+                user_results = await user_validator.validate_sample(
+                    members,
+                    tolerance_percent=tolerance_percent,
+                    heal_mismatches=heal_mismatches
+                )
+                results["user_results"] = user_results
+                results["escalated_users"] = len(members)
+                results["healed"] = user_results.get("healed", 0)
+
+        # Advance the checked channels and start new ones (including ones without
+        # messages yet); unsampled channels keep growing their window
+        checkpoint_at = now
+        if results["healed"]:
+            # Healed totals include messages tracked during the escalation, so
+            # they are paired with a timestamp taken together with the re-read
+            checkpoint_at = datetime.now(timezone.utc)
+            store_totals = await self.message_store.get_channel_totals(self.guild.id)
+        new_checkpoints = {
+            channel_id: store_totals.get(channel_id, 0)
+            for channel_id in set(channels_by_id) | set(store_totals)
+            if channel_id in checked or channel_id not in checkpoints
+        }
+        await self.message_store.set_channel_checkpoints(self.guild.id, new_checkpoints, checkpoint_at)
+
+        # Disagreeing channels are fine if their users check out (or were healed)
+        user_results = results["user_results"]
+        results["passed"] = results["mismatches"] == 0 or (
+            user_results is not None
+            and user_results["healed"] == user_results["mismatches"]
+        )
+
+        logger.info(
+            f"Channel window verification done: {results['matches']}/{results['channels_checked']} channels match, "
+            f"{results['api_messages']} API messages, {results['escalated_users']} users escalated"
+        )
+
+        return results
@@ -0,0 +1,104 @@
+import asyncio
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.database.message_store import MessageStore
+from web_api.analytics_api import AnalyticsService
+
+
+GUILD_ID = 123
+
+
+class TestRankingCache(unittest.TestCase):
+
+    def setUp(self):
+        """Create a fresh messages.db with three active users."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = str(Path(self.tmpdir.name) / "messages.db")
+        self.store = MessageStore(db_path=self.db_path)
+        self.service = AnalyticsService(db_path=self.db_path)
+
+        async def seed():
+            now = datetime.now(timezone.utc)
+            for user_id, count in ((1, 30), (2, 20), (3, 10)):
+                await self.store.increment_message(
+                    GUILD_ID, user_id, 999, count=count, message_date=now
+                )
+
+        asyncio.run(seed())
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_data_version_bumped_on_write(self):
+        """Every write to the store increments the guild's data version."""
+        async def run():
+            before = await self.store.get_data_version(GUILD_ID)
+            await self.store.increment_message(GUILD_ID, 1, 999)
+            return before, await self.store.get_data_version(GUILD_ID)
+
+        before, after = asyncio.run(run())
+        self.assertEqual(before, 3)
+        self.assertEqual(after, 4)
+
+    def test_snapshot_reused_until_version_changes(self):
+        """Snapshots are served from cache and revalidated after a write."""
+        async def run():
+            first = await self.service.get_ranking_snapshot(GUILD_ID)
+            second = await self.service.get_ranking_snapshot(GUILD_ID)
+            self.assertIs(first, second)
+
+            await self.store.increment_message(GUILD_ID, 3, 999, count=100)
+
+            # Stale snapshot is served while the refresh runs in background
+            stale = await self.service.get_ranking_snapshot(GUILD_ID)
+            self.assertIs(stale, first)
+            await asyncio.gather(*self.service._rankings._inflight.values())
+
+            return await self.service.get_ranking_snapshot(GUILD_ID)
+
+        fresh = asyncio.run(run())
+        self.assertEqual(fresh.scores[0].user_id, 3)
+        self.assertEqual(fresh.rank_index[3], 0)
+
+    def test_rankings_and_member_score_from_snapshot(self):
+        """Paging and single-member lookups read the same sorted snapshot."""
+        async def run():
+            page = await self.service.get_member_rankings(GUILD_ID, limit=2, offset=1)
+            score = await self.service.get_member_score(GUILD_ID, 2)
+            return page, score
+
+        page, score = asyncio.run(run())
+        self.assertEqual(page["total"], 3)
+        self.assertEqual([r["user_id"] for r in page["rankings"]], ["2", "3"])
+        self.assertEqual(page["rankings"][0]["rank"], 2)
+        self.assertEqual(score["rank"], 2)
+        self.assertEqual(score["total_members"], 3)
+
+    def test_cursor_paging_and_batch_scores(self):
+        """Keyset cursors walk the ranking; batch lookups share one snapshot."""
+        async def run():
+            first = await self.service.get_member_rankings(GUILD_ID, limit=2)
+            second = await self.service.get_member_rankings(
+                GUILD_ID, limit=2, cursor=first["next_cursor"]
+            )
+            invalid = await self.service.get_member_rankings(GUILD_ID, cursor="!!")
+            scores = await self.service.get_member_scores(GUILD_ID, [3, 1, 42])
+            return first, second, invalid, scores
+
+        first, second, invalid, scores = asyncio.run(run())
+        self.assertEqual([r["user_id"] for r in first["rankings"]], ["1", "2"])
+        self.assertEqual([r["user_id"] for r in second["rankings"]], ["3"])
+        self.assertEqual(second["rankings"][0]["rank"], 3)
+        self.assertIsNone(second["next_cursor"])
+        self.assertIn("error", invalid)
+        self.assertEqual(scores["1"]["rank"], 1)
+        self.assertEqual(scores["3"]["rank"], 3)
+        self.assertIsNone(scores["42"])
+        self.assertEqual(self.service.get_cache_stats()["loads"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+import asyncio
+import tempfile
+import unittest
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import discord
+
+from src.database.bot_message_store import (
+    PURPOSE_RAID_REMINDER,
+    PURPOSE_RAID_SLOT_PING,
+    BotMessageStore,
+)
+from src.database.raid_store import RaidRecord
+from src.utils.bot_messages import purge_tracked, track_message
+from src.utils.raid_utils import purge_raid_notices
+
+
+GUILD_ID = 321
+CHANNEL_ID = 555
+
+
+def snowflake(days_ago):
+    return discord.utils.time_snowflake(datetime.now(timezone.utc) - timedelta(days=days_ago))
+
+
+class FakeChannel:
+    """Stands in for discord.TextChannel; records deletions."""
+
+    id = CHANNEL_ID
+    name = "raids"
+
+    def __init__(self, missing=(), history=()):
+        self.bulk_calls = []
+        self.single_deletes = []
+        self.missing = set(missing)
+        self.messages = list(history)
+        self.history_calls = 0
+
+    async def history(self, limit, before):
+        self.history_calls += 1
+        for message in self.messages[:limit]:
+            if message.created_at < before:
+                yield message
+
+    async def delete_messages(self, messages):
+        self.bulk_calls.append([message.id for message in messages])
+
+    def get_partial_message(self, message_id):
+        channel = self
+
+        async def delete():
+            if message_id in channel.missing:
+                raise discord.NotFound(SimpleNamespace(status=404, reason="Not Found"), "gone")
+            channel.single_deletes.append(message_id)
+
+        return SimpleNamespace(id=message_id, delete=delete)
+
+
+class TestBotMessages(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.store = BotMessageStore(db_path=str(Path(self.tmpdir.name) / "bot_messages.db"))
+        patcher = mock.patch("src.utils.bot_messages.get_bot_message_store", return_value=self.store)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_purge_deletes_exactly_the_registered_messages(self):
+        """Recent messages go in one bulk call, old ones one by one; others stay."""
+        recent = [snowflake(1) + i for i in range(3)]
+        old = snowflake(20)
+        other_raid = snowflake(1) + 10
+        gone = snowflake(30)
+
+        async def run():
+            for message_id in recent + [old, gone]:
+                await self.store.register(GUILD_ID, CHANNEL_ID, message_id, PURPOSE_RAID_REMINDER, "7")
+            await self.store.register(GUILD_ID, CHANNEL_ID, other_raid, PURPOSE_RAID_REMINDER, "8")
+            await self.store.register(GUILD_ID, CHANNEL_ID, snowflake(1) + 20, PURPOSE_RAID_SLOT_PING, "7")
+
+            channel = FakeChannel(missing={gone})
+            deleted = await purge_tracked(channel, PURPOSE_RAID_REMINDER, 7)
+            remaining = await self.store.list_messages(PURPOSE_RAID_REMINDER)
+            return channel, deleted, remaining
+
+        channel, deleted, remaining = asyncio.run(run())
+        self.assertEqual(deleted, 5)
+        self.assertEqual(channel.bulk_calls, [sorted(recent)])
+        self.assertEqual(channel.single_deletes, [old])
+        self.assertEqual([record.message_id for record in remaining], [other_raid])
+
+    def test_track_message_registers_sent_message(self):
+        """Sent messages are registered with their channel and creation time."""
+        created = datetime.now(timezone.utc).replace(microsecond=0)
+        message = SimpleNamespace(
+            id=snowflake(0),
+            guild=SimpleNamespace(id=GUILD_ID),
+            channel=SimpleNamespace(id=CHANNEL_ID),
+            created_at=created,
+        )
+
+        async def run():
+            await track_message(message, PURPOSE_RAID_SLOT_PING, 7)
+            await track_message(None, PURPOSE_RAID_SLOT_PING, 7)
+            return await self.store.list_messages(PURPOSE_RAID_SLOT_PING, "7", channel_id=CHANNEL_ID)
+
+        records = asyncio.run(run())
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].message_id, message.id)
+        self.assertEqual(records[0].created_at, int(created.timestamp()))
+
+    def test_legacy_raid_pings_are_adopted_once(self):
+        """Pings from before tracking are found by one scan, then by ID."""
+        posted = datetime.now(timezone.utc) - timedelta(days=2)
+        bot = SimpleNamespace(bot=True)
+
+        def legacy(content, author=bot):
+            return SimpleNamespace(
+                id=discord.utils.time_snowflake(posted),
+                author=author,
+                content=content,
+                created_at=posted,
+                guild=SimpleNamespace(id=GUILD_ID),
+                channel=SimpleNamespace(id=CHANNEL_ID),
+            )
+
+        reminder = legacy("⏰ Reminder: **Dungeon Night** starts in 1 hour")
+        other_raid = legacy("⏰ Reminder: **Guild War** starts in 1 hour")
+        by_user = legacy("reminder: dungeon night", author=SimpleNamespace(bot=False))
+        channel = FakeChannel(history=[reminder, other_raid, by_user])
+        raid = RaidRecord(
+            7, GUILD_ID, CHANNEL_ID, None, 1, "Dungeon Night", None, "where_winds_meet", "raid",
+            0, 1, 1, 3, 0, "open", int(posted.timestamp()), None
+        )
+
+        async def run():
+            first = await purge_raid_notices(channel, raid, PURPOSE_RAID_REMINDER)
+            second = await purge_raid_notices(channel, raid, PURPOSE_RAID_REMINDER)
+            # Raids created after tracking started are never scanned
+            newer = replace(raid, id=8, created_at=int(datetime.now(timezone.utc).timestamp()) + 60)
+            await purge_raid_notices(channel, newer, PURPOSE_RAID_REMINDER)
+            return first, second
+
+        first, second = asyncio.run(run())
+        self.assertEqual((first, second), (1, 0))
+        self.assertEqual(channel.single_deletes, [reminder.id])
+        self.assertEqual(channel.history_calls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
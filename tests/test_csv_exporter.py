@@ -0,0 +1,98 @@
+import csv
+import gzip
+import importlib.util
+import subprocess
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from src.analytics.scorer import UserScore
+from src.exporters.csv_exporter import RANKING_COLUMNS, CSVExporter
+
+
+def make_score(user_id):
+    return UserScore(
+        user_id=user_id,
+        username=f"user{user_id}",
+        discriminator="0",
+        days_in_server=user_id * 10,
+        message_count=user_id * 3,
+        voice_seconds=0,
+        days_score=12.5,
+        message_score=40.0,
+        voice_score=0.0,
+        final_score=100.0 - user_id,
+        join_date=datetime(2024, 1, user_id, tzinfo=timezone.utc),
+    )
+
+
+def ranked(count):
+    """Generator of ranking rows, like a streaming producer."""
+    for rank in range(1, count + 1):
+        yield rank, make_score(rank)
+
+
+class TestCSVExporter(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.exporter = CSVExporter(export_dir=self.tmpdir.name, encoding="utf-8")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_csv_and_gzip_from_generator(self):
+        """Rows from a generator end up in plain and gzipped CSV identically."""
+        plain = self.exporter.export_ranking(ranked(3), "Raiders", filename="plain")
+        packed = self.exporter.export_ranking(ranked(3), "Raiders", filename="packed", compress=True)
+        self.assertTrue(plain.endswith("plain.csv"))
+        self.assertTrue(packed.endswith("packed.csv.gz"))
+
+        with open(plain, encoding="utf-8", newline="") as handle:
+            plain_rows = list(csv.reader(handle))
+        with gzip.open(packed, "rt", encoding="utf-8", newline="") as handle:
+            packed_rows = list(csv.reader(handle))
+
+        self.assertEqual(plain_rows, packed_rows)
+        self.assertEqual(plain_rows[0], RANKING_COLUMNS)
+        self.assertEqual(plain_rows[1], [
+            "1", "user1", "99.0", "3", "10", "2024-01-01 00:00:00", "40.0", "12.5", "1"
+        ])
+        self.assertEqual(len(plain_rows), 4)
+
+    def test_parquet_without_pyarrow_falls_back_to_csv(self):
+        """A parquet setting without pyarrow exports CSV instead of failing."""
+        missing = ImportError("Parquet export requires pyarrow (pip install pyarrow)")
+        with patch("src.exporters.csv_exporter._load_pyarrow", side_effect=missing):
+            with self.assertLogs("guildscout.csv_exporter", level="WARNING"):
+                exporter = CSVExporter(export_dir=self.tmpdir.name, encoding="utf-8", export_format="parquet")
+            configured = exporter.export_ranking(ranked(2), "Raiders", filename="configured")
+            requested = self.exporter.export_ranking(ranked(2), "Raiders", filename="requested", export_format="parquet")
+
+        self.assertEqual(exporter.export_format, "csv")
+        self.assertTrue(configured.endswith("configured.csv"))
+        self.assertTrue(requested.endswith("requested.csv"))
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow not installed")
+    def test_parquet_export(self):
+        """Parquet output holds every row, written in batches."""
+        import pyarrow.parquet as pq
+
+        path = self.exporter.export_ranking(ranked(2500), "Raiders", export_format="parquet")
+        table = pq.read_table(path)
+        self.assertEqual(table.num_rows, 2500)
+        self.assertEqual(table.column_names, RANKING_COLUMNS)
+
+    def test_exporters_do_not_import_pandas(self):
+        """Importing the exporters stays cheap."""
+        code = "import sys, src.exporters; print('pandas' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import asyncio
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.analytics.scorer import Scorer
+from src.database.message_store import MessageStore
+from src.utils.dashboard_model import DashboardModel
+
+
+GUILD_ID = 321
+
+
+def make_member(user_id, days_ago):
+    return SimpleNamespace(
+        id=user_id,
+        name=f"user{user_id}",
+        discriminator="0",
+        joined_at=datetime.now(timezone.utc) - timedelta(days=days_ago),
+    )
+
+
+class TestDashboardModel(unittest.TestCase):
+
+    def setUp(self):
+        """Seed a store with a few days of messages and one voice session."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.store = MessageStore(db_path=str(Path(self.tmpdir.name) / "messages.db"))
+        self.now = datetime.now(timezone.utc).replace(hour=12)
+
+        async def seed():
+            for days_ago, user_id, count in ((0, 1, 5), (1, 2, 3), (8, 3, 4), (8, 1, 1)):
+                await self.store.increment_message(
+                    GUILD_ID, user_id, 999, count=count,
+                    message_date=self.now - timedelta(days=days_ago)
+                )
+            await self.store.log_voice_session(
+                GUILD_ID, 2, 555, self.now - timedelta(hours=1), self.now
+            )
+
+        asyncio.run(seed())
+        self.model = DashboardModel(GUILD_ID)
+        asyncio.run(self.model.load(self.store))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_deltas_update_windows_and_chart_version(self):
+        """Live deltas move the rolling windows without touching the store."""
+        self.assertEqual(self.model.window_sums(2), (8, 5))
+        version = self.model.chart_version
+
+        self.model.record_message(2, self.now)
+        self.model.record_voice(2, 60)
+        self.model.record_message_removed(3, 10)
+
+        self.assertEqual(self.model.window_sums(2), (9, 5))
+        self.assertEqual(self.model.chart_version, version + 1)
+        self.assertEqual(self.model.message_totals[3], 0)
+        self.assertEqual(self.model.total_messages, 10)
+        self.assertEqual(self.model.total_voice_seconds, 3660)
+
+    def test_at_risk_matches_scorer_and_is_reused(self):
+        """The bottom-N heap agrees with a full Scorer run and is cached."""
+        members = [make_member(1, 30), make_member(2, 20), make_member(3, 10), make_member(4, 2)]
+        scorer = Scorer(weight_days=0.1, weight_messages=0.55, weight_voice=0.35, min_messages=0)
+
+        bottom, eligible = self.model.at_risk(members, scorer)
+
+        expected = [
+            s for s in scorer.calculate_scores(
+                members, self.model.message_totals, self.model.voice_totals
+            )
+            if s.days_in_server >= 7
+        ]
+        expected.sort(key=lambda s: s.final_score)
+        self.assertEqual(eligible, 3)
+        self.assertEqual(
+            [(s.user_id, s.final_score) for s in bottom],
+            [(s.user_id, s.final_score) for s in expected[:5]],
+        )
+
+        # A delta for a non-member keeps the cached list
+        self.model.record_message(99, self.now)
+        self.assertIs(self.model.at_risk(members, scorer)[0], bottom)
+
+        # A delta for a member triggers a recompute
+        self.model.record_message(3, self.now)
+        self.assertIsNot(self.model.at_risk(members, scorer)[0], bottom)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+import asyncio
+import time
+import unittest
+
+from aiohttp import web
+
+from web_api.discord_client import DiscordRestClient, _RateLimitBucket, _route_key
+
+
+class StubDiscord:
+    """Minimal local HTTP server imitating the Discord REST API."""
+
+    def __init__(self):
+        self.hits = {}
+        self.rate_limit_once = True
+        self.runner = None
+        self.base_url = None
+
+    def _count(self, name):
+        self.hits[name] = self.hits.get(name, 0) + 1
+
+    async def guild(self, request):
+        self._count("guild")
+        await asyncio.sleep(0.05)  # give concurrent callers time to pile up
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.json_response(
+            {"id": request.match_info["guild_id"], "name": "Stub"},
+            headers={
+                "ETag": '"v1"',
+                "X-RateLimit-Bucket": "guild-bucket",
+                "X-RateLimit-Remaining": "5",
+                "X-RateLimit-Reset-After": "1",
+            },
+        )
+
+    async def member(self, request):
+        self._count("member")
+        if self.rate_limit_once:
+            self.rate_limit_once = False
+            return web.json_response(
+                {"retry_after": 0.05, "global": False}, status=429
+            )
+        return web.json_response({"roles": ["1"]})
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/guilds/{guild_id}", self.guild)
+        app.router.add_get("/guilds/{guild_id}/members/{user_id}", self.member)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+class TestDiscordRestClient(unittest.TestCase):
+
+    def run_with_stub(self, scenario):
+        async def runner():
+            stub = StubDiscord()
+            await stub.start()
+            client = DiscordRestClient(base_url=stub.base_url)
+            try:
+                return await scenario(stub, client)
+            finally:
+                await client.aclose()
+                await stub.stop()
+
+        return asyncio.run(runner())
+
+    def test_concurrent_gets_are_coalesced_and_cached(self):
+        """Identical concurrent GETs hit the server once; repeats hit the cache."""
+        async def scenario(stub, client):
+            headers = {"Authorization": "Bot x"}
+            results = await asyncio.gather(*[
+                client.get_json("/guilds/1", headers=headers, cache_ttl=60)
+                for _ in range(5)
+            ])
+            await client.get_json("/guilds/1", headers=headers, cache_ttl=60)
+            return stub, client, results
+
+        stub, client, results = self.run_with_stub(scenario)
+        self.assertEqual(stub.hits["guild"], 1)
+        self.assertTrue(all(result == (200, {"id": "1", "name": "Stub"}) for result in results))
+        cache_stats = client.get_stats()["cache"]
+        self.assertEqual(cache_stats["coalesced"], 4)
+        self.assertEqual(cache_stats["hits"], 1)
+
+    def test_expired_entry_revalidated_with_etag(self):
+        """Expired entries are revalidated with If-None-Match and reused on 304."""
+        async def scenario(stub, client):
+            headers = {"Authorization": "Bot x"}
+            await client.get_json("/guilds/1", headers=headers, cache_ttl=0.01)
+            await asyncio.sleep(0.02)
+            result = await client.get_json("/guilds/1", headers=headers, cache_ttl=60)
+            return stub, client, result
+
+        stub, client, result = self.run_with_stub(scenario)
+        self.assertEqual(stub.hits["guild"], 2)
+        self.assertEqual(client.stats["revalidated"], 1)
+        self.assertEqual(result[1]["name"], "Stub")
+
+    def test_429_is_retried(self):
+        """A 429 response is retried after retry_after."""
+        async def scenario(stub, client):
+            return stub, client, await client.get_json(
+                "/guilds/1/members/2", headers={"Authorization": "Bot x"}
+            )
+
+        stub, client, result = self.run_with_stub(scenario)
+        self.assertEqual(result, (200, {"roles": ["1"]}))
+        self.assertEqual(stub.hits["member"], 2)
+        self.assertEqual(client.stats["rate_limited"], 1)
+
+    def test_lru_eviction(self):
+        """The response cache never grows beyond its size bound."""
+        async def scenario(stub, client):
+            client._cache.maxsize = 2
+            for guild_id in (1, 2, 3):
+                await client.get_json(
+                    f"/guilds/{guild_id}", headers={"Authorization": "Bot x"}, cache_ttl=60
+                )
+            return client
+
+        client = self.run_with_stub(scenario)
+        cache_stats = client.get_stats()["cache"]
+        self.assertEqual(cache_stats["size"], 2)
+        self.assertEqual(cache_stats["evictions"], 1)
+
+    def test_exhausted_bucket_releases_waiters_per_window(self):
+        """Waiters on an exhausted bucket do not all fire at the reset."""
+        async def run():
+            client = DiscordRestClient()
+            client._route_buckets["GET /guilds/1"] = "guild-bucket"
+            client._buckets["guild-bucket"] = _RateLimitBucket(
+                remaining=0, limit=2, reset_at=time.monotonic() + 0.1, reset_after=0.1
+            )
+            started = time.monotonic()
+            fired = []
+
+            async def call():
+                await client._wait_for_bucket("GET /guilds/1")
+                fired.append(time.monotonic() - started)
+
+            await asyncio.gather(*[call() for _ in range(4)])
+            return sorted(fired)
+
+        fired = asyncio.run(run())
+        # Two slots per 0.1s window: two requests after the first reset, two after the next
+        self.assertTrue(all(0.09 <= t < 0.19 for t in fired[:2]), fired)
+        self.assertTrue(all(t >= 0.19 for t in fired[2:]), fired)
+
+    def test_route_key_keeps_major_parameters(self):
+        """Guild/channel IDs stay in the bucket key, other IDs are collapsed."""
+        key = _route_key("GET", "/guilds/123456789012345678/members/223456789012345678")
+        self.assertEqual(key, "GET /guilds/123456789012345678/members/:id")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import tempfile
+import unittest
+
+from src.utils.image_cache import ImageCache
+
+
+class TestImageCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_key_depends_only_on_inputs(self):
+        """Equal inputs share a key regardless of dict order."""
+        a = ImageCache.make_key("card:v1", {"rank": 1, "score": 50.0})
+        b = ImageCache.make_key("card:v1", {"score": 50.0, "rank": 1})
+        c = ImageCache.make_key("card:v1", {"rank": 2, "score": 50.0})
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, c)
+        self.assertNotEqual(a, ImageCache.make_key("card:v2", {"rank": 1, "score": 50.0}))
+
+    def test_size_cap_evicts_least_recently_used(self):
+        """Going over the size cap drops the least recently read image."""
+        cache = ImageCache(self.tmpdir.name, max_bytes=250)
+        cache.put("aa1", b"x" * 100)
+        cache.put("bb2", b"y" * 100)
+        self.assertEqual(cache.get("aa1"), b"x" * 100)  # aa1 is now most recent
+        cache.put("cc3", b"z" * 100)
+
+        self.assertIsNone(cache.get("bb2"))
+        self.assertEqual(cache.get("aa1"), b"x" * 100)
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+        # A new instance picks up the files left on disk
+        reopened = ImageCache(self.tmpdir.name, max_bytes=250)
+        self.assertEqual(reopened.get("cc3"), b"z" * 100)
+        self.assertEqual(reopened.get_stats()["bytes"], 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import json
+import logging
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.utils.logger import LogSampler, setup_logger, stop_logging
+
+
+class TestLoggingPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        stop_logging()
+        logging.getLogger("guildscout_test").handlers.clear()
+        self.tmpdir.cleanup()
+
+    def test_records_keep_their_state_at_the_call(self):
+        log_file = Path(self.tmpdir.name) / "bot.log"
+        json_file = Path(self.tmpdir.name) / "bot.jsonl"
+        counts = {"messages": 1}
+
+        with patch("sys.stdout"):
+            logger = setup_logger("guildscout_test", "INFO", str(log_file), json_file=str(json_file))
+            logger.propagate = False
+            logger.info("tracked %s", counts, extra={"guild_id": 42})
+            counts["messages"] = 2  # Changed before the listener gets to the record
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logger.error("failed", exc_info=True)
+            stop_logging()
+
+        self.assertIn("tracked {'messages': 1}", log_file.read_text(encoding="utf-8"))
+
+        entries = [json.loads(line) for line in json_file.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual(entries[0]["message"], "tracked {'messages': 1}")
+        self.assertEqual(entries[0]["guild_id"], 42)
+        self.assertEqual(entries[0]["level"], "INFO")
+        self.assertIn("ValueError: boom", entries[1]["exception"])
+
+    def test_sampler_counts_suppressed_events(self):
+        logger = logging.getLogger("guildscout_test.sampler")
+        sampler = LogSampler(logger, interval=10)
+
+        with patch("src.utils.logger.time.monotonic", side_effect=[100.0, 101.0, 102.0, 111.0]):
+            with self.assertLogs(logger, level="DEBUG") as captured:
+                for user in ("a", "b", "c", "d"):
+                    sampler.debug("tracked", "Tracked message from %s", user)
+
+        self.assertEqual(captured.output, [
+            "DEBUG:guildscout_test.sampler:Tracked message from a",
+            "DEBUG:guildscout_test.sampler:Tracked message from d (+2 more in 11s)",
+        ])
+        self.assertEqual(captured.records[1].sampled_count, 3)
+
+    def test_sampler_is_a_level_check_when_debug_is_off(self):
+        logger = logging.getLogger("guildscout_test.quiet")
+        logger.setLevel(logging.INFO)
+        sampler = LogSampler(logger)
+
+        with patch("src.utils.logger.time.monotonic", side_effect=AssertionError("sampled")):
+            sampler.debug("tracked", "Tracked message from %s", "a")
+        self.assertEqual(sampler._state, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
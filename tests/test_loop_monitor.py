@@ -0,0 +1,51 @@
+import asyncio
+import time
+import unittest
+
+from src.utils.loop_monitor import LoopMonitor
+
+
+def _render_chart_synchronously():
+    """Stands in for CPU-bound work called directly on the loop."""
+    time.sleep(0.3)
+
+
+class TestLoopMonitor(unittest.TestCase):
+
+    def test_blocking_call_is_captured_with_its_location(self):
+        async def run():
+            monitor = LoopMonitor(threshold=0.1, interval=0.02)
+            monitor.start()
+            try:
+                await asyncio.sleep(0.1)
+                _render_chart_synchronously()
+                await asyncio.sleep(0.1)
+            finally:
+                monitor.stop()
+            return monitor
+
+        monitor = asyncio.run(run())
+        offenders = monitor.get_worst_offenders()
+
+        self.assertEqual(monitor.stalls, 1)
+        self.assertIn("_render_chart_synchronously", offenders[0].location)
+        self.assertIn("test_loop_monitor.py", offenders[0].stack)
+        self.assertGreaterEqual(offenders[0].worst, 0.2)
+        self.assertGreaterEqual(monitor.get_lag_stats()['max'], 0.2)
+
+    def test_idle_loop_has_no_stalls(self):
+        async def run():
+            monitor = LoopMonitor(threshold=0.1, interval=0.02)
+            monitor.start()
+            await asyncio.sleep(0.15)
+            monitor.stop()
+            return monitor
+
+        monitor = asyncio.run(run())
+        self.assertEqual(monitor.offenders, {})
+        self.assertGreater(monitor.get_lag_stats()['samples'], 3)
+        self.assertFalse(monitor.running)
+
+
+if __name__ == '__main__':
+    unittest.main()
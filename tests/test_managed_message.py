@@ -0,0 +1,59 @@
+import asyncio
+import io
+import unittest
+
+import discord
+
+from src.utils.managed_message import ManagedMessage, message_fingerprint
+
+
+class FakeMessage:
+    """Stands in for discord.Message; records edits."""
+
+    id = 42
+
+    def __init__(self):
+        self.edits = []
+
+    async def edit(self, **kwargs):
+        self.edits.append(kwargs)
+        return self
+
+
+class TestManagedMessage(unittest.TestCase):
+
+    def test_fingerprint_ignores_timestamp_and_hashes_files(self):
+        """Only visible content counts; files are hashed by their bytes."""
+        a = discord.Embed(title="Dashboard", timestamp=discord.utils.utcnow())
+        b = discord.Embed(title="Dashboard")
+        self.assertEqual(message_fingerprint(embed=a), message_fingerprint(embed=b))
+        self.assertNotEqual(
+            message_fingerprint(embed=a, ignore_timestamp=False),
+            message_fingerprint(embed=b, ignore_timestamp=False),
+        )
+
+        file_a = discord.File(io.BytesIO(b"png-1"), filename="chart.png")
+        file_b = discord.File(io.BytesIO(b"png-2"), filename="chart.png")
+        self.assertNotEqual(
+            message_fingerprint(embed=b, attachments=[file_a]),
+            message_fingerprint(embed=b, attachments=[file_b]),
+        )
+        self.assertEqual(file_a.fp.read(), b"png-1")  # not consumed by hashing
+
+    def test_unchanged_edit_is_skipped(self):
+        """Repeated identical edits reach Discord only once."""
+        message = FakeMessage()
+        managed = ManagedMessage(message, name="test")
+
+        async def run():
+            results = [await managed.edit(embed=discord.Embed(title="A")) for _ in range(3)]
+            results.append(await managed.edit(embed=discord.Embed(title="B")))
+            return results
+
+        self.assertEqual(asyncio.run(run()), [True, False, False, True])
+        self.assertEqual(len(message.edits), 2)
+        self.assertEqual((managed.edits, managed.skipped), (2, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+import asyncio
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+from src.database.cache import MessageCache, exclusion_key
+from src.database.message_store import MessageStore
+
+
+class TestMessageCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = str(Path(self.tmpdir.name) / "cache.db")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_exclusion_key_ignores_order(self):
+        self.assertEqual(exclusion_key([3, 1, 2]), exclusion_key([2, 3, 1]))
+        self.assertNotEqual(exclusion_key([1]), exclusion_key([]))
+        self.assertEqual(exclusion_key(None), exclusion_key([]))
+
+    def test_get_many_round_trip(self):
+        """Batched writes are readable in one lookup, per exclusion set and lookback."""
+        async def run():
+            cache = MessageCache(self.db_path)
+            await cache.set_many(1, {10: 5, 11: 7, 12: 0}, excluded_channels=[9, 8])
+            await cache.set_many(1, {10: 2}, days_lookback=7, excluded_channels=[8, 9])
+
+            # Fresh instance: everything comes from SQLite
+            cold = MessageCache(self.db_path)
+            all_time = await cold.get_many(1, [10, 11, 12, 13], excluded_channels=[8, 9])
+            weekly = await cold.get_many(1, [10, 11], days_lookback=7, excluded_channels=[9, 8])
+            other = await cold.get_many(1, [10], excluded_channels=[])
+            return all_time, weekly, other, await cold.get(1, 11, None, [8, 9])
+
+        all_time, weekly, other, single = asyncio.run(run())
+        self.assertEqual(all_time, {10: 5, 11: 7, 12: 0})
+        self.assertEqual(weekly, {10: 2})
+        self.assertEqual(other, {})
+        self.assertEqual(single, 7)
+
+    def test_memory_front_serves_repeat_lookups(self):
+        """Repeat lookups don't touch SQLite; the LRU stays bounded."""
+        async def run():
+            cache = MessageCache(self.db_path, max_memory_entries=2)
+            await cache.set_many(1, {10: 1, 11: 2, 12: 3})
+            self.assertEqual(len(cache._memory), 2)
+
+            with patch("src.database.cache.aiosqlite.connect", side_effect=AssertionError("SQLite hit")):
+                hits = await cache.get_many(1, [11, 12])
+            # Evicted entry is still in SQLite
+            return hits, await cache.get_many(1, [10])
+
+        hits, evicted = asyncio.run(run())
+        self.assertEqual(hits, {11: 2, 12: 3})
+        self.assertEqual(evicted, {10: 1})
+
+    def test_expired_entries_are_misses(self):
+        async def run():
+            cache = MessageCache(self.db_path, ttl=60)
+            await cache.set_many(1, {10: 1})
+            later = time.time() + 120
+            with patch("src.database.cache.time.time", return_value=later):
+                return await cache.get_many(1, [10]), len(cache._memory)
+
+        self.assertEqual(asyncio.run(run()), ({}, 0))
+
+    def test_clear_user_drops_memory_entries(self):
+        async def run():
+            cache = MessageCache(self.db_path)
+            await cache.set_many(1, {10: 1, 11: 2})
+            await cache.clear_user(1, 10)
+            return await cache.get_many(1, [10, 11])
+
+        self.assertEqual(asyncio.run(run()), {11: 2})
+
+
+class TestCacheDeltas(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = str(Path(self.tmpdir.name) / "cache.db")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_live_deltas_patch_or_drop_entries(self):
+        """Store writes patch all-time counts and drop what can't be patched exactly."""
+        async def run():
+            store = MessageStore(str(Path(self.tmpdir.name) / "messages.db"))
+            cache = MessageCache(self.db_path, ttl=86400)
+            store.add_delta_listener(cache.apply_delta)
+
+            await cache.set_many(1, {10: 5, 11: 3}, excluded_channels=[99])
+            await cache.set_many(1, {10: 2}, days_lookback=7, excluded_channels=[99])
+
+            now = datetime.now(timezone.utc)
+            await store.increment_message(1, 10, 100, message_date=now)
+            await store.increment_message(1, 10, 99, message_date=now)       # excluded channel
+            await store.adjust_message_count(1, 11, 100, 1)
+            await store.adjust_message_count(1, 11, 100, -1)
+            await store.increment_message(1, 10, 100, message_date=now - timedelta(days=30))  # outside window
+            await store.adjust_message_count(1, 10, 100, -1, message_date=now - timedelta(days=30))
+
+            memory = (
+                await cache.get_many(1, [10, 11], excluded_channels=[99]),
+                await cache.get_many(1, [10], days_lookback=7, excluded_channels=[99]),
+            )
+            await cache.flush_deltas()
+
+            cold = MessageCache(self.db_path, ttl=86400)
+            persisted = (
+                await cold.get_many(1, [10, 11], excluded_channels=[99]),
+                await cold.get_many(1, [10], days_lookback=7, excluded_channels=[99]),
+            )
+
+            # Without a date the windowed entry can't stay exact
+            await store.adjust_message_count(1, 10, 100, -1)
+            undated = await cache.get_many(1, [10], days_lookback=7, excluded_channels=[99])
+            return memory, persisted, undated
+
+        memory, persisted, undated = asyncio.run(run())
+        # All-time: +3-1 for user 10, +1-1 for user 11; windowed: +1, older messages leave it alone
+        self.assertEqual(memory, ({10: 6, 11: 3}, {10: 3}))
+        self.assertEqual(persisted, memory)
+        self.assertEqual(undated, {})
+
+    def test_replaced_counts_drop_entries(self):
+        """Healing, historical imports and guild resets invalidate instead of patching."""
+        async def run():
+            store = MessageStore(str(Path(self.tmpdir.name) / "messages.db"))
+            cache = MessageCache(self.db_path)
+            store.add_delta_listener(cache.apply_delta)
+
+            await cache.set_many(1, {10: 5, 11: 3}, excluded_channels=[])
+            await store.update_users_counts(1, {10: {100: 8}})
+            healed = await cache.get_many(1, [10, 11], excluded_channels=[])
+
+            # Imported history isn't added on top of cached counts
+            await cache.set_many(1, {12: 4}, excluded_channels=[])
+            await store.bulk_increment_messages({(1, 12, 100): 4, (1, 12, 101): 2})
+            imported = await cache.get_many(1, [12], excluded_channels=[])
+
+            await store.reset_guild(1)
+            await cache.flush_deltas()
+            return healed, imported, await MessageCache(self.db_path).get_many(1, [10, 11], excluded_channels=[])
+
+        self.assertEqual(asyncio.run(run()), ({11: 3}, {}, {}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from src.utils.health_server import HealthCheckServer
+from src.utils.metrics import MetricFamily, MetricsRegistry, get_registry
+
+
+class TestMetricsRegistry(unittest.TestCase):
+
+    def test_counter_and_histogram_exposition(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("test_requests_total", "Requests", ("route",))
+        counter.inc(route="/a")
+        counter.inc(2, route='say "hi"')
+        histogram = registry.histogram("test_latency_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        lines = registry.render().splitlines()
+
+        self.assertIn("# TYPE test_requests_total counter", lines)
+        self.assertIn('test_requests_total{route="/a"} 1', lines)
+        self.assertIn('test_requests_total{route="say \\"hi\\""} 2', lines)
+        # Buckets are cumulative, the boundary value falls into its bucket
+        self.assertIn('test_latency_seconds_bucket{le="0.1"} 2', lines)
+        self.assertIn('test_latency_seconds_bucket{le="1"} 3', lines)
+        self.assertIn('test_latency_seconds_bucket{le="+Inf"} 4', lines)
+        self.assertIn("test_latency_seconds_count 4", lines)
+        self.assertIn("test_latency_seconds_sum 3.65", lines)
+
+    def test_registration_is_idempotent_and_checked(self):
+        registry = MetricsRegistry()
+        first = registry.counter("test_total", "Help", ("a",))
+        self.assertIs(registry.counter("test_total", "Help", ("a",)), first)
+        with self.assertRaises(ValueError):
+            registry.gauge("test_total", "Help", ("a",))
+        with self.assertRaises(ValueError):
+            first.inc(b=1)
+
+    def test_failing_collector_is_skipped(self):
+        registry = MetricsRegistry()
+
+        def broken():
+            raise RuntimeError("boom")
+
+        def working():
+            return [MetricFamily("test_up", "gauge", "Up").add(1)]
+
+        registry.add_collector(broken)
+        self.assertIn("test_up 1", registry.render(working).splitlines())
+
+
+class FakeBot:
+    guilds = []
+    latency = 0.05
+
+    def __init__(self, tracker=None):
+        self.cache = SimpleNamespace(memory_stats={"hits": 3, "misses": 1}, _memory={1: None})
+        self._tracker = tracker
+
+    def is_ready(self):
+        return True
+
+    def is_closed(self):
+        return False
+
+    def get_cog(self, name):
+        return self._tracker if name == "MessageTracker" else None
+
+
+class TestMetricsEndpoint(unittest.TestCase):
+
+    def test_metrics_include_recorded_and_collected_values(self):
+        tracker = SimpleNamespace(get_dedup_stats=lambda: {"total_seen": 10, "duplicates_blocked": 2})
+        server = HealthCheckServer(FakeBot(tracker))
+        get_registry().counter("guildscout_messages_tracked_total", "Messages counted by live tracking").inc()
+
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.chdir(tmpdir)  # VerificationStats reads ./data
+            try:
+                response = asyncio.run(server.metrics(None))
+            finally:
+                os.chdir(cwd)
+
+        self.assertTrue(response.content_type.startswith("text/plain"))
+        lines = response.body.decode().splitlines()
+        self.assertIn("guildscout_up 1", lines)
+        self.assertIn('guildscout_message_events_total{result="duplicate"} 2', lines)
+        self.assertIn('guildscout_cache_lookups_total{result="hit"} 3', lines)
+        self.assertTrue(any(line.startswith("guildscout_messages_tracked_total ") for line in lines))
+        self.assertIn("# TYPE guildscout_event_loop_lag_seconds histogram", lines)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,225 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+import aiosqlite
+
+from src.database.message_store import MIGRATIONS as MESSAGE_STORE_MIGRATIONS
+from src.database.migrations import Migration, MigrationRunner, OnlineMigration
+from src.database.raid_store import RaidStore
+
+
+async def _build_user_totals(db, position, chunk_size):
+    """Aggregate message_counts into user_totals, one chunk of rowids at a time."""
+    start = position or 0
+    cursor = await db.execute(
+        "SELECT rowid, guild_id, user_id, message_count FROM message_counts "
+        "WHERE rowid > ? ORDER BY rowid LIMIT ?",
+        (start, chunk_size)
+    )
+    rows = await cursor.fetchall()
+    if not rows:
+        return None
+    await db.executemany(
+        """
+        INSERT INTO user_totals (guild_id, user_id, total) VALUES (?, ?, ?)
+        ON CONFLICT(guild_id, user_id) DO UPDATE SET total = total + excluded.total
+        """,
+        [(row[1], row[2], row[3]) for row in rows]
+    )
+    return rows[-1][0]
+
+
+AGGREGATE_MIGRATIONS = MESSAGE_STORE_MIGRATIONS + [
+    Migration(100, "user totals table", (
+        "CREATE TABLE user_totals (guild_id INTEGER, user_id INTEGER, total INTEGER, "
+        "PRIMARY KEY (guild_id, user_id))",
+    )),
+    OnlineMigration(101, "fill user totals", _build_user_totals, chunk_size=2, pause_seconds=0),
+]
+
+
+class TestMigrationRunner(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmpdir.name) / "messages.db"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    async def _seed_message_counts(self):
+        await MigrationRunner(self.db_path, "message_store", MESSAGE_STORE_MIGRATIONS).run()
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.executemany(
+                "INSERT INTO message_counts (guild_id, user_id, channel_id, message_count) "
+                "VALUES (?, ?, ?, ?)",
+                [(1, 10, 100, 5), (1, 10, 101, 3), (1, 11, 100, 7), (1, 12, 102, 1), (1, 11, 103, 2)]
+            )
+            await db.commit()
+
+    async def _totals(self):
+        async with aiosqlite.connect(self.db_path) as db:
+            cursor = await db.execute("SELECT user_id, total FROM user_totals ORDER BY user_id")
+            return await cursor.fetchall()
+
+    def test_pending_migrations_run_once(self):
+        """Applied versions are recorded; a second run does nothing."""
+        async def run():
+            runner = MigrationRunner(self.db_path, "raid_store", [
+                Migration(1, "table", ("CREATE TABLE t (x INTEGER)",)),
+                Migration(2, "column", ("ALTER TABLE t ADD COLUMN y INTEGER",)),
+            ])
+            first = await runner.run()
+            second = await runner.run()
+            return first.applied, second.applied, await runner.current_version()
+
+        self.assertEqual(asyncio.run(run()), ([1, 2], [], 2))
+
+    def test_failed_migration_rolls_back(self):
+        """A failing migration leaves neither its changes nor its version behind."""
+        async def run():
+            runner = MigrationRunner(self.db_path, "cache", [
+                Migration(1, "broken", ("CREATE TABLE t (x INTEGER)", "NOT SQL")),
+            ])
+            with self.assertRaises(aiosqlite.OperationalError):
+                await runner.run()
+            async with aiosqlite.connect(self.db_path) as db:
+                cursor = await db.execute("SELECT COUNT(*) FROM sqlite_master WHERE name = 't'")
+                exists = (await cursor.fetchone())[0]
+            return exists, await runner.current_version()
+
+        self.assertEqual(asyncio.run(run()), (0, 0))
+
+    def test_online_migration_builds_aggregate_in_chunks(self):
+        """The aggregate is built in the background, chunk by chunk."""
+        async def run():
+            await self._seed_message_counts()
+            runner = MigrationRunner(self.db_path, "message_store", AGGREGATE_MIGRATIONS)
+            result = await runner.run()
+            self.assertIsNotNone(result.background)
+            await result.background
+            return await self._totals(), await runner.current_version()
+
+        totals, version = asyncio.run(run())
+        self.assertEqual(totals, [(10, 8), (11, 9), (12, 1)])
+        self.assertEqual(version, 101)
+
+    def test_online_migration_resumes_after_interruption(self):
+        """Committed chunks are kept and the migration continues after them."""
+        calls = []
+
+        async def failing_step(db, position, chunk_size):
+            calls.append(position)
+            if len(calls) == 2:
+                raise RuntimeError("interrupted")
+            return await _build_user_totals(db, position, chunk_size)
+
+        interrupted = AGGREGATE_MIGRATIONS[:-1] + [
+            OnlineMigration(101, "fill user totals", failing_step, chunk_size=2, pause_seconds=0)
+        ]
+
+        async def run():
+            await self._seed_message_counts()
+            with self.assertRaises(RuntimeError):
+                await MigrationRunner(self.db_path, "message_store", interrupted).run(background=False)
+
+            runner = MigrationRunner(self.db_path, "message_store", AGGREGATE_MIGRATIONS)
+            await runner.run(background=False)
+            return await self._totals()
+
+        self.assertEqual(asyncio.run(run()), [(10, 8), (11, 9), (12, 1)])
+        # Second chunk started after the first one's last rowid
+        self.assertEqual(calls, [None, 2])
+
+    def test_components_share_a_database(self):
+        """Versions are tracked per component in the same file."""
+        async def run():
+            await MigrationRunner(self.db_path, "web_store", [
+                Migration(1, "a", ("CREATE TABLE a (x INTEGER)",)),
+                Migration(2, "a2", ("CREATE TABLE a2 (x INTEGER)",)),
+            ]).run()
+            other = MigrationRunner(self.db_path, "raid_templates", [
+                Migration(1, "b", ("CREATE TABLE b (x INTEGER)",)),
+            ])
+            result = await other.run()
+            return result.applied, await other.current_version()
+
+        self.assertEqual(asyncio.run(run()), ([1], 1))
+
+    def test_versions_must_increase(self):
+        with self.assertRaises(ValueError):
+            MigrationRunner(self.db_path, "cache", [Migration(2, "b"), Migration(1, "a")])
+
+
+class TestStoreMigrations(unittest.TestCase):
+
+    def test_raid_store_skips_applied_migrations(self):
+        """Applied migrations are not re-run; new versions are."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = str(Path(tmpdir) / "raids.db")
+
+            async def table_exists():
+                async with aiosqlite.connect(db_path) as db:
+                    cursor = await db.execute(
+                        "SELECT COUNT(*) FROM sqlite_master WHERE name = 'raid_alerts'"
+                    )
+                    return (await cursor.fetchone())[0]
+
+            async def run():
+                await RaidStore(db_path).initialize()
+                async with aiosqlite.connect(db_path) as db:
+                    await db.execute("DROP TABLE raid_alerts")
+                    await db.commit()
+
+                # Up to date: nothing re-runs, the dropped table stays missing
+                await RaidStore(db_path).initialize()
+                skipped = await table_exists()
+
+                # Pretend version 1 wasn't applied yet: it runs again
+                async with aiosqlite.connect(db_path) as db:
+                    await db.execute("DELETE FROM schema_version WHERE component = 'raid_store'")
+                    await db.commit()
+                await RaidStore(db_path).initialize()
+                return skipped, await table_exists()
+
+            self.assertEqual(asyncio.run(run()), (0, 1))
+
+    def test_raid_store_adds_legacy_columns(self):
+        """Databases from before the game/mode/confirmed columns get them added."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = str(Path(tmpdir) / "raids.db")
+
+            async def run():
+                async with aiosqlite.connect(db_path) as db:
+                    await db.execute(
+                        "CREATE TABLE raids (id INTEGER PRIMARY KEY AUTOINCREMENT, guild_id INTEGER, "
+                        "channel_id INTEGER, message_id INTEGER, creator_id INTEGER, title TEXT, "
+                        "description TEXT, start_time INTEGER, tanks_needed INTEGER, "
+                        "healers_needed INTEGER, dps_needed INTEGER, bench_needed INTEGER, "
+                        "status TEXT, created_at INTEGER, closed_at INTEGER)"
+                    )
+                    await db.execute(
+                        "CREATE TABLE raid_signups (raid_id INTEGER, user_id INTEGER, role TEXT, "
+                        "joined_at INTEGER, PRIMARY KEY (raid_id, user_id))"
+                    )
+                    await db.commit()
+
+                await RaidStore(db_path).initialize()
+                async with aiosqlite.connect(db_path) as db:
+                    raids = [row[1] for row in await (await db.execute("PRAGMA table_info(raids)")).fetchall()]
+                    signups = [
+                        row[1] for row in await (await db.execute("PRAGMA table_info(raid_signups)")).fetchall()
+                    ]
+                return raids, signups
+
+            raids, signups = asyncio.run(run())
+            self.assertIn("game", raids)
+            self.assertIn("mode", raids)
+            self.assertIn("preferred_role", signups)
+            self.assertIn("confirmed", signups)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import time
+import unittest
+from unittest.mock import patch
+
+from src.commands.profile import (
+    BUCKET_COUNT,
+    WINDOW_COUNT,
+    WINDOW_SECONDS,
+    PerformanceTracker,
+    _bucket_index,
+    _bucket_value,
+)
+
+
+class TestPerformanceTracker(unittest.TestCase):
+
+    def setUp(self):
+        self.tracker = PerformanceTracker()
+        self.tracker.reset()
+
+    def tearDown(self):
+        self.tracker.reset()
+
+    def test_buckets_keep_relative_error_small(self):
+        for seconds in (0.000003, 0.0004, 0.012, 0.25, 1.7, 42.0):
+            estimate = _bucket_value(_bucket_index(seconds))
+            self.assertLess(abs(estimate - seconds) / seconds, 1 / 16 + 1e-9)
+        self.assertEqual(_bucket_index(0), 0)
+        self.assertEqual(_bucket_index(1e9), BUCKET_COUNT - 1)
+
+    def test_percentiles_show_the_tail(self):
+        """A slow 2% tail is visible in p99 but not in p50."""
+        for _ in range(980):
+            self.tracker.record_execution("db", 0.002)
+        for _ in range(20):
+            self.tracker.record_execution("db", 0.8, error=True)
+
+        stats = self.tracker.get_stats("db")
+
+        self.assertEqual((stats['count'], stats['errors'], stats['recent_count']), (1000, 20, 1000))
+        self.assertAlmostEqual(stats['p50'], 0.002, delta=0.002 / 16)
+        self.assertAlmostEqual(stats['p95'], 0.002, delta=0.002 / 16)
+        self.assertAlmostEqual(stats['p99'], 0.8, delta=0.8 / 16)
+        self.assertEqual(stats['max'], 0.8)
+
+    def test_old_windows_leave_the_rolling_period(self):
+        start = 1_000_000.0
+        with patch("src.commands.profile.time.monotonic", return_value=start):
+            self.tracker.record_execution("job", 2.0)
+        later = start + WINDOW_SECONDS * (WINDOW_COUNT + 1)
+        with patch("src.commands.profile.time.monotonic", return_value=later):
+            self.tracker.record_execution("job", 0.01)
+            stats = self.tracker.get_stats("job")
+
+        # All-time aggregates keep the old call, percentiles don't
+        self.assertEqual((stats['count'], stats['recent_count']), (2, 1))
+        self.assertEqual(stats['max'], 2.0)
+        self.assertLess(stats['p99'], 0.011)
+
+    def test_metrics_export(self):
+        self.tracker.record_execution("verification_job", 0.5)
+        calls, latency = self.tracker.collect_metrics()
+
+        self.assertIn('guildscout_operation_calls_total{operation="verification_job",result="ok"} 1', calls.render())
+        self.assertTrue(any('quantile="0.99"' in line for line in latency.render()))
+
+    def test_record_overhead_stays_small(self):
+        runs = 50_000
+        start = time.perf_counter()
+        for _ in range(runs):
+            self.tracker.record_execution("hot", 0.001)
+        per_record = (time.perf_counter() - start) / runs
+
+        # Typically well under a microsecond; generous bound for slow CI machines
+        self.assertLess(per_record, 10e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()
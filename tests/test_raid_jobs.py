@@ -0,0 +1,274 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import aiosqlite
+
+from src.database.raid_store import (
+    JOB_CLOSE,
+    JOB_CONFIRMATION,
+    JOB_DM_REMINDER,
+    JOB_NO_SHOW,
+    JOB_REMINDER,
+    RaidStore,
+)
+from src.tasks.raid_scheduler import RaidScheduler, build_job_plan
+
+START = 1_000_000
+
+PLAN = [
+    (JOB_REMINDER, 24, -24 * 3600),
+    (JOB_REMINDER, 1, -3600),
+    (JOB_DM_REMINDER, 15, -15 * 60),
+    (JOB_NO_SHOW, 0, 0),
+    (JOB_CLOSE, 0, 0),
+]
+
+
+class FlakyMessage:
+    def __init__(self, channel):
+        self.channel = channel
+        self.id = 500
+        self.edits = 0
+
+    async def edit(self, **kwargs):
+        self.channel.maybe_fail()
+        self.edits += 1
+
+
+class FlakyChannel:
+    """Channel whose first ``failures`` sends or edits raise."""
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.sent = []
+        self.message = FlakyMessage(self)
+
+    def maybe_fail(self):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("Discord unavailable")
+
+    async def send(self, content, **kwargs):
+        self.maybe_fail()
+        self.sent.append(content)
+        return SimpleNamespace(id=len(self.sent))
+
+    async def fetch_message(self, message_id):
+        return self.message
+
+
+async def _create_raid(store, start_time=START):
+    return await store.create_raid(
+        guild_id=1,
+        channel_id=2,
+        creator_id=3,
+        title="Raid",
+        description=None,
+        game="where_winds_meet",
+        mode="raid",
+        start_time=start_time,
+        tanks_needed=1,
+        healers_needed=1,
+        dps_needed=3,
+        bench_needed=0,
+    )
+
+
+class TestRaidJobQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.store = RaidStore(str(Path(self.tmpdir.name) / "raids.db"))
+        self.store.configure_jobs(PLAN)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_jobs_follow_the_raid_lifecycle(self):
+        async def run():
+            raid_id = await _create_raid(self.store)
+            scheduled = self.store.jobs_changed.is_set()
+            first_due = await self.store.next_job_due_at()
+
+            due = await self.store.list_due_jobs(START)
+            order = [(job.job_type, job.offset) for job in due]
+
+            # Moving the raid moves its jobs
+            await self.store.update_raid_details(raid_id, "Raid", None, START + 7200)
+            moved = await self.store.next_job_due_at()
+
+            await self.store.close_raid(raid_id)
+            return scheduled, first_due, order, moved, await self.store.next_job_due_at()
+
+        scheduled, first_due, order, moved, after_close = asyncio.run(run())
+        self.assertTrue(scheduled)
+        self.assertEqual(first_due, START - 24 * 3600)
+        self.assertEqual(order, [
+            (JOB_REMINDER, 24), (JOB_REMINDER, 1), (JOB_DM_REMINDER, 15), (JOB_NO_SHOW, 0), (JOB_CLOSE, 0),
+        ])
+        self.assertEqual(moved, START + 7200 - 24 * 3600)
+        self.assertIsNone(after_close)
+
+    def test_resync_backfills_without_repeating_sent_reminders(self):
+        async def run():
+            unplanned = RaidStore(str(self.store.db_path))
+            raid_id = await _create_raid(unplanned)
+            await self.store.mark_reminder_sent(raid_id, 24)
+            await self.store.mark_reminder_sent(raid_id, -15)
+
+            count = await self.store.resync_jobs()
+            due = await self.store.list_due_jobs(START)
+            return count, {(job.job_type, job.offset) for job in due}
+
+        count, due = asyncio.run(run())
+        self.assertEqual(count, 1)
+        self.assertEqual(due, {(JOB_REMINDER, 1), (JOB_NO_SHOW, 0), (JOB_CLOSE, 0)})
+
+    def test_raid_moved_mid_pass_keeps_its_new_jobs(self):
+        async def run():
+            raid_id = await _create_raid(self.store)
+            due = await self.store.list_due_jobs(START)
+
+            # The raid is moved by a day while the pass is running
+            await self.store.update_raid_details(raid_id, "Raid", None, START + 86400)
+            await self.store.retry_job(due[0], START + 60)
+            await self.store.complete_jobs(due)
+
+            remaining = await self.store.list_due_jobs(START + 2 * 86400)
+            return {(job.job_type, job.offset): job.due_at for job in remaining}
+
+        remaining = asyncio.run(run())
+        self.assertEqual(remaining, {
+            (JOB_REMINDER, 24): START,
+            (JOB_REMINDER, 1): START + 86400 - 3600,
+            (JOB_DM_REMINDER, 15): START + 86400 - 15 * 60,
+            (JOB_NO_SHOW, 0): START + 86400,
+            (JOB_CLOSE, 0): START + 86400,
+        })
+
+    def test_due_lookup_uses_the_due_index(self):
+        async def run():
+            await self.store.initialize()
+            async with aiosqlite.connect(self.store.db_path) as db:
+                cursor = await db.execute(
+                    "EXPLAIN QUERY PLAN SELECT due_at FROM raid_jobs WHERE due_at <= ?", (START,)
+                )
+                return " ".join(row[-1] for row in await cursor.fetchall())
+
+        self.assertIn("idx_raid_jobs_due", asyncio.run(run()))
+
+
+class TestRaidScheduler(unittest.TestCase):
+
+    def test_plan_follows_config(self):
+        config = SimpleNamespace(
+            raid_reminder_hours=[1],
+            raid_dm_reminder_minutes=[],
+            raid_checkin_enabled=True,
+            raid_confirmation_minutes=30,
+            raid_confirmation_reminder_minutes=0,
+            raid_auto_close_at_start=False,
+            raid_auto_close_after_hours=12,
+        )
+        self.assertEqual(build_job_plan(config), [
+            (JOB_REMINDER, 1, -3600),
+            (JOB_CONFIRMATION, 30, -1800),
+            (JOB_NO_SHOW, 0, 0),
+            (JOB_CLOSE, 0, 12 * 3600),
+        ])
+
+    def test_due_jobs_run_in_one_pass(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = RaidStore(str(Path(tmpdir) / "raids.db"))
+            store.configure_jobs(PLAN)
+            bot = SimpleNamespace(get_guild=lambda guild_id: None)
+            config = SimpleNamespace(raid_enabled=False)
+            scheduler = RaidScheduler(bot, config, store)
+
+            async def run():
+                started = await _create_raid(store)
+                upcoming = await _create_raid(store, START + 90000)
+
+                processed = await scheduler.run_due_jobs(START + 60)
+                started_raid = await store.get_raid(started)
+                no_show = await store.get_alert_sent_at(started, "no_show_marked")
+                return processed, started_raid.status, no_show, await store.get_raid(upcoming)
+
+            processed, status, no_show, upcoming = asyncio.run(run())
+
+        # The three notices are stale; no-show marking runs before closing
+        self.assertEqual(processed, 5)
+        self.assertEqual(status, "closed")
+        self.assertIsNotNone(no_show)
+        self.assertEqual(upcoming.status, "open")
+
+    def _scheduler_with_channel(self, store, channel):
+        async def fetch_channel(channel_id):
+            return channel
+
+        guild = SimpleNamespace(
+            get_channel=lambda channel_id: None,
+            fetch_channel=fetch_channel,
+            get_role=lambda role_id: None,
+        )
+        bot = SimpleNamespace(get_guild=lambda guild_id: guild)
+        config = SimpleNamespace(
+            raid_enabled=False,
+            raid_participant_role_id=None,
+            raid_notice_delete_minutes=0,
+            raid_timezone="UTC",
+        )
+        return RaidScheduler(bot, config, store)
+
+    def test_failed_reminder_send_is_retried(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = RaidStore(str(Path(tmpdir) / "raids.db"))
+            store.configure_jobs([(JOB_REMINDER, 1, -3600)])
+            channel = FlakyChannel(failures=1)
+            scheduler = self._scheduler_with_channel(store, channel)
+
+            async def run():
+                await _create_raid(store)
+                await scheduler.run_due_jobs(START - 3600)
+                retry_at = await store.next_job_due_at()
+                await scheduler.run_due_jobs(retry_at)
+                return retry_at, await store.next_job_due_at()
+
+            with patch("src.tasks.raid_scheduler.purge_raid_notices", AsyncMock()), \
+                    patch("src.tasks.raid_scheduler.track_message", AsyncMock()):
+                retry_at, after = asyncio.run(run())
+
+        self.assertEqual(retry_at, START - 3600 + 60)
+        self.assertEqual(len(channel.sent), 1)
+        self.assertIsNone(after)
+
+    def test_failed_no_show_update_backs_off(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = RaidStore(str(Path(tmpdir) / "raids.db"))
+            store.configure_jobs([(JOB_NO_SHOW, 0, 0)])
+            channel = FlakyChannel(failures=2)
+            scheduler = self._scheduler_with_channel(store, channel)
+
+            async def run():
+                raid_id = await _create_raid(store)
+                await store.set_message_id(raid_id, 500)
+                retries = []
+                due_at = START
+                for _ in range(3):
+                    await scheduler.run_due_jobs(due_at)
+                    due_at = await store.next_job_due_at()
+                    retries.append(due_at)
+                return retries
+
+            retries = asyncio.run(run())
+
+        # 1 then 2 minutes later; the third attempt updates the raid post
+        self.assertEqual(retries, [START + 60, START + 60 + 120, None])
+        self.assertEqual(channel.message.edits, 1)
+
+if __name__ == '__main__':
+    unittest.main()
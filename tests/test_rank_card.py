@@ -0,0 +1,34 @@
+import asyncio
+import io
+import unittest
+
+from PIL import Image
+
+from src.utils.rank_card_generator import CardRenderer, RankCardGenerator, _benchmark_spec
+
+
+class TestCardRenderer(unittest.TestCase):
+
+    def test_render_reuses_preloaded_assets(self):
+        """Cards render from the shared background and a cached avatar."""
+        renderer = CardRenderer()
+        first = renderer.render(_benchmark_spec(0))
+        background = renderer._background
+        second = renderer.render(_benchmark_spec(8))  # same avatar key
+
+        self.assertIs(renderer._background, background)
+        self.assertEqual(len(renderer._avatars), 1)
+        with Image.open(io.BytesIO(first)) as image:
+            self.assertEqual(image.size, (CardRenderer.WIDTH, CardRenderer.HEIGHT))
+        self.assertTrue(second.startswith(b"\x89PNG"))
+
+    def test_render_off_loop_without_pool(self):
+        """The thread fallback produces the same PNG as inline rendering."""
+        spec = _benchmark_spec(1)
+        generator = RankCardGenerator(use_process_pool=False)
+        rendered = asyncio.run(generator.render(spec))
+        self.assertEqual(rendered, CardRenderer().render(spec))
+
+
+if __name__ == '__main__':
+    unittest.main()
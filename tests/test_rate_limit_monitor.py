@@ -0,0 +1,140 @@
+import asyncio
+import unittest
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import discord
+from discord.http import Route
+
+from src.utils.managed_message import ManagedMessage
+from src.utils.rate_limit_monitor import _SOURCE_ROOT, RateLimitMonitor, RollingCounter, _route_from_url
+
+# Compiled with a src/ filename so the stack looks like the import code
+# calling into discord.py's HTTPClient.request
+_IMPORT_CODE = '''
+async def request(route, session, url):
+    async with session.get(url) as response:
+        return response.status
+
+async def import_history(session, url):
+    return await request(Route("GET", "/channels/{channel_id}/messages", channel_id=1), session, url)
+'''
+
+# Dashboard code editing its message through the shared ManagedMessage helper
+_DASHBOARD_CODE = '''
+async def refresh_dashboard(handle, embed):
+    return await handle.edit(embed=embed)
+'''
+
+
+async def request(route, session, url):
+    """Stands in for discord.py's HTTPClient.request."""
+    async with session.patch(url) as response:
+        return response.status
+
+
+class FakeMessage:
+    """Message whose edit goes out through the traced session."""
+
+    id = 1
+
+    def __init__(self, session, url):
+        self.session = session
+        self.url = url
+
+    async def edit(self, **kwargs):
+        route = Route("PATCH", "/channels/{channel_id}/messages/{message_id}", channel_id=1, message_id=1)
+        await request(route, self.session, self.url)
+
+
+class TestRollingCounter(unittest.TestCase):
+
+    def test_rate_only_counts_the_window(self):
+        counter = RollingCounter()
+        for now in (100.0, 100.5, 106.2, 109.9):
+            counter.add(now)
+        counter.add(109.9, rate_limited=True)
+
+        self.assertEqual(counter.rate(110.0, window=5), 3 / 5)
+        self.assertEqual(counter.rate(170.0, window=10), 0)
+        self.assertEqual((counter.total, counter.rate_limited), (5, 1))
+
+
+class TestRestAccounting(unittest.TestCase):
+
+    def test_url_fallback_strips_snowflakes(self):
+        self.assertEqual(
+            _route_from_url("GET", "https://discord.com/api/v10/channels/123456789012345678/messages"),
+            "GET /channels/{id}/messages"
+        )
+
+    def test_trace_attributes_route_bucket_and_subsystem(self):
+        monitor = RateLimitMonitor()
+        namespace = {"Route": Route}
+        exec(compile(_IMPORT_CODE, str(_SOURCE_ROOT / "utils" / "historical_import.py"), "exec"), namespace)
+        responses = iter([200, 429])
+
+        async def handler(request):
+            status = next(responses)
+            headers = {"X-RateLimit-Bucket": "abc123"}
+            if status == 429:
+                headers.update({"Retry-After": "0.5", "X-RateLimit-Scope": "user"})
+            return web.json_response({}, status=status, headers=headers)
+
+        async def run():
+            app = web.Application()
+            app.router.add_get("/api/v10/channels/1/messages", handler)
+            async with TestServer(app) as server:
+                url = server.make_url("/api/v10/channels/1/messages")
+                async with aiohttp.ClientSession(trace_configs=[monitor.create_trace_config()]) as session:
+                    await namespace["import_history"](session, url)
+                    await namespace["import_history"](session, url)
+                    # Outside our code and outside HTTPClient.request
+                    async with session.get(url.with_path("/api/v10/gateway")):
+                        pass
+
+        asyncio.run(run())
+
+        route = "GET /channels/{channel_id}/messages"
+        self.assertEqual(monitor.routes[route].total, 2)
+        self.assertEqual(monitor.buckets["abc123"].rate_limited, 1)
+        self.assertEqual(monitor.route_subsystems[(route, "import")], 2)
+        self.assertEqual(monitor.route_subsystems[("GET /gateway", "discord")], 1)
+        self.assertEqual((monitor.total_requests, monitor.rate_limit_hits, monitor.global_rate_limits), (3, 1, 0))
+
+        top = monitor.get_top_consumers("subsystems")
+        self.assertEqual((top[0]["name"], top[0]["total"], top[0]["rate_limited"]), ("import", 2, 1))
+
+        requests, limited, _ = monitor.collect_metrics()
+        self.assertIn(
+            'guildscout_discord_rest_requests_total{route="GET /channels/{channel_id}/messages",subsystem="import"} 2',
+            requests.render()
+        )
+        self.assertIn('guildscout_discord_rest_rate_limited_total{bucket="abc123"} 1', limited.render())
+
+    def test_edits_through_managed_message_are_booked_to_the_caller(self):
+        monitor = RateLimitMonitor()
+        namespace = {}
+        exec(compile(_DASHBOARD_CODE, str(_SOURCE_ROOT / "utils" / "dashboard_manager.py"), "exec"), namespace)
+
+        async def handler(request):
+            return web.json_response({})
+
+        async def run():
+            app = web.Application()
+            app.router.add_patch("/api/v10/channels/1/messages/1", handler)
+            async with TestServer(app) as server:
+                url = server.make_url("/api/v10/channels/1/messages/1")
+                async with aiohttp.ClientSession(trace_configs=[monitor.create_trace_config()]) as session:
+                    handle = ManagedMessage(FakeMessage(session, url), name="dashboard")
+                    await namespace["refresh_dashboard"](handle, discord.Embed(title="Dashboard"))
+
+        asyncio.run(run())
+
+        route = "PATCH /channels/{channel_id}/messages/{message_id}"
+        self.assertEqual(monitor.route_subsystems, {(route, "dashboard"): 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
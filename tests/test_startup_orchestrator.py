@@ -0,0 +1,59 @@
+import asyncio
+import time
+import unittest
+
+from src.utils.startup_orchestrator import StartupOrchestrator
+from src.utils.startup_profiler import StartupProfiler
+
+
+class TestStartupOrchestrator(unittest.TestCase):
+
+    def test_group_runs_concurrently_and_reports_failures(self):
+        """Steps of a group overlap; a failure is raised after all steps ran."""
+        orchestrator = StartupOrchestrator(StartupProfiler())
+        finished = []
+
+        def step(name, fail=False):
+            async def run():
+                await asyncio.sleep(0.05)
+                finished.append(name)
+                if fail:
+                    raise RuntimeError(name)
+            return run
+
+        async def run():
+            start = time.perf_counter()
+            await orchestrator.run_group("store", [("a", step("a")), ("b", step("b"))])
+            elapsed = time.perf_counter() - start
+
+            with self.assertRaises(RuntimeError):
+                await orchestrator.run_group("cog", [("c", step("c", fail=True)), ("d", step("d"))])
+            return elapsed
+
+        elapsed = asyncio.run(run())
+        self.assertLess(elapsed, 0.09)
+        self.assertEqual(sorted(finished), ["a", "b", "c", "d"])
+        stage_names = {name for name, _, _ in orchestrator.profiler.stages}
+        self.assertTrue({"store a", "store b", "store (group)"} <= stage_names)
+
+    def test_deferred_steps_run_once_after_start(self):
+        """Deferred steps only run when started, and only once."""
+        orchestrator = StartupOrchestrator(StartupProfiler())
+        calls = []
+
+        async def reporter():
+            calls.append("reporter")
+
+        async def run():
+            orchestrator.defer([("reporter", reporter)])
+            self.assertEqual(calls, [])
+            task = orchestrator.start_deferred()
+            self.assertIs(orchestrator.start_deferred(), task)
+            await task
+
+        asyncio.run(run())
+        self.assertEqual(calls, ["reporter"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import asyncio
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.utils.startup_profiler import StartupProfiler
+
+
+class TestStartupProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        root = Path(self.tmpdir.name)
+        package = root / "slowpkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("import time\ntime.sleep(0.01)\nfrom . import child\n")
+        (package / "child.py").write_text("import time\ntime.sleep(0.02)\n")
+        sys.path.insert(0, str(root))
+
+    def tearDown(self):
+        sys.path.remove(self.tmpdir.name)
+        for name in ("slowpkg", "slowpkg.child"):
+            sys.modules.pop(name, None)
+        self.tmpdir.cleanup()
+
+    def test_import_times_and_stages(self):
+        """Imports get cumulative and self time; stages time awaited blocks."""
+        profiler = StartupProfiler()
+        profiler.install_import_hook()
+        try:
+            import slowpkg  # noqa: F401
+        finally:
+            profiler.remove_import_hook()
+
+        cumulative, own = profiler.imports["slowpkg"]
+        child_cumulative, _ = profiler.imports["slowpkg.child"]
+        self.assertGreaterEqual(child_cumulative, 0.02)
+        self.assertGreaterEqual(cumulative, own + child_cumulative - 0.001)
+        self.assertEqual(
+            [name for name, _, _ in profiler.slowest_imports()], ["slowpkg"]
+        )
+        # The real loader is restored on the module
+        self.assertNotIn("_TimedLoader", type(sys.modules["slowpkg"].__loader__).__name__)
+
+        async def stage():
+            with profiler.stage("store init"):
+                await asyncio.sleep(0.01)
+
+        asyncio.run(stage())
+        profiler.finish()
+
+        summary = profiler.summary()
+        self.assertEqual(summary["stages"][0]["name"], "store init")
+        self.assertGreaterEqual(summary["stages"][0]["duration"], 0.01)
+        self.assertIn("on_ready", summary["marks"])
+        self.assertTrue(profiler.finished)
+
+
+if __name__ == '__main__':
+    unittest.main()
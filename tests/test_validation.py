@@ -0,0 +1,177 @@
+import asyncio
+import random
+import tempfile
+import unittest
+from datetime import timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.database.message_store import MessageStore
+from src.utils.validation import ChannelWindowValidator, MessageCountValidator, stratify_channels
+
+
+class FakeTracker:
+    """Stands in for ActivityTracker's channel-first sweep."""
+
+    def __init__(self, breakdowns):
+        self.breakdowns = breakdowns
+        self.sweeps = 0
+
+    def get_excluded_channel_ids(self):
+        return [999]
+
+    async def count_messages_for_users(self, users, **kwargs):
+        self.sweeps += 1
+        assert kwargs.get("return_breakdown")
+        counts = {user.id: sum(self.breakdowns.get(user.id, {}).values()) for user in users}
+        return counts, {}, {user.id: dict(self.breakdowns.get(user.id, {})) for user in users}
+
+    async def count_user_messages(self, *args, **kwargs):
+        raise AssertionError("healing must not rescan channels")
+
+
+class TestMessageCountValidator(unittest.TestCase):
+
+    def test_single_sweep_and_batched_store_access(self):
+        """Store totals come from one query, healing reuses the sweep's breakdown."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = MessageStore(str(Path(tmpdir) / "messages.db"))
+            users = [SimpleNamespace(id=user_id, name=f"user{user_id}") for user_id in (1, 2, 3)]
+            tracker = FakeTracker({
+                1: {100: 5, 101: 2},
+                2: {100: 10},
+                3: {},
+            })
+
+            async def run():
+                await store.update_users_counts(42, {
+                    1: {100: 5, 101: 2, 999: 50},  # excluded channel is ignored
+                    2: {100: 4},                   # drifted
+                })
+                validator = MessageCountValidator(SimpleNamespace(id=42), store, tracker)
+                with patch.object(store, "get_user_total", side_effect=AssertionError("per-user query")):
+                    results = await validator.validate_sample(users, tolerance_percent=0, heal_mismatches=True)
+                return results, await store.get_user_breakdowns(42, [1, 2, 3])
+
+            results, breakdowns = asyncio.run(run())
+
+        self.assertEqual(tracker.sweeps, 1)
+        self.assertEqual((results["matches"], results["mismatches"], results["healed"]), (2, 1, 1))
+        self.assertEqual(results["discrepancies"][0]["user_id"], 2)
+        self.assertEqual(breakdowns[2], {100: 10})
+        self.assertEqual(breakdowns[3], {})
+
+
+class FakeWindowTracker(FakeTracker):
+    """Serves per-channel window counts; user sweeps come from FakeTracker."""
+
+    def __init__(self, channels, windows, breakdowns):
+        super().__init__(breakdowns)
+        self.channels = channels
+        self.windows = windows
+        self.window_calls = []
+        self.window_ends = []
+
+    async def _gather_message_sources(self, include_archived_threads=False):
+        return self.channels
+
+    async def count_channel_window(self, channel, after, before):
+        self.window_calls.append(channel.id)
+        self.window_ends.append(before)
+        return dict(self.windows.get(channel.id, {}))
+
+
+class TestChannelWindowValidator(unittest.TestCase):
+
+    def test_stratified_sample_covers_every_stratum(self):
+        activity = {channel_id: channel_id for channel_id in range(1, 31)}
+        picked = stratify_channels(activity, 6, strata=3, rng=random.Random(1))
+
+        self.assertEqual(len(picked), 6)
+        self.assertEqual(sum(1 for c in picked if c > 20), 2)
+        self.assertEqual(sum(1 for c in picked if 10 < c <= 20), 2)
+        self.assertEqual(sum(1 for c in picked if c <= 10), 2)
+        self.assertEqual(sorted(stratify_channels({1: 0, 2: 5}, 10)), [1, 2])
+
+    def test_windows_compare_store_growth_and_escalate(self):
+        """Only disagreeing channels lead to a user-level check."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = MessageStore(str(Path(tmpdir) / "messages.db"))
+            channels = [SimpleNamespace(id=channel_id, name=f"c{channel_id}") for channel_id in (100, 200, 300)]
+            members = {user_id: SimpleNamespace(id=user_id, name=f"user{user_id}", bot=False) for user_id in (1, 2)}
+            guild = SimpleNamespace(id=42, get_member=members.get)
+            tracker = FakeWindowTracker(
+                channels,
+                windows={100: {1: 3}, 200: {2: 4}},
+                breakdowns={1: {100: 13}, 2: {200: 4}},
+            )
+
+            async def run():
+                validator = ChannelWindowValidator(guild, store, tracker)
+                # First run only records checkpoints
+                first = await validator.validate_windows(sample_size=3)
+
+                # Live tracking since then: channel 100 complete, channel 200 missed messages
+                await store.update_users_counts(42, {1: {100: 13}})
+                checkpoints = await store.get_channel_checkpoints(42)
+                await store.set_channel_checkpoints(
+                    42,
+                    {100: 10, 200: 0, 300: 0},
+                    checkpoints[100][0] - timedelta(hours=6)
+                )
+
+                second = await validator.validate_windows(
+                    sample_size=3, tolerance_messages=0, heal_mismatches=True
+                )
+                return first, second, await store.get_channel_totals(42), await store.get_channel_checkpoints(42)
+
+            first, second, totals, checkpoints = asyncio.run(run())
+
+        self.assertTrue(first["baseline_only"])
+        self.assertEqual(first["channels_checked"], 0)
+        # Busiest channel first, each channel fetched once
+        self.assertEqual(tracker.window_calls[0], 100)
+        self.assertEqual(sorted(tracker.window_calls), [100, 200, 300])
+
+        self.assertEqual((second["matches"], second["mismatches"]), (2, 1))
+        self.assertEqual(second["discrepancies"][0]["channel_id"], 200)
+        self.assertEqual(second["escalated_users"], 1)
+        self.assertEqual(second["healed"], 1)
+        self.assertTrue(second["passed"])
+        self.assertEqual(totals[200], 4)
+        # New checkpoints hold the healed totals, as of the re-read after healing
+        self.assertEqual(checkpoints[200][1], 4)
+        self.assertGreater(checkpoints[200][0], max(tracker.window_ends))
+
+    def test_unsampled_channels_keep_their_window(self):
+        """Only checked channels (and new ones) get a new checkpoint."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = MessageStore(str(Path(tmpdir) / "messages.db"))
+            channels = [SimpleNamespace(id=channel_id, name=f"c{channel_id}") for channel_id in (100, 200)]
+            guild = SimpleNamespace(id=42, get_member=lambda user_id: None)
+            tracker = FakeWindowTracker(channels, windows={100: {1: 5}}, breakdowns={})
+
+            async def run():
+                validator = ChannelWindowValidator(guild, store, tracker)
+                await validator.validate_windows(sample_size=1)
+                before = await store.get_channel_checkpoints(42)
+
+                await store.update_users_counts(42, {1: {100: 5, 200: 3, 300: 2}})
+                channels.append(SimpleNamespace(id=300, name="c300"))
+                await validator.validate_windows(sample_size=1)
+                return before, await store.get_channel_checkpoints(42)
+
+            before, after = asyncio.run(run())
+
+        [sampled] = tracker.window_calls
+        unsampled = 200 if sampled == 100 else 100
+        self.assertEqual(after[sampled][1], {100: 5, 200: 3}[sampled])
+        self.assertGreater(after[sampled][0], before[sampled][0])
+        self.assertEqual(after[unsampled], before[unsampled])
+        # Channel 300 had no checkpoint yet
+        self.assertEqual(after[300][1], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
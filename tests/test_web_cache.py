@@ -0,0 +1,104 @@
+import asyncio
+import time
+import unittest
+
+from web_api.cache import AsyncTTLCache
+
+
+class TestAsyncTTLCache(unittest.TestCase):
+
+    def test_lru_eviction_and_counters(self):
+        """Least recently used entries are evicted once maxsize is exceeded."""
+        cache = AsyncTTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(cache.get("a"), 1)  # "a" is now most recent
+        cache.set("c", 3)
+
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.get("b"), None)
+        stats = cache.stats()
+        self.assertEqual(stats["size"], 2)
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+
+    def test_ttl_expiry_and_stale_reads(self):
+        """Expired entries miss on get but remain readable within stale_ttl."""
+        cache = AsyncTTLCache(maxsize=10, ttl=0.01, stale_ttl=60)
+        cache.set("a", 1)
+        time.sleep(0.02)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get_stale("a"), 1)
+        self.assertTrue(cache.touch("a", ttl=60))
+        self.assertEqual(cache.get("a"), 1)
+
+    def test_get_or_load_is_single_flight(self):
+        """Concurrent misses for one key share a single loader call."""
+        cache = AsyncTTLCache(maxsize=10, ttl=60)
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        async def run():
+            results = await asyncio.gather(*[
+                cache.get_or_load("key", loader) for _ in range(10)
+            ])
+            results.append(await cache.get_or_load("key", loader))
+            return results
+
+        results = asyncio.run(run())
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(set(results), {"value"})
+        self.assertEqual(cache.stats()["coalesced"], 9)
+
+    def test_loader_errors_propagate_and_are_not_cached(self):
+        """A failing load raises for every waiter and leaves no entry."""
+        cache = AsyncTTLCache(maxsize=10, ttl=60)
+
+        async def loader():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        async def run():
+            return await asyncio.gather(
+                cache.get_or_load("key", loader),
+                cache.get_or_load("key", loader),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+        self.assertNotIn("key", cache)
+
+    def test_callers_get_copies(self):
+        """Mutating a returned value does not change the cached entry."""
+        cache = AsyncTTLCache(maxsize=10, ttl=60)
+        guilds = [{"id": "1", "name": "Guild"}]
+        cache.set("guilds", guilds)
+        guilds.append({"id": "2"})
+        cache.get("guilds")[0]["name"] = "Changed"
+
+        async def loader():
+            await asyncio.sleep(0.01)
+            return {"members": []}
+
+        async def run():
+            first, second = await asyncio.gather(
+                cache.get_or_load("payload", loader),
+                cache.get_or_load("payload", loader),
+            )
+            first["members"].append(1)
+            return second, await cache.get_or_load("payload", loader)
+
+        second, cached = asyncio.run(run())
+        self.assertEqual(cache.get("guilds"), [{"id": "1", "name": "Guild"}])
+        self.assertEqual(second, {"members": []})
+        self.assertEqual(cached, {"members": []})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import yaml
+
+from web_api.config import BotConfigProvider
+
+
+class TestBotConfigProvider(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.config_path = Path(self.tmpdir.name) / "config.yaml"
+        self.write({"scoring": {"min_messages": 10}})
+        self.provider = BotConfigProvider(self.config_path)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write(self, data, mtime=None):
+        self.config_path.write_text(yaml.safe_dump(data), encoding="utf-8")
+        if mtime is not None:
+            os.utime(self.config_path, (mtime, mtime))
+
+    def test_unchanged_file_is_parsed_once(self):
+        """Repeated reads are served from the cache and hand out copies."""
+        first = self.provider.get()
+        first["scoring"]["min_messages"] = 99
+        second = self.provider.get()
+
+        self.assertEqual(second["scoring"]["min_messages"], 10)
+        self.assertEqual(self.provider.parse_count, 1)
+
+    def test_reloads_when_the_file_changes(self):
+        """An edit outside the UI is picked up through the mtime change."""
+        self.provider.get()
+        stat = self.config_path.stat()
+        # Same size as before, so only the mtime tells the versions apart
+        self.write({"scoring": {"min_messages": 20}}, mtime=stat.st_mtime + 5)
+
+        self.assertEqual(self.provider.get()["scoring"]["min_messages"], 20)
+        self.assertEqual(self.provider.parse_count, 2)
+
+    def test_save_updates_the_cache_without_a_reparse(self):
+        """Settings saved through the provider are visible on the next read."""
+        self.provider.get()
+        self.provider.save({"scoring": {"min_messages": 30}})
+
+        self.assertEqual(self.provider.get()["scoring"]["min_messages"], 30)
+        self.assertEqual(yaml.safe_load(self.config_path.read_text(encoding="utf-8")),
+                         {"scoring": {"min_messages": 30}})
+        self.assertEqual(self.provider.parse_count, 1)
+
+    def test_invalidate_and_missing_file(self):
+        """invalidate() forces a re-parse; a missing file raises."""
+        self.provider.get()
+        self.provider.invalidate()
+        self.provider.get()
+        self.assertEqual(self.provider.parse_count, 2)
+
+        self.config_path.unlink()
+        with self.assertRaises(FileNotFoundError):
+            self.provider.get()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,16 +2,31 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
 import logging
-from dataclasses import dataclass
+import time
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import aiosqlite
 
+from web_api.cache import AsyncTTLCache
+
 logger = logging.getLogger("guildscout.web_api.analytics")
 
+# Fallback expiry for cached rankings when messages.db has no data-version
+# table yet (bot not upgraded). With a version counter, entries never expire
+# by time - only by version or day change.
+RANKING_FALLBACK_TTL = 60
+# Upper bound on cached (guild, weights, lookback) snapshots
+RANKING_CACHE_SIZE = 32
+# Upper bound on user ids per batch score lookup
+MAX_BATCH_SCORES = 500
+
 
 @dataclass
 class MemberScore:
@@ -45,6 +60,57 @@ class MemberScore:
         }
 
 
+@dataclass
+class RankingSnapshot:
+    """Fully scored and sorted ranking of a guild at a given data version."""
+
+    data_version: Optional[int]
+    computed_on: str
+    computed_at: float
+    scores: List[MemberScore] = field(default_factory=list)
+    rank_index: Dict[int, int] = field(default_factory=dict)
+    # (-final_score, user_id) per row, i.e. the sort order of ``scores``
+    sort_keys: List[Tuple[float, int]] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return len(self.scores)
+
+    def position_after(self, cursor: Tuple[float, int]) -> int:
+        """Index of the first row ranked after a (final_score, user_id) cursor."""
+        final_score, user_id = cursor
+        return bisect_right(self.sort_keys, (-final_score, user_id))
+
+    def is_fresh(self, data_version: Optional[int], today: str) -> bool:
+        """Check whether this snapshot still reflects the database."""
+        if self.computed_on != today:
+            # days_in_server and voice lookback windows roll over daily
+            return False
+        if data_version is None or self.data_version is None:
+            return time.monotonic() - self.computed_at < RANKING_FALLBACK_TTL
+        return data_version == self.data_version
+
+
+def encode_cursor(score: MemberScore) -> str:
+    """Encode the keyset position of a ranking row as an opaque cursor."""
+    raw = f"{score.final_score!r}:{score.user_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Optional[Tuple[float, int]]:
+    """Decode a cursor from ``encode_cursor``.
+
+    Returns:
+        (final_score, user_id) tuple, or None if the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        final_score, user_id = raw.split(":", 1)
+        return float(final_score), int(user_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+
+
 class AnalyticsService:
     """Service for computing analytics data from the message database."""
 
@@ -61,6 +127,13 @@ class AnalyticsService:
         self.weight_messages = 0.55
         self.weight_voice = 0.35
 
+        # Ranking cache: (guild_id, weights, lookback) -> snapshot.
+        # Freshness is decided by data version, not TTL. Snapshots are only
+        # read here (responses are built from copies), so they are not copied.
+        self._rankings = AsyncTTLCache(
+            maxsize=RANKING_CACHE_SIZE, ttl=None, name="rankings", copy_values=False
+        )
+
     def set_weights(self, days: float, messages: float, voice: float) -> None:
         """Set scoring weights.
 
@@ -80,15 +153,22 @@ class AnalyticsService:
         guild_id: int,
         limit: int = 50,
         offset: int = 0,
-        days_lookback: Optional[int] = None
+        days_lookback: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> Dict[str, Any]:
         """Get ranked member list with scores.
 
+        Pages can be addressed by ``offset`` or by ``cursor``. A cursor is
+        the ``next_cursor`` of the previous page and marks the last
+        (final_score, user_id) row seen, so paging stays stable while
+        scores shift between requests.
+
         Args:
             guild_id: Discord guild ID
             limit: Maximum number of members to return
-            offset: Offset for pagination
+            offset: Offset for pagination (ignored when cursor is given)
             days_lookback: Optional filter for voice activity days
+            cursor: Keyset cursor returned by a previous page
 
         Returns:
             Dictionary with rankings and metadata
@@ -96,42 +176,66 @@ class AnalyticsService:
         if not self.db_path.exists():
             return {"rankings": [], "total": 0, "error": "Database not found"}
 
-        async with aiosqlite.connect(self.db_path) as db:
-            # Get all members with their data
-            members_data = await self._fetch_members_with_activity(
-                db, guild_id, days_lookback
-            )
-
-            if not members_data:
-                return {"rankings": [], "total": 0}
+        position = None
+        if cursor:
+            position = decode_cursor(cursor)
+            if position is None:
+                return {"rankings": [], "total": 0, "error": "Invalid cursor"}
 
-            # Calculate scores
-            scores = self._calculate_scores(members_data)
+        snapshot = await self.get_ranking_snapshot(guild_id, days_lookback)
+        if not snapshot.scores:
+            return {"rankings": [], "total": 0, "next_cursor": None}
 
-            # Sort by final score (descending)
-            scores.sort(key=lambda x: x.final_score, reverse=True)
+        if position is not None:
+            offset = snapshot.position_after(position)
 
-            # Add ranks
-            total = len(scores)
-            paginated = scores[offset:offset + limit]
+        # Snapshot is already sorted; paging is a plain slice
+        paginated = snapshot.scores[offset:offset + limit]
 
-            rankings = []
-            for idx, score in enumerate(paginated, start=offset + 1):
-                data = score.to_dict()
-                data["rank"] = idx
-                rankings.append(data)
+        rankings = []
+        for idx, score in enumerate(paginated, start=offset + 1):
+            data = score.to_dict()
+            data["rank"] = idx
+            rankings.append(data)
 
-            return {
-                "rankings": rankings,
-                "total": total,
-                "page": (offset // limit) + 1 if limit > 0 else 1,
-                "per_page": limit,
-                "weights": {
-                    "days": self.weight_days,
-                    "messages": self.weight_messages,
-                    "voice": self.weight_voice,
-                }
+        has_more = offset + len(paginated) < snapshot.total
+        return {
+            "rankings": rankings,
+            "total": snapshot.total,
+            "page": (offset // limit) + 1 if limit > 0 else 1,
+            "per_page": limit,
+            "next_cursor": encode_cursor(paginated[-1]) if paginated and has_more else None,
+            "weights": {
+                "days": self.weight_days,
+                "messages": self.weight_messages,
+                "voice": self.weight_voice,
             }
+        }
+
+    async def get_member_scores(
+        self,
+        guild_id: int,
+        user_ids: List[int],
+        days_lookback: Optional[int] = None
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get scores for many members from one ranking snapshot.
+
+        Args:
+            guild_id: Discord guild ID
+            user_ids: Discord user IDs (at most MAX_BATCH_SCORES are used)
+            days_lookback: Optional filter for voice activity days
+
+        Returns:
+            Mapping of user ID (as string) to score data, or None if not ranked
+        """
+        if not self.db_path.exists():
+            return {}
+
+        snapshot = await self.get_ranking_snapshot(guild_id, days_lookback)
+        return {
+            str(user_id): self._score_entry(snapshot, user_id)
+            for user_id in user_ids[:MAX_BATCH_SCORES]
+        }
 
     async def get_member_score(
         self,
@@ -152,31 +256,146 @@ class AnalyticsService:
         if not self.db_path.exists():
             return None
 
+        snapshot = await self.get_ranking_snapshot(guild_id, days_lookback)
+        return self._score_entry(snapshot, user_id)
+
+    def _score_entry(
+        self,
+        snapshot: RankingSnapshot,
+        user_id: int
+    ) -> Optional[Dict[str, Any]]:
+        """Build the score payload for one user from a snapshot.
+
+        Args:
+            snapshot: Ranking snapshot to read from
+            user_id: Discord user ID
+
+        Returns:
+            Member score data or None if the user is not ranked
+        """
+        index = snapshot.rank_index.get(user_id)
+        if index is None:
+            return None
+
+        total = snapshot.total
+        rank = index + 1
+        data = snapshot.scores[index].to_dict()
+        data["rank"] = rank
+        data["total_members"] = total
+        data["percentile"] = round(
+            (1 - (rank - 1) / total) * 100, 1
+        ) if total > 1 else 100
+        return data
+
+    async def get_ranking_snapshot(
+        self,
+        guild_id: int,
+        days_lookback: Optional[int] = None
+    ) -> RankingSnapshot:
+        """Get the cached ranking for a guild, refreshing it if needed.
+
+        A snapshot is reused as long as the guild's data version in
+        messages.db is unchanged. Once the bot bumps the version, the stale
+        snapshot is still served while a single background task recomputes
+        it (stale-while-revalidate). Only a cold cache waits for the scoring.
+
+        Args:
+            guild_id: Discord guild ID
+            days_lookback: Optional filter for voice activity days
+
+        Returns:
+            RankingSnapshot for the current weights and lookback
+        """
+        weights = (self.weight_days, self.weight_messages, self.weight_voice)
+        key = (guild_id, weights, days_lookback)
+        snapshot = self._rankings.get(key)
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+        data_version = await self._get_data_version(guild_id)
+        if snapshot and snapshot.is_fresh(data_version, today):
+            return snapshot
+
+        def loader():
+            return self._refresh_rankings(key, guild_id, weights, days_lookback, data_version)
+
+        if snapshot is not None:
+            self._rankings.start_load(key, loader)
+            return snapshot
+
+        return await self._rankings.single_flight(key, loader)
+
+    def invalidate_rankings(self, guild_id: Optional[int] = None) -> None:
+        """Drop cached rankings for one guild or all guilds.
+
+        Args:
+            guild_id: Guild to invalidate, or None for every guild
+        """
+        if guild_id is None:
+            self._rankings.clear()
+        else:
+            self._rankings.invalidate(lambda key: key[0] == guild_id)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters of the ranking cache."""
+        return self._rankings.stats()
+
+    async def _refresh_rankings(
+        self,
+        key: Tuple,
+        guild_id: int,
+        weights: Tuple[float, float, float],
+        days_lookback: Optional[int],
+        data_version: Optional[int]
+    ) -> RankingSnapshot:
+        """Recompute and store the ranking snapshot for a cache key."""
+        started = time.perf_counter()
         async with aiosqlite.connect(self.db_path) as db:
-            # Get all members to calculate relative scores
             members_data = await self._fetch_members_with_activity(
                 db, guild_id, days_lookback
             )
 
-            if not members_data:
-                return None
+        scores = self._calculate_scores(members_data, weights)
+        # Tie-break on user_id so the order (and paging) is deterministic
+        scores.sort(key=lambda x: (-x.final_score, x.user_id))
+
+        snapshot = RankingSnapshot(
+            data_version=data_version,
+            computed_on=datetime.now(timezone.utc).strftime("%Y-%m-%d"),
+            computed_at=time.monotonic(),
+            scores=scores,
+            rank_index={score.user_id: idx for idx, score in enumerate(scores)},
+            sort_keys=[(-score.final_score, score.user_id) for score in scores],
+        )
+        self._rankings.set(key, snapshot)
+
+        # Snapshots for superseded weights of this guild are never read again
+        self._rankings.invalidate(lambda other: other[0] == guild_id and other[1] != weights)
 
-            # Calculate all scores for proper normalization
-            scores = self._calculate_scores(members_data)
-            scores.sort(key=lambda x: x.final_score, reverse=True)
+        logger.debug(
+            "Refreshed rankings for guild %s (%d members, version %s) in %.1fms",
+            guild_id,
+            len(scores),
+            data_version,
+            (time.perf_counter() - started) * 1000,
+        )
+        return snapshot
 
-            # Find the user
-            for rank, score in enumerate(scores, start=1):
-                if score.user_id == user_id:
-                    data = score.to_dict()
-                    data["rank"] = rank
-                    data["total_members"] = len(scores)
-                    data["percentile"] = round(
-                        (1 - (rank - 1) / len(scores)) * 100, 1
-                    ) if len(scores) > 1 else 100
-                    return data
+    async def _get_data_version(self, guild_id: int) -> Optional[int]:
+        """Read the guild's data version written by the bot.
 
+        Returns:
+            Version counter, or None if messages.db predates versioning
+        """
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                cursor = await db.execute(
+                    "SELECT version FROM guild_data_version WHERE guild_id = ?",
+                    (guild_id,)
+                )
+                row = await cursor.fetchone()
+        except aiosqlite.OperationalError:
             return None
+        return row[0] if row else 0
 
     async def get_activity_overview(
         self,
@@ -312,12 +531,15 @@ class AnalyticsService:
 
     def _calculate_scores(
         self,
-        members_data: List[Dict[str, Any]]
+        members_data: List[Dict[str, Any]],
+        weights: Optional[Tuple[float, float, float]] = None
     ) -> List[MemberScore]:
         """Calculate normalized scores for all members.
 
         Args:
             members_data: List of member data dictionaries
+            weights: Optional (days, messages, voice) weights; defaults to
+                the service's current weights
 
         Returns:
             List of MemberScore objects
@@ -325,6 +547,10 @@ class AnalyticsService:
         if not members_data:
             return []
 
+        weight_days, weight_messages, weight_voice = weights or (
+            self.weight_days, self.weight_messages, self.weight_voice
+        )
+
         # Find max values for normalization
         max_days = max(m["days_in_server"] for m in members_data) or 1
         max_messages = max(m["message_count"] for m in members_data) or 1
@@ -339,9 +565,9 @@ class AnalyticsService:
 
             # Calculate weighted final score
             final_score = (
-                (days_score * self.weight_days) +
-                (message_score * self.weight_messages) +
-                (voice_score * self.weight_voice)
+                (days_score * weight_days) +
+                (message_score * weight_messages) +
+                (voice_score * weight_voice)
             )
 
             scores.append(MemberScore(
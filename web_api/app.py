@@ -21,12 +21,14 @@ from itsdangerous import BadSignature, TimestampSigner
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
+from web_api.cache import AsyncTTLCache
 from web_api.config import load_bot_config, load_web_config, save_bot_config
 from web_api.db import GuildSettings, WebSession, WebStore
 from web_api.discord_client import (
     DiscordApiError,
     add_reaction,
     build_avatar_url,
+    close_discord_client,
     create_message,
     delete_message,
     edit_message,
@@ -35,10 +37,11 @@ from web_api.discord_client import (
     fetch_member,
     fetch_user,
     fetch_user_guilds,
+    get_discord_client,
 )
 from src.database.raid_store import RaidRecord, RaidStore
 from src.database.raid_template_store import RaidTemplateStore
-from web_api.analytics_api import get_analytics_service
+from web_api.analytics_api import MAX_BATCH_SCORES, get_analytics_service
 from web_api.activity_api import get_activity_service
 from web_api.websocket_manager import (
     get_websocket_manager,
@@ -84,51 +87,27 @@ template_store = RaidTemplateStore(str(web_config.web_db_path))
 
 signer = TimestampSigner(web_config.session_secret)
 
-# Cache TTLs (seconds) - increased for better performance
-ACCESSIBLE_GUILDS_TTL = 300   # 5 minutes (was 2 min) - user's accessible guilds
-BOT_GUILD_TTL = 600           # 10 minutes (was 5 min) - bot guild info
-MEMBER_TTL = 300              # 5 minutes (was 3 min) - member info
+# Discord REST cache TTLs (seconds) - responses are cached by the shared client
+ACCESSIBLE_GUILDS_TTL = 300   # 5 minutes - user's guild list
+BOT_GUILD_TTL = 600           # 10 minutes - bot guild info
+MEMBER_TTL = 300              # 5 minutes - member info
 
-_accessible_guilds_cache: dict[int, tuple[int, list[dict[str, Any]]]] = {}
-_bot_guild_cache: dict[int, tuple[int, Optional[dict[str, Any]]]] = {}
-_member_cache: dict[tuple[int, int], tuple[int, Optional[dict[str, Any]]]] = {}
-
-
-def _cache_get(cache: dict, key: Any) -> Optional[Any]:
-    now_ts = int(time.time())
-    entry = cache.get(key)
-    if not entry:
-        return None
-    expires_at, value = entry
-    if expires_at < now_ts:
-        cache.pop(key, None)
-        return None
-    return value
-
-
-def _cache_set(cache: dict, key: Any, ttl_seconds: int, value: Any) -> None:
-    cache[key] = (int(time.time()) + ttl_seconds, value)
+# Derived per-user guild list (REST responses + permission checks)
+_accessible_guilds_cache = AsyncTTLCache(
+    maxsize=1000, ttl=ACCESSIBLE_GUILDS_TTL, name="accessible_guilds"
+)
 
 
 async def _fetch_bot_guild_cached(guild_id: int) -> Optional[dict[str, Any]]:
-    cached = _cache_get(_bot_guild_cache, guild_id)
-    if cached is not None:
-        return cached
-    bot_guild = await fetch_bot_guild(web_config.bot_token, guild_id)
-    _cache_set(_bot_guild_cache, guild_id, BOT_GUILD_TTL, bot_guild)
-    return bot_guild
+    return await fetch_bot_guild(web_config.bot_token, guild_id, cache_ttl=BOT_GUILD_TTL)
 
 
 async def _fetch_member_cached(
     guild_id: int, user_id: int
 ) -> Optional[dict[str, Any]]:
-    key = (guild_id, user_id)
-    cached = _cache_get(_member_cache, key)
-    if cached is not None:
-        return cached
-    member = await fetch_member(web_config.bot_token, guild_id, user_id)
-    _cache_set(_member_cache, key, MEMBER_TTL, member)
-    return member
+    return await fetch_member(
+        web_config.bot_token, guild_id, user_id, cache_ttl=MEMBER_TTL
+    )
 
 
 @app.on_event("startup")
@@ -139,6 +118,11 @@ async def startup() -> None:
     await web_store.purge_expired_sessions()
 
 
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    await close_discord_client()
+
+
 def build_manage_components() -> list[dict[str, Any]]:
     return [
         {
@@ -570,10 +554,13 @@ async def _accessible_guilds(session: WebSession) -> list[dict[str, Any]]:
     but a separate "id_str" field is provided for safe JSON serialization
     to JavaScript (which cannot handle integers > 2^53-1).
     """
-    cached = _cache_get(_accessible_guilds_cache, session.user_id)
-    if cached is not None:
-        return cached
-    guilds = await fetch_user_guilds(session.access_token)
+    return await _accessible_guilds_cache.get_or_load(
+        session.user_id, lambda: _load_accessible_guilds(session)
+    )
+
+
+async def _load_accessible_guilds(session: WebSession) -> list[dict[str, Any]]:
+    guilds = await fetch_user_guilds(session.access_token, cache_ttl=ACCESSIBLE_GUILDS_TTL)
     visible = []
     for guild in guilds:
         guild_id = int(guild["id"])
@@ -592,7 +579,6 @@ async def _accessible_guilds(session: WebSession) -> list[dict[str, Any]]:
                 "permissions": permissions,
             }
         )
-    _cache_set(_accessible_guilds_cache, session.user_id, ACCESSIBLE_GUILDS_TTL, visible)
     return visible
 
 
@@ -713,6 +699,7 @@ async def auth_logout(request: Request) -> RedirectResponse:
     session = await _get_session(request)
     if session:
         await web_store.delete_session(session.session_id)
+        _accessible_guilds_cache.pop(session.user_id)
     response = RedirectResponse("/login", status_code=302)
     response.delete_cookie(web_config.cookie_name)
     return response
@@ -1530,6 +1517,8 @@ async def update_settings(
         open_slot_ping_minutes=_parse_int(open_slot_ping_minutes, 30),
     )
     await web_store.upsert_guild_settings(settings)
+    # Creator roles decide guild visibility
+    _accessible_guilds_cache.clear()
 
     config_data = load_bot_config(web_config.config_path)
     if config_data.get("discord", {}).get("guild_id") == guild_id:
@@ -1684,15 +1673,38 @@ async def update_config(request: Request, guild_id: int) -> RedirectResponse:
 # =============================================================================
 
 
+def _scoring_analytics():
+    """Return the analytics service configured with the bot's scoring weights.
+
+    Returns:
+        Tuple of (AnalyticsService, days_lookback from the scoring config)
+    """
+    config_data = load_bot_config(web_config.config_path)
+    scoring_cfg = config_data.get("scoring", {})
+    weights = scoring_cfg.get("weights", {})
+
+    analytics = get_analytics_service(str(ROOT / "data" / "messages.db"))
+    analytics.set_weights(
+        days=weights.get("days_in_server", 0.10),
+        messages=weights.get("message_count", 0.55),
+        voice=weights.get("voice_activity", 0.35),
+    )
+    return analytics, scoring_cfg.get("max_days_lookback")
+
+
 @app.get("/api/guilds/{guild_id}/analytics/rankings")
 async def api_analytics_rankings(
     request: Request,
     guild_id: int,
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
 ):
     """Get member rankings with scores.
 
+    Pass the ``next_cursor`` of a response as ``cursor`` to fetch the next
+    page by keyset (score, user_id) instead of by offset.
+
     Multi-Guild Isolation: Rankings are filtered by guild_id in all
     database queries. User must have access to the guild.
     """
@@ -1700,23 +1712,14 @@ async def api_analytics_rankings(
     if error:
         return error
 
-    # Load scoring weights from config
-    config_data = load_bot_config(web_config.config_path)
-    scoring_cfg = config_data.get("scoring", {})
-    weights = scoring_cfg.get("weights", {})
-
-    analytics = get_analytics_service(str(ROOT / "data" / "messages.db"))
-    analytics.set_weights(
-        days=weights.get("days_in_server", 0.10),
-        messages=weights.get("message_count", 0.55),
-        voice=weights.get("voice_activity", 0.35),
-    )
+    analytics, days_lookback = _scoring_analytics()
 
     result = await analytics.get_member_rankings(
         guild_id=guild_id,
         limit=limit,
         offset=offset,
-        days_lookback=scoring_cfg.get("max_days_lookback"),
+        days_lookback=days_lookback,
+        cursor=cursor,
     )
 
     return {"success": True, "data": result}
@@ -1742,6 +1745,40 @@ async def api_analytics_overview(
     return {"success": True, "data": result}
 
 
+@app.get("/api/guilds/{guild_id}/members/scores")
+async def api_member_scores(
+    request: Request,
+    guild_id: int,
+    user_ids: str = "",
+):
+    """Get scores for several members in one request.
+
+    ``user_ids`` is a comma-separated list (up to MAX_BATCH_SCORES ids);
+    all scores come from one ranking snapshot. Unranked ids map to null.
+
+    Multi-Guild Isolation: Scores are calculated only using data from the
+    specified guild. User must have access to the guild.
+    """
+    session, guild, error = await _require_guild_access(request, guild_id)
+    if error:
+        return error
+
+    ids = _parse_int_list(user_ids)
+    if not ids:
+        return {"error": "No user ids given", "success": False}
+    if len(ids) > MAX_BATCH_SCORES:
+        return {"error": f"At most {MAX_BATCH_SCORES} user ids per request", "success": False}
+
+    analytics, days_lookback = _scoring_analytics()
+    result = await analytics.get_member_scores(
+        guild_id=guild_id,
+        user_ids=ids,
+        days_lookback=days_lookback,
+    )
+
+    return {"success": True, "data": result}
+
+
 @app.get("/api/guilds/{guild_id}/members/{user_id}/score")
 async def api_member_score(
     request: Request,
@@ -1757,22 +1794,12 @@ async def api_member_score(
     if error:
         return error
 
-    # Load scoring weights from config
-    config_data = load_bot_config(web_config.config_path)
-    scoring_cfg = config_data.get("scoring", {})
-    weights = scoring_cfg.get("weights", {})
-
-    analytics = get_analytics_service(str(ROOT / "data" / "messages.db"))
-    analytics.set_weights(
-        days=weights.get("days_in_server", 0.10),
-        messages=weights.get("message_count", 0.55),
-        voice=weights.get("voice_activity", 0.35),
-    )
+    analytics, days_lookback = _scoring_analytics()
 
     result = await analytics.get_member_score(
         guild_id=guild_id,
         user_id=user_id,
-        days_lookback=scoring_cfg.get("max_days_lookback"),
+        days_lookback=days_lookback,
     )
 
     if result is None:
@@ -1792,22 +1819,12 @@ async def api_my_score(request: Request, guild_id: int):
     if error:
         return error
 
-    # Load scoring weights from config
-    config_data = load_bot_config(web_config.config_path)
-    scoring_cfg = config_data.get("scoring", {})
-    weights = scoring_cfg.get("weights", {})
-
-    analytics = get_analytics_service(str(ROOT / "data" / "messages.db"))
-    analytics.set_weights(
-        days=weights.get("days_in_server", 0.10),
-        messages=weights.get("message_count", 0.55),
-        voice=weights.get("voice_activity", 0.35),
-    )
+    analytics, days_lookback = _scoring_analytics()
 
     result = await analytics.get_member_score(
         guild_id=guild_id,
         user_id=session.user_id,
-        days_lookback=scoring_cfg.get("max_days_lookback"),
+        days_lookback=days_lookback,
     )
 
     if result is None:
@@ -1979,6 +1996,24 @@ async def websocket_stats(request: Request):
     return {"success": True, "data": ws_manager.get_stats()}
 
 
+@app.get("/api/cache/stats")
+async def cache_stats(request: Request):
+    """Get hit/miss/eviction counters of the web process caches."""
+    session = await _require_session(request)
+    if not session:
+        return {"error": "Unauthorized", "success": False}
+
+    analytics = get_analytics_service(str(ROOT / "data" / "messages.db"))
+    return {
+        "success": True,
+        "data": {
+            "accessible_guilds": _accessible_guilds_cache.stats(),
+            "rankings": analytics.get_cache_stats(),
+            "discord": get_discord_client().get_stats(),
+        },
+    }
+
+
 if os.getenv("WEB_UI_DEBUG"):
     import uvicorn
 
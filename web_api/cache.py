@@ -0,0 +1,239 @@
+"""Bounded async LRU + TTL cache for the web UI."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+_MISSING = object()
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: Optional[float]
+
+
+class AsyncTTLCache:
+    """Size-bounded LRU cache with per-entry TTL and single-flight loading.
+
+    - At most ``maxsize`` entries; the least recently used one is evicted
+    - Entries expire after ``ttl`` seconds (None = only LRU eviction)
+    - Expired entries stay readable via ``get_stale`` for ``stale_ttl``
+      seconds, e.g. for conditional revalidation
+    - Concurrent misses for the same key share one loader call
+    - Values are copied on the way in and out, so a caller mutating a result
+      never changes what later callers see (``copy_values=False`` opts out
+      for values the owner treats as read-only)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = 300,
+        stale_ttl: float = 0,
+        name: str = "cache",
+        copy_values: bool = True,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.name = name
+        self.copy_values = copy_values
+
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.loads = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._lookup(key, count=False) is not _MISSING
+
+    def _copy(self, value: Any) -> Any:
+        return copy.deepcopy(value) if self.copy_values else value
+
+    def _expires_at(self, ttl: Optional[float]) -> Optional[float]:
+        ttl = self.ttl if ttl is None else ttl
+        return time.monotonic() + ttl if ttl is not None else None
+
+    def _lookup(self, key: Hashable, count: bool = True) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            if count:
+                self.misses += 1
+            return _MISSING
+
+        now = time.monotonic()
+        if entry.expires_at is not None and entry.expires_at <= now:
+            if entry.expires_at + self.stale_ttl <= now:
+                self._entries.pop(key, None)
+                self.expirations += 1
+            if count:
+                self.misses += 1
+            return _MISSING
+
+        self._entries.move_to_end(key)
+        if count:
+            self.hits += 1
+        return entry.value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the fresh value for a key, or ``default``."""
+        value = self._lookup(key)
+        return default if value is _MISSING else self._copy(value)
+
+    def get_stale(self, key: Hashable, default: Any = None) -> Any:
+        """Return a value even if expired, as long as it is within ``stale_ttl``."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        if (
+            entry.expires_at is not None
+            and entry.expires_at + self.stale_ttl <= time.monotonic()
+        ):
+            self._entries.pop(key, None)
+            self.expirations += 1
+            return default
+        return self._copy(entry.value)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value; ``ttl`` overrides the cache default for this entry."""
+        self._entries[key] = _Entry(value=self._copy(value), expires_at=self._expires_at(ttl))
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def touch(self, key: Hashable, ttl: Optional[float] = None) -> bool:
+        """Extend the lifetime of an existing entry (fresh or stale)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        entry.expires_at = self._expires_at(ttl)
+        self._entries.move_to_end(key)
+        return True
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.pop(key, None)
+        return default if entry is None else self._copy(entry.value)
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """Drop all entries, or those whose key matches ``predicate``."""
+        if predicate is None:
+            removed = len(self._entries)
+            self._entries.clear()
+            return removed
+        keys = [key for key in self._entries if predicate(key)]
+        for key in keys:
+            self._entries.pop(key, None)
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _evict(self) -> None:
+        if len(self._entries) <= self.maxsize:
+            return
+        # Prefer dropping expired entries before live ones
+        now = time.monotonic()
+        for key in [
+            key for key, entry in self._entries.items()
+            if entry.expires_at is not None and entry.expires_at + self.stale_ttl <= now
+        ]:
+            self._entries.pop(key, None)
+            self.expirations += 1
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def is_loading(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    def start_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> asyncio.Future:
+        """Start ``loader`` for a key unless a load is already running.
+
+        Returns the in-flight task; the loader runs detached from any single
+        caller, so cancelling one waiter never aborts the shared load.
+        """
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            return inflight
+
+        self.loads += 1
+        task = asyncio.ensure_future(loader())
+        self._inflight[key] = task
+
+        def _done(finished: asyncio.Future) -> None:
+            if self._inflight.get(key) is finished:
+                self._inflight.pop(key, None)
+            if not finished.cancelled():
+                # Mark retrieved so a load nobody awaited doesn't log a warning
+                finished.exception()
+
+        task.add_done_callback(_done)
+        return task
+
+    async def single_flight(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Run ``loader`` once per key at a time; concurrent callers share the result.
+
+        The result is not stored - use ``get_or_load`` for that. Every caller
+        gets its own copy of it.
+        """
+        return self._copy(await asyncio.shield(self.start_load(key, loader)))
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """Return the cached value or load, store and return it."""
+        value = self._lookup(key)
+        if value is not _MISSING:
+            return self._copy(value)
+
+        async def load_and_store() -> Any:
+            result = await loader()
+            self.set(key, result, ttl)
+            return result
+
+        return await self.single_flight(key, load_and_store)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "name": self.name,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "loads": self.loads,
+            "coalesced": self.coalesced,
+            "inflight": len(self._inflight),
+        }
+
+
+__all__ = ["AsyncTTLCache"]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import copy
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 import os
@@ -9,6 +11,8 @@ import os
 from dotenv import load_dotenv
 import yaml
 
+from src.utils.config_watcher import FileSignature, file_signature
+
 
 @dataclass(frozen=True)
 class WebConfig:
@@ -37,8 +41,67 @@ def _read_yaml(path: Path) -> dict:
 
 def _write_yaml(path: Path, data: dict) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
+    # Write + rename so readers never parse a half-written file and the
+    # new inode is a reliable change signal for file_signature()
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as handle:
         yaml.safe_dump(data, handle, sort_keys=False)
+    tmp_path.replace(path)
+
+
+class BotConfigProvider:
+    """Cached access to the bot's config.yaml.
+
+    The parsed dict is kept in memory and only re-parsed when the file's
+    stat signature (mtime, inode, size) changes - the same signal the bot's
+    ConfigWatcher uses. Saves go through the provider, so settings changed
+    in the UI are visible to the next request without a re-parse.
+    """
+
+    def __init__(self, config_path: Path):
+        self.config_path = Path(config_path)
+        self._data: dict | None = None
+        self._signature: FileSignature | None = None
+        self._lock = threading.Lock()
+        self.parse_count = 0
+
+    def get(self) -> dict:
+        """Return a private copy of the current config."""
+        signature = file_signature(self.config_path)
+        if signature is None:
+            raise FileNotFoundError(f"Missing config file: {self.config_path}")
+        with self._lock:
+            if self._data is None or signature != self._signature:
+                self._data = _read_yaml(self.config_path)
+                self._signature = signature
+                self.parse_count += 1
+            # Callers mutate the dict before saving; never hand out the cache
+            return copy.deepcopy(self._data)
+
+    def save(self, config_data: dict) -> None:
+        """Write the config and make it the cached version."""
+        with self._lock:
+            _write_yaml(self.config_path, config_data)
+            self._data = copy.deepcopy(config_data)
+            self._signature = file_signature(self.config_path)
+
+    def invalidate(self) -> None:
+        """Force a re-parse on the next access."""
+        with self._lock:
+            self._data = None
+            self._signature = None
+
+
+_config_providers: dict[Path, BotConfigProvider] = {}
+
+
+def get_bot_config_provider(config_path: Path | None = None) -> BotConfigProvider:
+    config_path = Path(config_path or Path("config/config.yaml"))
+    provider = _config_providers.get(config_path)
+    if provider is None:
+        provider = BotConfigProvider(config_path)
+        _config_providers[config_path] = provider
+    return provider
 
 
 def load_web_config(config_path: Path | None = None) -> WebConfig:
@@ -84,17 +147,17 @@ def load_web_config(config_path: Path | None = None) -> WebConfig:
 
 
 def load_bot_config(config_path: Path | None = None) -> dict:
-    config_path = config_path or Path("config/config.yaml")
-    return _read_yaml(config_path)
+    return get_bot_config_provider(config_path).get()
 
 
 def save_bot_config(config_data: dict, config_path: Path | None = None) -> None:
-    config_path = config_path or Path("config/config.yaml")
-    _write_yaml(config_path, config_data)
+    get_bot_config_provider(config_path).save(config_data)
 
 
 __all__ = [
     "WebConfig",
+    "BotConfigProvider",
+    "get_bot_config_provider",
     "load_web_config",
     "load_bot_config",
     "save_bot_config",
@@ -10,6 +10,47 @@ from typing import Any, Dict, Optional
 
 import aiosqlite
 
+from src.database.migrations import Migration, MigrationRunner
+
+
+MIGRATIONS = [
+    Migration(1, "initial schema", (
+        """
+        CREATE TABLE IF NOT EXISTS web_sessions (
+            id TEXT PRIMARY KEY,
+            user_id INTEGER NOT NULL,
+            username TEXT NOT NULL,
+            avatar TEXT,
+            access_token TEXT NOT NULL,
+            refresh_token TEXT NOT NULL,
+            expires_at INTEGER NOT NULL,
+            created_at INTEGER NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS guild_settings (
+            guild_id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            raid_channel_id INTEGER,
+            guildwar_channel_id INTEGER,
+            info_channel_id INTEGER,
+            log_channel_id INTEGER,
+            participant_role_id INTEGER,
+            creator_roles TEXT NOT NULL,
+            timezone TEXT NOT NULL,
+            reminder_hours TEXT NOT NULL,
+            dm_reminder_minutes TEXT NOT NULL,
+            checkin_enabled INTEGER NOT NULL,
+            open_slot_ping_enabled INTEGER NOT NULL,
+            auto_close_at_start INTEGER NOT NULL,
+            auto_close_after_hours INTEGER NOT NULL,
+            confirmation_minutes INTEGER NOT NULL,
+            confirmation_reminder_minutes INTEGER NOT NULL,
+            open_slot_ping_minutes INTEGER NOT NULL
+        )
+        """,
+    )),
+]
 
 @dataclass(frozen=True)
 class WebSession:
@@ -54,47 +95,7 @@ class WebStore:
     async def initialize(self) -> None:
         if self._initialized:
             return
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("PRAGMA journal_mode=WAL")
-            await db.execute(
-                """
-                CREATE TABLE IF NOT EXISTS web_sessions (
-                    id TEXT PRIMARY KEY,
-                    user_id INTEGER NOT NULL,
-                    username TEXT NOT NULL,
-                    avatar TEXT,
-                    access_token TEXT NOT NULL,
-                    refresh_token TEXT NOT NULL,
-                    expires_at INTEGER NOT NULL,
-                    created_at INTEGER NOT NULL
-                )
-                """
-            )
-            await db.execute(
-                """
-                CREATE TABLE IF NOT EXISTS guild_settings (
-                    guild_id INTEGER PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    raid_channel_id INTEGER,
-                    guildwar_channel_id INTEGER,
-                    info_channel_id INTEGER,
-                    log_channel_id INTEGER,
-                    participant_role_id INTEGER,
-                    creator_roles TEXT NOT NULL,
-                    timezone TEXT NOT NULL,
-                    reminder_hours TEXT NOT NULL,
-                    dm_reminder_minutes TEXT NOT NULL,
-                    checkin_enabled INTEGER NOT NULL,
-                    open_slot_ping_enabled INTEGER NOT NULL,
-                    auto_close_at_start INTEGER NOT NULL,
-                    auto_close_after_hours INTEGER NOT NULL,
-                    confirmation_minutes INTEGER NOT NULL,
-                    confirmation_reminder_minutes INTEGER NOT NULL,
-                    open_slot_ping_minutes INTEGER NOT NULL
-                )
-                """
-            )
-            await db.commit()
+        await MigrationRunner(self.db_path, "web_store", MIGRATIONS, journal_mode="WAL").run()
         self._initialized = True
 
     async def create_session(self, session: WebSession) -> None:
@@ -2,13 +2,37 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import asyncio
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
 from urllib.parse import quote
 
 import httpx
 
+from web_api.cache import AsyncTTLCache
+
+try:  # HTTP/2 needs the optional "h2" package (httpx[http2])
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+logger = logging.getLogger("guildscout.web_api.discord")
 
 DISCORD_API_BASE = "https://discord.com/api/v10"
+USER_AGENT = "GuildScoutWebUI (https://github.com/zerodoxx/guildscout, 1.0)"
+
+# Only these statuses are worth caching; anything else is retried next time
+_CACHEABLE_STATUSES = (200, 404)
+# How long an expired response is kept around for ETag revalidation
+_STALE_RETENTION = 3600
+# Path segments whose IDs are "major parameters" in Discord's bucketing
+_MAJOR_PARAMS = ("channels", "guilds", "webhooks")
+_SNOWFLAKE = re.compile(r"^\d{15,25}$")
 
 
 class DiscordApiError(RuntimeError):
@@ -18,10 +42,309 @@ class DiscordApiError(RuntimeError):
 def _headers(token: str, token_type: str = "Bot") -> Dict[str, str]:
     return {
         "Authorization": f"{token_type} {token}",
-        "User-Agent": "GuildScoutWebUI (https://github.com/zerodoxx/guildscout, 1.0)",
+        "User-Agent": USER_AGENT,
     }
 
 
+def _route_key(method: str, path: str) -> str:
+    """Collapse a request path into its rate-limit route.
+
+    Discord buckets requests per route template, but keeps channel, guild and
+    webhook IDs ("major parameters") distinct.
+    """
+    parts = path.strip("/").split("/")
+    normalized = []
+    for index, part in enumerate(parts):
+        if _SNOWFLAKE.match(part) and (index == 0 or parts[index - 1] not in _MAJOR_PARAMS):
+            normalized.append(":id")
+        else:
+            normalized.append(part)
+    return f"{method} /{'/'.join(normalized)}"
+
+
+@dataclass
+class _CachedResponse:
+    status_code: int
+    body: Any
+    etag: Optional[str]
+
+
+@dataclass
+class _RateLimitBucket:
+    remaining: int = 1
+    limit: int = 1
+    reset_at: float = 0.0
+    reset_after: float = 0.0
+    # Held while a caller waits for and reserves a slot
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class DiscordRestClient:
+    """App-lifetime Discord REST client.
+
+    - One pooled httpx.AsyncClient (HTTP/2 when available, keep-alive otherwise)
+    - Per-bucket rate limit tracking from X-RateLimit-* headers, 429 retries
+    - LRU + TTL response cache for GETs with ETag revalidation
+    - Concurrent identical GETs share one in-flight request
+    """
+
+    def __init__(
+        self,
+        base_url: str = DISCORD_API_BASE,
+        timeout: float = 15,
+        cache_size: int = 2048,
+        max_retries: int = 3,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_retries = max_retries
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._cache = AsyncTTLCache(
+            maxsize=cache_size,
+            ttl=None,
+            stale_ttl=_STALE_RETENTION,
+            name="discord_rest",
+        )
+        self._route_buckets: Dict[str, str] = {}
+        self._buckets: Dict[str, _RateLimitBucket] = {}
+        self._global_reset_at = 0.0
+
+        self.stats = {
+            "requests": 0,
+            "revalidated": 0,
+            "rate_limited": 0,
+        }
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                http2=HTTP2_AVAILABLE,
+                headers={"User-Agent": USER_AGENT},
+                limits=httpx.Limits(
+                    max_connections=50,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=120,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled connection(s)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    # ------------------------------------------------------------------
+    # Rate limiting
+    # ------------------------------------------------------------------
+
+    async def _wait_for_bucket(self, route: str) -> None:
+        bucket_id = self._route_buckets.get(route)
+        bucket = self._buckets.get(bucket_id) if bucket_id else None
+        if bucket:
+            # Callers take slots one at a time, so an exhausted bucket lets
+            # only ``limit`` of its waiters through per window
+            async with bucket.lock:
+                while True:
+                    now = time.monotonic()
+                    if bucket.reset_at <= now:
+                        # New window; assume it is as long as the last one
+                        bucket.remaining = bucket.limit
+                        bucket.reset_at = now + bucket.reset_after
+                    if bucket.remaining > 0:
+                        break
+                    delay = bucket.reset_at - now
+                    logger.debug("Rate limit: waiting %.2fs for %s", delay, route)
+                    await asyncio.sleep(delay)
+                bucket.remaining -= 1
+
+        delay = self._global_reset_at - time.monotonic()
+        if delay > 0:
+            logger.debug("Rate limit: waiting %.2fs for %s (global)", delay, route)
+            await asyncio.sleep(delay)
+
+    def _update_bucket(self, route: str, response: httpx.Response) -> None:
+        bucket_id = response.headers.get("X-RateLimit-Bucket")
+        if not bucket_id:
+            return
+        self._route_buckets[route] = bucket_id
+        bucket = self._buckets.setdefault(bucket_id, _RateLimitBucket())
+        try:
+            remaining = int(response.headers.get("X-RateLimit-Remaining", bucket.remaining))
+            limit = int(response.headers.get("X-RateLimit-Limit", bucket.limit))
+            reset_after = float(response.headers.get("X-RateLimit-Reset-After", 0))
+        except ValueError:
+            return
+        now = time.monotonic()
+        if bucket.reset_at > now:
+            # Slots reserved by requests still in flight are not in the
+            # server's count yet
+            remaining = min(remaining, bucket.remaining)
+        bucket.remaining = remaining
+        bucket.limit = max(limit, 1)
+        bucket.reset_after = reset_after
+        bucket.reset_at = now + reset_after
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> float:
+        try:
+            return float(response.json().get("retry_after", 1))
+        except Exception:
+            return float(response.headers.get("Retry-After", 1) or 1)
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request, honouring rate limit buckets and retrying 429s."""
+        route = _route_key(method, path)
+        client = self._get_client()
+
+        for attempt in range(self.max_retries + 1):
+            await self._wait_for_bucket(route)
+            self.stats["requests"] += 1
+            response = await client.request(method, path, headers=headers, **kwargs)
+            self._update_bucket(route, response)
+
+            if response.status_code != 429:
+                return response
+
+            self.stats["rate_limited"] += 1
+            retry_after = self._retry_after(response)
+            if response.headers.get("X-RateLimit-Global") or response.headers.get(
+                "X-RateLimit-Scope"
+            ) == "global":
+                self._global_reset_at = time.monotonic() + retry_after
+            logger.warning(
+                "Discord 429 on %s (attempt %d), retrying in %.2fs",
+                route,
+                attempt + 1,
+                retry_after,
+            )
+            if attempt < self.max_retries:
+                await asyncio.sleep(retry_after)
+
+        return response
+
+    # ------------------------------------------------------------------
+    # Cached GETs
+    # ------------------------------------------------------------------
+
+    def invalidate(self, path: str, authorization: Optional[str] = None) -> None:
+        """Drop cached responses for a path (for one or all tokens)."""
+        self._cache.invalidate(
+            lambda key: key[1] == path and (authorization is None or key[0] == authorization)
+        )
+
+    async def get_json(
+        self,
+        path: str,
+        *,
+        headers: Dict[str, str],
+        cache_ttl: float = 0,
+    ) -> Tuple[int, Any]:
+        """GET a JSON resource through the response cache.
+
+        Args:
+            path: API path relative to the base URL
+            headers: Request headers (including Authorization)
+            cache_ttl: Seconds a response stays fresh; 0 disables caching
+
+        Returns:
+            Tuple of (status_code, parsed JSON body or None)
+        """
+        if cache_ttl <= 0:
+            response = await self.request("GET", path, headers=headers)
+            return response.status_code, self._json_or_none(response)
+
+        key = (headers.get("Authorization", ""), path)
+        entry = self._cache.get(key)
+        if entry is not None:
+            return entry.status_code, entry.body
+
+        return await self._cache.single_flight(
+            key, lambda: self._fetch_and_cache(key, path, headers, cache_ttl)
+        )
+
+    async def _fetch_and_cache(
+        self,
+        key: Tuple[str, str],
+        path: str,
+        headers: Dict[str, str],
+        cache_ttl: float,
+    ) -> Tuple[int, Any]:
+        stale = self._cache.get_stale(key)
+        request_headers = dict(headers)
+        if stale is not None and stale.etag:
+            request_headers["If-None-Match"] = stale.etag
+
+        response = await self.request("GET", path, headers=request_headers)
+
+        if response.status_code == 304 and stale is not None:
+            self.stats["revalidated"] += 1
+            self._cache.touch(key, cache_ttl)
+            return stale.status_code, stale.body
+
+        body = self._json_or_none(response)
+        if response.status_code in _CACHEABLE_STATUSES:
+            self._cache.set(
+                key,
+                _CachedResponse(
+                    status_code=response.status_code,
+                    body=body,
+                    etag=response.headers.get("ETag"),
+                ),
+                ttl=cache_ttl,
+            )
+        return response.status_code, body
+
+    @staticmethod
+    def _json_or_none(response: httpx.Response) -> Any:
+        if not response.content:
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "buckets": len(self._buckets),
+            "http2": HTTP2_AVAILABLE,
+            "cache": self._cache.stats(),
+        }
+
+
+_discord_client: Optional[DiscordRestClient] = None
+
+
+def get_discord_client() -> DiscordRestClient:
+    """Get or create the shared Discord REST client."""
+    global _discord_client
+    if _discord_client is None:
+        _discord_client = DiscordRestClient()
+    return _discord_client
+
+
+def set_discord_client(client: Optional[DiscordRestClient]) -> None:
+    """Replace the shared client (e.g. to point at a stub server in tests)."""
+    global _discord_client
+    _discord_client = client
+
+
+async def close_discord_client() -> None:
+    if _discord_client is not None:
+        await _discord_client.aclose()
+
+
 async def exchange_code_for_token(
     client_id: str,
     client_secret: str,
@@ -36,54 +359,58 @@ async def exchange_code_for_token(
         "redirect_uri": redirect_uri,
     }
     headers = {"Content-Type": "application/x-www-form-urlencoded"}
-    async with httpx.AsyncClient(timeout=15) as client:
-        resp = await client.post(f"{DISCORD_API_BASE}/oauth2/token", data=data, headers=headers)
+    resp = await get_discord_client().request(
+        "POST", "/oauth2/token", data=data, headers=headers
+    )
     if resp.status_code != 200:
         raise DiscordApiError(f"Token exchange failed ({resp.status_code})")
     return resp.json()
 
 
 async def fetch_user(access_token: str) -> Dict[str, Any]:
-    async with httpx.AsyncClient(timeout=15) as client:
-        resp = await client.get(
-            f"{DISCORD_API_BASE}/users/@me",
-            headers=_headers(access_token, token_type="Bearer"),
-        )
-    if resp.status_code != 200:
+    status, body = await get_discord_client().get_json(
+        "/users/@me",
+        headers=_headers(access_token, token_type="Bearer"),
+    )
+    if status != 200:
         raise DiscordApiError("Failed to fetch user profile")
-    return resp.json()
+    return body
 
 
-async def fetch_user_guilds(access_token: str) -> list[Dict[str, Any]]:
-    async with httpx.AsyncClient(timeout=15) as client:
-        resp = await client.get(
-            f"{DISCORD_API_BASE}/users/@me/guilds",
-            headers=_headers(access_token, token_type="Bearer"),
-        )
-    if resp.status_code != 200:
+async def fetch_user_guilds(access_token: str, cache_ttl: float = 0) -> list[Dict[str, Any]]:
+    status, body = await get_discord_client().get_json(
+        "/users/@me/guilds",
+        headers=_headers(access_token, token_type="Bearer"),
+        cache_ttl=cache_ttl,
+    )
+    if status != 200:
         raise DiscordApiError("Failed to fetch user guilds")
-    return resp.json()
-
-
-async def fetch_bot_guild(bot_token: str, guild_id: int) -> Optional[Dict[str, Any]]:
-    async with httpx.AsyncClient(timeout=15) as client:
-        resp = await client.get(
-            f"{DISCORD_API_BASE}/guilds/{guild_id}",
-            headers=_headers(bot_token, token_type="Bot"),
-        )
-    if resp.status_code == 200:
-        return resp.json()
+    return body
+
+
+async def fetch_bot_guild(
+    bot_token: str, guild_id: int, cache_ttl: float = 0
+) -> Optional[Dict[str, Any]]:
+    status, body = await get_discord_client().get_json(
+        f"/guilds/{guild_id}",
+        headers=_headers(bot_token, token_type="Bot"),
+        cache_ttl=cache_ttl,
+    )
+    if status == 200:
+        return body
     return None
 
 
-async def fetch_member(bot_token: str, guild_id: int, user_id: int) -> Optional[Dict[str, Any]]:
-    async with httpx.AsyncClient(timeout=15) as client:
-        resp = await client.get(
-            f"{DISCORD_API_BASE}/guilds/{guild_id}/members/{user_id}",
-            headers=_headers(bot_token, token_type="Bot"),
-        )
-    if resp.status_code == 200:
-        return resp.json()
+async def fetch_member(
+    bot_token: str, guild_id: int, user_id: int, cache_ttl: float = 0
+) -> Optional[Dict[str, Any]]:
+    status, body = await get_discord_client().get_json(
+        f"/guilds/{guild_id}/members/{user_id}",
+        headers=_headers(bot_token, token_type="Bot"),
+        cache_ttl=cache_ttl,
+    )
+    if status == 200:
+        return body
     return None
 
 
@@ -92,12 +419,12 @@ async def create_message(
     channel_id: int,
     payload: Dict[str, Any],
 ) -> Dict[str, Any]:
-    async with httpx.AsyncClient(timeout=15) as client:
-        resp = await client.post(
-            f"{DISCORD_API_BASE}/channels/{channel_id}/messages",
-            headers=_headers(bot_token, token_type="Bot"),
-            json=payload,
-        )
+    resp = await get_discord_client().request(
+        "POST",
+        f"/channels/{channel_id}/messages",
+        headers=_headers(bot_token, token_type="Bot"),
+        json=payload,
+    )
     if resp.status_code not in (200, 201):
         raise DiscordApiError(f"Failed to create message ({resp.status_code})")
     return resp.json()
@@ -109,22 +436,22 @@ async def edit_message(
     message_id: int,
     payload: Dict[str, Any],
 ) -> None:
-    async with httpx.AsyncClient(timeout=15) as client:
-        resp = await client.patch(
-            f"{DISCORD_API_BASE}/channels/{channel_id}/messages/{message_id}",
-            headers=_headers(bot_token, token_type="Bot"),
-            json=payload,
-        )
+    resp = await get_discord_client().request(
+        "PATCH",
+        f"/channels/{channel_id}/messages/{message_id}",
+        headers=_headers(bot_token, token_type="Bot"),
+        json=payload,
+    )
     if resp.status_code not in (200, 204):
         raise DiscordApiError(f"Failed to edit message ({resp.status_code})")
 
 
 async def delete_message(bot_token: str, channel_id: int, message_id: int) -> None:
-    async with httpx.AsyncClient(timeout=15) as client:
-        resp = await client.delete(
-            f"{DISCORD_API_BASE}/channels/{channel_id}/messages/{message_id}",
-            headers=_headers(bot_token, token_type="Bot"),
-        )
+    resp = await get_discord_client().request(
+        "DELETE",
+        f"/channels/{channel_id}/messages/{message_id}",
+        headers=_headers(bot_token, token_type="Bot"),
+    )
     if resp.status_code not in (200, 204):
         raise DiscordApiError("Failed to delete message")
 
@@ -136,11 +463,11 @@ async def add_reaction(
     emoji: str,
 ) -> None:
     encoded = quote(emoji)
-    async with httpx.AsyncClient(timeout=15) as client:
-        resp = await client.put(
-            f"{DISCORD_API_BASE}/channels/{channel_id}/messages/{message_id}/reactions/{encoded}/@me",
-            headers=_headers(bot_token, token_type="Bot"),
-        )
+    resp = await get_discord_client().request(
+        "PUT",
+        f"/channels/{channel_id}/messages/{message_id}/reactions/{encoded}/@me",
+        headers=_headers(bot_token, token_type="Bot"),
+    )
     if resp.status_code not in (200, 204):
         raise DiscordApiError("Failed to add reaction")
 
@@ -151,13 +478,16 @@ async def remove_role(
     user_id: int,
     role_id: int,
 ) -> None:
-    async with httpx.AsyncClient(timeout=15) as client:
-        resp = await client.delete(
-            f"{DISCORD_API_BASE}/guilds/{guild_id}/members/{user_id}/roles/{role_id}",
-            headers=_headers(bot_token, token_type="Bot"),
-        )
+    client = get_discord_client()
+    resp = await client.request(
+        "DELETE",
+        f"/guilds/{guild_id}/members/{user_id}/roles/{role_id}",
+        headers=_headers(bot_token, token_type="Bot"),
+    )
     if resp.status_code not in (204, 200):
         raise DiscordApiError("Failed to remove role")
+    # Cached member roles are now outdated
+    client.invalidate(f"/guilds/{guild_id}/members/{user_id}")
 
 
 def build_avatar_url(user_id: int, avatar_hash: Optional[str]) -> Optional[str]:
@@ -169,6 +499,10 @@ def build_avatar_url(user_id: int, avatar_hash: Optional[str]) -> Optional[str]:
 
 __all__ = [
     "DiscordApiError",
+    "DiscordRestClient",
+    "get_discord_client",
+    "set_discord_client",
+    "close_discord_client",
     "exchange_code_for_token",
     "fetch_user",
     "fetch_user_guilds",
@@ -1,4 +1,4 @@
-import React, { useEffect, useState, useCallback } from 'react';
+import React, { useEffect, useState, useCallback, useRef } from 'react';
 import { useTranslation } from 'react-i18next';
 import { Users, Search, Download, ChevronLeft, ChevronRight, Loader2, AlertCircle, Trophy, MessageSquare, Mic, Calendar, SortAsc, SortDesc } from 'lucide-react';
 import { cn } from '@/lib/utils';
@@ -21,6 +21,7 @@ interface RankingsData {
   total: number;
   page: number;
   per_page: number;
+  next_cursor?: string | null;
   weights?: {
     days: number;
     messages: number;
@@ -47,19 +48,25 @@ const Members: React.FC<MembersProps> = ({ data }) => {
   const [sortAsc, setSortAsc] = useState(true);
 
   const perPage = 25;
+  // next_cursor of every loaded page; the following page is fetched by keyset
+  const cursors = useRef<Record<number, string | null>>({});
 
   const fetchData = useCallback(async () => {
     try {
       setLoading(true);
       setError(null);
 
-      const offset = (page - 1) * perPage;
+      const cursor = cursors.current[page - 1];
+      const position = cursor
+        ? `cursor=${encodeURIComponent(cursor)}`
+        : `offset=${(page - 1) * perPage}`;
       const response = await fetch(
-        `/api/guilds/${data.guild.id}/analytics/rankings?limit=${perPage}&offset=${offset}`
+        `/api/guilds/${data.guild.id}/analytics/rankings?limit=${perPage}&${position}`
       );
       const json = await response.json();
 
       if (json.success) {
+        cursors.current[page] = json.data.next_cursor ?? null;
         setRankings(json.data);
       } else {
         throw new Error(json.error || 'Failed to load members');